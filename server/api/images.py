@@ -2,11 +2,13 @@
 이미지 관련 API 엔드포인트
 """
 import logging
-import os
-from pathlib import Path
 from typing import List, TYPE_CHECKING, Optional
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query, Request
+
+from utils.http_cache import (
+    conditional_file_response, conditional_bytes_response, not_modified_response,
+    content_etag, guess_image_media_type
+)
 
 if TYPE_CHECKING:
     from managers.image_utils import ImageManager
@@ -28,11 +30,30 @@ def set_dependencies(img_manager: 'ImageManager'):
 
 
 @router.get("/api/images", tags=["Images"])
-async def list_images():
-    """이미지 목록 조회"""
+async def list_images(
+    prefix: Optional[str] = Query(None, description="날짜/프로젝트 경로 접두사 (예: 2024-01-01/project)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="페이지 크기")
+):
+    """
+    이미지 목록 조회
+
+    prefix/cursor/limit 중 하나라도 지정하면 커서 기반 페이지로 반환합니다.
+    (지정하지 않으면 기존처럼 전체 목록을 반환)
+    """
+    if image_manager is None:
+        raise HTTPException(status_code=500, detail="이미지 매니저가 초기화되지 않았습니다.")
+    if prefix is None and cursor is None and limit is None:
+        return image_manager.list_images()
+    return image_manager.list_images_page(prefix=prefix, cursor=cursor, limit=limit or 500)
+
+
+@router.get("/api/images/count", tags=["Images"])
+async def count_images(prefix: Optional[str] = Query(None, description="날짜/프로젝트 경로 접두사")):
+    """이미지 수 조회 (전체 목록을 내려받지 않고 개수만 확인)"""
     if image_manager is None:
         raise HTTPException(status_code=500, detail="이미지 매니저가 초기화되지 않았습니다.")
-    return image_manager.list_images()
+    return image_manager.count_images(prefix)
 
 
 @router.get("/refresh", tags=["Images"]) 
@@ -44,10 +65,11 @@ async def refresh_images():
 
 
 @router.get("/image/{filename:path}", tags=["Images"])
-async def get_image(filename: str):
+async def get_image(request: Request, filename: str):
     """
     파일 경로로부터 이미지를 가져옵니다.
     상대 경로나 파일명으로 접근 가능합니다.
+    ETag/If-None-Match(304)와 Range(206)를 지원합니다.
     """
     try:
         if image_manager is None:
@@ -58,8 +80,22 @@ async def get_image(filename: str):
         
         if not image_path:
             raise HTTPException(status_code=404, detail=f"이미지를 찾을 수 없습니다: {filename}")
+        
+        # 메모리 이미지 (콘텐츠 해시 ETag)
+        if str(image_path).startswith("memory://"):
+            memory_filename = str(image_path)[len("memory://"):]
+            content_hash = image_manager.memory_images.hash_of(memory_filename)
+            if content_hash:
+                not_modified = not_modified_response(request, content_etag(content_hash))
+                if not_modified:
+                    return not_modified
+            memory_data = image_manager.get_memory_image(memory_filename)
+            if not memory_data:
+                raise HTTPException(status_code=404, detail=f"이미지를 찾을 수 없습니다: {filename}")
+            etag = content_etag(content_hash or image_manager.content_store.hash_bytes(memory_data))
+            return conditional_bytes_response(request, memory_data, etag, guess_image_media_type(filename))
             
-        return FileResponse(image_path)
+        return conditional_file_response(request, image_path, guess_image_media_type(image_path))
         
     except HTTPException:
         raise
@@ -77,74 +113,3 @@ async def upload_files(
     if image_manager is None:
         raise HTTPException(status_code=500, detail="이미지 매니저가 초기화되지 않았습니다.")
     return await image_manager.upload_files(files, project)
-
-
-@router.delete("/api/delete-image/{filename}", tags=["Images"])
-async def delete_image_and_label(filename: str, project_path: str):
-    """
-    이미지 파일과 해당 라벨 파일을 삭제합니다.
-    
-    Args:
-        filename: 삭제할 이미지 파일명
-        project_path: 프로젝트 경로
-    """
-    try:
-        project_dir = Path(project_path)
-        
-        # 프로젝트 경로 유효성 확인
-        if not project_dir.exists():
-            raise HTTPException(status_code=404, detail="프로젝트 경로를 찾을 수 없습니다.")
-        
-        # 이미지 파일 경로
-        images_dir = project_dir / "images"
-        image_path = images_dir / filename
-        
-        # 라벨 파일 경로 (확장자를 .txt로 변경)
-        labels_dir = project_dir / "labels"
-        label_filename = Path(filename).stem + ".txt"
-        label_path = labels_dir / label_filename
-        
-        deleted_files = []
-        errors = []
-        
-        # 이미지 파일 삭제
-        if image_path.exists():
-            try:
-                os.remove(image_path)
-                deleted_files.append(f"이미지: {filename}")
-                logger.info(f"이미지 파일 삭제 성공: {image_path}")
-            except Exception as e:
-                errors.append(f"이미지 파일 삭제 실패: {str(e)}")
-                logger.error(f"이미지 파일 삭제 실패: {image_path}, 오류: {str(e)}")
-        else:
-            errors.append(f"이미지 파일을 찾을 수 없습니다: {filename}")
-        
-        # 라벨 파일 삭제
-        if label_path.exists():
-            try:
-                os.remove(label_path)
-                deleted_files.append(f"라벨: {label_filename}")
-                logger.info(f"라벨 파일 삭제 성공: {label_path}")
-            except Exception as e:
-                errors.append(f"라벨 파일 삭제 실패: {str(e)}")
-                logger.error(f"라벨 파일 삭제 실패: {label_path}, 오류: {str(e)}")
-        else:
-            # 라벨 파일이 없는 것은 정상적인 상황일 수 있음
-            logger.info(f"라벨 파일이 존재하지 않음: {label_path}")
-        
-        # 결과 처리
-        if len(deleted_files) == 0:
-            raise HTTPException(status_code=404, detail="삭제할 파일을 찾을 수 없습니다.")
-        
-        return {
-            "success": True,
-            "message": f"파일 삭제 완료: {', '.join(deleted_files)}",
-            "deleted_files": deleted_files,
-            "errors": errors if errors else None
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"파일 삭제 오류: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"파일 삭제 오류: {str(e)}") 
\ No newline at end of file
@@ -2,15 +2,26 @@
 
 from .config import (
     IMAGE_EXTENSIONS, LABEL_EXTENSIONS, TEXT_FILE_EXTENSIONS,
-    IMAGES_DIR_NAME, LABELS_DIR_NAME, INFO_FILE_SUFFIX, 
+    IMAGES_DIR_NAME, LABELS_DIR_NAME, INFO_FILE_SUFFIX, MANIFEST_FILE_SUFFIX,
     DEFAULT_PROJECT_NAME, MAX_FILE_SIZE, ALLOWED_UPLOAD_EXTENSIONS,
     UNSAFE_PATH_PREFIXES, API_TAGS_METADATA,
-    get_base_dir, get_upload_dir, get_model_dir, get_vue_dist_dir
+    get_base_dir, get_upload_dir, get_model_dir, get_vue_dist_dir,
+    get_memory_store_settings, get_result_cache_settings, get_thumbnail_settings,
+    get_io_pool_settings, get_metrics_settings, get_project_catalog_path
 )
 from .utils import (
     cleanup_memory_images_info, get_handle_positions, 
-    is_valid_project_structure, safe_mkdir, safe_file_write
+    is_valid_project_structure, find_project_info_file, safe_mkdir, safe_file_write
 )
+from .content_store import ContentStore, BLOB_DIR_NAME, is_content_hash
+from .file_index import FileIndex, get_file_index
+from .image_probe import (
+    ImageHeader, NeedMoreData, TrailerScanner, probe_image_header, probe_image_file, probe_with_decoder
+)
+from .image_manifest import ImageManifest, manifest_path
+from .io_pool import IOPool
+from .metrics import MetricsRegistry, MetricsMiddleware, LoopLagMonitor, get_metrics, record_images_processed
+from .tracing import RequestTrace, TracingMiddleware, current_trace, trace_request, record_span, span
 from .path_utils import (
     is_safe_path, normalize_project_path, get_project_dir,
     find_image_paths, scan_image_files, clean_url_path,
@@ -20,15 +31,38 @@ from .path_utils import (
 __all__ = [
     # config.py에서
     'IMAGE_EXTENSIONS', 'LABEL_EXTENSIONS', 'TEXT_FILE_EXTENSIONS',
-    'IMAGES_DIR_NAME', 'LABELS_DIR_NAME', 'INFO_FILE_SUFFIX',
+    'IMAGES_DIR_NAME', 'LABELS_DIR_NAME', 'INFO_FILE_SUFFIX', 'MANIFEST_FILE_SUFFIX',
     'DEFAULT_PROJECT_NAME', 'MAX_FILE_SIZE', 'ALLOWED_UPLOAD_EXTENSIONS', 
     'UNSAFE_PATH_PREFIXES', 'API_TAGS_METADATA',
     'get_base_dir', 'get_upload_dir', 'get_model_dir', 'get_vue_dist_dir',
+    'get_memory_store_settings', 'get_result_cache_settings', 'get_thumbnail_settings',
+    'get_io_pool_settings', 'get_metrics_settings', 'get_project_catalog_path',
     
     # utils.py에서
     'cleanup_memory_images_info', 'get_handle_positions', 
-    'is_valid_project_structure', 'safe_mkdir', 'safe_file_write',
+    'is_valid_project_structure', 'find_project_info_file', 'safe_mkdir', 'safe_file_write',
     
+    # content_store.py에서
+    'ContentStore', 'BLOB_DIR_NAME', 'is_content_hash',
+
+    # file_index.py에서
+    'FileIndex', 'get_file_index',
+
+    # image_probe.py에서
+    'ImageHeader', 'NeedMoreData', 'TrailerScanner', 'probe_image_header', 'probe_image_file', 'probe_with_decoder',
+
+    # image_manifest.py에서
+    'ImageManifest', 'manifest_path',
+
+    # io_pool.py에서
+    'IOPool',
+
+    # metrics.py에서
+    'MetricsRegistry', 'MetricsMiddleware', 'LoopLagMonitor', 'get_metrics', 'record_images_processed',
+
+    # tracing.py에서
+    'RequestTrace', 'TracingMiddleware', 'current_trace', 'trace_request', 'record_span', 'span',
+
     # path_utils.py에서
     'is_safe_path', 'normalize_project_path', 'get_project_dir',
     'find_image_paths', 'scan_image_files', 'clean_url_path',
@@ -17,6 +17,7 @@ LABELS_DIR_NAME = "labels"
 
 # 프로젝트 구조 관련
 INFO_FILE_SUFFIX = "_info.json"
+MANIFEST_FILE_SUFFIX = "_manifest.json"
 DEFAULT_PROJECT_NAME = "default"
 
 
@@ -24,6 +25,25 @@ DEFAULT_PROJECT_NAME = "default"
 # 업로드 제한
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 ALLOWED_UPLOAD_EXTENSIONS = IMAGE_EXTENSIONS
+# 업로드 검증(해시/헤더 검사/임시 파일 기록) 워커 수
+UPLOAD_WORKERS = int(os.getenv('AUTOLABELING_UPLOAD_WORKERS', min(4, os.cpu_count() or 1)))
+# 프로젝트 불러오기(이미지 크기 확인/라벨 파싱) 워커 수 - 대부분 파일 I/O 대기이므로 CPU 수보다 크게 둠
+PROJECT_LOAD_WORKERS = int(os.getenv('AUTOLABELING_LOAD_WORKERS', min(16, (os.cpu_count() or 1) * 4)))
+
+# 메모리 이미지 저장소 기본값
+MEMORY_IMAGE_BUDGET_MB = 1024
+MEMORY_IMAGE_SPILL_BUDGET_MB = 4096
+MEMORY_IMAGE_TTL_SECONDS = 6 * 60 * 60  # 마지막 사용 후 6시간
+
+# 추론 결과 캐시 기본값
+RESULT_CACHE_MEMORY_MB = 64
+RESULT_CACHE_DISK_MB = 1024
+
+# 썸네일 기본값 (요청 너비는 가장 가까운 고정 크기로 올림)
+THUMBNAIL_SIZES = (128, 256, 512)
+THUMBNAIL_PREGENERATE_SIZES = (256,)
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_CACHE_MB = 2048
 
 # 경로 설정 함수
 def get_base_dir():
@@ -82,6 +102,97 @@ def get_model_dir():
 
 
 
+def get_memory_store_settings():
+    """
+    메모리 이미지 저장소 설정을 환경 변수 또는 기본값으로 반환
+
+    - AUTOLABELING_MEMORY_BUDGET_MB: 메모리 예산 (MB)
+    - AUTOLABELING_MEMORY_SPILL: 디스크 스필 사용 여부 (1/0)
+    - AUTOLABELING_MEMORY_SPILL_DIR: 스필 디렉토리 (기본값: 시스템 임시 디렉토리)
+    - AUTOLABELING_MEMORY_SPILL_BUDGET_MB: 스필 예산 (MB)
+    - AUTOLABELING_MEMORY_TTL: 항목 TTL (초, 0이면 만료 없음)
+    """
+    mb = 1024 * 1024
+    return {
+        "max_bytes": int(float(os.getenv('AUTOLABELING_MEMORY_BUDGET_MB', MEMORY_IMAGE_BUDGET_MB)) * mb),
+        "spill_enabled": os.getenv('AUTOLABELING_MEMORY_SPILL', '1').lower() not in ('0', 'false', 'no'),
+        "spill_dir": os.getenv('AUTOLABELING_MEMORY_SPILL_DIR') or None,
+        "max_spill_bytes": int(float(os.getenv('AUTOLABELING_MEMORY_SPILL_BUDGET_MB', MEMORY_IMAGE_SPILL_BUDGET_MB)) * mb),
+        "ttl_seconds": float(os.getenv('AUTOLABELING_MEMORY_TTL', MEMORY_IMAGE_TTL_SECONDS)) or None
+    }
+
+def get_result_cache_settings():
+    """
+    추론 결과 캐시 설정을 환경 변수 또는 기본값으로 반환
+
+    - AUTOLABELING_RESULT_CACHE: 결과 캐시 사용 여부 (1/0)
+    - AUTOLABELING_RESULT_CACHE_DIR: 디스크 캐시 디렉토리 (기본값: server/cache/results)
+    - AUTOLABELING_RESULT_CACHE_MEMORY_MB: 메모리 캐시 예산 (MB)
+    - AUTOLABELING_RESULT_CACHE_DISK_MB: 디스크 캐시 예산 (MB, 0이면 디스크 캐시 미사용)
+    """
+    mb = 1024 * 1024
+    cache_dir = os.getenv('AUTOLABELING_RESULT_CACHE_DIR')
+    return {
+        "enabled": os.getenv('AUTOLABELING_RESULT_CACHE', '1').lower() not in ('0', 'false', 'no'),
+        "disk_dir": Path(cache_dir).resolve() if cache_dir else get_base_dir() / "cache" / "results",
+        "max_memory_bytes": int(float(os.getenv('AUTOLABELING_RESULT_CACHE_MEMORY_MB', RESULT_CACHE_MEMORY_MB)) * mb),
+        "max_disk_bytes": int(float(os.getenv('AUTOLABELING_RESULT_CACHE_DISK_MB', RESULT_CACHE_DISK_MB)) * mb)
+    }
+
+def get_thumbnail_settings():
+    """
+    썸네일 서비스 설정을 환경 변수 또는 기본값으로 반환
+
+    - AUTOLABELING_THUMB_DIR: 썸네일 캐시 디렉토리 (기본값: server/cache/thumbs)
+    - AUTOLABELING_THUMB_FORMAT: webp 또는 jpeg (기본값: webp)
+    - AUTOLABELING_THUMB_WORKERS: 요청 시 생성 워커 수 (기본값: CPU 수, 최대 4)
+    - AUTOLABELING_THUMB_CACHE_MB: 썸네일 캐시 디스크 예산 (MB, 0이면 제한 없음)
+    """
+    mb = 1024 * 1024
+    cache_dir = os.getenv('AUTOLABELING_THUMB_DIR')
+    return {
+        "cache_dir": Path(cache_dir).resolve() if cache_dir else get_base_dir() / "cache" / "thumbs",
+        "sizes": THUMBNAIL_SIZES,
+        "pregenerate_sizes": THUMBNAIL_PREGENERATE_SIZES,
+        "image_format": os.getenv('AUTOLABELING_THUMB_FORMAT', 'webp').lower(),
+        "quality": int(os.getenv('AUTOLABELING_THUMB_QUALITY', THUMBNAIL_QUALITY)),
+        "workers": int(os.getenv('AUTOLABELING_THUMB_WORKERS', min(4, os.cpu_count() or 1))),
+        "max_cache_bytes": int(float(os.getenv('AUTOLABELING_THUMB_CACHE_MB', THUMBNAIL_CACHE_MB)) * mb)
+    }
+
+def get_io_pool_settings():
+    """
+    프로젝트 파일 I/O 풀 설정 반환
+
+    - AUTOLABELING_IO_WORKERS: 동시 파일 작업 수 (기본값: CPU 수 x 2, 최대 8)
+    - AUTOLABELING_IO_WRITE_CONCURRENCY: 동시에 실행할 대량 쓰기(프로젝트 저장/삭제) 수 (기본값: 2)
+    """
+    return {
+        "workers": int(os.getenv('AUTOLABELING_IO_WORKERS', min(8, (os.cpu_count() or 1) * 2))),
+        "write_concurrency": int(os.getenv('AUTOLABELING_IO_WRITE_CONCURRENCY', 2))
+    }
+
+def get_metrics_settings():
+    """
+    런타임 지표 설정 반환
+
+    - AUTOLABELING_LOOP_LAG_INTERVAL: 이벤트 루프 지연 측정 간격 (초, 기본값: 0.5)
+    """
+    return {
+        "loop_lag_interval": float(os.getenv('AUTOLABELING_LOOP_LAG_INTERVAL', 0.5))
+    }
+
+def get_project_catalog_path():
+    """
+    프로젝트 카탈로그(SQLite) 파일 경로 반환
+
+    - AUTOLABELING_PROJECT_CATALOG: DB 파일 경로 (기본값: server/cache/projects.db, ":memory:"이면 메모리 DB)
+    """
+    db_path = os.getenv('AUTOLABELING_PROJECT_CATALOG')
+    if db_path == ":memory:":
+        return db_path
+    return Path(db_path).resolve() if db_path else get_base_dir() / "cache" / "projects.db"
+
 def get_vue_dist_dir():
     """Vue 빌드 파일 디렉토리 경로 반환"""
     return get_base_dir().parent / "dist"
@@ -0,0 +1,263 @@
+"""콘텐츠 해시 기반 이미지 저장소 (디스크 중복 제거)"""
+
+import os
+import re
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIR_NAME = ".blobs"
+_HASH_CHUNK_SIZE = 1024 * 1024
+# sha256 hex (소문자 64자) - blob 경로에 그대로 쓰이므로 이 형식만 허용
+_CONTENT_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def is_content_hash(value: Optional[str]) -> bool:
+    """콘텐츠 해시 형식(소문자 sha256 hex 64자)인지 확인합니다."""
+    return isinstance(value, str) and _CONTENT_HASH_PATTERN.fullmatch(value) is not None
+
+
+class ContentStore:
+    """
+    업로드 디렉토리 아래 `.blobs/<해시 앞 2자리>/<해시>`에 이미지 바이트를 한 벌만 보관하고,
+    프로젝트의 images 폴더에는 하드링크(지원되지 않으면 복사)로 배치합니다.
+
+    같은 이미지가 여러 프로젝트에 포함되어도 디스크에는 한 번만 저장됩니다.
+    blob의 참조 수는 파일 링크 수(st_nlink)로 판단합니다. 링크 수가 1이면 (blob 자신만 남음)
+    어느 프로젝트도 쓰지 않는 blob이므로 unlink()/collect_garbage()에서 삭제합니다.
+    """
+
+    def __init__(self, upload_dir: Path):
+        self.root = Path(upload_dir) / BLOB_DIR_NAME
+        self._lock = threading.Lock()
+        self._linked = 0
+        self._copied = 0
+        self._deduplicated = 0
+        self._collected = 0
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """바이트의 콘텐츠 해시 (sha256 hex)"""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def hash_file(path: Union[str, Path]) -> str:
+        """파일의 콘텐츠 해시 (청크 단위로 읽음)"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def blob_path(self, content_hash: str) -> Path:
+        """
+        콘텐츠 해시에 해당하는 blob 경로
+
+        Raises:
+            ValueError: 해시 형식이 아닌 값 (경로 조작 방지)
+        """
+        if not is_content_hash(content_hash):
+            raise ValueError(f"잘못된 콘텐츠 해시: {content_hash!r}")
+        return self.root / content_hash[:2] / content_hash
+
+    def has(self, content_hash: str) -> bool:
+        """blob 존재 여부 (해시 형식이 아니면 False)"""
+        return is_content_hash(content_hash) and self.blob_path(content_hash).is_file()
+
+    def put_bytes(self, data: bytes, content_hash: Optional[str] = None) -> str:
+        """
+        바이트를 blob으로 저장합니다. 이미 있으면 다시 쓰지 않습니다.
+
+        Returns:
+            str: 콘텐츠 해시
+        """
+        content_hash = content_hash or self.hash_bytes(data)
+        target = self.blob_path(content_hash)
+        if target.is_file():
+            self._deduplicated += 1
+            return content_hash
+
+        def write(tmp_file):
+            tmp_file.write(data)
+
+        self._write_blob(target, write)
+        return content_hash
+
+    def put_file(self, source: Union[str, Path]) -> str:
+        """
+        파일을 blob으로 복사해 저장합니다.
+
+        원본에 하드링크하지 않으므로 원본 파일이 나중에 수정되어도 blob 내용(=해시)은 바뀌지 않습니다.
+
+        Returns:
+            str: 콘텐츠 해시
+        """
+        content_hash = self.hash_file(source)
+        target = self.blob_path(content_hash)
+        if target.is_file():
+            self._deduplicated += 1
+            return content_hash
+
+        def write(tmp_file):
+            with open(source, "rb") as src:
+                shutil.copyfileobj(src, tmp_file, _HASH_CHUNK_SIZE)
+
+        self._write_blob(target, write)
+        return content_hash
+
+    def _write_blob(self, target: Path, write) -> None:
+        """임시 파일에 쓴 뒤 rename하여 부분 기록된 blob이 노출되지 않도록 함"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, target)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def materialize(self, content_hash: str, dest_path: Union[str, Path]) -> str:
+        """
+        blob을 대상 경로에 배치합니다. 대상에 다른 파일이 있으면 unlink()로 교체합니다.
+
+        Returns:
+            str: "exists" (이미 같은 파일), "hardlink" 또는 "copy"
+        """
+        source = self.blob_path(content_hash)
+        dest_path = Path(dest_path)
+
+        if dest_path.exists():
+            try:
+                if os.path.samefile(source, dest_path):
+                    return "exists"
+            except OSError:
+                pass
+            self.unlink(dest_path)
+
+        try:
+            os.link(source, dest_path)
+            self._linked += 1
+            return "hardlink"
+        except OSError:
+            shutil.copy2(source, dest_path)
+            self._copied += 1
+            return "copy"
+
+    def store_bytes_at(self, data: bytes, dest_path: Union[str, Path], content_hash: Optional[str] = None) -> str:
+        """바이트를 blob으로 저장하고 대상 경로에 배치합니다. 콘텐츠 해시를 반환합니다."""
+        content_hash = self.put_bytes(data, content_hash)
+        try:
+            self.materialize(content_hash, dest_path)
+        except FileNotFoundError:
+            # 저장과 배치 사이에 GC가 참조 없는 blob을 지운 경우 다시 저장
+            self.put_bytes(data, content_hash)
+            self.materialize(content_hash, dest_path)
+        return content_hash
+
+    def store_file_at(self, source: Union[str, Path], dest_path: Union[str, Path]) -> str:
+        """파일을 blob으로 저장하고 대상 경로에 배치합니다. 콘텐츠 해시를 반환합니다."""
+        content_hash = self.put_file(source)
+        try:
+            self.materialize(content_hash, dest_path)
+        except FileNotFoundError:
+            self.put_file(source)
+            self.materialize(content_hash, dest_path)
+        return content_hash
+
+    def unlink(self, path: Union[str, Path]) -> bool:
+        """
+        배치된 파일(프로젝트 이미지)을 삭제하고, 그 파일이 blob의 마지막 참조였으면 blob도 삭제합니다.
+
+        Args:
+            path: 삭제할 파일 경로
+
+        Returns:
+            bool: blob까지 삭제했는지 여부
+
+        Raises:
+            OSError: 파일을 삭제할 수 없음
+        """
+        path = Path(path)
+        placed = path.stat()
+        content_hash = None
+        # 링크 수 2 = 이 파일 + blob (다른 프로젝트도 쓰고 있으면 3 이상)
+        if placed.st_nlink == 2:
+            try:
+                content_hash = self.hash_file(path)
+            except OSError:
+                pass
+        path.unlink()
+        if content_hash is None:
+            return False
+        return self._remove_unreferenced(self.blob_path(content_hash), placed)
+
+    def collect_garbage(self) -> Dict[str, int]:
+        """
+        어느 프로젝트에서도 링크하지 않는 blob을 삭제합니다.
+        (프로젝트 폴더가 통째로 삭제된 경우, 복사로 배치된 경우 등)
+
+        Returns:
+            Dict[str, int]: 삭제한 blob 수와 용량
+        """
+        removed = 0
+        freed = 0
+        if self.root.is_dir():
+            for blob in self.root.glob("*/*"):
+                if blob.name.startswith(".tmp_") or not is_content_hash(blob.name):
+                    continue
+                try:
+                    size = blob.stat().st_size
+                except OSError:
+                    continue
+                if self._remove_unreferenced(blob):
+                    removed += 1
+                    freed += size
+        if removed:
+            logger.info(f"🧹 참조 없는 blob 정리: {removed}개, {freed} bytes")
+        return {"removed": removed, "freed_bytes": freed}
+
+    def _remove_unreferenced(self, blob: Path, placed: Optional[os.stat_result] = None) -> bool:
+        """링크 수가 1인 blob 삭제 (placed가 있으면 같은 inode인 경우에만)"""
+        with self._lock:
+            try:
+                blob_stat = blob.stat()
+            except OSError:
+                return False
+            if blob_stat.st_nlink != 1:
+                return False
+            if placed is not None and (blob_stat.st_ino, blob_stat.st_dev) != (placed.st_ino, placed.st_dev):
+                return False
+            try:
+                blob.unlink()
+            except OSError as e:
+                logger.warning(f"⚠️ blob 삭제 실패 ({blob.name}): {str(e)}")
+                return False
+            self._collected += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """blob 수/용량 및 배치 통계"""
+        blob_count = 0
+        blob_bytes = 0
+        if self.root.exists():
+            for path in self.root.glob("*/*"):
+                if path.is_file() and not path.name.startswith(".tmp_"):
+                    blob_count += 1
+                    blob_bytes += path.stat().st_size
+        return {
+            "root": str(self.root),
+            "blobs": blob_count,
+            "blob_bytes": blob_bytes,
+            "hardlinked": self._linked,
+            "copied": self._copied,
+            "deduplicated": self._deduplicated,
+            "collected": self._collected
+        }
@@ -0,0 +1,396 @@
+"""업로드 디렉토리 이미지 파일명 인덱스 (파일명/상대 경로 조회를 디렉토리 순회 없이 처리)"""
+
+import os
+import bisect
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
+
+from .config import IMAGE_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+# refresh() 시 이 수보다 많이 바뀌면 개별 삽입 대신 정렬 목록을 다시 만듦
+_BULK_CHANGE_THRESHOLD = 1000
+
+
+class FileIndex:
+    """
+    업로드 디렉토리의 이미지 파일을 메모리에 색인합니다.
+
+    - 상대 경로 집합: 정확한 경로 조회
+    - 파일명 → 상대 경로 목록: 파일명 완전 일치 조회 (O(1))
+    - 정렬된 파일명 목록: 부분 일치 조회 (접두사는 bisect, 그 외는 메모리 내 탐색)
+    - 정렬된 상대 경로 목록: 이미지 목록 조회 (temp 디렉토리 제외, 매 호출마다 정렬하지 않음)
+    - 디렉토리별 mtime: refresh() 시 변경된 디렉토리만 다시 읽음
+
+    처음 조회할 때 한 번만 디렉토리를 순회하며, 이후에는 저장/업로드/삭제 시
+    add()/discard()로 갱신합니다. 숨김 디렉토리(.blobs 등)는 색인하지 않습니다.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.RLock()
+        self._built = False
+        self._paths = set()
+        self._by_name: Dict[str, List[str]] = {}
+        self._names: List[str] = []
+        self._listed: List[str] = []
+        # 상대 디렉토리 → (mtime_ns, 이미지 파일명 집합, 하위 디렉토리명 집합)
+        self._dirs: Dict[str, Tuple[int, Set[str], Set[str]]] = {}
+
+    # ------------------------------------------------------------------
+    # 구축/갱신
+    # ------------------------------------------------------------------
+
+    def build(self):
+        """업로드 디렉토리를 한 번 순회하여 인덱스를 다시 만듭니다."""
+        dirs: Dict[str, Tuple[int, Set[str], Set[str]]] = {}
+        self._scan_tree('', dirs)
+
+        paths = set()
+        for rel_dir, (_, files, _) in dirs.items():
+            paths.update(_join(rel_dir, file) for file in files)
+
+        with self._lock:
+            self._paths = paths
+            self._dirs = dirs
+            self._rebuild_lookups()
+            self._built = True
+        logger.info(f"🗂️ 파일명 인덱스 구축 완료: {len(paths)}개 이미지, {len(dirs)}개 디렉토리")
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        변경된 디렉토리만 다시 읽어 인덱스를 갱신합니다.
+
+        디렉토리 mtime은 항목이 추가/삭제/이름 변경될 때 바뀌므로, mtime이 그대로인
+        디렉토리는 건너뛰고 디렉토리 수만큼의 stat만 수행합니다.
+
+        Returns:
+            Dict[str, int]: 추가/삭제된 이미지 수와 다시 읽은 디렉토리 수
+        """
+        if not self._built:
+            self.build()
+            return {"added": len(self._paths), "removed": 0, "rescanned_dirs": len(self._dirs)}
+
+        added, removed, rescanned = [], [], 0
+        with self._lock:
+            known_dirs = list(self._dirs.items())
+
+        for rel_dir, (mtime_ns, files, subdirs) in known_dirs:
+            with self._lock:
+                if rel_dir not in self._dirs:
+                    continue  # 이미 상위 디렉토리와 함께 제거됨
+            try:
+                current_mtime = os.stat(self._abs(rel_dir)).st_mtime_ns
+            except OSError:
+                removed.extend(self._drop_tree(rel_dir))
+                continue
+            if current_mtime == mtime_ns:
+                continue
+
+            rescanned += 1
+            entry = self._read_dir(rel_dir)
+            if entry is None:
+                removed.extend(self._drop_tree(rel_dir))
+                continue
+            _, new_files, new_subdirs = entry
+            with self._lock:
+                self._dirs[rel_dir] = entry
+            added.extend(_join(rel_dir, name) for name in new_files - files)
+            removed.extend(_join(rel_dir, name) for name in files - new_files)
+
+            for name in subdirs - new_subdirs:
+                removed.extend(self._drop_tree(_join(rel_dir, name)))
+            for name in new_subdirs - subdirs:
+                new_dirs: Dict[str, Tuple[int, Set[str], Set[str]]] = {}
+                self._scan_tree(_join(rel_dir, name), new_dirs)
+                rescanned += len(new_dirs)
+                with self._lock:
+                    self._dirs.update(new_dirs)
+                for sub_dir, (_, sub_files, _) in new_dirs.items():
+                    added.extend(_join(sub_dir, file) for file in sub_files)
+
+        with self._lock:
+            if len(added) + len(removed) > _BULK_CHANGE_THRESHOLD:
+                # 대량 변경은 개별 삽입 대신 메모리에서 정렬 목록을 다시 만듦 (디스크 재순회 없음)
+                self._paths.difference_update(removed)
+                self._paths.update(added)
+                self._rebuild_lookups()
+            else:
+                for rel_path in removed:
+                    self._remove_path(rel_path)
+                for rel_path in added:
+                    self._insert_path(rel_path)
+
+        if added or removed:
+            logger.info(f"🔄 파일명 인덱스 갱신: +{len(added)} / -{len(removed)} (다시 읽은 디렉토리 {rescanned}개)")
+        return {"added": len(added), "removed": len(removed), "rescanned_dirs": rescanned}
+
+    def ensure_built(self):
+        """인덱스가 없으면 구축합니다."""
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    self.build()
+
+    def add(self, path: Union[str, Path]):
+        """
+        새로 저장된 이미지를 인덱스에 추가합니다.
+
+        Args:
+            path: 절대 경로 또는 업로드 디렉토리 기준 상대 경로
+        """
+        rel_path = self._relative(path)
+        if rel_path is None or not rel_path.lower().endswith(IMAGE_EXTENSIONS):
+            return
+
+        with self._lock:
+            if not self._built:
+                return
+            self._insert_path(rel_path)
+
+    def discard(self, path: Union[str, Path]):
+        """
+        삭제된 이미지를 인덱스에서 제거합니다.
+
+        Args:
+            path: 절대 경로 또는 업로드 디렉토리 기준 상대 경로
+        """
+        rel_path = self._relative(path)
+        if rel_path is None:
+            return
+
+        with self._lock:
+            self._remove_path(rel_path)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def contains(self, rel_path: str) -> bool:
+        """상대 경로가 인덱스에 있는지 확인"""
+        self.ensure_built()
+        return rel_path.replace(os.sep, '/') in self._paths
+
+    def find_by_name(self, name: str) -> Optional[Path]:
+        """파일명이 완전히 일치하는 이미지 경로 (없으면 None)"""
+        self.ensure_built()
+        with self._lock:
+            candidates = list(self._by_name.get(name, ()))
+        return self._first_existing(candidates)
+
+    def find_partial(self, name: str) -> Optional[Path]:
+        """
+        파일명에 name이 포함된 이미지 경로 (없으면 None)
+
+        name으로 시작하는 파일명을 먼저 bisect로 찾고, 없으면 메모리의 파일명 목록에서 찾습니다.
+        """
+        if not name:
+            return None
+        self.ensure_built()
+        with self._lock:
+            names = self._names
+            start = bisect.bisect_left(names, name)
+            matches = []
+            for candidate in names[start:start + 64]:
+                if not candidate.startswith(name):
+                    break
+                matches.append(candidate)
+            if not matches:
+                matches = [candidate for candidate in names if name in candidate]
+            candidates = [rel for candidate in matches for rel in self._by_name.get(candidate, ())]
+        return self._first_existing(candidates)
+
+    def listed_paths(self) -> List[str]:
+        """정렬된 이미지 상대 경로 목록 (temp 디렉토리 제외)"""
+        self.ensure_built()
+        with self._lock:
+            return list(self._listed)
+
+    def page(self, prefix: str = '', after: Optional[str] = None, limit: int = 500) -> Tuple[List[str], Optional[str]]:
+        """
+        정렬된 이미지 목록의 한 페이지를 반환합니다. (bisect로 시작 위치를 찾으므로 O(log n + limit))
+
+        Args:
+            prefix: 상대 경로 접두사 (예: "2024-01-01/", "2024-01-01/project/")
+            after: 이전 페이지의 마지막 경로 (이 경로 다음부터 반환)
+            limit: 페이지 크기
+
+        Returns:
+            (경로 목록, 다음 페이지 기준 경로 또는 None)
+        """
+        self.ensure_built()
+        with self._lock:
+            listed = self._listed
+            start = bisect.bisect_right(listed, after) if after else 0
+            start = max(start, bisect.bisect_left(listed, prefix))
+            end = bisect.bisect_left(listed, _prefix_upper(prefix)) if prefix else len(listed)
+            items = listed[start:min(start + limit, end)]
+            has_more = start + len(items) < end
+        return items, (items[-1] if has_more and items else None)
+
+    def count(self, prefix: str = '') -> int:
+        """접두사에 해당하는 이미지 수 (bisect 두 번으로 계산)"""
+        self.ensure_built()
+        with self._lock:
+            if not prefix:
+                return len(self._listed)
+            return bisect.bisect_left(self._listed, _prefix_upper(prefix)) - bisect.bisect_left(self._listed, prefix)
+
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 상태"""
+        with self._lock:
+            return {
+                "built": self._built,
+                "images": len(self._paths),
+                "listed_images": len(self._listed),
+                "unique_names": len(self._by_name),
+                "directories": len(self._dirs)
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _rebuild_lookups(self):
+        """_paths로부터 파일명/정렬 목록을 다시 만듭니다. (호출 측에서 잠금)"""
+        by_name: Dict[str, List[str]] = {}
+        for rel_path in sorted(self._paths):
+            by_name.setdefault(rel_path.rpartition('/')[2], []).append(rel_path)
+        self._by_name = by_name
+        self._names = sorted(by_name)
+        self._listed = sorted(path for path in self._paths if _is_listed(path))
+
+    def _insert_path(self, rel_path: str):
+        """경로 추가 (호출 측에서 잠금)"""
+        if rel_path in self._paths:
+            return
+        self._paths.add(rel_path)
+        rel_dir, _, name = rel_path.rpartition('/')
+        rel_paths = self._by_name.get(name)
+        if rel_paths is None:
+            self._by_name[name] = [rel_path]
+            bisect.insort(self._names, name)
+        else:
+            bisect.insort(rel_paths, rel_path)
+        if _is_listed(rel_path):
+            bisect.insort(self._listed, rel_path)
+        entry = self._dirs.get(rel_dir)
+        if entry is not None:
+            entry[1].add(name)
+
+    def _remove_path(self, rel_path: str):
+        """경로 제거 (호출 측에서 잠금)"""
+        if rel_path not in self._paths:
+            return
+        self._paths.discard(rel_path)
+        rel_dir, _, name = rel_path.rpartition('/')
+        rel_paths = self._by_name.get(name, [])
+        if rel_path in rel_paths:
+            rel_paths.remove(rel_path)
+        if not rel_paths:
+            self._by_name.pop(name, None)
+            _remove_sorted(self._names, name)
+        _remove_sorted(self._listed, rel_path)
+        entry = self._dirs.get(rel_dir)
+        if entry is not None:
+            entry[1].discard(name)
+
+    def _drop_tree(self, rel_dir: str) -> List[str]:
+        """삭제된 디렉토리와 하위 디렉토리를 추적 대상에서 제외하고, 포함되어 있던 이미지 경로를 반환합니다."""
+        removed = []
+        prefix = f"{rel_dir}/"
+        with self._lock:
+            for known in [d for d in self._dirs if d == rel_dir or d.startswith(prefix)]:
+                _, files, _ = self._dirs.pop(known)
+                removed.extend(_join(known, name) for name in files)
+        return removed
+
+    def _scan_tree(self, rel_dir: str, dirs: Dict[str, Tuple[int, Set[str], Set[str]]]):
+        """rel_dir 이하 모든 디렉토리를 읽어 dirs에 기록합니다."""
+        pending = [rel_dir]
+        while pending:
+            current = pending.pop()
+            entry = self._read_dir(current)
+            if entry is None:
+                continue
+            dirs[current] = entry
+            pending.extend(_join(current, name) for name in entry[2])
+
+    def _read_dir(self, rel_dir: str) -> Optional[Tuple[int, Set[str], Set[str]]]:
+        """디렉토리 하나를 읽어 (mtime_ns, 이미지 파일명 집합, 하위 디렉토리명 집합)을 반환합니다."""
+        path = self._abs(rel_dir)
+        files, subdirs = set(), set()
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.'):
+                            subdirs.add(entry.name)
+                    elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                        files.add(entry.name)
+        except OSError:
+            return None
+        return mtime_ns, files, subdirs
+
+    def _abs(self, rel_dir: str) -> str:
+        return os.path.join(str(self.root), rel_dir) if rel_dir else str(self.root)
+
+    def _relative(self, path: Union[str, Path]) -> Optional[str]:
+        path = Path(path)
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            if not path.is_absolute():
+                return path.as_posix()
+            try:
+                return path.resolve().relative_to(self.root.resolve()).as_posix()
+            except ValueError:
+                return None
+
+    def _first_existing(self, rel_paths: List[str]) -> Optional[Path]:
+        """외부에서 삭제된 파일은 인덱스에서 정리하고 존재하는 첫 경로를 반환합니다."""
+        for rel_path in rel_paths:
+            full_path = self.root / rel_path
+            if full_path.is_file():
+                return full_path
+            self.discard(rel_path)
+        return None
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _is_listed(rel_path: str) -> bool:
+    """이미지 목록에 포함할 경로인지 (temp 디렉토리의 이미지는 제외)"""
+    return "temp" not in rel_path.rpartition('/')[0]
+
+
+def _prefix_upper(prefix: str) -> str:
+    """prefix로 시작하는 모든 문자열보다 큰 가장 작은 문자열"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _remove_sorted(values: List[str], value: str):
+    position = bisect.bisect_left(values, value)
+    if position < len(values) and values[position] == value:
+        del values[position]
+
+
+_indexes: Dict[str, FileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_file_index(upload_dir: Union[str, Path]) -> FileIndex:
+    """업로드 디렉토리별 공유 파일명 인덱스"""
+    key = str(upload_dir)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = FileIndex(Path(upload_dir))
+            _indexes[key] = index
+        return index
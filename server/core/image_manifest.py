@@ -0,0 +1,129 @@
+"""프로젝트 이미지 크기 매니페스트 ({프로젝트명}_manifest.json)"""
+
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from .config import IMAGES_DIR_NAME, MANIFEST_FILE_SUFFIX
+from .image_probe import probe_image_file
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def manifest_path(project_dir: Union[str, Path]) -> Path:
+    """프로젝트의 매니페스트 파일 경로"""
+    project_dir = Path(project_dir)
+    return project_dir / f"{project_dir.name}{MANIFEST_FILE_SUFFIX}"
+
+
+class ImageManifest:
+    """
+    프로젝트 images 폴더의 이미지 크기 목록
+
+    - 항목: 파일명 → {"width", "height", "size", "mtime_ns"}
+    - 파일 크기/mtime이 항목과 같으면 이미지를 열지 않고 크기를 반환
+    - 항목이 없거나 바뀐 파일은 헤더만 읽어 크기를 확인하고 항목을 갱신 (save()로 기록)
+    """
+
+    def __init__(self, project_dir: Union[str, Path], entries: Optional[Dict[str, Dict[str, int]]] = None):
+        self.project_dir = Path(project_dir)
+        self.images_dir = self.project_dir / IMAGES_DIR_NAME
+        self.path = manifest_path(self.project_dir)
+        self._entries: Dict[str, Dict[str, int]] = entries or {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, project_dir: Union[str, Path]) -> "ImageManifest":
+        """매니페스트 파일을 읽습니다. (없거나 손상되었으면 빈 매니페스트)"""
+        manifest = cls(project_dir)
+        try:
+            with open(manifest.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+            if content.get("version") == MANIFEST_VERSION and isinstance(content.get("images"), dict):
+                manifest._entries = content["images"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"⚠️ 이미지 매니페스트를 읽을 수 없어 다시 만듭니다: {manifest.path} ({str(e)})")
+        return manifest
+
+    @property
+    def dirty(self) -> bool:
+        """저장되지 않은 변경이 있는지 여부"""
+        return self._dirty
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def dimensions(self, filename: str) -> Optional[Tuple[int, int]]:
+        """
+        이미지 크기를 반환합니다. 매니페스트 항목이 최신이면 그대로 사용하고, 아니면 헤더를 읽습니다.
+
+        Args:
+            filename: images 폴더 안의 파일명
+
+        Returns:
+            (width, height) 또는 None (파일이 없거나 헤더를 읽을 수 없음)
+        """
+        image_path = self.images_dir / filename
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+
+        entry = self._entries.get(filename)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["width"], entry["height"]
+
+        try:
+            header = probe_image_file(image_path)
+        except OSError:
+            return None
+        if header is None:
+            return None
+
+        with self._lock:
+            self._entries[filename] = {
+                "width": header.width, "height": header.height,
+                "size": stat.st_size, "mtime_ns": stat.st_mtime_ns
+            }
+            self._dirty = True
+        return header.width, header.height
+
+    def update(self, filenames: Iterable[str]) -> int:
+        """
+        주어진 파일들의 항목을 갱신합니다. (최신 항목은 건너뜀)
+
+        Returns:
+            int: 크기를 확인할 수 있었던 파일 수
+        """
+        return sum(1 for filename in filenames if self.dimensions(filename) is not None)
+
+    def save(self, force: bool = False):
+        """변경이 있으면 매니페스트를 기록합니다. (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            if not self._dirty and not force:
+                return
+            # 삭제된 이미지 항목 정리
+            entries = {name: entry for name, entry in self._entries.items() if (self.images_dir / name).exists()}
+            self._entries = entries
+            payload = json.dumps({"version": MANIFEST_VERSION, "images": entries}, separators=(",", ":"))
+            self._dirty = False
+
+        tmp_path = self.path.with_name(f".{self.path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ 이미지 매니페스트 저장 실패: {self.path} ({str(e)})")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
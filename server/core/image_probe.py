@@ -0,0 +1,253 @@
+"""이미지 헤더 검사 (디코딩 없이 포맷/크기 확인)"""
+
+import struct
+import zlib
+from pathlib import Path
+from typing import Optional, NamedTuple, Union
+
+from PIL import Image
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+PNG_IEND = b"\x00\x00\x00\x00IEND\xaeB`\x82"
+BMP_SIGNATURE = b"BM"
+GIF_SIGNATURES = (b"GIF87a", b"GIF89a")
+GIF_TRAILER = b"\x3b"
+
+# 헤더 파서가 읽는 최대 크기 - JPEG 헤더(EXIF/ICC/XMP 포함)가 이 안에 SOF를 포함하지 않으면
+# PIL로 헤더만 열어 확인 (probe_with_decoder)
+MAX_HEADER_BYTES = 512 * 1024
+
+# 파일에서 헤더를 읽을 때 처음 읽는 크기 (대부분의 JPEG는 이 안에 SOF가 있음)
+_FILE_PROBE_INITIAL_BYTES = 16 * 1024
+
+# SOF 마커 (DHT=C4, JPG=C8, DAC=CC 제외)
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# 길이 필드가 없는 독립 마커
+_JPEG_STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+# 헤더 뒤 어디에 있어도 되는 종료 표식
+_END_MARKERS = {"jpeg": JPEG_EOI, "png": PNG_IEND}
+# PIL 포맷 이름 → ImageHeader.format
+_DECODER_FORMATS = {"JPEG": "jpeg", "MPO": "jpeg", "PNG": "png", "GIF": "gif", "BMP": "bmp"}
+
+
+class ImageHeader(NamedTuple):
+    """헤더에서 읽은 이미지 정보"""
+    format: str   # "jpeg", "png", "bmp", "gif"
+    width: int
+    height: int
+    data_offset: int = 0  # 헤더 다음 바이트 위치 (종료 표식 검사 시작점)
+
+
+class NeedMoreData(Exception):
+    """헤더를 판정하려면 더 많은 바이트가 필요함"""
+
+
+def probe_image_header(data: bytes) -> Optional[ImageHeader]:
+    """
+    이미지 앞부분 바이트에서 포맷과 크기를 읽습니다.
+
+    Args:
+        data: 파일 앞부분 바이트
+
+    Returns:
+        ImageHeader 또는 None (지원하지 않거나 손상된 헤더)
+
+    Raises:
+        NeedMoreData: 판정하기에 바이트가 부족함 (스트리밍 시 더 읽은 뒤 다시 호출,
+                      MAX_HEADER_BYTES를 넘으면 probe_with_decoder로 확인)
+    """
+    if data.startswith(PNG_SIGNATURE):
+        return _probe_png(data)
+    if data.startswith(JPEG_SOI):
+        return _probe_jpeg(data)
+    if data.startswith(GIF_SIGNATURES):
+        return _probe_gif(data)
+    if data.startswith(BMP_SIGNATURE):
+        return _probe_bmp(data)
+    if len(data) < len(PNG_SIGNATURE) and (
+        PNG_SIGNATURE.startswith(data) or JPEG_SOI.startswith(data[:2])
+        or BMP_SIGNATURE.startswith(data[:2]) or any(sig.startswith(data) for sig in GIF_SIGNATURES)
+    ):
+        raise NeedMoreData()
+    return None
+
+
+def probe_image_file(path: Union[str, Path]) -> Optional[ImageHeader]:
+    """
+    파일 앞부분만 읽어 이미지 포맷과 크기를 확인합니다. (디코더를 만들지 않음)
+
+    Args:
+        path: 이미지 파일 경로
+
+    Returns:
+        ImageHeader 또는 None (지원하지 않거나 손상된 헤더)
+
+    Raises:
+        OSError: 파일을 읽을 수 없음
+    """
+    read_size = _FILE_PROBE_INITIAL_BYTES
+    with open(path, "rb") as f:
+        data = f.read(read_size)
+        while True:
+            try:
+                return probe_image_header(data)
+            except NeedMoreData:
+                if len(data) >= MAX_HEADER_BYTES:
+                    break
+                more = f.read(min(read_size, MAX_HEADER_BYTES - len(data)))
+                if not more:
+                    return None  # 헤더가 끝나기 전에 파일이 끝남
+                data += more
+                read_size *= 2
+    return probe_with_decoder(path)
+
+
+def probe_with_decoder(path: Union[str, Path]) -> Optional[ImageHeader]:
+    """
+    헤더가 MAX_HEADER_BYTES를 넘는 파일(큰 APP 세그먼트 등)의 포맷과 크기를 PIL로 확인합니다.
+    (Image.open은 헤더만 읽고 픽셀은 디코딩하지 않음)
+
+    Args:
+        path: 이미지 파일 경로
+
+    Returns:
+        ImageHeader 또는 None (PIL이 열 수 없거나 지원하지 않는 포맷)
+    """
+    try:
+        with Image.open(path) as img:
+            image_format = _DECODER_FORMATS.get(img.format or "")
+            width, height = img.size
+    except Exception:
+        return None
+    if image_format is None or width == 0 or height == 0:
+        return None
+    return ImageHeader(image_format, width, height)
+
+
+class TrailerScanner:
+    """
+    스트리밍 중인 파일에 포맷의 종료 표식이 있는지 확인합니다. (잘린 업로드 검출)
+
+    - JPEG EOI / PNG IEND: 헤더 뒤 어디에 있어도 허용
+      (EOI 뒤에 MPF 보조 이미지나 패딩이 붙은 JPEG, IEND 뒤에 데이터가 붙은 PNG)
+    - GIF: 파일 마지막 16바이트 안에 트레일러가 있어야 함
+    - BMP: 종료 표식 없음 (항상 유효)
+
+    사용 예:
+        scanner = TrailerScanner(header.format)
+        scanner.feed(data[header.data_offset:])
+        ...
+        if not scanner.valid: ...
+    """
+
+    def __init__(self, image_format: str):
+        self.format = image_format
+        self._marker = _END_MARKERS.get(image_format)
+        self._found = False
+        self._carry = b""
+        self._tail = b""
+
+    def feed(self, data: bytes):
+        """헤더 뒤의 바이트를 순서대로 전달합니다."""
+        if not data:
+            return
+        self._tail = (self._tail + data[-16:])[-16:]
+        if self._marker is None or self._found:
+            return
+        # 청크 경계에 걸친 표식은 이전 청크 끝부분과 이어 붙여 확인
+        keep = len(self._marker) - 1
+        if self._marker in data or self._marker in self._carry + data[:keep]:
+            self._found = True
+            self._carry = b""
+        else:
+            self._carry = (self._carry + data[-keep:])[-keep:]
+
+    @property
+    def valid(self) -> bool:
+        if self._marker is not None:
+            return self._found
+        if self.format == "gif":
+            return GIF_TRAILER in self._tail
+        return True
+
+
+def _probe_png(data: bytes) -> Optional[ImageHeader]:
+    # 시그니처(8) + 길이(4) + "IHDR"(4) + 데이터(13) + CRC(4)
+    if len(data) < 33:
+        raise NeedMoreData()
+    length, chunk_type = struct.unpack(">I4s", data[8:16])
+    if chunk_type != b"IHDR" or length != 13:
+        return None
+    ihdr = data[16:29]
+    (crc,) = struct.unpack(">I", data[29:33])
+    if zlib.crc32(b"IHDR" + ihdr) & 0xFFFFFFFF != crc:
+        return None
+    width, height = struct.unpack(">II", ihdr[:8])
+    if width == 0 or height == 0:
+        return None
+    return ImageHeader("png", width, height, 33)
+
+
+def _probe_jpeg(data: bytes) -> Optional[ImageHeader]:
+    position = 2
+    size = len(data)
+    while True:
+        # 마커 앞의 0xFF 채움 바이트 건너뛰기
+        while position < size and data[position] == 0xFF and position + 1 < size and data[position + 1] == 0xFF:
+            position += 1
+        if position + 2 > size:
+            break
+        if data[position] != 0xFF:
+            return None
+        marker = data[position + 1]
+        position += 2
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+        if marker in (0xD9, 0xDA):
+            return None  # SOF 이전에 EOI/SOS
+        if position + 2 > size:
+            break
+        (segment_length,) = struct.unpack(">H", data[position:position + 2])
+        if segment_length < 2:
+            return None
+        if marker in _JPEG_SOF_MARKERS:
+            if position + 7 > size:
+                break
+            height, width = struct.unpack(">HH", data[position + 3:position + 7])
+            if width == 0 or height == 0:
+                return None
+            return ImageHeader("jpeg", width, height, position + segment_length)
+        position += segment_length
+
+    raise NeedMoreData()
+
+
+def _probe_gif(data: bytes) -> Optional[ImageHeader]:
+    # 시그니처(6) + 논리 화면 너비/높이 (리틀 엔디언 2바이트씩)
+    if len(data) < 10:
+        raise NeedMoreData()
+    width, height = struct.unpack("<HH", data[6:10])
+    if width == 0 or height == 0:
+        return None
+    return ImageHeader("gif", width, height, 10)
+
+
+def _probe_bmp(data: bytes) -> Optional[ImageHeader]:
+    # 파일 헤더(14) + DIB 헤더 크기(4) + 너비/높이
+    if len(data) < 26:
+        raise NeedMoreData()
+    (dib_size,) = struct.unpack("<I", data[14:18])
+    if dib_size == 12:
+        # BITMAPCOREHEADER: 부호 없는 16비트 너비/높이
+        width, height = struct.unpack("<HH", data[18:22])
+    elif dib_size >= 40:
+        # BITMAPINFOHEADER 이상: 부호 있는 32비트 (높이가 음수면 위에서 아래로 저장된 이미지)
+        width, height = struct.unpack("<ii", data[18:26])
+        height = abs(height)
+    else:
+        return None
+    if width <= 0 or height == 0:
+        return None
+    return ImageHeader("bmp", width, height, 26)
@@ -0,0 +1,58 @@
+"""블로킹 파일 I/O를 이벤트 루프 밖에서 실행하는 제한된 스레드 풀"""
+
+import asyncio
+import logging
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IOPool:
+    """
+    프로젝트 API의 디스크 작업(open/iterdir/glob/copy/remove)을 실행하는 스레드 풀
+
+    - async 핸들러에서 await run()/run_write()로 호출하면 작업이 끝날 때까지
+      이벤트 루프는 다른 요청(이미지/썸네일 제공 등)을 계속 처리
+    - 전체 동시 작업 수는 workers로 제한
+    - 대량 쓰기(프로젝트 저장/삭제)는 write_concurrency개까지만 동시에 실행하여
+      저장이 몰려도 읽기 작업용 워커가 남도록 함
+    - contextvars를 복사해서 실행하므로 요청 단위 컨텍스트가 워커 스레드에서도 유지됨
+    """
+
+    def __init__(self, workers: int, write_concurrency: int):
+        self.workers = max(1, workers)
+        self.write_concurrency = max(1, min(write_concurrency, self.workers))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="project-io")
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        self._write_slots: Optional[asyncio.Semaphore] = None
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        블로킹 함수를 풀에서 실행하고 결과를 기다립니다. (예외는 그대로 전달)
+
+        Args:
+            func: 실행할 동기 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    async def run_write(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """쓰기 작업용 run() - 동시에 write_concurrency개까지만 실행하고 나머지는 대기"""
+        if self._write_slots is None:
+            self._write_slots = asyncio.Semaphore(self.write_concurrency)
+        async with self._write_slots:
+            return await self.run(func, *args, **kwargs)
+
+    def close(self):
+        """진행 중인 작업을 마친 뒤 풀 종료"""
+        self._executor.shutdown(wait=True)
+        logger.info("🧹 프로젝트 I/O 풀 종료")
@@ -0,0 +1,293 @@
+"""서버 런타임 지표 (요청 지연 히스토그램, 이벤트 루프 지연, 모델별 처리 수) - Prometheus 텍스트 형식"""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 요청 지연 구간 (초) - 썸네일/정적 파일(ms)부터 배치 추론(수십 초)까지
+REQUEST_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 요청 처리 단계(span) 구간 (초) - core/tracing.py
+STAGE_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 이벤트 루프 지연 구간 (초)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# 라우트에 매칭되지 않은 요청의 라벨 (경로를 그대로 쓰면 라벨 수가 끝없이 늘어남)
+UNMATCHED_ROUTE = "<unmatched>"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple((name, str(value)) for name, value in labels.items())
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Histogram:
+    """누적 구간 히스토그램 (라벨 조합 하나)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 지표 저장소
+
+    - counter: 누적 값 (inc)
+    - gauge: 현재 값 (set/inc, 또는 render() 시점에 콜백으로 계산)
+    - histogram: 구간별 누적 개수 + 합계
+    - render(): Prometheus 텍스트 노출 형식 (text/plain; version=0.0.4)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 이름 → (종류, 설명)
+        self._meta: Dict[str, Tuple[str, str]] = {}
+        self._values: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._histogram_buckets: Dict[str, Tuple[float, ...]] = {}
+        self._callbacks: Dict[str, Callable[[], Any]] = {}
+
+    # ------------------------------------------------------------------
+    # 등록
+    # ------------------------------------------------------------------
+
+    def counter(self, name: str, help_text: str):
+        self._declare(name, "counter", help_text)
+
+    def gauge(self, name: str, help_text: str, callback: Optional[Callable[[], Any]] = None):
+        """
+        게이지 등록
+
+        Args:
+            callback: render() 때마다 호출해 값을 얻는 함수
+                      (숫자 또는 [(라벨 dict, 값), ...] 목록)
+        """
+        self._declare(name, "gauge", help_text)
+        if callback is not None:
+            self._callbacks[name] = callback
+
+    def histogram(self, name: str, help_text: str, buckets: Tuple[float, ...]):
+        self._declare(name, "histogram", help_text)
+        self._histogram_buckets[name] = tuple(sorted(buckets))
+
+    def _declare(self, name: str, kind: str, help_text: str):
+        with self._lock:
+            self._meta.setdefault(name, (kind, help_text))
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        """counter/gauge 값 증가 (gauge는 음수로 감소)"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._values.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def set(self, name: str, value: float, **labels):
+        """gauge 값 설정"""
+        with self._lock:
+            self._values.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """histogram 관측값 추가"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self._histogram_buckets[name])
+            histogram.observe(value)
+
+    # ------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------
+
+    def render(self) -> str:
+        """모든 지표를 Prometheus 텍스트 형식으로 변환합니다."""
+        callback_values = {}
+        for name, callback in list(self._callbacks.items()):
+            try:
+                callback_values[name] = callback()
+            except Exception as e:
+                logger.warning(f"⚠️ 지표 콜백 실패 ({name}): {str(e)}")
+
+        lines: List[str] = []
+        with self._lock:
+            for name, (kind, help_text) in self._meta.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == "histogram":
+                    for key, histogram in self._histograms.get(name, {}).items():
+                        cumulative = 0
+                        for bound, count in zip(histogram.buckets, histogram.counts):
+                            cumulative += count
+                            lines.append(f"{name}_bucket{_format_labels(key, ('le', _format_value(float(bound))))} {cumulative}")
+                        lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {histogram.count}")
+                        lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                        lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+                    continue
+
+                series = dict(self._values.get(name, {}))
+                if name in callback_values:
+                    value = callback_values[name]
+                    if isinstance(value, (list, tuple)):
+                        for labels, item in value:
+                            series[_label_key(labels)] = item
+                    elif value is not None:
+                        series[()] = value
+                for key, value in series.items():
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 라우트별 지연 시간/상태 코드와 진행 중 요청 수를 기록하는 ASGI 미들웨어
+
+    라우트 라벨은 경로 템플릿 (예: /files/{filename:path})을 사용하여
+    파일명마다 새 라벨이 생기지 않도록 합니다. 라우트는 앱이 요청을 처리한 뒤
+    라우터가 scope["route"]에 남긴 값으로 정하므로 include_router로 추가한 라우트도 구분됩니다.
+    (진행 중 요청 수는 라우팅 전에 세므로 메서드별로만 기록)
+    """
+
+    def __init__(self, app, registry: Optional[MetricsRegistry] = None):
+        self.app = app
+        self.registry = registry or get_metrics()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        status_holder = {"status": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder["status"] = message["status"]
+            await send(message)
+
+        registry = self.registry
+        registry.inc("autolabel_http_requests_in_flight", 1, method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = _route_template(scope)
+            registry.inc("autolabel_http_requests_in_flight", -1, method=method)
+            registry.observe("autolabel_http_request_duration_seconds", elapsed, method=method, route=route)
+            registry.inc("autolabel_http_requests_total", 1, method=method, route=route,
+                         status=status_holder["status"])
+
+
+def _route_template(scope) -> str:
+    """라우터가 요청에 매칭한 라우트의 경로 템플릿 (매칭된 라우트가 없으면 UNMATCHED_ROUTE)"""
+    return getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연 측정
+
+    interval마다 asyncio.sleep()을 걸고 실제로 깨어난 시각과의 차이를 기록합니다.
+    (블로킹 코드가 루프를 붙잡고 있으면 그만큼 늦게 깨어남)
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, interval: float = 0.5):
+        self.registry = registry or get_metrics()
+        self.interval = max(0.01, interval)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """현재 이벤트 루프에서 측정 시작 (lifespan 시작 시 호출)"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"⏱️ 이벤트 루프 지연 측정 시작 (간격 {self.interval}초)")
+
+    async def stop(self):
+        """측정 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.registry.observe("autolabel_event_loop_lag_seconds", lag)
+            self.registry.set("autolabel_event_loop_lag_last_seconds", lag)
+
+
+def record_images_processed(model: str, count: int = 1):
+    """모델별 처리 이미지 수 증가 (결과 캐시 적중 포함)"""
+    if count > 0:
+        get_metrics().inc("autolabel_images_processed_total", count, model=model or "unknown")
+
+
+def _register_defaults(registry: MetricsRegistry):
+    registry.counter("autolabel_http_requests_total", "HTTP 요청 수 (메서드/라우트/상태 코드별)")
+    registry.histogram("autolabel_http_request_duration_seconds", "HTTP 요청 처리 시간 (초)", REQUEST_LATENCY_BUCKETS)
+    registry.gauge("autolabel_http_requests_in_flight", "처리 중인 HTTP 요청 수 (메서드별)")
+    registry.histogram("autolabel_event_loop_lag_seconds", "이벤트 루프 지연 (초)", LOOP_LAG_BUCKETS)
+    registry.gauge("autolabel_event_loop_lag_last_seconds", "마지막으로 측정한 이벤트 루프 지연 (초)")
+    registry.counter("autolabel_images_processed_total", "모델별 처리 이미지 수")
+    registry.histogram("autolabel_stage_duration_seconds", "요청 처리 단계별 시간 (초)", STAGE_LATENCY_BUCKETS)
+
+
+_metrics: Optional[MetricsRegistry] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """프로세스 전역 지표 저장소"""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                registry = MetricsRegistry()
+                _register_defaults(registry)
+                _metrics = registry
+    return _metrics
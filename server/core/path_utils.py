@@ -11,6 +11,7 @@ from .config import (
     IMAGE_EXTENSIONS, UNSAFE_PATH_PREFIXES,
     IMAGES_DIR_NAME, LABELS_DIR_NAME, DEFAULT_PROJECT_NAME
 )
+from .file_index import get_file_index
 
 logger = logging.getLogger(__name__)
 
@@ -113,22 +114,18 @@ def find_image_paths(
                     logger.debug(f"images 디렉토리 추가하여 이미지 찾음: {try_path}")
                     return try_path
     
-            # 4. 전체 폴더 검색 (파일 이름으로)
-    for root, _, files in os.walk(upload_dir):
-        for file in files:
-            # 완전 일치
-            if file == base_name:
-                found_path = Path(os.path.join(root, file))
-                logger.debug(f"전체 검색으로 이미지 찾음: {found_path}")
-                return found_path
+    # 4. 파일명 인덱스 검색 (완전 일치)
+    index = get_file_index(upload_dir)
+    found_path = index.find_by_name(base_name)
+    if found_path:
+        logger.debug(f"파일명 인덱스로 이미지 찾음: {found_path}")
+        return found_path
     
     # 5. 부분 일치로 검색
-    for root, _, files in os.walk(upload_dir):
-        for file in files:
-            if base_name in file and file.lower().endswith(IMAGE_EXTENSIONS):
-                found_path = Path(os.path.join(root, file))
-                logger.debug(f"부분 일치 검색으로 이미지 찾음: {found_path}")
-                return found_path
+    found_path = index.find_partial(base_name)
+    if found_path:
+        logger.debug(f"부분 일치 검색으로 이미지 찾음: {found_path}")
+        return found_path
     
     # 이미지를 찾지 못함
     logger.error(f"이미지를 찾을 수 없음: {filename}")
@@ -0,0 +1,128 @@
+"""요청 단위 단계별 처리 시간 측정 (contextvars 기반 span) - Server-Timing 헤더/지표로 노출"""
+
+import time
+import logging
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from .metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# 자동 라벨링 요청의 주요 단계 (span 이름)
+STAGE_UPLOAD_READ = "upload_read"    # 업로드 본문 읽기 / 해시 참조 이미지 조회
+STAGE_DECODE = "decode"              # 이미지 디코딩 (cv2/PIL)
+STAGE_PREPROCESS = "preprocess"      # 모델 입력 변환 (색상 모드, 리사이즈, processor)
+STAGE_FORWARD = "forward"            # 모델 추론
+STAGE_POSTPROCESS = "postprocess"    # 추론 결과 → 박스 목록
+STAGE_ENCODE = "encode"              # 결과 이미지 base64 인코딩
+
+_current_trace: contextvars.ContextVar[Optional["RequestTrace"]] = contextvars.ContextVar(
+    "autolabel_request_trace", default=None
+)
+
+
+class RequestTrace:
+    """
+    요청 하나의 단계별 누적 시간
+
+    같은 이름의 span이 여러 번 기록되면 합산합니다. (배치/타일 추론의 forward 등)
+    기록 순서를 유지하므로 Server-Timing 헤더도 처리 순서대로 나옵니다.
+    """
+
+    __slots__ = ("started", "_durations")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._durations: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float):
+        self._durations[stage] = self._durations.get(stage, 0.0) + seconds
+
+    def __bool__(self) -> bool:
+        return bool(self._durations)
+
+    def timings_ms(self) -> Dict[str, float]:
+        """단계별 시간 (ms, 소수점 3자리) - 응답의 timings 필드용"""
+        return {stage: round(seconds * 1000, 3) for stage, seconds in self._durations.items()}
+
+    def server_timing(self) -> str:
+        """
+        Server-Timing 헤더 값
+
+        예: "upload_read;dur=1.204, decode;dur=8.310, forward;dur=41.027, total;dur=63.5"
+        """
+        entries = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in self._durations.items()]
+        entries.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.3f}")
+        return ", ".join(entries)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """현재 요청의 trace (요청 밖에서 호출되면 None)"""
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_request() -> Iterator[RequestTrace]:
+    """현재 컨텍스트에 새 trace를 설정합니다. (TracingMiddleware가 요청마다 사용)"""
+    trace = RequestTrace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def record_span(stage: str, seconds: float):
+    """
+    측정한 시간을 현재 trace와 단계별 지표(autolabel_stage_duration_seconds)에 기록합니다.
+    trace가 없으면 (백그라운드 작업 등) 지표에만 기록합니다.
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(stage, seconds)
+    get_metrics().observe("autolabel_stage_duration_seconds", seconds, stage=stage)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """
+    with 블록의 실행 시간을 stage 이름으로 기록합니다. (예외가 나도 기록)
+
+    사용 예:
+        with span(STAGE_FORWARD):
+            results = self.model.predict(...)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(stage, time.perf_counter() - start)
+
+
+class TracingMiddleware:
+    """
+    요청마다 trace를 만들고 응답 헤더에 Server-Timing을 붙이는 ASGI 미들웨어
+
+    핸들러(및 그 안에서 호출한 ModelManager/BaseModel 매니저)가 기록한 span이
+    응답 시작 시점에 헤더로 나갑니다. span이 하나도 없는 요청에는 헤더를 붙이지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with trace_request() as trace:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start" and trace:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -3,6 +3,7 @@
 """
 import logging
 from pathlib import Path
+from typing import Optional
 
 from .config import IMAGES_DIR_NAME, LABELS_DIR_NAME, INFO_FILE_SUFFIX
 from .path_utils import scan_image_files
@@ -19,6 +20,8 @@ def cleanup_memory_images_info():
     - 프로젝트 저장 완료 후
     - 서버 재시작 시 (메모리 초기화)
     - ImageManager.clear_memory_images() 호출 시
+    - 메모리 예산 초과 시 (LRU 순서로 디스크 스필 또는 제거)
+    - TTL 동안 사용되지 않은 경우
     
     Returns:
         정보성 메시지 (실제 정리 작업은 ImageManager에서 수행)
@@ -100,6 +103,29 @@ def is_valid_project_structure(project_dir: Path) -> bool:
         logger.error(f"프로젝트 구조 검증 오류: {str(e)}")
         return False
 
+def find_project_info_file(project_dir: Path) -> Optional[Path]:
+    """
+    프로젝트 정보 파일을 찾습니다.
+
+    {프로젝트명}_info.json을 우선 사용하고, 없으면 다른 *_info.json 중 이름순 첫 번째,
+    그것도 없으면 info.json을 사용합니다. (프로젝트 목록과 불러오기가 같은 파일을 읽도록)
+
+    Args:
+        project_dir: 프로젝트 디렉토리 경로
+
+    Returns:
+        정보 파일 경로 (없으면 None)
+    """
+    project_dir = Path(project_dir)
+    preferred = project_dir / f"{project_dir.name}{INFO_FILE_SUFFIX}"
+    if preferred.is_file():
+        return preferred
+    info_files = sorted(path for path in project_dir.glob(f"*{INFO_FILE_SUFFIX}") if path.is_file())
+    if info_files:
+        return info_files[0]
+    info_json = project_dir / "info.json"
+    return info_json if info_json.is_file() else None
+
 # is_upload_dir_restricted_path 함수는 path_utils.py로 이동됨
 
 def safe_mkdir(path, upload_dir):
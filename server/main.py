@@ -1,12 +1,12 @@
 # FastAPI 관련 임포트
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Query
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, Response
 
 # 표준 라이브러리 임포트
 import os
-import re
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -19,17 +19,37 @@ from PIL import Image
 # 로컬 모듈 임포트
 from managers import model_utils, image_utils
 from managers.pipeline_manager import PipelineManager
+from managers.base_model import TaskType
 from managers.model_factory import ModelFactory
+from managers.inference_profiles import get_profile, list_profiles, run_profile_check, comparison_boxes
+from managers.result_cache import get_result_cache
 from core.config import (
     API_TAGS_METADATA, get_upload_dir, get_model_dir,
-    get_vue_dist_dir
+    get_vue_dist_dir, get_thumbnail_settings, get_project_catalog_path, get_io_pool_settings,
+    get_metrics_settings
 )
+from core.io_pool import IOPool
+from core.content_store import is_content_hash
+from core.metrics import MetricsMiddleware, LoopLagMonitor, get_metrics
+from core.tracing import TracingMiddleware, current_trace, record_span, STAGE_UPLOAD_READ, STAGE_DECODE, STAGE_ENCODE
 
 # 라우터 임포트
+from api import images
 from api.images import router as images_router
 
 # 서비스 임포트
 from services.project_service import ProjectService
+from services.thumbnail_service import ThumbnailService
+from services.project_catalog import ProjectCatalog, collect_box_confidences
+from services.project_loader import ProjectLoader
+
+# 유틸리티 임포트
+from utils.result_format import validate_result_format, encode_boxes, RESULT_FORMAT_COLUMNAR
+from utils.serialization import FastJSONResponse, negotiated_response
+from utils.http_cache import (
+    conditional_file_response, conditional_bytes_response, not_modified_response,
+    content_etag, guess_image_media_type
+)
 
 # 필요한 클래스 가져오기
 ModelManager = model_utils.ModelManager
@@ -81,6 +101,8 @@ ensure_directories()
 
 # 전역 파이프라인 매니저
 pipeline_manager = PipelineManager()
+metrics = get_metrics()
+loop_lag_monitor = LoopLagMonitor(metrics, interval=get_metrics_settings()["loop_lag_interval"])
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -89,12 +111,25 @@ async def lifespan(app: FastAPI):
     logger.info("서버 시작됨")
     logger.info("메모리 기반 이미지 시스템 사용 중")
     logger.info("🚀 멀티모델 파이프라인 시스템 초기화 완료")
+    loop_lag_monitor.start()
+    # 서버가 꺼져 있는 동안 삭제된 프로젝트/이미지의 blob 정리 (백그라운드)
+    blob_gc = asyncio.create_task(io_pool.run(image_manager.content_store.collect_garbage))
 
     yield  # 서버 실행 중
 
     # 서버 종료 시 실행되는 코드
+    await loop_lag_monitor.stop()
+    try:
+        await blob_gc
+    except Exception as e:
+        logger.warning(f"⚠️ blob 정리 실패: {str(e)}")
     logger.info("🗑️ 파이프라인 매니저 정리 중...")
     pipeline_manager.clear_all_models()
+    image_manager.memory_images.close()
+    thumbnail_service.close()
+    project_catalog.close()
+    project_loader.close()
+    io_pool.close()
     logger.info("서버 종료됨")
 
 app = FastAPI(
@@ -102,6 +137,7 @@ app = FastAPI(
     description="API for Iljoo AutoLabeling",
     version="1.0.0",
     openapi_tags=API_TAGS_METADATA,
+    default_response_class=FastJSONResponse,
     lifespan=lifespan
 )
 
@@ -113,6 +149,10 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"]
 )
+# 요청 단계별 처리 시간 (Server-Timing 헤더)
+app.add_middleware(TracingMiddleware)
+# 라우트별 지연 시간/진행 중 요청 수 기록 (/metrics)
+app.add_middleware(MetricsMiddleware, registry=metrics)
 
 # 캐시 제어를 위한 커스텀 StaticFiles 클래스
 class NoCacheStaticFiles(StaticFiles):
@@ -179,12 +219,34 @@ image_manager = ImageManager(UPLOAD_DIR)
 
 # 서비스 객체 생성
 project_service = ProjectService(UPLOAD_DIR, image_manager, model_manager)
+thumbnail_service = ThumbnailService(image_manager, **get_thumbnail_settings())
+# 프로젝트 폴더가 삭제되면 더 이상 링크되지 않은 이미지 blob 정리
+project_catalog = ProjectCatalog(
+    UPLOAD_DIR, get_project_catalog_path(),
+    on_projects_removed=lambda paths: image_manager.content_store.collect_garbage()
+)
+# 프로젝트 API의 디스크 작업은 이벤트 루프 밖의 제한된 풀에서 실행
+io_pool = IOPool(**get_io_pool_settings())
+project_loader = ProjectLoader(UPLOAD_DIR, model_manager)
 
 # 초기화 작업
 image_manager.load_existing_images()
 
-# 라우터에 의존성 설정은 images 모듈이 필요한 경우에만 사용
-# images.set_dependencies(image_manager)  # 제거: 사용되지 않음
+# 런타임 지표 게이지 (/metrics 조회 시점의 값)
+def _memory_image_bytes():
+    stats = image_manager.memory_images.stats()
+    return [({"tier": "memory"}, stats["memory_bytes"]), ({"tier": "spill"}, stats["spilled_bytes"])]
+
+metrics.gauge(
+    "autolabel_memory_image_bytes", "메모리 이미지 저장소 사용량 (바이트, tier=memory/spill)", _memory_image_bytes
+)
+metrics.gauge(
+    "autolabel_loaded_models", "로드된 모델 수 (YOLO 단일 모델 + 파이프라인 작업별 모델)",
+    lambda: (1 if model_manager.model is not None else 0) + len(pipeline_manager.models)
+)
+
+# 라우터에 의존성 설정 (/upload/, /api/images 등에서 image_manager 사용)
+images.set_dependencies(image_manager)
 
 # 라우터 포함 - 이미지 관련 엔드포인트들을 별도 라우터로 분리
 app.include_router(images_router, prefix="")
@@ -203,6 +265,18 @@ async def root():
         return response
     return {"message": "Welcome to the Iljoo AutoLabeling API"}
 
+@app.get("/metrics", tags=["Root"])
+async def get_runtime_metrics():
+    """런타임 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+def _with_timings(result: Dict[str, Any], include_timings: bool) -> Dict[str, Any]:
+    """include_timings 요청 시 단계별 처리 시간(ms)을 timings 필드로 추가"""
+    trace = current_trace()
+    if include_timings and trace is not None:
+        result["timings"] = trace.timings_ms()
+    return result
+
 @app.get("/models/", tags=["Models"])
 async def get_models():
     """사용 가능한 모델 목록을 반환합니다."""
@@ -309,11 +383,84 @@ async def get_model_types():
         logger.error(f"모델 타입 목록 조회 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/models/profiles", tags=["Models"])
+async def get_inference_profiles():
+    """모델 로드 시 선택 가능한 추론 프로파일 목록을 반환합니다."""
+    return {"profiles": list_profiles()}
+
+@app.post("/models/profile-check", tags=["Models"])
+async def check_inference_profile(data: Dict[str, Any]):
+    """
+    추론 프로파일 결과를 fp32 기준(accurate)과 비교합니다.
+
+    샘플 이미지에 대해 두 프로파일로 추론하여 박스 일치도(recall/precision, IoU)와
+    지연 시간 비교를 반환합니다. task가 없으면 메인 YOLO 모델을 사용합니다.
+    """
+    try:
+        filenames = data.get("filenames") or []
+        profile_name = data.get("profile", "fast")
+        task_name = data.get("task")
+        confidence = float(data.get("confidence_threshold", 0.5))
+        iou_threshold = float(data.get("iou_threshold", 0.5))
+
+        if not filenames:
+            raise HTTPException(status_code=400, detail="filenames가 필요합니다")
+        try:
+            get_profile(profile_name)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # 샘플 이미지를 한 번만 디코딩하여 두 프로파일에서 재사용
+        images = []
+        for filename in filenames:
+            image_path = image_manager.find_image_path(filename)
+            if not image_path:
+                raise HTTPException(status_code=404, detail=f"이미지 파일을 찾을 수 없습니다: {filename}")
+            if str(image_path).startswith("memory://"):
+                from io import BytesIO
+                img = Image.open(BytesIO(image_manager.get_memory_image(os.path.basename(filename))))
+            else:
+                img = Image.open(image_path)
+            images.append(img.convert("RGB"))
+
+        if task_name:
+            model = pipeline_manager.models.get(task_name)
+            if model is None:
+                raise HTTPException(status_code=400, detail=f"'{task_name}' 태스크에 로드된 모델이 없습니다")
+            if model.task_type not in (TaskType.BBOX, TaskType.KEYPOINT):
+                raise HTTPException(status_code=400, detail=f"'{task_name}' 태스크는 박스 출력이 없어 프로파일 일치도를 비교할 수 없습니다")
+            task_kwargs = {k: v for k, v in (data.get("config") or {}).items()
+                           if k not in ("inference_profile", "use_cache")}
+            task_kwargs.setdefault("confidence_threshold", confidence)
+
+            # 결과 캐시를 건너뛰어야 두 프로파일 모두 실제로 추론하고 측정됨
+            def predict_fn(image, profile):
+                return comparison_boxes(model.predict(image, inference_profile=profile.name, use_cache=False,
+                                                      **task_kwargs))
+        else:
+            if model_manager.model is None:
+                raise HTTPException(status_code=400, detail="모델이 로드되지 않았습니다. 먼저 모델을 로드해주세요.")
+
+            def predict_fn(image, profile):
+                return model_manager.predict_image(image, None, confidence, profile=profile, use_cache=False)
+
+        return run_profile_check(predict_fn, images, profile_name, iou_threshold=iou_threshold)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 추론 프로파일 검사 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"추론 프로파일 검사 오류: {str(e)}")
+
 @app.post("/models/load/{model_path:path}", tags=["Models"])
-async def load_model(model_path: str):
-    """모델을 로드합니다. (로컬 모델 및 Hugging Face 모델 지원)"""
+async def load_model(model_path: str, profile: Optional[str] = Query(None)):
+    """
+    모델을 로드합니다. (로컬 모델 및 Hugging Face 모델 지원)
+
+    profile 쿼리로 추론 프로파일("accurate", "fast")을 선택할 수 있습니다.
+    """
     try:
-        logger.info(f"🔄 모델 로드 요청: {model_path}")
+        logger.info(f"🔄 모델 로드 요청: {model_path} (프로파일: {profile or 'accurate'})")
 
         # Hugging Face 모델인지 확인 (grounding_dino/IDEA-Research/... 형태)
         path_parts = model_path.split('/')
@@ -327,7 +474,8 @@ async def load_model(model_path: str):
             result = pipeline_manager.add_model(
                 task_name="detection",
                 model_name="grounding_dino",
-                model_path=model_id
+                model_path=model_id,
+                inference_profile=profile
             )
 
             # 모델 로드 결과에 추가 정보 병합
@@ -351,7 +499,7 @@ async def load_model(model_path: str):
         if not model_full_path.is_file():
             raise HTTPException(status_code=404, detail="Model file not found")
 
-        result = model_manager.load_model(model_full_path)
+        result = model_manager.load_model(model_full_path, profile=profile)
         return result
 
     except HTTPException:
@@ -443,6 +591,95 @@ async def delete_model(model_type: str, model_name: str):
         logger.error(f"모델 삭제 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"모델 삭제 실패: {str(e)}")
 
+@app.get("/api/memory-images/stats", tags=["Files"])
+async def get_memory_image_stats():
+    """메모리 이미지 저장소 사용량(메모리/스필 바이트, 적중률, 제거 횟수, 중복 제거)을 반환합니다."""
+    return {
+        "success": True,
+        "stats": image_manager.get_memory_stats(),
+        "content_store": image_manager.content_store.stats()
+    }
+
+@app.get("/api/result-cache/stats", tags=["Models"])
+async def get_result_cache_stats():
+    """추론 결과 캐시의 적중률과 메모리/디스크 사용량을 반환합니다."""
+    cache = get_result_cache()
+    if cache is None:
+        return {"success": True, "enabled": False, "stats": None}
+    return {"success": True, "enabled": True, "stats": cache.stats()}
+
+@app.delete("/api/result-cache", tags=["Models"])
+async def clear_result_cache():
+    """추론 결과 캐시(메모리/디스크)를 모두 삭제합니다."""
+    cache = get_result_cache()
+    if cache is None:
+        return {"success": True, "enabled": False}
+    cache.clear()
+    logger.info("🧹 추론 결과 캐시 삭제 완료")
+    return {"success": True, "enabled": True}
+
+@app.get("/api/image-hash/{content_hash}", tags=["Files"])
+async def check_image_hash(content_hash: str):
+    """
+    콘텐츠 해시에 해당하는 이미지가 서버에 있는지 확인합니다.
+
+    클라이언트는 업로드 전에 해시를 조회하여 이미 있는 이미지는 다시 보내지 않고
+    /labeling/process 등에 image_hash로 참조할 수 있습니다.
+    """
+    content_hash = content_hash.lower()
+    if not is_content_hash(content_hash):
+        raise HTTPException(status_code=400, detail="콘텐츠 해시는 sha256 hex 64자여야 합니다.")
+    return {
+        "hash": content_hash,
+        "in_memory": image_manager.memory_images.has_hash(content_hash),
+        "on_disk": image_manager.content_store.has(content_hash)
+    }
+
+def _delete_project_files(project_dir: Path, filename: str, label_filename: str) -> List[str]:
+    """이미지와 라벨 파일을 삭제하고 카탈로그를 갱신합니다. (블로킹 - I/O 풀에서 실행)"""
+    # 프로젝트 경로 검증
+    if not project_dir.exists():
+        raise HTTPException(status_code=404, detail="프로젝트 경로를 찾을 수 없습니다.")
+    
+    # 이미지 파일 경로
+    image_path = project_dir / "images" / filename
+    label_path = project_dir / "labels" / label_filename
+    
+    # 삭제할 파일들 목록
+    files_to_delete = []
+    deletion_results = []
+    
+    # 이미지 파일 확인 및 삭제
+    if image_path.exists():
+        files_to_delete.append(("이미지", image_path))
+    
+    # 라벨 파일 확인 및 삭제
+    if label_path.exists():
+        files_to_delete.append(("라벨", label_path))
+    
+    if not files_to_delete:
+        raise HTTPException(status_code=404, detail="삭제할 파일을 찾을 수 없습니다.")
+    
+    # 파일 삭제 실행
+    for file_type, file_path in files_to_delete:
+        try:
+            if file_path == image_path:
+                # 다른 프로젝트가 쓰지 않는 이미지면 중복 제거 저장소의 blob도 함께 삭제
+                image_manager.content_store.unlink(file_path)
+            else:
+                file_path.unlink()
+            image_manager.file_index.discard(file_path)
+            deletion_results.append(f"{file_type} 파일: {file_path.name}")
+            logger.info(f"{file_type} 파일 삭제 완료: {file_path}")
+        except Exception as e:
+            logger.error(f"{file_type} 파일 삭제 실패 ({file_path}): {str(e)}")
+            raise HTTPException(status_code=500, detail=f"{file_type} 파일 삭제 실패: {str(e)}")
+    
+    # 프로젝트 카탈로그의 이미지/라벨 개수와 라벨 통계 갱신
+    project_catalog.refresh_project(project_dir)
+    project_catalog.update_label_stats(project_dir, [Path(filename).stem])
+    return deletion_results
+
 @app.delete("/api/delete-image/{filename:path}", tags=["Files"])
 async def delete_image_and_label(filename: str, project_path: str = Query(...)):
     """이미지 파일과 연관된 라벨 파일을 삭제합니다."""
@@ -455,42 +692,11 @@ async def delete_image_and_label(filename: str, project_path: str = Query(...)):
         if not project_path:
             raise HTTPException(status_code=400, detail="프로젝트 경로가 필요합니다.")
         
-        # 프로젝트 경로 검증
-        project_dir = Path(project_path)
-        if not project_dir.exists():
-            raise HTTPException(status_code=404, detail="프로젝트 경로를 찾을 수 없습니다.")
-        
-        # 이미지 파일 경로
-        image_path = project_dir / "images" / filename
-        
         # 라벨 파일 경로 (확장자를 .txt로 변경)
         label_filename = Path(filename).stem + ".txt"
-        label_path = project_dir / "labels" / label_filename
-        
-        # 삭제할 파일들 목록
-        files_to_delete = []
-        deletion_results = []
-        
-        # 이미지 파일 확인 및 삭제
-        if image_path.exists():
-            files_to_delete.append(("이미지", image_path))
-        
-        # 라벨 파일 확인 및 삭제
-        if label_path.exists():
-            files_to_delete.append(("라벨", label_path))
         
-        if not files_to_delete:
-            raise HTTPException(status_code=404, detail="삭제할 파일을 찾을 수 없습니다.")
-        
-        # 파일 삭제 실행
-        for file_type, file_path in files_to_delete:
-            try:
-                file_path.unlink()
-                deletion_results.append(f"{file_type} 파일: {file_path.name}")
-                logger.info(f"{file_type} 파일 삭제 완료: {file_path}")
-            except Exception as e:
-                logger.error(f"{file_type} 파일 삭제 실패 ({file_path}): {str(e)}")
-                raise HTTPException(status_code=500, detail=f"{file_type} 파일 삭제 실패: {str(e)}")
+        # 파일 확인/삭제와 카탈로그 갱신은 I/O 풀에서 실행
+        deletion_results = await io_pool.run_write(_delete_project_files, Path(project_path), filename, label_filename)
         
         return {
             "success": True,
@@ -591,7 +797,7 @@ async def get_model_classes_with_ids():
         raise HTTPException(status_code=500, detail=f"모델 클래스 정보 조회 오류: {str(e)}")
 
 @app.post("/model/predict/{filename:path}", tags=["Models"])
-async def predict_image(filename: str, data: Dict[str, Any] = {}):
+async def predict_image(request: Request, filename: str, data: Dict[str, Any] = {}):
     """업로드된 이미지에 대한 예측을 수행합니다."""
     try:
                 # 이미지 경로 찾기
@@ -601,16 +807,24 @@ async def predict_image(filename: str, data: Dict[str, Any] = {}):
         
         # 선택된 클래스 목록
         selected_classes = data.get("selected_classes", [])
+        result_format = validate_result_format(data.get("result_format"))
+        
+        # 이미지 예측 수행 (tiled: 고해상도 이미지 타일 분할 추론)
+        boxes = model_manager.predict_image(
+            image_path,
+            selected_classes,
+            tiled=bool(data.get("tiled", False)),
+            tile_size=int(data.get("tile_size", 640)),
+            tile_overlap=float(data.get("tile_overlap", 0.2))
+        )
         
-        # 이미지 예측 수행
-        boxes = model_manager.predict_image(image_path, selected_classes)
-        
-        return {
+        return negotiated_response(request, _with_timings({
             "success": True,
             "filename": os.path.basename(filename),
-            "boxes": boxes,
-            "total_objects": len(boxes)
-        }
+            "boxes": encode_boxes(boxes, result_format),
+            "total_objects": len(boxes),
+            "result_format": result_format
+        }, bool(data.get("include_timings", False))))
         
     except HTTPException:
         raise
@@ -620,26 +834,55 @@ async def predict_image(filename: str, data: Dict[str, Any] = {}):
 
 @app.post("/labeling/process", tags=["Labeling"])
 async def process_labeling(
-    file: UploadFile = File(...),
+    request: Request,
+    file: Optional[UploadFile] = File(None),
     classes: str = Form(...),
     confidence_threshold: float = Form(0.5),
     text_prompt: str = Form(None),
     box_threshold: float = Form(0.3),
-    text_threshold: float = Form(0.25)
+    text_threshold: float = Form(0.25),
+    result_format: str = Form("verbose"),
+    tiled: bool = Form(False),
+    tile_size: Optional[int] = Form(None),
+    tile_overlap: float = Form(0.2),
+    image_hash: Optional[str] = Form(None),
+    filename: Optional[str] = Form(None),
+    include_timings: bool = Form(False)
 ):
-    """자동 라벨링을 위한 이미지 처리 엔드포인트 (YOLO 및 Grounding DINO 지원)"""
+    """
+    자동 라벨링을 위한 이미지 처리 엔드포인트 (YOLO 및 Grounding DINO 지원)
+
+    tiled=true이면 고해상도 이미지를 겹치는 타일로 나눠 추론한 뒤 병합합니다.
+    (tile_size 기본값: YOLO 640, Grounding DINO 800)
+
+    이미 업로드한 이미지는 file 대신 image_hash(+filename)로 참조할 수 있습니다.
+
+    단계별 처리 시간(upload_read, decode, preprocess, forward, postprocess, encode)은
+    Server-Timing 헤더로 반환되며, include_timings=true이면 응답의 timings 필드(ms)에도 포함됩니다.
+    """
     import time
 
     start_time = time.time()
 
     try:
+        result_format = validate_result_format(result_format)
+
+        if file is None and not image_hash:
+            raise HTTPException(status_code=400, detail="file 또는 image_hash가 필요합니다.")
+        if file is None:
+            image_hash = image_hash.lower()
+            if not is_content_hash(image_hash):
+                raise HTTPException(status_code=400, detail="image_hash는 sha256 hex 64자여야 합니다.")
+
+        image_filename = filename or (file.filename if file is not None else f"{image_hash[:16]}.jpg")
+
         if text_prompt:
-            logger.info(f"자동 라벨링 요청 시작 (Grounding DINO) - 파일: {file.filename}, 프롬프트: {text_prompt}, box_threshold: {box_threshold}, text_threshold: {text_threshold}")
+            logger.info(f"자동 라벨링 요청 시작 (Grounding DINO) - 파일: {image_filename}, 프롬프트: {text_prompt}, box_threshold: {box_threshold}, text_threshold: {text_threshold}")
         else:
-            logger.info(f"자동 라벨링 요청 시작 (YOLO) - 파일: {file.filename}, 신뢰도: {confidence_threshold}")
+            logger.info(f"자동 라벨링 요청 시작 (YOLO) - 파일: {image_filename}, 신뢰도: {confidence_threshold}")
         
         # 파일 검증
-        if not file.content_type or not file.content_type.startswith('image/'):
+        if file is not None and (not file.content_type or not file.content_type.startswith('image/')):
             logger.error(f"잘못된 파일 형식: {file.content_type}")
             raise HTTPException(status_code=400, detail="이미지 파일만 허용됩니다.")
         
@@ -648,13 +891,23 @@ async def process_labeling(
             logger.error(f"잘못된 신뢰도 임계값: {confidence_threshold}")
             raise HTTPException(status_code=400, detail="신뢰도 임계값은 0.0과 1.0 사이여야 합니다.")
         
-        # 파일 내용 읽기
-        try:
-            contents = await file.read()
-            logger.info(f"파일 읽기 완료 - 크기: {len(contents)} bytes")
-        except Exception as e:
-            logger.error(f"파일 읽기 실패: {str(e)}")
-            raise HTTPException(status_code=400, detail=f"파일 읽기 실패: {str(e)}")
+        # 파일 내용 읽기 (해시 참조인 경우 메모리/디스크 저장소에서 가져옴)
+        stage_start = time.perf_counter()
+        if file is None:
+            contents = image_manager.get_memory_image_by_hash(image_hash)
+            if contents is None and image_manager.content_store.has(image_hash):
+                contents = image_manager.content_store.blob_path(image_hash).read_bytes()
+            if contents is None:
+                raise HTTPException(status_code=404, detail=f"해시에 해당하는 이미지가 없습니다: {image_hash}")
+            logger.info(f"해시 참조 이미지 사용 - hash: {image_hash[:12]}, 크기: {len(contents)} bytes")
+        else:
+            try:
+                contents = await file.read()
+                logger.info(f"파일 읽기 완료 - 크기: {len(contents)} bytes")
+            except Exception as e:
+                logger.error(f"파일 읽기 실패: {str(e)}")
+                raise HTTPException(status_code=400, detail=f"파일 읽기 실패: {str(e)}")
+        record_span(STAGE_UPLOAD_READ, time.perf_counter() - stage_start)
         
         # 선택된 클래스 정보 파싱
         try:
@@ -671,18 +924,19 @@ async def process_labeling(
         
         # 메모리에서 직접 처리 (임시 파일 저장 제거)
         try:
-            # 메모리에 이미지 저장 (자동 라벨링 중에만 사용)
-            image_manager.add_memory_image(file.filename, contents, {
+            # 메모리에 이미지 저장 (자동 라벨링 중에만 사용, 같은 바이트는 한 벌만 보관)
+            content_hash = image_manager.add_memory_image(image_filename, contents, {
                 "project": "auto_labeling",
                 "size": len(contents)
             })
-            logger.info(f"메모리에 이미지 저장 완료: {file.filename}")
+            logger.info(f"메모리에 이미지 저장 완료: {image_filename}")
             
             # 원본 이미지 크기 정보 추출 (리사이즈 전)
             import cv2
             import numpy as np
             
             # BytesIO에서 원본 이미지 크기 추출
+            stage_start = time.perf_counter()
             try:
                 image_bytes = np.frombuffer(contents, dtype=np.uint8)
                 cv_image = cv2.imdecode(image_bytes, cv2.IMREAD_COLOR)
@@ -694,6 +948,7 @@ async def process_labeling(
             except Exception as e:
                 logger.error(f"이미지 크기 추출 실패: {str(e)}")
                 raise HTTPException(status_code=400, detail=f"이미지 크기 추출 실패: {str(e)}")
+            record_span(STAGE_DECODE, time.perf_counter() - stage_start)
             
             # 낮은 해상도 체크 (model_utils와 동일한 기준 사용)
             min_dimension = min(original_width, original_height)
@@ -714,12 +969,16 @@ async def process_labeling(
                     pil_image = Image.open(image_stream)
 
                     # pipeline_manager를 통해 Grounding DINO 추론
+                    tile_kwargs = {"tiled": tiled, "tile_overlap": tile_overlap}
+                    if tile_size:
+                        tile_kwargs["tile_size"] = tile_size
                     result = pipeline_manager.run_single_task(
                         task_name="detection",
                         image=pil_image,
                         text_prompt=text_prompt,
                         box_threshold=box_threshold,
-                        text_threshold=text_threshold
+                        text_threshold=text_threshold,
+                        **tile_kwargs
                     )
 
                     # 결과에서 boxes 추출
@@ -727,14 +986,24 @@ async def process_labeling(
                 else:
                     logger.info(f"모델 예측 시작 (YOLO) - 선택된 클래스: {selected_classes}, 신뢰도: {confidence_threshold}")
                     # YOLO용 기본 호출
-                    boxes = model_manager.predict_image(image_stream, selected_classes, confidence_threshold)
+                    boxes = model_manager.predict_image(
+                        image_stream,
+                        selected_classes,
+                        confidence_threshold,
+                        tiled=tiled,
+                        tile_size=tile_size or 640,
+                        tile_overlap=tile_overlap
+                    )
 
                 logger.info(f"모델 예측 완료 - 감지된 객체 수: {len(boxes)}")
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"모델 예측 실패: {str(e)}")
                 raise HTTPException(status_code=500, detail=f"모델 예측 실패: {str(e)}")
             
             # 이미지를 base64로 인코딩하여 반환 (원본 이미지 사용)
+            stage_start = time.perf_counter()
             try:
                 import base64
                 image = Image.open(BytesIO(contents))
@@ -763,6 +1032,7 @@ async def process_labeling(
             except Exception as e:
                 logger.error(f"이미지 인코딩 실패: {str(e)}")
                 raise HTTPException(status_code=500, detail=f"이미지 인코딩 실패: {str(e)}")
+            record_span(STAGE_ENCODE, time.perf_counter() - stage_start)
             
             processing_time = time.time() - start_time
 
@@ -779,8 +1049,10 @@ async def process_labeling(
 
             result = {
                 "success": True,
-                "filename": file.filename,
-                "boxes": boxes,
+                "filename": image_filename,
+                "image_hash": content_hash,
+                "boxes": encode_boxes(boxes, result_format),
+                "result_format": result_format,
                 "imageData": f"data:image/jpeg;base64,{image_data}",
                 "width": original_width,
                 "height": original_height,
@@ -796,7 +1068,7 @@ async def process_labeling(
 
             logger.info(f"자동 라벨링 처리 완료 - 처리 시간: {processing_time:.3f}초, 객체 수: {len(boxes)}")
             
-            return result
+            return negotiated_response(request, _with_timings(result, include_timings))
             
         finally:
             # 자동 라벨링용 임시 이미지는 즉시 제거 (저장하지 않는 경우)
@@ -810,7 +1082,7 @@ async def process_labeling(
         raise HTTPException(status_code=500, detail=f"자동 라벨링 처리 중 오류가 발생했습니다: {str(e)}")
 
 @app.post("/labeling/batch-process", tags=["Labeling"])
-async def batch_process_labeling(data: Dict[str, Any]):
+async def batch_process_labeling(request: Request, data: Dict[str, Any]):
     """
     배치 자동 라벨링 엔드포인트 (여러 이미지 동시 처리)
 
@@ -820,7 +1092,12 @@ async def batch_process_labeling(data: Dict[str, Any]):
             "text_prompt": str,      # Grounding DINO 텍스트 프롬프트
             "box_threshold": float,  # 박스 임계값 (기본값: 0.3)
             "text_threshold": float, # 텍스트 임계값 (기본값: 0.25)
-            "batch_size": int        # 배치 크기 (기본값: 4)
+            "batch_size": int,       # 배치 크기 (기본값: 4)
+            "result_format": str,    # "verbose" (기본값) 또는 "columnar"
+            "tiled": bool,           # 고해상도 이미지 타일 분할 추론 (기본값: False)
+            "tile_size": int,        # 타일 크기 (기본값: 800)
+            "tile_overlap": float,   # 타일 겹침 비율 (기본값: 0.2)
+            "include_timings": bool  # 단계별 처리 시간(ms)을 timings 필드로 반환 (기본값: False)
         }
 
     Returns:
@@ -836,6 +1113,10 @@ async def batch_process_labeling(data: Dict[str, Any]):
         box_threshold = data.get("box_threshold", 0.3)
         text_threshold = data.get("text_threshold", 0.25)
         batch_size = data.get("batch_size", 4)
+        result_format = validate_result_format(data.get("result_format"))
+        tile_kwargs = {
+            key: data[key] for key in ("tiled", "tile_size", "tile_overlap") if data.get(key) is not None
+        }
 
         # 유효성 검증
         if not filenames or not isinstance(filenames, list):
@@ -854,6 +1135,7 @@ async def batch_process_labeling(data: Dict[str, Any]):
         # 이미지 로드
         images = []
         image_infos = []
+        stage_start = time.perf_counter()
 
         for filename in filenames:
             try:
@@ -878,6 +1160,7 @@ async def batch_process_labeling(data: Dict[str, Any]):
                 logger.error(f"이미지 로드 실패 ({filename}): {str(e)}")
                 continue
 
+        record_span(STAGE_DECODE, time.perf_counter() - stage_start)
         if len(images) == 0:
             raise HTTPException(status_code=404, detail="유효한 이미지를 찾을 수 없습니다")
 
@@ -891,20 +1174,24 @@ async def batch_process_labeling(data: Dict[str, Any]):
                 text_prompt=text_prompt,
                 box_threshold=box_threshold,
                 text_threshold=text_threshold,
-                batch_size=batch_size
+                batch_size=batch_size,
+                **tile_kwargs
             )
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"배치 추론 실패: {str(e)}")
             raise HTTPException(status_code=500, detail=f"배치 추론 실패: {str(e)}")
 
-        # 결과 정리
+        # 결과 정리 (columnar 포맷은 배치 전체가 클래스 이름 목록을 공유)
+        shared_class_names = [] if result_format == RESULT_FORMAT_COLUMNAR else None
         processed_results = []
         for idx, result in enumerate(results):
             info = image_infos[idx]
             processed_results.append({
                 "success": True,
                 "filename": info["filename"],
-                "boxes": result.get("boxes", []),
+                "boxes": encode_boxes(result.get("boxes", []), result_format, shared_class_names),
                 "num_detections": result.get("num_detections", 0),
                 "width": info["size"][0],
                 "height": info["size"][1]
@@ -922,13 +1209,15 @@ async def batch_process_labeling(data: Dict[str, Any]):
 
         logger.info(f"✅ 배치 자동 라벨링 완료 - 처리 시간: {processing_time:.3f}초, 이미지: {len(processed_results)}개")
 
-        return {
+        return negotiated_response(request, _with_timings({
             "success": True,
             "results": processed_results,
             "total_images": len(processed_results),
             "processing_time": round(processing_time, 3),
-            "class_info": class_info_for_frontend  # ✅ 프롬프트 순서대로 class_info 추가
-        }
+            "class_info": class_info_for_frontend,  # ✅ 프롬프트 순서대로 class_info 추가
+            "result_format": result_format,
+            **({"class_names": shared_class_names} if shared_class_names is not None else {})
+        }, bool(data.get("include_timings", False))))
 
     except HTTPException:
         raise
@@ -937,8 +1226,13 @@ async def batch_process_labeling(data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"배치 자동 라벨링 실패: {str(e)}")
 
 @app.get("/files/{filename:path}", tags=["Files"])
-async def get_file(filename: str):
-    """파일 서빙을 위한 엔드포인트 - 기존 이미지 매니저와 통합"""
+async def get_file(request: Request, filename: str):
+    """
+    파일 서빙을 위한 엔드포인트 - 기존 이미지 매니저와 통합
+    
+    강한 ETag(파일은 mtime+크기, 메모리 이미지는 콘텐츠 해시)를 붙여 If-None-Match 시 304를 반환하고,
+    Range 요청에는 206 부분 응답을 반환합니다.
+    """
     try:
         # 빈 파일명 체크
         if not filename or filename.strip() == "":
@@ -950,21 +1244,21 @@ async def get_file(filename: str):
         # 메모리 이미지인 경우
         if image_path and str(image_path).startswith("memory://"):
             memory_filename = str(image_path).replace("memory://", "")
+            headers = {"Content-Disposition": f"inline; filename={filename}"}
+            
+            # 해시만으로 304 판단 (이미지 바이트를 꺼내지 않음)
+            content_hash = image_manager.memory_images.hash_of(memory_filename)
+            if content_hash:
+                not_modified = not_modified_response(request, content_etag(content_hash), headers)
+                if not_modified:
+                    return not_modified
+            
             memory_data = image_manager.get_memory_image(memory_filename)
             
             if memory_data:
-                # 이미지 타입 결정
-                if filename.lower().endswith(('.jpg', '.jpeg')):
-                    media_type = "image/jpeg"
-                elif filename.lower().endswith('.png'):
-                    media_type = "image/png"
-                else:
-                    media_type = "application/octet-stream"
-                
-                return Response(
-                    content=memory_data,
-                    media_type=media_type,
-                    headers={"Content-Disposition": f"inline; filename={filename}"}
+                etag = content_etag(content_hash or image_manager.content_store.hash_bytes(memory_data))
+                return conditional_bytes_response(
+                    request, memory_data, etag, guess_image_media_type(filename), headers
                 )
             else:
                 image_path = None
@@ -980,23 +1274,7 @@ async def get_file(filename: str):
         if not image_path:
             raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {filename}")
 
-        # 이미지 타입 결정
-        file_ext = Path(image_path).suffix.lower()
-        if file_ext in ['.jpg', '.jpeg']:
-            media_type = "image/jpeg"
-        elif file_ext == '.png':
-            media_type = "image/png"
-        elif file_ext == '.gif':
-            media_type = "image/gif"
-        elif file_ext == '.webp':
-            media_type = "image/webp"
-        else:
-            media_type = "application/octet-stream"
-
-        return FileResponse(
-            path=str(image_path),
-            media_type=media_type
-        )
+        return conditional_file_response(request, image_path, guess_image_media_type(image_path))
         
     except HTTPException:
         raise
@@ -1004,11 +1282,41 @@ async def get_file(filename: str):
         logger.error(f"[FILES] 파일 서빙 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"파일 서빙 오류: {str(e)}")
 
+@app.get("/thumbs/{filename:path}", tags=["Files"])
+async def get_thumbnail(request: Request, filename: str, w: int = Query(256, ge=16, le=4096, description="썸네일 너비 (고정 크기로 올림)")):
+    """
+    목록/네비게이터 미리보기용 썸네일을 반환합니다.
+    원본 대신 축소된 WebP/JPEG를 디스크 캐시에서 제공합니다. (파일 검색 규칙은 /files와 동일)
+    """
+    if not filename or filename.strip() == "":
+        raise HTTPException(status_code=400, detail="파일명이 필요합니다.")
+    
+    thumb_path = await thumbnail_service.get_thumbnail(filename, w)
+    return conditional_file_response(request, thumb_path, thumbnail_service.media_type)
+
+@app.get("/api/thumbnails/stats", tags=["Files"])
+async def get_thumbnail_stats():
+    """썸네일 캐시 통계를 반환합니다."""
+    return {"success": True, "stats": thumbnail_service.stats()}
+
+def _save_project_local(data: Dict[str, Any]) -> Dict[str, Any]:
+    """프로젝트 저장 후 썸네일 예약과 카탈로그 갱신 (블로킹 - I/O 풀에서 실행)"""
+    result = project_service.save_project(data)
+    # 저장된 이미지의 목록용 썸네일을 백그라운드에서 미리 생성
+    if result.get("path"):
+        thumbnail_service.schedule_directory(Path(result["path"]) / "images")
+        project_catalog.refresh_project(result["path"])
+        # 저장된 라벨 파일만 통계에 반영 (신뢰도는 txt에 없으므로 요청의 박스에서 가져옴)
+        confidences = collect_box_confidences(data.get("images", []))
+        project_catalog.update_label_stats(result["path"], confidences.keys(), confidences)
+    return result
+
 @app.post("/api/project/save-local", tags=["Projects"])
 async def save_project_local(data: Dict[str, Any]):
     """프로젝트를 로컬에 저장합니다."""
     try:
-        return project_service.save_project(data)
+        # 이미지 복사/라벨 쓰기는 I/O 풀에서 실행 (저장 중에도 다른 요청은 계속 처리)
+        return await io_pool.run_write(_save_project_local, data)
     except HTTPException:
         raise
     except Exception as e:
@@ -1019,7 +1327,9 @@ async def save_project_local(data: Dict[str, Any]):
 async def save_class_file(data: Dict[str, Any]):
     """클래스 파일을 저장합니다."""
     try:
-        return project_service.save_class_file(data)
+        result = await io_pool.run(project_service.save_class_file, data)
+        await io_pool.run(project_catalog.refresh_project, data.get("projectPath", ""))
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -1030,7 +1340,18 @@ async def save_class_file(data: Dict[str, Any]):
 async def save_label_file(data: Dict[str, Any]):
     """개별 라벨 파일을 저장합니다."""
     try:
-        return project_service.save_label_file(data)
+        result = await io_pool.run(project_service.save_label_file, data)
+        # UI는 projectPath="<project>/labels", filename="<stem>.txt"로 보내고
+        # 다른 호출자는 projectPath="<project>", filename="labels/<stem>.txt"로 보낼 수 있으므로
+        # 합친 경로에서 labels 폴더의 상위 폴더를 프로젝트로 사용
+        label_file = Path(data.get("projectPath", "")) / data.get("filename", "")
+        if label_file.parent.name == "labels" and label_file.suffix == ".txt":
+            project_dir = label_file.parent.parent
+            await io_pool.run(project_catalog.refresh_project, project_dir)
+            await io_pool.run(project_catalog.update_label_stats, project_dir, [label_file.stem])
+        else:
+            await io_pool.run(project_catalog.refresh_project, data.get("projectPath", ""))
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -1039,32 +1360,14 @@ async def save_label_file(data: Dict[str, Any]):
 
 @app.get("/api/list-projects", tags=["Projects"])
 async def list_projects():
-    """사용 가능한 프로젝트 목록을 반환합니다."""
+    """사용 가능한 프로젝트 목록을 반환합니다. (프로젝트 카탈로그에서 조회, 최신 먼저)"""
     try:
-        projects = []
-        
         # UPLOAD_DIR이 존재하지 않으면 빈 목록 반환
-        if not UPLOAD_DIR.exists():
+        if not await io_pool.run(UPLOAD_DIR.exists):
             return {"success": True, "projects": []}
         
-        # 1. 날짜 형식 폴더 내의 프로젝트 검색 (우선순위) - 2025-06-10/project_name 형태
-        for date_dir in UPLOAD_DIR.iterdir():
-            if date_dir.is_dir() and re.match(r'^\d{4}-\d{2}-\d{2}$', date_dir.name):
-                for proj_dir in date_dir.iterdir():
-                    if proj_dir.is_dir():
-                        project_info = validate_and_extract_project_info(proj_dir, date_prefix=date_dir.name)
-                        if project_info:
-                            projects.append(project_info)
-        
-        # 2. 루트 디렉토리의 프로젝트 폴더 검색 (레거시 지원) - 날짜 형식 폴더 제외
-        for folder in UPLOAD_DIR.iterdir():
-            if folder.is_dir() and not re.match(r'^\d{4}-\d{2}-\d{2}$', folder.name):
-                project_info = validate_and_extract_project_info(folder)
-                if project_info:
-                    projects.append(project_info)
-        
-        # 프로젝트를 생성 시간 기준으로 내림차순 정렬 (최신 먼저)
-        projects.sort(key=lambda x: x.get('createdTime', 0), reverse=True)
+        # 날짜 폴더(2025-06-10/project_name)와 루트의 레거시 프로젝트 폴더를 모두 포함
+        projects = await io_pool.run(project_catalog.list_projects)
         
         return {
             "success": True,
@@ -1076,264 +1379,61 @@ async def list_projects():
         logger.error(f"프로젝트 목록 조회 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"프로젝트 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
-def validate_and_extract_project_info(project_dir: Path, date_prefix: str = "") -> Optional[Dict[str, Any]]:
-    """프로젝트 디렉토리가 유효한지 확인하고 프로젝트 정보를 추출합니다."""
-    try:
-        # 유효한 프로젝트 구조인지 확인 (images, labels 폴더 존재)
-        images_dir = project_dir / "images"
-        labels_dir = project_dir / "labels"
-        
-        if not (images_dir.exists() and labels_dir.exists()):
-            return None
-        
-        # info.json 파일 검색
-        info_files = list(project_dir.glob("*_info.json"))
-        if not info_files:
-            # 일반적인 info.json 파일도 확인
-            info_json = project_dir / "info.json"
-            if info_json.exists():
-                info_files = [info_json]
-        
-        if not info_files:
-            return None
-        
-        # 프로젝트 이름 결정
-        project_name = project_dir.name
-        display_name = project_name
-        if date_prefix:
-            project_name = f"{date_prefix}/{project_name}"
-            display_name = f"{project_name} ({date_prefix})"
-        
-        # 이미지와 라벨 파일 개수 계산
-        image_count = len([f for f in images_dir.iterdir() if f.is_file() and f.suffix.lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']])
-        label_count = len([f for f in labels_dir.iterdir() if f.is_file() and f.suffix.lower() == '.txt'])
-        
-        # 생성 시간 확인 (info.json 파일의 수정 시간 사용)
-        created_time = info_files[0].stat().st_mtime
-        
-        # info.json에서 추가 정보 추출 (선택사항)
-        additional_info = {}
-        try:
-            with open(info_files[0], 'r', encoding='utf-8') as f:
-                info_data = json.load(f)
-                
-                # class_info 우선, 없으면 classes 키 사용 (하위 호환성)
-                classes_info = []
-                if "class_info" in info_data and info_data["class_info"]:
-                    # 새로운 class_info 형태: [{"id": 0, "name": "person"}, ...]
-                    class_info = info_data["class_info"]
-                    if isinstance(class_info, list):
-                        classes_info = [cls.get("name", f"class_{cls.get('id', 0)}") for cls in class_info if isinstance(cls, dict)]
-                elif "classes" in info_data:
-                    # 기존 classes 키 사용 (하위 호환성)
-                    classes_info = info_data.get('classes', [])
-                
-                additional_info = {
-                    'classes': classes_info,
-                    'description': info_data.get('description', ''),
-                    'version': info_data.get('version', '1.0')
-                }
-        except (json.JSONDecodeError, Exception) as e:
-            logger.warning(f"info.json 파일 읽기 실패 ({project_dir}): {e}")
-        
-        project_info = {
-            "name": project_name,  # API에서 사용할 전체 경로
-            "displayName": display_name,  # UI에서 표시할 이름
-            "path": str(project_dir),
-            "dateFolder": date_prefix if date_prefix else None,
-            "projectFolder": project_dir.name,
-            "imageCount": image_count,
-            "labelCount": label_count,
-            "createdTime": created_time,
-            **additional_info
-        }
-        
-        return project_info
-        
-    except Exception as e:
-        logger.warning(f"프로젝트 정보 추출 실패 ({project_dir}): {e}")
-        return None
-
 @app.post("/api/load-project", tags=["Projects"])
-async def load_project(data: Dict[str, Any]):
-    """지정된 프로젝트를 불러옵니다."""
+async def load_project(request: Request, data: Dict[str, Any]):
+    """
+    지정된 프로젝트를 불러옵니다.
+    
+    pageSize를 지정하면 프로젝트 정보와 첫 페이지만 반환하고, 나머지는
+    /api/load-project/page (nextCursor) 또는 /api/load-project/image로 필요할 때 요청합니다.
+    pageSize가 없으면 기존처럼 전체 이미지 결과를 한 번에 반환합니다.
+    """
     try:
         project_name = data.get("projectName")
-        if not project_name:
-            raise HTTPException(status_code=400, detail="프로젝트 이름이 제공되지 않았습니다.")
-        
-        # 프로젝트 경로 구성
-        project_path = UPLOAD_DIR / project_name
-        
-        if not project_path.exists():
-            raise HTTPException(status_code=404, detail=f"프로젝트를 찾을 수 없습니다: {project_name}")
-        
-        # 프로젝트 구조 검증
-        images_dir = project_path / "images"
-        labels_dir = project_path / "labels"
-        
-        if not images_dir.exists():
-            raise HTTPException(status_code=404, detail="이미지 폴더를 찾을 수 없습니다.")
-        
-        if not labels_dir.exists():
-            raise HTTPException(status_code=404, detail="라벨 폴더를 찾을 수 없습니다.")
-        
-        # info.json 파일 찾기
-        info_files = list(project_path.glob("*_info.json"))
-        if not info_files:
-            info_json = project_path / "info.json"
-            if info_json.exists():
-                info_files = [info_json]
-        
-        if not info_files:
-            raise HTTPException(status_code=404, detail="프로젝트 정보 파일(info.json)을 찾을 수 없습니다.")
-        
-        # 프로젝트 정보 로드
-        project_info = {}
-        try:
-            with open(info_files[0], 'r', encoding='utf-8') as f:
-                project_info = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f"프로젝트 정보 파일 파싱 오류: {e}")
-            raise HTTPException(status_code=400, detail="프로젝트 정보 파일 형식이 올바르지 않습니다.")
-        
-        # 클래스 정보 처리: class_info를 우선적으로 사용
-        logger.info("=== 프로젝트 로드: 클래스 정보 처리 시작 ===")
-        
-        processed_classes = []
-        
-        # 1. 먼저 project_info에서 class_info 확인
-        if "class_info" in project_info and project_info["class_info"]:
-            class_info = project_info["class_info"]
-            logger.info(f"✅ 프로젝트 파일에서 class_info 발견: {class_info}")
+        result_format = validate_result_format(data.get("resultFormat"))
+        page_size = data.get("pageSize")
+        paged = page_size is not None
+        if paged and (not isinstance(page_size, int) or page_size <= 0):
+            raise HTTPException(status_code=400, detail="pageSize는 양의 정수여야 합니다.")
+        
+        def open_and_load():
+            handle = project_loader.open_project(project_name)
             
-            if isinstance(class_info, list) and len(class_info) > 0:
-                # class_info가 [{"id": 0, "name": "person"}, {"id": 1, "name": "helmet"}, ...] 형태인 경우
-                try:
-                    # ID 순서대로 정렬하여 클래스명 추출
-                    sorted_class_info = sorted(class_info, key=lambda x: x.get("id", 0))
-                    processed_classes = [cls.get("name", f"class_{cls.get('id', 0)}") for cls in sorted_class_info]
-                    
-                    logger.info("✅ 프로젝트 저장 시 class_info 사용:")
-                    for cls_info in sorted_class_info:
-                        logger.info(f"  ID {cls_info.get('id')}: '{cls_info.get('name')}'")
-                    
-                    logger.info(f"🎯 프로젝트 로드에 사용할 클래스 정보 (class_info): {processed_classes}")
-                    
-                except Exception as e:
-                    logger.error(f"❌ class_info 파싱 오류: {str(e)}")
-                    processed_classes = []
-            else:
-                logger.warning("⚠️ class_info가 리스트가 아니거나 비어있음")
-        
-        # 2. class_info가 없거나 유효하지 않은 경우 현재 모델에서 동적으로 가져오기
-        if not processed_classes:
-            logger.info("📡 class_info가 없거나 유효하지 않음 - 현재 모델에서 클래스 정보 동적 로드")
+            # 목록용 썸네일을 백그라운드에서 미리 생성 (이미 있는 것은 건너뜀)
+            thumbnail_service.schedule_directory(handle.images_dir)
             
-            try:
-                # 현재 로드된 모델에서 클래스 정보 가져오기
-                model_classes_response = model_manager.get_model_classes()
-                
-                if model_classes_response and "classes" in model_classes_response:
-                    model_classes_dict = model_classes_response["classes"]
-                    logger.info(f"모델에서 가져온 클래스 딕셔너리: {model_classes_dict}")
-                    
-                    # 딕셔너리를 ID 순서대로 정렬하여 리스트로 변환
-                    if isinstance(model_classes_dict, dict):
-                        # ID 순서대로 정렬: {0: 'person', 1: 'helmet', ...} -> ['person', 'helmet', ...]
-                        processed_classes = [model_classes_dict[str(i)] for i in sorted([int(k) for k in model_classes_dict.keys()])]
-                        logger.info(f"현재 모델의 클래스 정보 (ID 순서): {processed_classes}")
-                    else:
-                        logger.error("모델 클래스 정보가 딕셔너리 형태가 아닙니다.")
-                        raise HTTPException(status_code=400, detail="현재 로드된 모델의 클래스 정보를 가져올 수 없습니다.")
-                else:
-                    logger.error("모델에서 클래스 정보를 가져오지 못했습니다.")
-                    raise HTTPException(status_code=400, detail="모델이 로드되지 않았거나 클래스 정보를 가져올 수 없습니다. 먼저 모델을 로드해주세요.")
-                    
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"모델 클래스 정보 가져오기 실패: {str(e)}")
-                raise HTTPException(status_code=500, detail="현재 로드된 모델에서 클래스 정보를 가져오는 중 오류가 발생했습니다.")
-        
-        logger.info(f"🎯 최종 프로젝트 로드에 사용할 클래스 정보: {processed_classes}")
-        project_info["processed_classes"] = processed_classes
-        
-        # class_info도 응답에 포함 (프론트엔드에서 사용할 수 있도록)
-        if "class_info" in project_info and project_info["class_info"]:
-            logger.info("✅ 프로젝트 응답에 class_info 포함")
-        else:
-            logger.info("📡 프로젝트 응답에 class_info가 없어서 processed_classes 기반으로 생성")
-            # processed_classes를 class_info 형태로 변환
-            class_info_for_response = []
-            for index, class_name in enumerate(processed_classes):
-                class_info_for_response.append({
-                    "id": index,
-                    "name": class_name
-                })
-            project_info["class_info"] = class_info_for_response
-        
-        # 이미지 파일 목록 수집
-        image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.gif']
-        image_files = []
-        
-        for img_file in images_dir.iterdir():
-            if img_file.is_file() and img_file.suffix.lower() in image_extensions:
-                image_files.append(img_file)
-        
-        # 이미지 파일 정렬
-        image_files.sort(key=lambda x: x.name)
-        
-        # 각 이미지에 대한 결과 데이터 구성
-        results = []
+            # 클래스 정보 처리: class_info를 우선적으로 사용
+            processed_classes, class_info = project_loader.resolve_classes(handle)
+            
+            # columnar 포맷은 프로젝트 클래스 목록을 이름 인덱스로 공유
+            shared_class_names = list(processed_classes) if result_format == RESULT_FORMAT_COLUMNAR else None
+            
+            page = project_loader.load_page(
+                handle, processed_classes, result_format,
+                limit=page_size if paged else None, shared_class_names=shared_class_names
+            )
+            return handle, processed_classes, class_info, shared_class_names, page
         
-        for img_file in image_files:
-            try:
-                
-                # 해당 이미지의 라벨 파일 찾기
-                label_file = labels_dir / f"{img_file.stem}.txt"
-                
-                # 이미지 메타데이터 수집
-                image_info = {
-                    "filename": img_file.name,
-                    "image_path": f"images/{img_file.name}",
-                    "boxes": []
-                }
-                
-                # 이미지 크기 정보 가져오기
-                try:
-                    with Image.open(img_file) as pil_img:
-                        image_info["width"], image_info["height"] = pil_img.size
-                except Exception as e:
-                    logger.warning(f"이미지 크기 정보 추출 실패 ({img_file.name}): {e}")
-                    image_info["width"] = 640  # 기본값
-                    image_info["height"] = 640
-                
-                # 라벨 파일이 존재하면 바운딩 박스 정보 로드
-                if label_file.exists():
-                    try:
-                        # 변환된 클래스 정보 사용
-                        boxes = parse_yolo_label_file(label_file, image_info["width"], image_info["height"], processed_classes)
-                        image_info["boxes"] = boxes
-                    except Exception as e:
-                        logger.warning(f"라벨 파일 파싱 실패 ({label_file.name}): {e}")
-                
-                results.append(image_info)
-                
-            except Exception as e:
-                logger.error(f"이미지 처리 오류 ({img_file.name}): {e}")
-                continue
+        # 이미지 크기 확인/라벨 읽기는 I/O 풀에서 실행
+        handle, processed_classes, class_info, shared_class_names, page = await io_pool.run(open_and_load)
+        project_info = dict(handle.info, processed_classes=processed_classes, class_info=class_info)
+        results = page["results"]
         
-        return {
+        response = {
             "success": True,
             "projectName": project_name,
-            "projectPath": str(project_path),
+            "projectPath": str(handle.path),
             "results": results,
             "classes": processed_classes,  # 변환된 클래스 정보 사용
-            "totalImages": len(results),
+            "totalImages": len(handle.image_names) if paged else len(results),
             "lowConfidenceImages": project_info.get("lowConfidenceImages", []),
-            "projectInfo": project_info
+            "projectInfo": project_info,
+            "resultFormat": result_format,
+            **({"classNames": shared_class_names} if shared_class_names is not None else {})
         }
+        if paged:
+            response.update({"paged": True, "pageSize": page_size, "nextCursor": page["nextCursor"]})
+        return negotiated_response(request, response)
         
     except HTTPException:
         raise
@@ -1341,66 +1441,79 @@ async def load_project(data: Dict[str, Any]):
         logger.error(f"프로젝트 로드 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"프로젝트 로드 중 오류가 발생했습니다: {str(e)}")
 
-def parse_yolo_label_file(label_file: Path, img_width: int, img_height: int, classes: List[str]) -> List[Dict[str, Any]]:
+@app.post("/api/load-project/page", tags=["Projects"])
+async def load_project_page(request: Request, data: Dict[str, Any]):
     """
-    YOLO 형식의 라벨 파일을 파싱하여 바운딩 박스 정보를 반환합니다.
-    프로젝트 저장 시 class_info로 저장된 클래스 정보를 우선 사용하고,
-    없을 경우 현재 로드된 모델의 클래스 정보를 사용합니다.
-    """
-    boxes = []
+    프로젝트 이미지 결과의 다음 페이지를 반환합니다.
     
+    요청: {"projectName", "cursor" (이전 응답의 nextCursor), "pageSize", "resultFormat"}
+    """
     try:
-        with open(label_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
+        result_format = validate_result_format(data.get("resultFormat"))
+        page_size = data.get("pageSize", 100)
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise HTTPException(status_code=400, detail="pageSize는 양의 정수여야 합니다.")
+        
+        def open_and_load():
+            handle = project_loader.open_project(data.get("projectName"))
+            processed_classes, _ = project_loader.resolve_classes(handle)
+            shared_class_names = list(processed_classes) if result_format == RESULT_FORMAT_COLUMNAR else None
             
-            parts = line.split()
-            if len(parts) < 5:
-                logger.warning(f"라벨 파일 {label_file.name} 라인 {line_num}: 형식이 올바르지 않음")
-                continue
-            
-            try:
-                class_id = int(parts[0])
-                x_center_norm = float(parts[1])
-                y_center_norm = float(parts[2])
-                width_norm = float(parts[3])
-                height_norm = float(parts[4])
-                
-                # 정규화된 좌표를 픽셀 좌표로 변환
-                x_center = x_center_norm * img_width
-                y_center = y_center_norm * img_height
-                box_width = width_norm * img_width
-                box_height = height_norm * img_height
-                
-                # 좌상단 좌표 계산
-                x = x_center - box_width / 2
-                y = y_center - box_height / 2
-                
-                # 현재 모델의 클래스 정보를 사용하여 클래스 이름 결정
-                class_name = classes[class_id] if class_id < len(classes) else f"class_{class_id}"
-                
-                box_info = {
-                    "bbox": [x, y, box_width, box_height],
-                    "class_name": class_name,
-                    # 프로젝트 로드 시에는 신뢰도를 표시하지 않음 (confidence 필드 제거)
-                    "normalized_coords": [x_center_norm, y_center_norm, width_norm, height_norm]
-                }
-                
-                boxes.append(box_info)
-                
-            except (ValueError, IndexError) as e:
-                logger.warning(f"라벨 파일 {label_file.name} 라인 {line_num} 파싱 오류: {e}")
-                continue
-    
+            page = project_loader.load_page(
+                handle, processed_classes, result_format,
+                cursor=data.get("cursor"), limit=page_size, shared_class_names=shared_class_names
+            )
+            return handle, shared_class_names, page
+        
+        handle, shared_class_names, page = await io_pool.run(open_and_load)
+        return negotiated_response(request, {
+            "success": True,
+            "projectName": handle.name,
+            "results": page["results"],
+            "nextCursor": page["nextCursor"],
+            "totalImages": len(handle.image_names),
+            "resultFormat": result_format,
+            **({"classNames": shared_class_names} if shared_class_names is not None else {})
+        })
+        
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"라벨 파일 읽기 오류 ({label_file}): {e}")
+        logger.error(f"프로젝트 페이지 로드 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"프로젝트 페이지 로드 중 오류가 발생했습니다: {str(e)}")
+
+@app.get("/api/load-project/image", tags=["Projects"])
+async def load_project_image(
+    request: Request,
+    projectName: str = Query(..., description="프로젝트 이름"),
+    filename: str = Query(..., description="이미지 파일명"),
+    resultFormat: Optional[str] = Query(None, description="결과 포맷 (verbose/columnar)")
+):
+    """프로젝트 이미지 한 장의 크기와 라벨 결과를 반환합니다."""
+    try:
+        result_format = validate_result_format(resultFormat)
+        def open_and_load():
+            handle = project_loader.open_project(projectName)
+            processed_classes, _ = project_loader.resolve_classes(handle)
+            shared_class_names = list(processed_classes) if result_format == RESULT_FORMAT_COLUMNAR else None
+            
+            result = project_loader.load_image(handle, filename, processed_classes, result_format, shared_class_names)
+            return handle, shared_class_names, result
+        
+        handle, shared_class_names, result = await io_pool.run(open_and_load)
+        return negotiated_response(request, {
+            "success": True,
+            "projectName": handle.name,
+            "result": result,
+            "resultFormat": result_format,
+            **({"classNames": shared_class_names} if shared_class_names is not None else {})
+        })
+        
+    except HTTPException:
         raise
-    
-    return boxes
+    except Exception as e:
+        logger.error(f"프로젝트 이미지 로드 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"프로젝트 이미지 로드 중 오류가 발생했습니다: {str(e)}")
 
 @app.get("/project/classes", tags=["Projects"])
 async def get_project_classes(project: Optional[str] = None):
@@ -1409,107 +1522,41 @@ async def get_project_classes(project: Optional[str] = None):
         # 사용할 프로젝트 결정 (파라미터 또는 자동 검색)
         target_project = project
         
-        # 특정 프로젝트 파라미터가 제공되지 않은 경우 자동으로 프로젝트 찾기
+        # 특정 프로젝트 파라미터가 제공되지 않은 경우 가장 최근 프로젝트 선택
         if not target_project:
             logger.info("프로젝트 파라미터가 제공되지 않았습니다. 사용 가능한 프로젝트를 검색합니다.")
-            
-            # 모든 프로젝트 폴더 검색
-            available_projects = []
-            
-            # 1. 루트 디렉토리의 프로젝트 폴더 검색
-            for folder in UPLOAD_DIR.iterdir():
-                if folder.is_dir():
-                    # 유효한 프로젝트 구조인지 확인 (images, labels 폴더와 *_info.json 파일 존재)
-                    if (folder / "images").exists() and (folder / "labels").exists():
-                        # info.json 파일 검색
-                        info_files = list(folder.glob("*_info.json"))
-                        if info_files:
-                            available_projects.append(folder.name)
-                            logger.info(f"사용 가능한 프로젝트 발견: {folder.name}")
-            
-            # 2. 날짜 형식 폴더 내의 프로젝트 검색
-            for date_dir in UPLOAD_DIR.iterdir():
-                if date_dir.is_dir() and date_dir.name.startswith('20'):  # 2023-01-01 형식
-                    for proj_dir in date_dir.iterdir():
-                        if proj_dir.is_dir():
-                            # 유효한 프로젝트 구조인지 확인
-                            if (proj_dir / "images").exists() and (proj_dir / "labels").exists():
-                                # info.json 파일 검색
-                                info_files = list(proj_dir.glob("*_info.json"))
-                                if info_files:
-                                    available_projects.append(f"{date_dir.name}/{proj_dir.name}")
-                                    logger.info(f"사용 가능한 프로젝트 발견: {date_dir.name}/{proj_dir.name}")
+            target_project = await io_pool.run(project_catalog.latest_project_name)
             
             # 사용 가능한 프로젝트가 없으면 오류 반환
-            if not available_projects:
+            if not target_project:
                 logger.error("사용 가능한 프로젝트를 찾을 수 없습니다.")
                 raise HTTPException(status_code=404, detail="사용 가능한 프로젝트를 찾을 수 없습니다.")
             
-            # 첫 번째 프로젝트 선택
-            target_project = available_projects[0]
             logger.info(f"자동으로 프로젝트 선택됨: {target_project}")
         
-        # 프로젝트 경로 정규화
-        project_path = UPLOAD_DIR / target_project
+        entry = await io_pool.run(project_catalog.get_project, target_project)
         
         # 프로젝트 경로 존재 여부 확인
-        if not project_path.is_dir():
-            logger.error(f"지정된 프로젝트 경로를 찾을 수 없습니다: {project_path}")
+        if entry is None:
+            logger.error(f"지정된 프로젝트 경로를 찾을 수 없습니다: {UPLOAD_DIR / target_project}")
             raise HTTPException(status_code=404, detail=f"프로젝트 경로를 찾을 수 없습니다: {target_project}")
         
-        # 프로젝트 이름 추출 (경로의 마지막 부분)
-        project_name = os.path.basename(target_project.rstrip('/'))
-        
-        # 프로젝트 폴더 내에서 info.json 파일 검색
-        info_files = []
-        info_file_pattern = re.compile(f"{project_name}_info.json$")
-        
-        for file in os.listdir(project_path):
-            if info_file_pattern.match(file) or file == 'info.json':
-                info_file_path = project_path / file
-                if info_file_path.is_file():
-                    info_files.append(info_file_path)
-        
         # info.json 파일이 없으면 오류 반환
-        if not info_files:
+        if not entry["valid"]:
             logger.error("info.json 파일을 찾을 수 없습니다.")
             raise HTTPException(status_code=404, detail=f"프로젝트 {target_project}에서 info.json 파일을 찾을 수 없습니다.")
         
-        # 첫 번째 info.json 파일 로드
-        try:
-            with open(info_files[0], 'r', encoding='utf-8') as f:
-                content = json.load(f)
-            
-            # 클래스 정보 추출
-            classes = []
-            
-            if "classes" in content and content["classes"]:
-                if isinstance(content["classes"], list):
-                    # 새 형식: [{"id": 0, "name": "person"}, ...] 또는 기존 형식: ["person", ...]
-                    for cls in content["classes"]:
-                        if isinstance(cls, dict) and "name" in cls:
-                            # 새 형식: {"id": 0, "name": "person"}
-                            classes.append(cls["name"])
-                        elif isinstance(cls, str):
-                            # 기존 형식: "person"
-                            classes.append(cls)
-                elif isinstance(content["classes"], dict):
-                    # 클래스 사전 형식 (ID: 이름)
-                    classes = list(content["classes"].values())
-            
-            if not classes:
-                logger.error("info.json 파일에서 클래스 정보를 찾을 수 없습니다.")
-                raise HTTPException(status_code=404, detail="클래스 정보가 없습니다.")
-            
-            logger.info(f"프로젝트 파일에서 클래스 정보 로드 성공: {classes}")
-            return {"classes": classes}
-            
-        except json.JSONDecodeError as json_err:
-            logger.error(f"JSON 파싱 오류: {str(json_err)}")
-            raise HTTPException(status_code=400, detail=f"JSON 파싱 오류: {str(json_err)}")
-        except Exception as load_err:
-            logger.error(f"info.json 파일 로드 중 오류: {str(load_err)}")
-            raise HTTPException(status_code=500, detail=f"정보 파일 로드 오류: {str(load_err)}")
+        classes = entry["class_names"]
+        if classes is None:
+            logger.error(f"info.json 파일 파싱 실패: {entry['info_file']}")
+            raise HTTPException(status_code=400, detail=f"JSON 파싱 오류: {entry['info_file']}")
+        
+        if not classes:
+            logger.error("info.json 파일에서 클래스 정보를 찾을 수 없습니다.")
+            raise HTTPException(status_code=404, detail="클래스 정보가 없습니다.")
+        
+        logger.info(f"프로젝트 카탈로그에서 클래스 정보 로드 성공: {classes}")
+        return {"classes": classes}
                 
     except HTTPException as http_e:
         # 기존 HTTPException은 그대로 전달
@@ -1518,6 +1565,20 @@ async def get_project_classes(project: Optional[str] = None):
         logger.error(f"프로젝트 클래스 정보 조회 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"프로젝트 클래스 정보 조회 오류: {str(e)}")
 
+@app.get("/api/project-stats", tags=["Projects"])
+async def get_project_stats(project: str = Query(..., description="프로젝트 이름 (YYYY-MM-DD/프로젝트)")):
+    """프로젝트 라벨 통계(클래스별 박스 수, 라벨 없는 이미지 수, 신뢰도 분포)를 반환합니다."""
+    try:
+        stats = await io_pool.run(project_catalog.project_stats, project)
+        if stats is None:
+            raise HTTPException(status_code=404, detail=f"프로젝트를 찾을 수 없습니다: {project}")
+        return {"success": True, "stats": stats}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"프로젝트 통계 조회 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"프로젝트 통계 조회 중 오류가 발생했습니다: {str(e)}")
+
 @app.post("/api/read-label-file", tags=["Projects"])
 async def read_label_file(data: Dict[str, Any]):
     """저장된 라벨 파일을 읽어옵니다."""
@@ -1530,13 +1591,12 @@ async def read_label_file(data: Dict[str, Any]):
         full_path = Path(label_file_path)
         
         # 프로젝트 경로에서 파일 존재 확인
-        if not full_path.exists():
+        if not await io_pool.run(full_path.exists):
             return {"success": False, "message": "라벨 파일을 찾을 수 없습니다.", "content": ""}
         
         # 파일 읽기
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = await io_pool.run(full_path.read_text, encoding='utf-8')
             
             return {
                 "success": True, 
@@ -1600,6 +1660,8 @@ async def load_pipeline_model(
             "pipeline_info": pipeline_manager.get_pipeline_info()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"모델 로드 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
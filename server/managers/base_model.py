@@ -5,8 +5,14 @@ Base model abstract class for all AI models
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from enum import Enum
+import functools
 import logging
 
+from fastapi import HTTPException
+
+from .inference_profiles import get_profile, module_device
+from .result_cache import get_result_cache, image_content_hash, model_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,11 +33,55 @@ class TaskType(Enum):
     POLYGON = "polygon"          # Polygon
 
 
-class BaseModel(ABC):
+class ProfiledModelMixin:
+    """
+    추론 프로파일 적용 공통 구현 (BaseModel 하위 매니저와 메인 YOLO ModelManager가 사용)
+
+    self.model / self.inference_profile을 가진 클래스에 섞어 씁니다.
+    """
+
+    _prepared_profile = None
+
+    def _profile_module(self):
+        """프로파일(메모리 포맷)을 적용할 torch 모듈 (기본값: ultralytics 래퍼의 내부 모델)"""
+        return getattr(self.model, 'model', None)
+
+    def _model_device(self):
+        """로드된 모델의 디바이스"""
+        return module_device(self._profile_module())
+
+    def _prepare_profile(self, profile):
+        """프로파일의 메모리 포맷을 모델에 적용합니다. (변경된 경우에만)"""
+        if self._prepared_profile is profile:
+            return
+        profile.prepare_module(self._profile_module())
+        self._prepared_profile = profile
+
+    def _resolve_profile(self, name: Optional[str]):
+        """
+        이번 호출에 사용할 추론 프로파일
+
+        Args:
+            name: 프로파일 이름 (없으면 로드 시 선택한 프로파일)
+
+        Raises:
+            HTTPException: 알 수 없는 프로파일 이름 (400)
+        """
+        if not name:
+            return getattr(self, 'inference_profile', None) or get_profile(None)
+        try:
+            return get_profile(name)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+
+class BaseModel(ProfiledModelMixin, ABC):
     """
     모든 모델의 추상 베이스 클래스
 
     모든 모델 매니저는 이 클래스를 상속받아 구현해야 합니다.
+    하위 클래스의 load_model/predict는 자동으로 추론 결과 캐시를 거칩니다.
+    (predict 호출 시 use_cache=False로 캐시를 건너뛸 수 있습니다)
     """
 
     def __init__(self):
@@ -41,8 +91,36 @@ class BaseModel(ABC):
         self.task_type: Optional[TaskType] = None
         self.is_loaded = False
         self.model_name = self.__class__.__name__
+        self._fingerprint = None
+        self._prepared_profile = None
         logger.info(f"🔧 {self.model_name} 초기화")
 
+    def __init_subclass__(cls, **kwargs):
+        """하위 클래스의 load_model/predict를 결과 캐시로 감쌉니다."""
+        super().__init_subclass__(**kwargs)
+        if 'load_model' in cls.__dict__:
+            cls.load_model = _with_fingerprint(cls.__dict__['load_model'])
+        if 'predict' in cls.__dict__:
+            cls.predict = _with_result_cache(cls.__dict__['predict'])
+
+    def cache_params(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        결과 캐시 키에 포함할 추론 파라미터
+
+        기본값은 predict에 전달된 모든 kwargs와 실제 적용되는 추론 프로파일입니다.
+
+        Args:
+            kwargs: predict에 전달된 파라미터
+
+        Returns:
+            Dict[str, Any]: 캐시 키 파라미터
+        """
+        params = dict(kwargs)
+        profile = getattr(self, 'inference_profile', None)
+        if not params.get('inference_profile') and profile is not None:
+            params['inference_profile'] = profile.name
+        return params
+
     @abstractmethod
     def load_model(self, model_path: str, **kwargs):
         """
@@ -96,6 +174,8 @@ class BaseModel(ABC):
             del self.model
             self.model = None
             self.is_loaded = False
+            self._fingerprint = None
+            self._prepared_profile = None
             logger.info(f"🗑️ {self.model_name} 언로드 완료")
 
     def __str__(self):
@@ -105,3 +185,45 @@ class BaseModel(ABC):
     def __repr__(self):
         """객체 표현"""
         return self.__str__()
+
+
+def _with_fingerprint(load_model):
+    """load_model 성공 후 모델 지문을 계산하고 이전 지문의 캐시를 무효화합니다."""
+    @functools.wraps(load_model)
+    def wrapper(self, model_path=None, **kwargs):
+        result = load_model(self, model_path, **kwargs)
+        try:
+            options = {k: v for k, v in kwargs.items() if k != 'inference_profile'}
+            model_ref = model_path or getattr(self, 'model_id', None) or kwargs.get('model_id')
+            self._fingerprint = model_fingerprint(model_ref, model_class=self.__class__.__name__, **options)
+            cache = get_result_cache()
+            if cache is not None:
+                cache.register_model(self._fingerprint)
+        except Exception as e:
+            self._fingerprint = None
+            logger.warning(f"⚠️ {self.model_name} 모델 지문 계산 실패 - 결과 캐시 미사용: {str(e)}")
+        return result
+    return wrapper
+
+
+def _with_result_cache(predict):
+    """같은 이미지/모델/파라미터의 predict 결과를 결과 캐시에서 반환합니다."""
+    @functools.wraps(predict)
+    def wrapper(self, image, **kwargs):
+        use_cache = kwargs.pop('use_cache', True)
+        cache = get_result_cache() if use_cache and self.is_loaded and self._fingerprint else None
+        image_hash = image_content_hash(image) if cache is not None else None
+        if image_hash is None:
+            return predict(self, image, **kwargs)
+
+        cache_key = cache.make_key(image_hash, self._fingerprint, self.cache_params(kwargs))
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"🗄️ {self.model_name} 결과 캐시 적중")
+            return cached
+
+        result = predict(self, image, **kwargs)
+        if isinstance(result, dict) and result.get("success", True):
+            cache.put(cache_key, result)
+        return result
+    return wrapper
@@ -4,9 +4,13 @@
 import logging
 from pathlib import Path
 from fastapi import HTTPException
-from PIL import Image
 from typing import Dict, Any, List
 
+try:
+    from ..core.image_probe import probe_image_file
+except ImportError:
+    from core.image_probe import probe_image_file
+
 try:
     # 상대 임포트 시도
     from ..core.utils import get_handle_positions
@@ -76,8 +80,14 @@ class BboxManager:
                     detail=f"이미지를 찾을 수 없습니다: {image_id}"
                 )
             
-            with Image.open(image_path) as img:
-                img_width, img_height = img.size
+            # 헤더만 읽어 이미지 크기 확인 (디코딩하지 않음)
+            header = probe_image_file(image_path)
+            if header is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"이미지 헤더를 읽을 수 없습니다: {image_id}"
+                )
+            img_width, img_height = header.width, header.height
             
             x = new_coords.get("x", 0)
             y = new_coords.get("y", 0)
@@ -3,6 +3,7 @@ Grounding DINO Detection Model Manager
 Grounding DINO 텍스트 프롬프트 기반 객체 탐지 모델 관리자
 Hugging Face Transformers 라이브러리 사용
 """
+import time
 import torch
 import logging
 import numpy as np
@@ -11,6 +12,13 @@ from PIL import Image
 from fastapi import HTTPException
 
 from ..base_model import BaseModel, ModelType, TaskType
+from ..inference_profiles import get_profile
+from .. import tiling
+
+try:
+    from ...core.tracing import span, record_span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
+except ImportError:
+    from core.tracing import span, record_span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +37,7 @@ class GroundingDINOManager(BaseModel):
         self.task_type = TaskType.BBOX
         self.processor = None
         self.model_id = None
+        self.inference_profile = get_profile(None)
 
     def load_model(self, model_path: str = None, **kwargs):
         """
@@ -41,7 +50,13 @@ class GroundingDINOManager(BaseModel):
                 - model_id (str): 모델 ID (model_path 대신 사용 가능)
                 - enable_compile (bool): torch.compile() 사용 여부 (기본값: False)
                   → Windows에서는 Triton 미지원으로 기본 비활성화
+                - inference_profile (str): 추론 프로파일 이름 (기본값: "accurate")
         """
+        try:
+            inference_profile = get_profile(kwargs.get('inference_profile'))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
         try:
             # Transformers 라이브러리 임포트
             try:
@@ -73,6 +88,12 @@ class GroundingDINOManager(BaseModel):
             # GPU로 이동
             self.model.to(device)
 
+            # 추론 프로파일 적용 (torch.compile 이전에 메모리 포맷 변환)
+            self.inference_profile = inference_profile
+            self._prepared_profile = None
+            self._prepare_profile(inference_profile)
+            logger.info(f"  - 추론 프로파일: {inference_profile.name}")
+
             # torch.compile()로 모델 최적화 (PyTorch 2.0+)
             # Windows 환경에서는 Triton 미지원으로 기본 비활성화
             enable_compile = kwargs.get('enable_compile', False)  # 기본값: False (안정성 우선)
@@ -113,7 +134,8 @@ class GroundingDINOManager(BaseModel):
                 "message": f"Grounding DINO model loaded successfully from Hugging Face",
                 "model_id": self.model_id,
                 "supports_text_prompt": True,
-                "device": device
+                "device": device,
+                "inference_profile": inference_profile.name
             }
 
         except Exception as e:
@@ -130,6 +152,10 @@ class GroundingDINOManager(BaseModel):
                 - text_prompt (str): 탐지할 객체 텍스트 프롬프트 (예: "person. car. dog.")
                 - box_threshold (float): 박스 신뢰도 임계값 (기본값: 0.3)
                 - text_threshold (float): 텍스트 신뢰도 임계값 (기본값: 0.25)
+                - inference_profile (str): 이번 호출에만 사용할 추론 프로파일 (기본값: 로드 시 프로파일)
+                - tiled (bool): 고해상도 이미지 타일 분할 추론 사용 여부 (기본값: False)
+                - tile_size (int): 타일 크기 (기본값: 800, 800px 리사이징 기준과 동일)
+                - tile_overlap (float): 타일 겹침 비율 (기본값: 0.2)
 
         Returns:
             Dict[str, Any]: 탐지 결과
@@ -137,6 +163,8 @@ class GroundingDINOManager(BaseModel):
         if not self.validate_model():
             raise HTTPException(status_code=400, detail="모델이 로드되지 않았습니다")
 
+        profile = self._resolve_profile(kwargs.get('inference_profile'))
+
         try:
             # 필수 파라미터 확인
             text_prompt = kwargs.get('text_prompt')
@@ -156,6 +184,7 @@ class GroundingDINOManager(BaseModel):
             logger.info(f"  - Text threshold: {text_threshold}")
 
             # 이미지 전처리
+            stage_start = time.perf_counter()
             if not isinstance(image, Image.Image):
                 if isinstance(image, np.ndarray):
                     image = Image.fromarray(image)
@@ -174,6 +203,33 @@ class GroundingDINOManager(BaseModel):
             max_size = 800
             width, height = image.size
 
+            # 타일 분할 추론 (리사이징으로 작은 객체가 사라지는 고해상도 이미지용)
+            tile_size = int(kwargs.get('tile_size', max_size))
+            if kwargs.get('tiled') and tiling.needs_tiling(width, height, tile_size):
+                record_span(STAGE_PREPROCESS, time.perf_counter() - stage_start)
+                detections, num_passes = self._predict_tiled(
+                    image,
+                    text_prompt=text_prompt,
+                    prompt_classes=prompt_classes,
+                    box_threshold=box_threshold,
+                    text_threshold=text_threshold,
+                    profile=profile,
+                    tile_size=tile_size,
+                    tile_overlap=float(kwargs.get('tile_overlap', tiling.DEFAULT_TILE_OVERLAP)),
+                    max_size=max_size
+                )
+                logger.info(f"✅ Grounding DINO 타일 추론 완료 - 패스: {num_passes}개, 탐지된 객체: {len(detections)}개")
+                return {
+                    "boxes": detections,
+                    "num_detections": len(detections),
+                    "task_type": "bbox",
+                    "model_type": "grounding_dino",
+                    "text_prompt": text_prompt,
+                    "prompt_classes": prompt_classes,
+                    "tiled": True,
+                    "num_tiles": num_passes
+                }
+
             if max(width, height) > max_size:
                 # 비율을 유지하면서 리사이징
                 if width > height:
@@ -199,12 +255,15 @@ class GroundingDINOManager(BaseModel):
                 text=text_prompt,
                 return_tensors="pt"
             ).to(device)
+            record_span(STAGE_PREPROCESS, time.perf_counter() - stage_start)
 
-            # 추론
-            with torch.no_grad():
+            # 추론 (프로파일에 따라 inference_mode/autocast 적용)
+            self._prepare_profile(profile)
+            with span(STAGE_FORWARD), profile.inference_context(device):
                 outputs = self.model(**inputs)
 
             # 후처리 (Transformers API)
+            stage_start = time.perf_counter()
             # 버전에 따라 threshold 파라미터 지원 여부가 다를 수 있음
 
             try:
@@ -261,6 +320,7 @@ class GroundingDINOManager(BaseModel):
                 else:
                     detections = []
 
+            record_span(STAGE_POSTPROCESS, time.perf_counter() - stage_start)
             logger.info(f"✅ Grounding DINO 추론 완료 - 탐지된 객체: {len(detections)}개")
 
             return {
@@ -276,6 +336,115 @@ class GroundingDINOManager(BaseModel):
             logger.error(f"❌ Grounding DINO 추론 실패: {str(e)}")
             raise HTTPException(status_code=500, detail=f"추론 실패: {str(e)}")
 
+    def _predict_tiled(
+        self,
+        image: Image.Image,
+        text_prompt: str,
+        prompt_classes: List[str],
+        box_threshold: float,
+        text_threshold: float,
+        profile,
+        tile_size: int,
+        tile_overlap: float,
+        max_size: int = 800
+    ):
+        """
+        타일 분할 추론
+
+        겹치는 타일과 (800px로 축소한) 전체 이미지를 한 배치로 추론한 뒤
+        타일 좌표를 원본 좌표로 옮겨 레이블별 NMS로 병합합니다.
+
+        Returns:
+            (박스 정보 리스트, 실행한 패스 수)
+        """
+        stage_start = time.perf_counter()
+        windows = tiling.compute_tile_windows(image.width, image.height, tile_size, tile_overlap)
+        crops, offsets = tiling.crop_tiles(image, windows, include_full=True)
+
+        # 전체 이미지 패스는 기존과 동일하게 축소 (후처리 target_size는 원본 크기 사용)
+        target_sizes = [crop.size[::-1] for crop in crops]
+        scale = max_size / max(image.size)
+        if scale < 1.0:
+            crops[-1] = image.resize((int(image.width * scale), int(image.height * scale)), Image.LANCZOS)
+
+        logger.info(f"🧩 Grounding DINO 타일 추론 - 타일: {len(windows)}개 ({tile_size}px, 겹침 {tile_overlap}) + 전체 이미지")
+
+        device = next(self.model.parameters()).device
+        inputs = self.processor(
+            images=crops,
+            text=[text_prompt] * len(crops),
+            return_tensors="pt"
+        ).to(device)
+        record_span(STAGE_PREPROCESS, time.perf_counter() - stage_start)
+
+        self._prepare_profile(profile)
+        with span(STAGE_FORWARD), profile.inference_context(device):
+            outputs = self.model(**inputs)
+
+        stage_start = time.perf_counter()
+
+        try:
+            results = self.processor.post_process_grounded_object_detection(
+                outputs,
+                inputs.input_ids,
+                box_threshold=box_threshold,
+                text_threshold=text_threshold,
+                target_sizes=target_sizes
+            )
+            threshold_applied = True
+        except TypeError:
+            # 구버전: threshold 파라미터 미지원 - 아래에서 수동 필터링
+            results = self.processor.post_process_grounded_object_detection(
+                outputs,
+                inputs.input_ids,
+                target_sizes=target_sizes
+            )
+            threshold_applied = False
+
+        # 레이블 문자열을 정수 그룹으로 변환하여 레이블별 NMS 수행
+        label_index: Dict[str, int] = {}
+        group_labels: List[str] = []
+        per_tile = []
+        for result in results:
+            scores = result["scores"].float().cpu().numpy().reshape(-1)
+            boxes = result["boxes"].float().cpu().numpy().reshape(-1, 4)
+            tile_labels = list(result["labels"])
+            if not threshold_applied:
+                mask = scores >= box_threshold
+                scores, boxes = scores[mask], boxes[mask]
+                tile_labels = [label for label, keep in zip(tile_labels, mask) if keep]
+
+            groups = []
+            for label in tile_labels:
+                key = label.strip().lower()
+                if key not in label_index:
+                    label_index[key] = len(group_labels)
+                    group_labels.append(label)
+                groups.append(label_index[key])
+            per_tile.append((boxes, scores, np.asarray(groups, dtype=np.int64)))
+
+        xyxy, scores, groups = tiling.merge_tile_detections(
+            per_tile, offsets, image.size, window_sizes=np.asarray([crop.size for crop in crops])
+        )
+        if len(xyxy) == 0:
+            record_span(STAGE_POSTPROCESS, time.perf_counter() - stage_start)
+            return [], len(crops)
+
+        detections = self._postprocess_results(
+            boxes=xyxy,
+            scores=scores,
+            labels=[group_labels[group] for group in groups.tolist()],
+            image_size=image.size,
+            prompt_classes=prompt_classes,
+            original_size=image.size
+        )
+        record_span(STAGE_POSTPROCESS, time.perf_counter() - stage_start)
+        return detections, len(crops)
+
+    def _profile_module(self):
+        """프로파일을 적용할 torch 모듈 (transformers 모델 자체)"""
+        return self.model
+
     def _postprocess_results(
         self,
         boxes: torch.Tensor,
@@ -396,6 +565,8 @@ class GroundingDINOManager(BaseModel):
                 - box_threshold (float): 박스 신뢰도 임계값 (기본값: 0.3)
                 - text_threshold (float): 텍스트 신뢰도 임계값 (기본값: 0.25)
                 - batch_size (int): 배치 크기 (기본값: 4)
+                - inference_profile (str): 이번 호출에만 사용할 추론 프로파일 (기본값: 로드 시 프로파일)
+                - tiled (bool): 타일 분할 추론 사용 여부 - 이미지별로 타일 전체를 한 배치로 실행 (기본값: False)
 
         Returns:
             List[Dict[str, Any]]: 각 이미지별 탐지 결과 리스트
@@ -403,6 +574,8 @@ class GroundingDINOManager(BaseModel):
         if not self.validate_model():
             raise HTTPException(status_code=400, detail="모델이 로드되지 않았습니다")
 
+        profile = self._resolve_profile(kwargs.get('inference_profile'))
+
         try:
             # 필수 파라미터 확인
             text_prompt = kwargs.get('text_prompt')
@@ -412,10 +585,16 @@ class GroundingDINOManager(BaseModel):
             box_threshold = kwargs.get('box_threshold', 0.3)
             text_threshold = kwargs.get('text_threshold', 0.25)
             batch_size = kwargs.get('batch_size', 4)
+            self._prepare_profile(profile)
 
             # 프롬프트에서 클래스 순서 추출
             prompt_classes = [cls.strip() for cls in text_prompt.split('.') if cls.strip()]
 
+            # 타일 추론은 이미지 하나의 타일들이 이미 하나의 배치이므로 이미지 단위로 실행
+            if kwargs.get('tiled'):
+                logger.info(f"🧩 Grounding DINO 타일 배치 추론 - 총 이미지 수: {len(images)}개")
+                return [self.predict(img, **kwargs) for img in images]
+
             logger.info(f"🔍 Grounding DINO 배치 추론 시작")
             logger.info(f"  - 총 이미지 수: {len(images)}개")
             logger.info(f"  - 배치 크기: {batch_size}")
@@ -434,6 +613,7 @@ class GroundingDINOManager(BaseModel):
                 logger.info(f"📦 배치 {batch_num}/{total_batches} 처리 중 ({len(batch_images)}개 이미지)")
 
                 # 배치 이미지 전처리
+                stage_start = time.perf_counter()
                 processed_images = []
                 original_sizes = []
 
@@ -475,12 +655,14 @@ class GroundingDINOManager(BaseModel):
                     text=[text_prompt] * len(processed_images),  # 각 이미지에 동일한 프롬프트
                     return_tensors="pt"
                 ).to(device)
+                record_span(STAGE_PREPROCESS, time.perf_counter() - stage_start)
 
                 # 배치 추론
-                with torch.no_grad():
+                with span(STAGE_FORWARD), profile.inference_context(device):
                     outputs = self.model(**inputs)
 
                 # 배치 후처리
+                stage_start = time.perf_counter()
                 try:
                     # 최신 버전: box_threshold, text_threshold 지원
                     results = self.processor.post_process_grounded_object_detection(
@@ -548,6 +730,7 @@ class GroundingDINOManager(BaseModel):
                         "prompt_classes": prompt_classes
                     })
 
+                record_span(STAGE_POSTPROCESS, time.perf_counter() - stage_start)
                 logger.info(f"✅ 배치 {batch_num}/{total_batches} 완료")
 
             logger.info(f"✅ 전체 배치 추론 완료 - 총 {len(all_results)}개 이미지 처리")
@@ -575,5 +758,6 @@ class GroundingDINOManager(BaseModel):
             "supports_batch_inference": True,
             "zero_shot": True,
             "model_id": self.model_id,
-            "source": "Hugging Face Hub"
+            "source": "Hugging Face Hub",
+            "inference_profile": self.inference_profile.name
         }
@@ -11,6 +11,13 @@ from PIL import Image
 from fastapi import HTTPException
 
 from ..base_model import BaseModel, ModelType, TaskType
+from ..inference_profiles import get_profile
+from .. import tiling
+
+try:
+    from ...core.tracing import span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
+except ImportError:
+    from core.tracing import span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +34,7 @@ class YOLOManager(BaseModel):
         self.model_type = ModelType.DETECTION
         self.task_type = TaskType.BBOX
         self.classes = None
+        self.inference_profile = get_profile(None)
 
     def load_model(self, model_path: str, **kwargs):
         """
@@ -35,7 +43,13 @@ class YOLOManager(BaseModel):
         Args:
             model_path (str): 모델 파일 경로 (.pt, .pth)
             **kwargs: 추가 설정
+                - inference_profile (str): 추론 프로파일 이름 (기본값: "accurate")
         """
+        try:
+            inference_profile = get_profile(kwargs.get('inference_profile'))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
         try:
             from ultralytics import YOLO
 
@@ -54,6 +68,11 @@ class YOLOManager(BaseModel):
             else:
                 logger.info(f"✅ YOLO 모델을 CPU로 로드")
 
+            # 추론 프로파일 적용
+            self.inference_profile = inference_profile
+            self._prepared_profile = None
+            self._prepare_profile(inference_profile)
+
             # 클래스 정보 저장
             self.classes = self.model.names
             self.is_loaded = True
@@ -62,7 +81,8 @@ class YOLOManager(BaseModel):
             return {
                 "success": True,
                 "message": f"Model {model_path.name} loaded successfully",
-                "num_classes": len(self.classes)
+                "num_classes": len(self.classes),
+                "inference_profile": inference_profile.name
             }
 
         except Exception as e:
@@ -79,6 +99,10 @@ class YOLOManager(BaseModel):
                 - confidence_threshold (float): 신뢰도 임계값 (기본값: 0.5)
                 - selected_classes (List[str]): 필터링할 클래스 목록
                 - imgsz (int): 추론 이미지 크기 (기본값: 640)
+                - inference_profile (str): 이번 호출에만 사용할 추론 프로파일 (기본값: 로드 시 프로파일)
+                - tiled (bool): 고해상도 이미지 타일 분할 추론 사용 여부 (기본값: False)
+                - tile_size (int): 타일 크기 (기본값: 640)
+                - tile_overlap (float): 타일 겹침 비율 (기본값: 0.2)
 
         Returns:
             Dict[str, Any]: 탐지 결과
@@ -86,38 +110,48 @@ class YOLOManager(BaseModel):
         if not self.validate_model():
             raise HTTPException(status_code=400, detail="모델이 로드되지 않았습니다")
 
+        if kwargs.get('tiled'):
+            return self._predict_tiled(image, **kwargs)
+
+        profile = self._resolve_profile(kwargs.get('inference_profile'))
+
         try:
             # 파라미터 추출
             confidence_threshold = kwargs.get('confidence_threshold', 0.5)
             selected_classes = kwargs.get('selected_classes', None)
             imgsz = kwargs.get('imgsz', 640)
 
-            logger.info(f"🔍 YOLO 추론 시작 - 신뢰도: {confidence_threshold}")
+            logger.info(f"🔍 YOLO 추론 시작 - 신뢰도: {confidence_threshold}, 프로파일: {profile.name}")
 
             # 이미지 전처리
-            processed_image = self._preprocess_image(image)
+            with span(STAGE_PREPROCESS):
+                processed_image = self._preprocess_image(image)
 
             # YOLO 추론 실행
-            results = self.model.predict(
-                processed_image,
-                imgsz=imgsz,
-                conf=confidence_threshold,
-                iou=0.5,
-                max_det=300,
-                augment=False,
-                agnostic_nms=False,
-                classes=None,
-                half=False,
-                device=None,
-                verbose=False,
-                save=False,
-                retina_masks=False,
-                rect=True,
-                batch=1
-            )
+            self._prepare_profile(profile)
+            device = self._model_device()
+            with span(STAGE_FORWARD), profile.inference_context(device):
+                results = self.model.predict(
+                    processed_image,
+                    imgsz=imgsz,
+                    conf=confidence_threshold,
+                    iou=0.5,
+                    max_det=300,
+                    augment=False,
+                    agnostic_nms=False,
+                    classes=None,
+                    half=profile.use_half(device),
+                    device=None,
+                    verbose=False,
+                    save=False,
+                    retina_masks=False,
+                    rect=True,
+                    batch=1
+                )
 
             # 결과 후처리
-            boxes = self._postprocess_results(results[0], selected_classes)
+            with span(STAGE_POSTPROCESS):
+                boxes = self._postprocess_results(results[0], selected_classes)
 
             logger.info(f"✅ YOLO 추론 완료 - 탐지된 객체: {len(boxes)}개")
 
@@ -132,6 +166,65 @@ class YOLOManager(BaseModel):
             logger.error(f"❌ YOLO 추론 실패: {str(e)}")
             raise HTTPException(status_code=500, detail=f"추론 실패: {str(e)}")
 
+    def _predict_tiled(self, image, **kwargs) -> Dict[str, Any]:
+        """
+        타일 분할 추론 (이미지 하나의 모든 타일을 한 배치로 실행 후 타일 간 NMS로 병합)
+
+        이미지가 타일보다 작으면 일반 추론과 동일하게 처리합니다.
+        """
+        profile = self._resolve_profile(kwargs.get('inference_profile'))
+
+        try:
+            confidence_threshold = kwargs.get('confidence_threshold', 0.5)
+            selected_classes = kwargs.get('selected_classes', None)
+            tile_size = int(kwargs.get('tile_size', tiling.DEFAULT_TILE_SIZE))
+            tile_overlap = float(kwargs.get('tile_overlap', tiling.DEFAULT_TILE_OVERLAP))
+
+            with span(STAGE_PREPROCESS):
+                pil_image = tiling.to_pil_rgb(self._preprocess_image(image))
+            if not tiling.needs_tiling(pil_image.width, pil_image.height, tile_size):
+                return self.predict(pil_image, **{**kwargs, 'tiled': False, 'imgsz': tile_size})
+
+            logger.info(f"🧩 YOLO 타일 추론 시작 - 이미지: {pil_image.size}, 타일: {tile_size}px, 겹침: {tile_overlap}")
+
+            self._prepare_profile(profile)
+            device = self._model_device()
+            with span(STAGE_FORWARD), profile.inference_context(device):
+                xyxy, scores, class_ids, num_passes = tiling.predict_ultralytics_tiled(
+                    self.model,
+                    pil_image,
+                    tile_size=tile_size,
+                    overlap=tile_overlap,
+                    conf=confidence_threshold,
+                    iou=0.5,
+                    max_det=300,
+                    half=profile.use_half(device)
+                )
+
+            with span(STAGE_POSTPROCESS):
+                boxes = tiling.detections_to_boxes(
+                    xyxy, scores, class_ids, pil_image.size, self.classes, selected_classes
+                )
+
+            logger.info(f"✅ YOLO 타일 추론 완료 - 패스: {num_passes}개, 탐지된 객체: {len(boxes)}개")
+
+            return {
+                "boxes": boxes,
+                "num_detections": len(boxes),
+                "task_type": "bbox",
+                "model_type": "yolo",
+                "tiled": True,
+                "num_tiles": num_passes
+            }
+
+        except HTTPException:
+            raise
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"❌ YOLO 타일 추론 실패: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"타일 추론 실패: {str(e)}")
+
     def _preprocess_image(self, image_input):
         """
         이미지 전처리
@@ -246,7 +339,8 @@ class YOLOManager(BaseModel):
             "task": "detection",
             "framework": "ultralytics",
             "device": "cuda" if torch.cuda.is_available() else "cpu",
-            "is_loaded": self.is_loaded
+            "is_loaded": self.is_loaded,
+            "inference_profile": self.inference_profile.name
         }
 
         if self.is_loaded and self.classes:
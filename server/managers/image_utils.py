@@ -5,7 +5,11 @@ import os
 import logging
 import time
 import json
+import asyncio
+import hashlib
+import tempfile
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import HTTPException
 from PIL import Image
 import base64
@@ -51,6 +55,23 @@ except ImportError:
             
             return image_files
 
+try:
+    from ..core.config import get_memory_store_settings, MAX_FILE_SIZE, UPLOAD_WORKERS
+    from ..core.content_store import ContentStore
+    from ..core.file_index import get_file_index
+    from ..core.image_probe import (
+        probe_image_header, probe_with_decoder, TrailerScanner, NeedMoreData, MAX_HEADER_BYTES
+    )
+except ImportError:
+    from core.config import get_memory_store_settings, MAX_FILE_SIZE, UPLOAD_WORKERS
+    from core.content_store import ContentStore
+    from core.file_index import get_file_index
+    from core.image_probe import (
+        probe_image_header, probe_with_decoder, TrailerScanner, NeedMoreData, MAX_HEADER_BYTES
+    )
+
+from .memory_store import MemoryImageStore
+
 def get_project_dir(upload_dir, project_path):
     """
     프로젝트 디렉터리 경로를 반환합니다.
@@ -78,19 +99,59 @@ def get_project_dir(upload_dir, project_path):
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 스트리밍 업로드 청크 크기
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def _normalize_prefix(prefix):
+    """목록 필터 접두사를 디렉토리 경계의 상대 경로로 정규화합니다. ("2024-01-01" → "2024-01-01/")"""
+    if not prefix:
+        return ''
+    prefix = prefix.replace('\\', '/').strip('/')
+    if prefix.startswith("upload_images/"):
+        prefix = prefix[len("upload_images/"):]
+    return f"{prefix}/" if prefix else ''
+
+def _encode_cursor(path):
+    """페이지 커서 (마지막 경로를 URL-safe base64로 인코딩)"""
+    return base64.urlsafe_b64encode(path.encode('utf-8')).decode('ascii').rstrip('=')
+
+def _decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        return base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
 class ImageManager:
     def __init__(self, upload_dir):
         self.upload_dir = upload_dir
-        self.image_files = []
-        self.memory_images = {}  # 메모리에 저장된 임시 이미지들 (파일명: {"data": bytes, "metadata": dict})
+        # 메모리에 저장된 임시 이미지들 (바이트 예산 LRU, 파일명: {"data": bytes, "metadata": dict})
+        self.memory_images = MemoryImageStore(**get_memory_store_settings())
+        # 디스크 이미지 중복 제거 저장소 (upload_dir/.blobs, 프로젝트에는 하드링크로 배치)
+        self.content_store = ContentStore(upload_dir)
+        # 파일명/상대 경로 인덱스 (find_image_paths가 디렉토리 순회 없이 조회)
+        self.file_index = get_file_index(upload_dir)
+        # 업로드 검증 워커 풀 (이벤트 루프를 막지 않고 여러 파일을 동시에 처리)
+        self._upload_executor = ThreadPoolExecutor(max_workers=max(1, UPLOAD_WORKERS), thread_name_prefix="upload")
         
+    @property
+    def image_files(self):
+        """정렬된 이미지 상대 경로 목록 (파일명 인덱스가 유지)"""
+        return self.file_index.listed_paths()
+
     def load_existing_images(self):
         """
         서버의 이미지 파일 목록을 메모리에 로드합니다.
         새로운 폴더 구조에 맞게 모든 프로젝트의 이미지를 조회합니다.
         """
-        # scan_image_files 함수 사용으로 중복 제거
-        self.image_files = scan_image_files(self.upload_dir, exclude_temp=True)
+        # 시작 시 한 번만 전체 순회 (이후에는 refresh_images가 변경된 디렉토리만 다시 읽음)
+        self.file_index.build()
             
     def list_images(self):
         """
@@ -100,10 +161,11 @@ class ImageManager:
             이미지 목록 정보
         """
         try:
+            images = self.image_files
             return {
                 "success": True,
-                "images": sorted(self.image_files),
-                "total_count": len(self.image_files)
+                "images": images,
+                "total_count": len(images)
             }
         except Exception as e:
             logger.error(f"이미지 목록 조회 오류: {str(e)}")
@@ -112,24 +174,64 @@ class ImageManager:
                 detail="이미지 목록을 가져올 수 없습니다."
             )
             
+    def list_images_page(self, prefix=None, cursor=None, limit=500):
+        """
+        이미지 목록을 커서 기반 페이지로 반환합니다.
+        정렬된 인덱스에서 바로 잘라내므로 페이지마다 정렬/스캔하지 않습니다.
+        
+        Args:
+            prefix: 날짜/프로젝트 경로 접두사 (예: "2024-01-01" 또는 "2024-01-01/project")
+            cursor: 이전 응답의 next_cursor (처음 페이지는 None)
+            limit: 페이지 크기
+            
+        Returns:
+            이미지 목록 페이지 정보
+        """
+        path_prefix = _normalize_prefix(prefix)
+        after = _decode_cursor(cursor) if cursor else None
+        images, last = self.file_index.page(path_prefix, after, limit)
+        return {
+            "success": True,
+            "images": images,
+            "count": len(images),
+            "prefix": path_prefix or None,
+            "next_cursor": _encode_cursor(last) if last else None
+        }
+
+    def count_images(self, prefix=None):
+        """
+        접두사에 해당하는 이미지 수를 반환합니다.
+        
+        Args:
+            prefix: 날짜/프로젝트 경로 접두사 (없으면 전체)
+        """
+        path_prefix = _normalize_prefix(prefix)
+        return {
+            "success": True,
+            "prefix": path_prefix or None,
+            "total_count": self.file_index.count(path_prefix)
+        }
+            
     def refresh_images(self):
         """
         이미지 목록을 새로고침합니다.
+        디렉토리 mtime이 바뀐 디렉토리만 다시 읽습니다.
         
         Returns:
             업데이트된 이미지 목록 정보
         """
         try:
-            # scan_image_files 함수 사용으로 중복 제거
-            self.image_files = scan_image_files(self.upload_dir, exclude_temp=True)
+            changes = self.file_index.refresh()
+            images = self.image_files
             
-            logger.info(f"이미지 목록 새로고침 완료: {len(self.image_files)}개 파일 찾음")
+            logger.info(f"이미지 목록 새로고침 완료: {len(images)}개 파일 찾음 (+{changes['added']} / -{changes['removed']})")
             
             return {
                 "success": True,
-                "message": f"이미지 목록 새로고침 완료: {len(self.image_files)}개 파일 찾음",
-                "images": sorted(self.image_files),
-                "total_count": len(self.image_files)
+                "message": f"이미지 목록 새로고침 완료: {len(images)}개 파일 찾음",
+                "images": images,
+                "total_count": len(images),
+                "changes": changes
             }
         except Exception as e:
             logger.error(f"이미지 목록 새로고침 오류: {str(e)}")
@@ -169,16 +271,36 @@ class ImageManager:
             filename: 파일명
             image_data: 이미지 바이너리 데이터
             metadata: 추가 메타데이터 (width, height, project 등)
+
+        Returns:
+            str: 콘텐츠 해시 (같은 바이트는 한 벌만 저장)
         """
-        if metadata is None:
-            metadata = {}
-            
-        self.memory_images[filename] = {
-            "data": image_data,
-            "metadata": metadata,
-            "timestamp": time.time()
-        }
-        logger.info(f"이미지를 메모리에 저장: {filename} ({len(image_data)} bytes)")
+        content_hash = self.memory_images.put(filename, image_data, metadata)
+        logger.info(f"이미지를 메모리에 저장: {filename} ({len(image_data)} bytes, hash={content_hash[:12]})")
+        return content_hash
+
+    def link_memory_image(self, filename, content_hash, metadata=None):
+        """
+        이미 메모리에 있는 이미지를 콘텐츠 해시로 참조하여 새 파일명으로 등록합니다.
+
+        Args:
+            filename: 등록할 파일명
+            content_hash: 업로드 시 반환된 콘텐츠 해시
+            metadata: 추가 메타데이터
+
+        Returns:
+            bool: 해당 해시의 이미지가 있으면 True
+        """
+        return self.memory_images.link(filename, content_hash, metadata)
+
+    def get_memory_image_by_hash(self, content_hash):
+        """
+        콘텐츠 해시로 메모리 이미지 데이터를 가져옵니다.
+
+        Returns:
+            이미지 바이너리 데이터 또는 None
+        """
+        return self.memory_images.get_by_hash(content_hash)
     
     def get_memory_image(self, filename):
         """
@@ -188,11 +310,9 @@ class ImageManager:
             filename: 파일명
             
         Returns:
-            이미지 바이너리 데이터 또는 None
+            이미지 바이너리 데이터 또는 None (예산 초과로 제거되었거나 만료된 경우 포함)
         """
-        if filename in self.memory_images:
-            return self.memory_images[filename]["data"]
-        return None
+        return self.memory_images.get(filename)
     
     def remove_memory_image(self, filename):
         """
@@ -201,22 +321,33 @@ class ImageManager:
         Args:
             filename: 파일명
         """
-        if filename in self.memory_images:
-            del self.memory_images[filename]
+        if self.memory_images.remove(filename):
             logger.info(f"메모리에서 이미지 제거: {filename}")
     
     def clear_memory_images(self):
         """
         모든 메모리 이미지를 정리합니다.
         """
-        count = len(self.memory_images)
-        self.memory_images.clear()
+        count = self.memory_images.clear()
         logger.info(f"메모리 이미지 {count}개 정리 완료")
+
+    def get_memory_stats(self):
+        """
+        메모리 이미지 저장소 사용량 통계를 반환합니다.
+
+        Returns:
+            메모리/스필 바이트, 항목 수, 적중률, 제거/만료 횟수
+        """
+        return self.memory_images.stats()
             
     async def upload_files(self, files, project):
         """
         이미지 파일을 메모리에 업로드합니다. (디스크 임시 저장 제거)
         
+        각 파일을 청크 단위로 읽으면서 해시 계산, 헤더 검사(포맷/크기), 저장소 기록을 한 번에 처리하므로
+        파일 전체를 메모리에 올리거나 디코딩하지 않습니다.
+        파일별 수신/검증은 워커 풀에서 동시에 실행하고, 결과는 업로드 순서대로 반영합니다.
+        
         Args:
             files: 업로드할 파일 목록
             project: 대상 프로젝트명
@@ -228,52 +359,81 @@ class ImageManager:
         
         logger.info(f"[MEMORY] 메모리 기반 이미지 업로드 시작: 프로젝트={project}")
         
-        # 각 파일 처리
+        accepted = []
         for file in files:
+            file_ext = os.path.splitext(file.filename or "")[1].lower()
+            if file_ext not in ['.jpg', '.jpeg', '.png']:
+                logger.warning(f"지원하지 않는 파일 형식: {file.filename}")
+                continue
+            accepted.append(file)
+        
+        # 파일 데이터를 워커 풀에서 스트리밍으로 수신 (해시 + 헤더 검사 + 임시 파일 기록)
+        loop = asyncio.get_running_loop()
+        staged_results = await asyncio.gather(
+            *(loop.run_in_executor(self._upload_executor, self._stage_upload, file.file) for file in accepted),
+            return_exceptions=True
+        )
+        
+        # 업로드 순서대로 저장소에 반영 (같은 배치 안의 중복은 먼저 올라온 파일이 원본)
+        for file, staged in zip(accepted, staged_results):
             try:
-                file_ext = os.path.splitext(file.filename)[1].lower()
-                if file_ext not in ['.jpg', '.jpeg', '.png']:
-                    logger.warning(f"지원하지 않는 파일 형식: {file.filename}")
+                if isinstance(staged, ValueError):
+                    logger.error(f"잘못된 이미지 파일 ({file.filename}): {str(staged)}")
                     continue
+                if isinstance(staged, BaseException):
+                    raise staged
                 
-                # 파일 데이터 읽기
-                image_data = await file.read()
+                tmp_path, size, digest, header = staged
                 
-                # 이미지 파일 유효성 검사
-                try:
-                    from io import BytesIO
-                    
-                    # 이미지 검증
-                    with Image.open(BytesIO(image_data)) as img:
-                        img.verify()
-                    
-                    # 크기 정보 가져오기 (verify() 후에는 다시 열어야 함)
-                    with Image.open(BytesIO(image_data)) as img:
-                        width, height = img.size
-                        
-                    # 메모리에 이미지 저장
-                    metadata = {
-                        "width": width,
-                        "height": height,
-                        "project": project,
-                        "size": len(image_data)
-                    }
-                    
-                    self.add_memory_image(file.filename, image_data, metadata)
-                    
-                    # 응답에 이미지 정보 추가
+                # 이미 올라온 동일 이미지는 검증 없이 참조만 추가
+                known_metadata = self.memory_images.metadata_by_hash(digest)
+                if known_metadata and "width" in known_metadata:
+                    _remove_quietly(tmp_path)
+                    metadata = {**known_metadata, "project": project}
+                    self.link_memory_image(file.filename, digest, metadata)
                     uploaded_files.append({
                         "filename": file.filename,
-                        "path": f"memory/{file.filename}",  # 메모리 경로 식별자
-                        "width": width,
-                        "height": height
+                        "path": f"memory/{file.filename}",
+                        "width": metadata["width"],
+                        "height": metadata["height"],
+                        "hash": digest,
+                        "duplicate": True
                     })
-                    
-                    logger.info(f"[MEMORY] 이미지 메모리 업로드 성공: {file.filename} ({len(image_data)} bytes)")
-                    
-                except Exception as img_error:
-                    logger.error(f"잘못된 이미지 파일 ({file.filename}): {str(img_error)}")
+                    logger.info(f"[MEMORY] 중복 이미지 참조 추가: {file.filename} (hash={digest[:12]})")
                     continue
+                
+                # 이미지 파일 유효성 검사 (헤더 + 종료 표식)
+                if header is None:
+                    _remove_quietly(tmp_path)
+                    logger.error(f"잘못된 이미지 파일 ({file.filename}): 이미지 헤더를 읽을 수 없습니다")
+                    continue
+                
+                width, height = header.width, header.height
+                
+                # 메모리에 이미지 저장 (예산이 부족하면 임시 파일을 스필 항목으로 그대로 등록)
+                metadata = {
+                    "width": width,
+                    "height": height,
+                    "project": project,
+                    "size": size
+                }
+                
+                await loop.run_in_executor(
+                    self._upload_executor, self.memory_images.put_file,
+                    file.filename, tmp_path, size, digest, metadata
+                )
+                
+                # 응답에 이미지 정보 추가
+                uploaded_files.append({
+                    "filename": file.filename,
+                    "path": f"memory/{file.filename}",  # 메모리 경로 식별자
+                    "width": width,
+                    "height": height,
+                    "hash": digest,  # 이후 요청에서 바이트 대신 해시로 참조 가능
+                    "duplicate": False
+                })
+                
+                logger.info(f"[MEMORY] 이미지 메모리 업로드 성공: {file.filename} ({size} bytes)")
                     
             except Exception as e:
                 logger.error(f"파일 업로드 오류 ({file.filename}): {str(e)}")
@@ -289,6 +449,74 @@ class ImageManager:
             "files": uploaded_files,
             "project": project
         }
+    
+    def _stage_upload(self, source):
+        """
+        업로드 파일을 청크 단위로 저장소 임시 파일에 기록합니다. (워커 스레드에서 실행)
+        
+        Args:
+            source: 업로드 파일 객체 (UploadFile.file)
+        
+        Returns:
+            (임시 파일 경로, 크기, 콘텐츠 해시, ImageHeader 또는 None)
+            헤더가 손상되었거나 파일이 잘린 경우(종료 표식 없음) ImageHeader는 None입니다.
+        
+        Raises:
+            ValueError: 최대 업로드 크기 초과
+        """
+        fd, tmp_path = tempfile.mkstemp(prefix=".upload_", dir=str(self.memory_images.staging_dir()))
+        digest = hashlib.sha256()
+        head = bytearray()
+        header = None
+        header_done = False
+        use_decoder = False
+        scanner = None
+        size = 0
+        
+        try:
+            source.seek(0)
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = source.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > MAX_FILE_SIZE:
+                        raise ValueError(f"파일 크기가 최대 업로드 크기({MAX_FILE_SIZE} bytes)를 초과합니다")
+                    digest.update(chunk)
+                    out.write(chunk)
+                    
+                    if header_done:
+                        if scanner is not None:
+                            scanner.feed(chunk)
+                        continue
+                    
+                    head += chunk
+                    try:
+                        header = probe_image_header(bytes(head))
+                    except NeedMoreData:
+                        if len(head) < MAX_HEADER_BYTES:
+                            continue
+                        # SOF가 헤더 예산 밖 (큰 APP 세그먼트를 가진 JPEG) - 저장 후 PIL로 확인하고
+                        # EOI는 예산 이후 바이트에서 찾음
+                        use_decoder = True
+                        scanner = TrailerScanner("jpeg")
+                        scanner.feed(bytes(head[MAX_HEADER_BYTES:]))
+                    else:
+                        if header is not None:
+                            scanner = TrailerScanner(header.format)
+                            scanner.feed(bytes(head[header.data_offset:]))
+                    header_done = True
+                    head = None
+        except BaseException:
+            _remove_quietly(tmp_path)
+            raise
+        
+        if use_decoder:
+            header = probe_with_decoder(tmp_path)
+        if header is not None and (scanner is None or not scanner.valid):
+            header = None
+        return tmp_path, size, digest.hexdigest(), header
         
     def save_yolo_format(self, project_path, filename, label_data, image_data=None, overwrite=False):
         """
@@ -341,21 +569,12 @@ class ImageManager:
                 # 메모리 이미지 확인
                 memory_data = self.get_memory_image(filename)
                 if memory_data:
-                    # 메모리에서 디스크로 저장
-                    with open(dest_image_path, "wb") as f:
-                        f.write(memory_data)
+                    # 메모리에서 디스크로 저장 (콘텐츠 해시 blob + 하드링크)
+                    self.content_store.store_bytes_at(memory_data, dest_image_path)
+                    # 전역 이미지 목록(파일명 인덱스)에 추가
+                    self.file_index.add(dest_image_path)
                     logger.info(f"메모리 이미지를 디스크에 저장: {filename}")
                     
-                    # 전역 이미지 목록에 추가
-                    try:
-                        # 프로젝트 상대 경로 생성
-                        rel_project_path = project_dir.relative_to(self.upload_dir)
-                        rel_path = str(rel_project_path / "images" / filename)
-                        if rel_path not in self.image_files:
-                            self.image_files.append(rel_path)
-                    except Exception as e:
-                        logger.warning(f"이미지 파일 목록 업데이트 오류: {str(e)}")
-                    
                     # 메모리에서 제거
                     self.remove_memory_image(filename)
                     image_processed = True
@@ -375,9 +594,9 @@ class ImageManager:
                             # base64 문자열인 경우
                             image_binary = base64.b64decode(image_data)
                         
-                        # 이미지 저장
-                        with open(dest_image_path, "wb") as f:
-                            f.write(image_binary)
+                        # 이미지 저장 (콘텐츠 해시 blob + 하드링크)
+                        self.content_store.store_bytes_at(image_binary, dest_image_path)
+                        self.file_index.add(dest_image_path)
                         logger.info(f"base64 이미지 데이터로 이미지 저장: {dest_image_path}")
                         image_processed = True
                     except Exception as e:
@@ -436,9 +655,9 @@ class ImageManager:
             # Base64 디코딩
             image_bytes = base64.b64decode(image_base64)
             
-            # 파일 저장
-            with open(target_path, "wb") as f:
-                f.write(image_bytes)
+            # 파일 저장 (콘텐츠 해시 blob + 하드링크, 기존 링크는 덮어쓰지 않고 교체)
+            self.content_store.store_bytes_at(image_bytes, target_path)
+            self.file_index.add(target_path)
                 
             return True
         except Exception as e:
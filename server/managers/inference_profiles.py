@@ -0,0 +1,350 @@
+"""
+Inference profiles for CPU/GPU precision settings
+모델 로드 시 선택 가능한 추론 프로파일 (정밀도, 스레드 수, 메모리 포맷)
+"""
+import os
+import time
+import logging
+import contextlib
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Callable
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "accurate"
+
+
+@dataclass(frozen=True)
+class InferenceProfile:
+    """
+    추론 프로파일
+
+    Attributes:
+        name: 프로파일 이름
+        description: 설명
+        autocast_dtype: autocast에 사용할 dtype (None이면 fp32 그대로 실행)
+        use_inference_mode: torch.inference_mode() 사용 여부 (False면 torch.no_grad())
+        channels_last: 4D 가중치를 channels_last 메모리 포맷으로 변환할지 여부
+        num_threads: 추론 중에만 사용할 torch CPU 스레드 수 (None이면 변경하지 않음)
+        half_on_gpu: GPU에서 FP16 추론 사용 여부
+    """
+    name: str
+    description: str
+    autocast_dtype: Optional[torch.dtype] = None
+    use_inference_mode: bool = False
+    channels_last: bool = False
+    num_threads: Optional[int] = None
+    half_on_gpu: bool = False
+
+    def use_half(self, device) -> bool:
+        """ultralytics predict(half=...)에 전달할 값"""
+        return self.half_on_gpu and _device_type(device) == "cuda"
+
+    def prepare_module(self, module):
+        """
+        모델 모듈의 메모리 포맷을 프로파일에 맞게 변환합니다.
+
+        Args:
+            module: torch.nn.Module (None이면 무시)
+        """
+        if module is None or not hasattr(module, "to"):
+            return module
+        memory_format = torch.channels_last if self.channels_last else torch.contiguous_format
+        try:
+            module.to(memory_format=memory_format)
+        except Exception as e:
+            logger.warning(f"⚠️ 메모리 포맷 변환 실패 ({self.name}): {str(e)}")
+        return module
+
+    def inference_context(self, device="cpu"):
+        """
+        추론 시 사용할 컨텍스트 (inference_mode/no_grad + autocast + CPU 스레드 수)
+
+        torch 스레드 수는 프로세스 전역 설정이므로 블록 안에서만 바꾸고 나갈 때 되돌립니다.
+
+        Args:
+            device: 모델 디바이스 (문자열 또는 torch.device)
+
+        Returns:
+            contextlib.ExitStack
+        """
+        stack = contextlib.ExitStack()
+        if self.num_threads and torch.get_num_threads() != self.num_threads:
+            stack.callback(torch.set_num_threads, torch.get_num_threads())
+            torch.set_num_threads(self.num_threads)
+        stack.enter_context(torch.inference_mode() if self.use_inference_mode else torch.no_grad())
+
+        if self.autocast_dtype is not None:
+            device_type = _device_type(device)
+            # GPU에서는 bf16 대신 fp16 autocast 사용 (지원 범위가 더 넓음)
+            dtype = torch.float16 if device_type == "cuda" and self.half_on_gpu else self.autocast_dtype
+            try:
+                stack.enter_context(torch.autocast(device_type=device_type, dtype=dtype))
+            except Exception as e:
+                logger.warning(f"⚠️ autocast 활성화 실패 ({self.name}, {device_type}): {str(e)}")
+        return stack
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 dict로 변환"""
+        data = asdict(self)
+        data["autocast_dtype"] = str(self.autocast_dtype).replace("torch.", "") if self.autocast_dtype else "float32"
+        return data
+
+
+INFERENCE_PROFILES: Dict[str, InferenceProfile] = {
+    "accurate": InferenceProfile(
+        name="accurate",
+        description="FP32 reference inference (기본값)"
+    ),
+    "fast": InferenceProfile(
+        name="fast",
+        description="bf16 autocast + inference_mode + channels_last (GPU에서는 FP16)",
+        autocast_dtype=torch.bfloat16,
+        use_inference_mode=True,
+        channels_last=True,
+        num_threads=os.cpu_count(),
+        half_on_gpu=True
+    ),
+}
+
+
+def _device_type(device) -> str:
+    """디바이스 표현을 autocast device_type 문자열로 변환"""
+    if device is None:
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    device_str = str(device)
+    return "cuda" if device_str.startswith("cuda") else "cpu"
+
+
+def module_device(module):
+    """torch 모듈의 디바이스 (파라미터가 없으면 사용 가능한 기본 디바이스)"""
+    try:
+        return next(module.parameters()).device
+    except Exception:
+        return "cuda:0" if torch.cuda.is_available() else "cpu"
+
+
+def get_profile(name: Optional[str]) -> InferenceProfile:
+    """
+    이름으로 추론 프로파일을 가져옵니다.
+
+    Args:
+        name: 프로파일 이름 (None이면 기본 프로파일)
+
+    Returns:
+        InferenceProfile
+
+    Raises:
+        ValueError: 알 수 없는 프로파일인 경우
+    """
+    profile = INFERENCE_PROFILES.get(name or DEFAULT_PROFILE)
+    if profile is None:
+        available = ", ".join(INFERENCE_PROFILES.keys())
+        raise ValueError(f"지원하지 않는 추론 프로파일: {name}. 사용 가능한 프로파일: {available}")
+    return profile
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """등록된 프로파일 목록"""
+    return [profile.to_dict() for profile in INFERENCE_PROFILES.values()]
+
+
+def comparison_boxes(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    파이프라인 모델의 predict 결과에서 일치도 비교용 박스 목록을 추출합니다.
+
+    탐지 모델은 boxes를 그대로 사용하고, 포즈 모델은 사람별 bbox(없으면 키포인트 외곽)를
+    class 0 박스로 변환합니다. (verbose/compact 출력 모두 지원)
+
+    Args:
+        result: 모델 predict 결과
+
+    Returns:
+        List[Dict[str, Any]]: {"bbox": [x, y, w, h], "class_id", "confidence"} 리스트
+
+    Raises:
+        ValueError: 박스로 비교할 수 있는 출력이 없는 경우 (OCR 등)
+    """
+    if "boxes" in result:
+        return result["boxes"] or []
+
+    persons = result.get("keypoints")
+    if result.get("task_type") != "keypoint" or not isinstance(persons, list):
+        raise ValueError("박스 출력이 없는 모델은 프로파일 일치도를 비교할 수 없습니다 (탐지/포즈 모델만 지원)")
+
+    if result.get("output_format") == "compact":
+        bboxes = result.get("bboxes") or [None] * len(persons)
+        scores = result.get("avg_confidence") or [None] * len(persons)
+        persons = [
+            {"bbox": bbox, "keypoints": [{"x": x, "y": y, "confidence": c} for x, y, c in kpts],
+             "avg_confidence": score}
+            for kpts, bbox, score in zip(persons, bboxes, scores)
+        ]
+
+    boxes = []
+    for person in persons:
+        bbox = person.get("bbox") or _keypoint_extent(person.get("keypoints") or [])
+        if bbox is not None:
+            boxes.append({"bbox": bbox, "class_id": 0, "confidence": person.get("avg_confidence")})
+    return boxes
+
+
+def _keypoint_extent(keypoints: List[Dict[str, Any]]) -> Optional[List[float]]:
+    """신뢰도가 있는 키포인트를 감싸는 [x, y, w, h] (없으면 None)"""
+    points = [(kpt["x"], kpt["y"]) for kpt in keypoints if (kpt.get("confidence") or 0) > 0]
+    if not points:
+        return None
+    xs, ys = zip(*points)
+    return [min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)]
+
+
+def _boxes_to_arrays(boxes: List[Dict[str, Any]]):
+    """박스 dict 리스트를 (xyxy, class_id, confidence) 배열로 변환"""
+    if not boxes:
+        return np.zeros((0, 4), dtype=np.float64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    xywh = np.asarray([box["bbox"][:4] for box in boxes], dtype=np.float64)
+    xyxy = np.concatenate([xywh[:, :2], xywh[:, :2] + xywh[:, 2:4]], axis=1)
+    class_ids = np.asarray([box.get("class_id", -1) for box in boxes], dtype=np.int64)
+    scores = np.asarray([box.get("confidence") or 0.0 for box in boxes], dtype=np.float64)
+    return xyxy, class_ids, scores
+
+
+def _pairwise_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """두 xyxy 박스 집합 간 IoU 행렬 [len(a), len(b)]"""
+    top_left = np.maximum(a[:, None, :2], b[None, :, :2])
+    bottom_right = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    inter = np.clip(bottom_right - top_left, 0, None).prod(axis=2)
+    area_a = (a[:, 2:] - a[:, :2]).prod(axis=1)
+    area_b = (b[:, 2:] - b[:, :2]).prod(axis=1)
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-12), 0.0)
+
+
+def compare_detections(
+    reference: List[Dict[str, Any]],
+    candidate: List[Dict[str, Any]],
+    iou_threshold: float = 0.5
+) -> Dict[str, Any]:
+    """
+    기준(fp32) 결과와 후보 프로파일 결과의 박스 일치도를 계산합니다.
+
+    같은 class_id끼리 신뢰도 순으로 greedy 매칭하며 IoU가 임계값 이상이면 일치로 봅니다.
+
+    Args:
+        reference: 기준 박스 리스트
+        candidate: 비교 대상 박스 리스트
+        iou_threshold: 일치 판정 IoU 임계값
+
+    Returns:
+        Dict[str, Any]: 매칭 수, recall/precision, 평균 IoU, 최대 신뢰도 차이
+    """
+    ref_xyxy, ref_cls, ref_conf = _boxes_to_arrays(reference)
+    cand_xyxy, cand_cls, cand_conf = _boxes_to_arrays(candidate)
+
+    matched_ious = []
+    conf_diffs = []
+
+    if len(ref_xyxy) and len(cand_xyxy):
+        iou = _pairwise_iou(ref_xyxy, cand_xyxy)
+        iou[ref_cls[:, None] != cand_cls[None, :]] = 0.0
+        used = np.zeros(len(cand_xyxy), dtype=bool)
+
+        for ref_idx in np.argsort(-ref_conf):
+            row = np.where(used, 0.0, iou[ref_idx])
+            cand_idx = int(np.argmax(row))
+            if row[cand_idx] >= iou_threshold:
+                used[cand_idx] = True
+                matched_ious.append(float(row[cand_idx]))
+                conf_diffs.append(abs(float(ref_conf[ref_idx]) - float(cand_conf[cand_idx])))
+
+    matched = len(matched_ious)
+    return {
+        "reference_boxes": int(len(ref_xyxy)),
+        "candidate_boxes": int(len(cand_xyxy)),
+        "matched_boxes": matched,
+        "recall": matched / len(ref_xyxy) if len(ref_xyxy) else 1.0,
+        "precision": matched / len(cand_xyxy) if len(cand_xyxy) else 1.0,
+        "mean_iou": float(np.mean(matched_ious)) if matched_ious else None,
+        "max_confidence_diff": float(np.max(conf_diffs)) if conf_diffs else None
+    }
+
+
+def run_profile_check(
+    predict_fn: Callable[[Any, InferenceProfile], List[Dict[str, Any]]],
+    images: List[Any],
+    profile_name: str,
+    reference_name: str = DEFAULT_PROFILE,
+    iou_threshold: float = 0.5,
+    warmup: int = 1
+) -> Dict[str, Any]:
+    """
+    프로파일 결과를 fp32 기준 프로파일과 비교하여 박스 일치도와 속도 향상을 보고합니다.
+
+    Args:
+        predict_fn: (image, profile) -> 박스 리스트 를 반환하는 함수
+        images: 샘플 이미지 리스트
+        profile_name: 검사할 프로파일 이름
+        reference_name: 기준 프로파일 이름 (기본값: accurate)
+        iou_threshold: 일치 판정 IoU 임계값
+        warmup: 프로파일별 워밍업 실행 횟수 (첫 번째 이미지 사용, 최소 1회)
+
+    Returns:
+        Dict[str, Any]: 이미지별/전체 일치도와 지연 시간 비교
+    """
+    reference = get_profile(reference_name)
+    candidate = get_profile(profile_name)
+
+    if not images:
+        raise ValueError("프로파일 검사를 위한 샘플 이미지가 필요합니다")
+
+    # 프로파일마다 워밍업 후 모든 이미지를 연속으로 측정
+    # (메모리 포맷 변환은 프로파일이 바뀐 첫 호출에서 일어나므로 워밍업에서 끝나고 측정 구간에 들어가지 않음)
+    outputs, times = [], []
+    for profile in (reference, candidate):
+        for _ in range(max(1, warmup)):
+            predict_fn(images[0], profile)
+        profile_outputs, profile_times = [], []
+        for image in images:
+            start = time.perf_counter()
+            profile_outputs.append(predict_fn(image, profile))
+            profile_times.append(time.perf_counter() - start)
+        outputs.append(profile_outputs)
+        times.append(profile_times)
+
+    per_image = []
+    totals = {"reference_boxes": 0, "candidate_boxes": 0, "matched_boxes": 0}
+    for idx, (ref_boxes, cand_boxes) in enumerate(zip(*outputs)):
+        agreement = compare_detections(ref_boxes, cand_boxes, iou_threshold)
+        for key in totals:
+            totals[key] += agreement[key]
+        per_image.append({
+            "index": idx,
+            "reference_time": round(times[0][idx], 4),
+            "candidate_time": round(times[1][idx], 4),
+            **agreement
+        })
+
+    ref_total = sum(times[0])
+    cand_total = sum(times[1])
+
+    logger.info(
+        f"📏 프로파일 검사 완료: {profile_name} vs {reference_name} - "
+        f"이미지 {len(images)}개, 기준 {ref_total:.3f}초, 후보 {cand_total:.3f}초"
+    )
+
+    return {
+        "profile": candidate.to_dict(),
+        "reference_profile": reference.name,
+        "num_images": len(images),
+        "iou_threshold": iou_threshold,
+        "reference_time": round(ref_total, 4),
+        "candidate_time": round(cand_total, 4),
+        "speedup": round(ref_total / cand_total, 3) if cand_total > 0 else None,
+        "recall": totals["matched_boxes"] / totals["reference_boxes"] if totals["reference_boxes"] else 1.0,
+        "precision": totals["matched_boxes"] / totals["candidate_boxes"] if totals["candidate_boxes"] else 1.0,
+        **totals,
+        "images": per_image
+    }
@@ -12,6 +12,12 @@ from PIL import Image
 from fastapi import HTTPException
 
 from ..base_model import BaseModel, ModelType, TaskType
+from ..inference_profiles import get_profile
+
+try:
+    from ...core.tracing import span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
+except ImportError:
+    from core.tracing import span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +34,7 @@ class YOLOPoseManager(BaseModel):
         self.model_type = ModelType.KEYPOINT
         self.task_type = TaskType.KEYPOINT
         self.num_keypoints = 17  # COCO format
+        self.inference_profile = get_profile(None)
 
         # COCO 17 keypoints 정의
         self.keypoint_names = [
@@ -57,7 +64,13 @@ class YOLOPoseManager(BaseModel):
         Args:
             model_path (str): 모델 파일 경로 (yolov8n-pose.pt 등)
             **kwargs: 추가 설정
+                - inference_profile (str): 추론 프로파일 이름 (기본값: "accurate")
         """
+        try:
+            inference_profile = get_profile(kwargs.get('inference_profile'))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
         try:
             from ultralytics import YOLO
 
@@ -79,13 +92,19 @@ class YOLOPoseManager(BaseModel):
             else:
                 logger.info(f"✅ YOLO Pose 모델을 CPU로 로드")
 
+            # 추론 프로파일 적용
+            self.inference_profile = inference_profile
+            self._prepared_profile = None
+            self._prepare_profile(inference_profile)
+
             self.is_loaded = True
             logger.info(f"✅ YOLO Pose 모델 로딩 완료")
 
             return {
                 "success": True,
                 "message": f"YOLO Pose model {model_path.name} loaded successfully",
-                "num_keypoints": self.num_keypoints
+                "num_keypoints": self.num_keypoints,
+                "inference_profile": inference_profile.name
             }
 
         except Exception as e:
@@ -101,6 +120,9 @@ class YOLOPoseManager(BaseModel):
             **kwargs:
                 - confidence_threshold (float): 신뢰도 임계값 (기본값: 0.5)
                 - imgsz (int): 추론 이미지 크기 (기본값: 640)
+                - output_format (str): "verbose" (기본값, 사람/키포인트별 dict)
+                  또는 "compact" ([N, 17, 3] 배열 + keypoint_names 헤더)
+                - inference_profile (str): 이번 호출에만 사용할 추론 프로파일 (기본값: 로드 시 프로파일)
 
         Returns:
             Dict[str, Any]: 키포인트 탐지 결과
@@ -108,30 +130,58 @@ class YOLOPoseManager(BaseModel):
         if not self.validate_model():
             raise HTTPException(status_code=400, detail="모델이 로드되지 않았습니다")
 
+        profile = self._resolve_profile(kwargs.get('inference_profile'))
+
         try:
             # 파라미터 추출
             confidence_threshold = kwargs.get('confidence_threshold', 0.5)
             imgsz = kwargs.get('imgsz', 640)
+            output_format = kwargs.get('output_format', 'verbose')
+
+            if output_format not in ('verbose', 'compact'):
+                raise ValueError(f"지원하지 않는 output_format: {output_format} (verbose, compact 중 선택)")
 
             logger.info(f"🔍 YOLO Pose 추론 시작 - 신뢰도: {confidence_threshold}")
 
             # 이미지 전처리
-            processed_image = self._preprocess_image(image)
+            with span(STAGE_PREPROCESS):
+                processed_image = self._preprocess_image(image)
 
             # YOLO Pose 추론 실행
-            results = self.model.predict(
-                processed_image,
-                imgsz=imgsz,
-                conf=confidence_threshold,
-                iou=0.5,
-                max_det=300,
-                verbose=False,
-                save=False,
-                device=None
-            )
+            self._prepare_profile(profile)
+            device = self._model_device()
+            with span(STAGE_FORWARD), profile.inference_context(device):
+                results = self.model.predict(
+                    processed_image,
+                    imgsz=imgsz,
+                    conf=confidence_threshold,
+                    iou=0.5,
+                    max_det=300,
+                    half=profile.use_half(device),
+                    verbose=False,
+                    save=False,
+                    device=None
+                )
 
             # 결과 후처리
-            keypoints_data = self._postprocess_results(results[0])
+            if output_format == 'compact':
+                with span(STAGE_POSTPROCESS):
+                    compact_data = self._postprocess_results_compact(results[0])
+                num_persons = len(compact_data["keypoints"])
+
+                logger.info(f"✅ YOLO Pose 추론 완료 - 탐지된 사람: {num_persons}명 (compact)")
+
+                return {
+                    **compact_data,
+                    "num_persons": num_persons,
+                    "task_type": "keypoint",
+                    "model_type": "yolo_pose",
+                    "keypoint_format": "coco_17",
+                    "output_format": "compact"
+                }
+
+            with span(STAGE_POSTPROCESS):
+                keypoints_data = self._postprocess_results(results[0])
 
             logger.info(f"✅ YOLO Pose 추론 완료 - 탐지된 사람: {len(keypoints_data)}명")
 
@@ -184,7 +234,7 @@ class YOLOPoseManager(BaseModel):
 
     def _postprocess_results(self, result) -> List[Dict]:
         """
-        YOLO Pose 결과 후처리
+        YOLO Pose 결과 후처리 (기본 verbose 스키마)
 
         Args:
             result: YOLO 결과 객체
@@ -192,64 +242,123 @@ class YOLOPoseManager(BaseModel):
         Returns:
             List[Dict]: 키포인트 정보 리스트
         """
+        arrays = self._extract_arrays(result)
+        if arrays is None:
+            return []
+
+        kpts, bboxes, avg_conf, img_width, img_height = arrays
+
+        # 정규화 좌표와 가시성은 배열 단위로 한 번에 계산
+        norm_x = (kpts[:, :, 0] / img_width).tolist()
+        norm_y = (kpts[:, :, 1] / img_height).tolist()
+        visible = (kpts[:, :, 2] > 0.5).tolist()
+        kpts_list = kpts.tolist()
+        bbox_list = bboxes.tolist() if bboxes is not None else None
+        avg_conf_list = avg_conf.tolist()
+        names = self.keypoint_names
+
         keypoints_data = []
+        for person_idx, person_kpts in enumerate(kpts_list):
+            person_norm_x = norm_x[person_idx]
+            person_norm_y = norm_y[person_idx]
+            person_visible = visible[person_idx]
+
+            keypoints_list = [
+                {
+                    "name": names[kpt_idx],
+                    "x": x,
+                    "y": y,
+                    "confidence": conf,
+                    "normalized_x": person_norm_x[kpt_idx],
+                    "normalized_y": person_norm_y[kpt_idx],
+                    "visible": person_visible[kpt_idx]  # 신뢰도 0.5 이상이면 보임
+                }
+                for kpt_idx, (x, y, conf) in enumerate(person_kpts)
+            ]
+
+            keypoints_data.append({
+                "person_id": person_idx,
+                "keypoints": keypoints_list,
+                "num_keypoints": self.num_keypoints,
+                "bbox": bbox_list[person_idx] if bbox_list is not None and person_idx < len(bbox_list) else None,
+                "avg_confidence": avg_conf_list[person_idx]
+            })
+
+        return keypoints_data
+
+    def _postprocess_results_compact(self, result) -> Dict[str, Any]:
+        """
+        YOLO Pose 결과 후처리 (compact 스키마)
+
+        사람별 dict 대신 [N, 17, 3] (x, y, confidence) 배열과
+        공유 keypoint_names 헤더만 반환합니다.
+
+        Args:
+            result: YOLO 결과 객체
 
+        Returns:
+            Dict[str, Any]: compact 키포인트 정보
+        """
+        arrays = self._extract_arrays(result)
+        if arrays is None:
+            return {
+                "keypoint_names": self.keypoint_names,
+                "keypoints": [],
+                # 박스 배열이 없을 때와 같은 값 (사람이 없으면 박스도 없음)
+                "bboxes": None,
+                "avg_confidence": [],
+                "image_size": [int(result.orig_shape[1]), int(result.orig_shape[0])]
+            }
+
+        kpts, bboxes, avg_conf, img_width, img_height = arrays
+        return {
+            "keypoint_names": self.keypoint_names,
+            "keypoints": kpts.tolist(),  # [N, 17, 3] - 픽셀 x, y, 신뢰도
+            "bboxes": bboxes.tolist() if bboxes is not None else None,  # [N, 4] - x, y, w, h
+            "avg_confidence": avg_conf.tolist(),
+            "image_size": [int(img_width), int(img_height)]
+        }
+
+    def _extract_arrays(self, result):
+        """
+        YOLO 결과에서 키포인트/박스 배열을 한 번에 추출합니다.
+
+        Args:
+            result: YOLO 결과 객체
+
+        Returns:
+            (keypoints [N,17,3], bboxes [N,4] 또는 None, avg_confidence [N], width, height)
+            탐지된 사람이 없으면 None
+        """
         if not hasattr(result, 'keypoints') or result.keypoints is None:
             logger.info("탐지된 키포인트가 없습니다")
-            return keypoints_data
+            return None
 
         if len(result.keypoints) == 0:
             logger.info("탐지된 사람이 없습니다")
-            return keypoints_data
+            return None
 
         logger.info(f"탐지된 사람 수: {len(result.keypoints)}")
 
-        # 키포인트 데이터 추출
-        kpts_xy = result.keypoints.xy.cpu().numpy()  # (N, 17, 2) - 픽셀 좌표
-        kpts_conf = result.keypoints.conf.cpu().numpy()  # (N, 17) - 신뢰도
+        # 디바이스 → 호스트 복사는 배열 전체에 대해 한 번씩만 수행
+        kpts_xy = result.keypoints.xy.cpu().numpy().astype(np.float32, copy=False)  # (N, 17, 2)
+        if result.keypoints.conf is not None:
+            kpts_conf = result.keypoints.conf.cpu().numpy().astype(np.float32, copy=False)  # (N, 17)
+        else:
+            kpts_conf = np.ones(kpts_xy.shape[:2], dtype=np.float32)
 
-        # 이미지 크기 (정규화용)
-        img_height, img_width = result.orig_shape
-
-        for person_idx, (person_kpts, person_conf) in enumerate(zip(kpts_xy, kpts_conf)):
-            # 각 사람의 키포인트 정보
-            keypoints_list = []
-
-            for kpt_idx, (xy, conf) in enumerate(zip(person_kpts, person_conf)):
-                x, y = xy
-                keypoint_info = {
-                    "name": self.keypoint_names[kpt_idx],
-                    "x": float(x),
-                    "y": float(y),
-                    "confidence": float(conf),
-                    "normalized_x": float(x / img_width),
-                    "normalized_y": float(y / img_height),
-                    "visible": conf > 0.5  # 신뢰도 0.5 이상이면 보임
-                }
-                keypoints_list.append(keypoint_info)
-
-            # 바운딩 박스 정보 (있으면)
-            bbox = None
-            if hasattr(result, 'boxes') and result.boxes is not None:
-                if len(result.boxes) > person_idx:
-                    box = result.boxes[person_idx]
-                    xywh = box.xywh[0].cpu().numpy()
-                    x_center, y_center, width, height = xywh
-                    x = x_center - width / 2
-                    y = y_center - height / 2
-                    bbox = [float(x), float(y), float(width), float(height)]
-
-            person_data = {
-                "person_id": person_idx,
-                "keypoints": keypoints_list,
-                "num_keypoints": self.num_keypoints,
-                "bbox": bbox,
-                "avg_confidence": float(np.mean(person_conf))
-            }
+        kpts = np.concatenate([kpts_xy, kpts_conf[:, :, None]], axis=2)
+        avg_conf = kpts_conf.mean(axis=1)
 
-            keypoints_data.append(person_data)
+        bboxes = None
+        if hasattr(result, 'boxes') and result.boxes is not None and len(result.boxes) > 0:
+            xywh = result.boxes.xywh.cpu().numpy().astype(np.float32, copy=False)
+            bboxes = xywh.copy()
+            bboxes[:, 0] -= xywh[:, 2] / 2
+            bboxes[:, 1] -= xywh[:, 3] / 2
 
-        return keypoints_data
+        img_height, img_width = result.orig_shape
+        return kpts, bboxes, avg_conf, img_width, img_height
 
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -266,5 +375,6 @@ class YOLOPoseManager(BaseModel):
             "is_loaded": self.is_loaded,
             "num_keypoints": self.num_keypoints,
             "keypoint_format": "coco_17",
-            "keypoint_names": self.keypoint_names
+            "keypoint_names": self.keypoint_names,
+            "inference_profile": self.inference_profile.name
         }
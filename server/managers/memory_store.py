@@ -0,0 +1,495 @@
+"""
+메모리 이미지 저장소
+콘텐츠 해시 기반 바이트 예산 LRU 캐시 (중복 제거, 디스크 스필, 항목별 TTL, 사용량 통계 지원)
+"""
+import os
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(data: bytes) -> str:
+    """이미지 바이트의 콘텐츠 해시 (sha256 hex)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class MemoryImageStore:
+    """
+    업로드 이미지를 보관하는 콘텐츠 해시 기반 바이트 예산 LRU 저장소
+
+    - 이미지 바이트는 콘텐츠 해시(sha256) 단위로 한 번만 저장되고,
+      파일명은 해시를 참조합니다. 같은 바이트를 여러 이름으로 올려도 한 벌만 차지합니다.
+    - 메모리 사용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 이미지를 내보냅니다.
+    - spill이 활성화되어 있으면 내보낸 이미지를 임시 디렉토리에 기록하고,
+      다시 조회되면 메모리로 복원합니다. (스필 용량도 max_spill_bytes로 제한)
+    - ttl_seconds가 지나도록 사용되지 않은 이미지는 자동으로 제거됩니다.
+
+    기존 dict 기반 memory_images와의 호환을 위해 `in`, `len()`, `[name]`, `del` 연산을 지원합니다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 1024 * 1024 * 1024,
+        spill_enabled: bool = True,
+        spill_dir: Optional[str] = None,
+        max_spill_bytes: int = 4 * 1024 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Args:
+            max_bytes: 메모리에 보관할 최대 바이트 수
+            spill_enabled: 메모리 예산 초과 시 디스크 스필 사용 여부
+            spill_dir: 스필 디렉토리 (None이면 첫 스필 시 임시 디렉토리 생성)
+            max_spill_bytes: 스필 디렉토리 최대 바이트 수
+            ttl_seconds: 마지막 사용 후 보관 시간 (None 또는 0이면 만료 없음)
+        """
+        self.max_bytes = max_bytes
+        self.spill_enabled = spill_enabled
+        self.max_spill_bytes = max_spill_bytes
+        self.ttl_seconds = ttl_seconds or None
+
+        self._spill_dir = Path(spill_dir) if spill_dir else None
+        self._owns_spill_dir = spill_dir is None
+        # 파일명 → {"hash", "metadata", "timestamp"}
+        self._refs: Dict[str, Dict[str, Any]] = {}
+        # 콘텐츠 해시 → {"data", "size", "last_access", "spill_path", "names"}
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._spilled: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._spilled_bytes = 0
+        self._lock = threading.RLock()
+        self._last_sweep = time.time()
+
+        self._hits = 0
+        self._spill_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._spills = 0
+        self._expirations = 0
+        self._dedup_hits = 0
+        self._dedup_bytes = 0
+
+    # ------------------------------------------------------------------
+    # 기본 연산
+    # ------------------------------------------------------------------
+
+    def put(self, name: str, data: bytes, metadata: Optional[Dict[str, Any]] = None, digest: Optional[str] = None) -> str:
+        """
+        이미지를 저장합니다. 같은 이름이 있으면 교체합니다.
+
+        Args:
+            name: 파일명
+            data: 이미지 바이트
+            metadata: 메타데이터
+            digest: 미리 계산한 콘텐츠 해시 (None이면 계산)
+
+        Returns:
+            str: 콘텐츠 해시
+        """
+        digest = digest or content_hash(data)
+        now = time.time()
+        with self._lock:
+            blob = self._memory.get(digest) or self._spilled.get(digest)
+            if blob is None:
+                blob = {
+                    "data": data,
+                    "size": len(data),
+                    "last_access": now,
+                    "spill_path": None,
+                    "names": set()
+                }
+                self._memory[digest] = blob
+                self._memory_bytes += len(data)
+            else:
+                self._dedup_hits += 1
+                self._dedup_bytes += len(data)
+                logger.debug(f"중복 이미지 감지: {name} → {digest[:12]}")
+            self._attach(name, digest, blob, metadata, now)
+            self._sweep_expired(now)
+            self._enforce_budget()
+        return digest
+
+    def put_file(self, name: str, path: str, size: int, digest: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        스트리밍 수신한 파일을 저장소로 가져옵니다. (파일은 저장소가 소유하며 호출 후 원본 경로는 사라짐)
+
+        메모리 예산에 여유가 있으면 한 번 읽어 메모리에 두고, 여유가 없고 스필이 활성화되어 있으면
+        파일을 스필 디렉토리로 옮겨 스필 항목으로 등록합니다. (다른 이미지를 밀어내거나 전체를 메모리에 올리지 않음)
+
+        Args:
+            name: 파일명
+            path: staging_dir() 아래에 기록한 임시 파일 경로
+            size: 파일 크기
+            digest: 수신 중 계산한 콘텐츠 해시
+            metadata: 메타데이터
+
+        Returns:
+            str: 콘텐츠 해시
+        """
+        now = time.time()
+        with self._lock:
+            blob = self._live_blob(digest, now)
+            if blob is not None:
+                self._dedup_hits += 1
+                self._dedup_bytes += size
+                self._attach(name, digest, blob, metadata, now)
+                self._unlink(path)
+                return digest
+
+            if self.spill_enabled and self._memory_bytes + size > self.max_bytes and size <= self.max_spill_bytes:
+                spill_path = self._ensure_spill_dir() / digest
+                try:
+                    os.replace(path, spill_path)
+                except OSError as e:
+                    logger.warning(f"⚠️ 업로드 파일 스필 등록 실패 ({digest[:12]}): {str(e)}")
+                else:
+                    blob = {
+                        "data": None,
+                        "size": size,
+                        "last_access": now,
+                        "spill_path": str(spill_path),
+                        "names": set()
+                    }
+                    self._spilled[digest] = blob
+                    self._spilled_bytes += size
+                    self._spills += 1
+                    self._attach(name, digest, blob, metadata, now)
+                    self._enforce_budget()
+                    return digest
+
+        with open(path, "rb") as f:
+            data = f.read()
+        self._unlink(path)
+        return self.put(name, data, metadata, digest=digest)
+
+    def staging_dir(self) -> Path:
+        """스트리밍 업로드 임시 파일을 기록할 디렉토리 (스필 디렉토리와 같은 파일시스템)"""
+        with self._lock:
+            return self._ensure_spill_dir()
+
+    def link(self, name: str, digest: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        이미 저장된 콘텐츠 해시를 새 파일명으로 참조합니다. (바이트 재전송 불필요)
+
+        Returns:
+            bool: 해당 해시의 이미지가 있으면 True
+        """
+        now = time.time()
+        with self._lock:
+            blob = self._live_blob(digest, now)
+            if blob is None:
+                return False
+            if self._refs.get(name, {}).get("hash") != digest:
+                self._dedup_hits += 1
+                self._dedup_bytes += blob["size"]
+            self._attach(name, digest, blob, metadata, now)
+            return True
+
+    def get(self, name: str) -> Optional[bytes]:
+        """이미지 데이터를 반환합니다. (스필된 경우 메모리로 복원)"""
+        entry = self.get_entry(name)
+        return entry["data"] if entry else None
+
+    def get_entry(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        이미지 항목을 반환합니다.
+
+        Returns:
+            {"data": bytes, "metadata": dict, "timestamp": float, "hash": str} 또는 None
+        """
+        with self._lock:
+            ref = self._refs.get(name)
+            if ref is None:
+                self._misses += 1
+                return None
+            data = self._read_blob(ref["hash"])
+            if data is None:
+                return None
+            return {"data": data, "metadata": ref["metadata"], "timestamp": ref["timestamp"], "hash": ref["hash"]}
+
+    def get_by_hash(self, digest: str) -> Optional[bytes]:
+        """콘텐츠 해시로 이미지 데이터를 반환합니다."""
+        with self._lock:
+            return self._read_blob(digest)
+
+    def has_hash(self, digest: str) -> bool:
+        """콘텐츠 해시에 해당하는 이미지가 있는지 확인합니다."""
+        with self._lock:
+            return self._live_blob(digest, time.time()) is not None
+
+    def metadata_by_hash(self, digest: str) -> Optional[Dict[str, Any]]:
+        """콘텐츠 해시를 참조하는 아무 파일명의 메타데이터 (없으면 None)"""
+        with self._lock:
+            blob = self._live_blob(digest, time.time())
+            if blob is None or not blob["names"]:
+                return None
+            return self._refs[next(iter(blob["names"]))]["metadata"]
+
+    def hash_of(self, name: str) -> Optional[str]:
+        """파일명이 참조하는 콘텐츠 해시"""
+        with self._lock:
+            ref = self._refs.get(name)
+            return ref["hash"] if ref and name in self else None
+
+    def get_metadata(self, name: str) -> Optional[Dict[str, Any]]:
+        """이미지 메타데이터만 반환합니다. (스필된 이미지를 복원하지 않음)"""
+        with self._lock:
+            if name not in self:
+                return None
+            return self._refs[name]["metadata"]
+
+    def remove(self, name: str) -> bool:
+        """파일명 참조를 제거합니다. 마지막 참조였다면 이미지 바이트도 해제됩니다."""
+        with self._lock:
+            return self._detach(name)
+
+    def clear(self) -> int:
+        """모든 이미지를 제거하고 제거된 파일명 개수를 반환합니다."""
+        with self._lock:
+            count = len(self._refs)
+            for blob in self._spilled.values():
+                self._unlink(blob.get("spill_path"))
+            self._refs.clear()
+            self._memory.clear()
+            self._spilled.clear()
+            self._memory_bytes = 0
+            self._spilled_bytes = 0
+            return count
+
+    def close(self):
+        """저장소를 비우고 직접 생성한 스필 디렉토리를 삭제합니다."""
+        with self._lock:
+            self.clear()
+            if self._owns_spill_dir and self._spill_dir is not None:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+
+    def stats(self) -> Dict[str, Any]:
+        """사용량, 적중률 및 중복 제거 통계"""
+        with self._lock:
+            lookups = self._hits + self._spill_hits + self._misses
+            return {
+                "entries": len(self._refs),
+                "unique_images": len(self._memory) + len(self._spilled),
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_bytes": self.max_bytes,
+                "spilled_entries": len(self._spilled),
+                "spilled_bytes": self._spilled_bytes,
+                "max_spill_bytes": self.max_spill_bytes if self.spill_enabled else 0,
+                "spill_dir": str(self._spill_dir) if self._spill_dir else None,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "spill_hits": self._spill_hits,
+                "misses": self._misses,
+                "hit_rate": round((self._hits + self._spill_hits) / lookups, 4) if lookups else None,
+                "evictions": self._evictions,
+                "spills": self._spills,
+                "expirations": self._expirations,
+                "dedup_hits": self._dedup_hits,
+                "dedup_bytes_saved": self._dedup_bytes
+            }
+
+    # ------------------------------------------------------------------
+    # dict 호환 인터페이스
+    # ------------------------------------------------------------------
+
+    def __contains__(self, name) -> bool:
+        with self._lock:
+            ref = self._refs.get(name)
+            if ref is None:
+                return False
+            return self._live_blob(ref["hash"], time.time()) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._refs)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._refs.keys()))
+
+    def __getitem__(self, name) -> Dict[str, Any]:
+        entry = self.get_entry(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry
+
+    def __delitem__(self, name):
+        if not self.remove(name):
+            raise KeyError(name)
+
+    def keys(self):
+        return list(iter(self))
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _attach(self, name: str, digest: str, blob: Dict[str, Any], metadata, now: float):
+        """파일명을 콘텐츠 해시에 연결 (기존 참조가 다른 해시면 먼저 해제)"""
+        previous = self._refs.get(name)
+        if previous is not None and previous["hash"] != digest:
+            self._detach(name)
+        self._refs[name] = {"hash": digest, "metadata": metadata or {}, "timestamp": now}
+        blob["names"].add(name)
+        blob["last_access"] = now
+
+    def _detach(self, name: str) -> bool:
+        ref = self._refs.pop(name, None)
+        if ref is None:
+            return False
+        blob = self._memory.get(ref["hash"]) or self._spilled.get(ref["hash"])
+        if blob is not None:
+            blob["names"].discard(name)
+            if not blob["names"]:
+                self._drop_blob(ref["hash"])
+        return True
+
+    def _drop_blob(self, digest: str):
+        blob = self._memory.pop(digest, None)
+        if blob is not None:
+            self._memory_bytes -= blob["size"]
+        else:
+            blob = self._spilled.pop(digest, None)
+            if blob is None:
+                return
+            self._spilled_bytes -= blob["size"]
+            self._unlink(blob.get("spill_path"))
+        for name in blob["names"]:
+            self._refs.pop(name, None)
+        blob["names"] = set()
+
+    def _live_blob(self, digest: str, now: float) -> Optional[Dict[str, Any]]:
+        """만료되지 않은 blob (만료된 경우 제거 후 None)"""
+        blob = self._memory.get(digest) or self._spilled.get(digest)
+        if blob is None:
+            return None
+        if self._is_expired(blob, now):
+            self._expire(digest)
+            return None
+        return blob
+
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        """blob 데이터를 읽고 LRU/적중 통계를 갱신합니다."""
+        now = time.time()
+        blob = self._live_blob(digest, now)
+        if blob is None:
+            self._misses += 1
+            return None
+
+        if digest in self._memory:
+            self._memory.move_to_end(digest)
+            blob["last_access"] = now
+            self._hits += 1
+            return blob["data"]
+
+        data = self._restore(digest, blob)
+        if data is None:
+            self._misses += 1
+            return None
+        blob["last_access"] = now
+        self._spill_hits += 1
+        return data
+
+    def _is_expired(self, blob: Dict[str, Any], now: float) -> bool:
+        return self.ttl_seconds is not None and now - blob["last_access"] > self.ttl_seconds
+
+    def _expire(self, digest: str):
+        self._drop_blob(digest)
+        self._expirations += 1
+        logger.debug(f"메모리 이미지 만료: {digest[:12]}")
+
+    def _sweep_expired(self, now: float):
+        """만료된 항목 정리 (TTL의 1/10 주기로만 전체 검사)"""
+        if self.ttl_seconds is None or now - self._last_sweep < self.ttl_seconds / 10:
+            return
+        self._last_sweep = now
+        expired = [
+            digest for store in (self._memory, self._spilled)
+            for digest, blob in store.items() if self._is_expired(blob, now)
+        ]
+        for digest in expired:
+            self._expire(digest)
+        if expired:
+            logger.info(f"🧹 만료된 메모리 이미지 {len(expired)}개 정리")
+
+    def _enforce_budget(self):
+        """메모리 예산 초과 시 LRU 순서로 스필 또는 제거 (가장 최근 항목은 유지)"""
+        while self._memory_bytes > self.max_bytes and len(self._memory) > 1:
+            digest, blob = self._memory.popitem(last=False)
+            self._memory_bytes -= blob["size"]
+            if self.spill_enabled and blob["size"] <= self.max_spill_bytes and self._spill(digest, blob):
+                continue
+            for name in blob["names"]:
+                self._refs.pop(name, None)
+            self._evictions += 1
+            logger.info(f"♻️ 메모리 이미지 제거 (LRU): {sorted(blob['names'])} ({blob['size']} bytes)")
+
+        while self._spilled_bytes > self.max_spill_bytes and self._spilled:
+            digest = next(iter(self._spilled))
+            names = sorted(self._spilled[digest]["names"])
+            self._drop_blob(digest)
+            self._evictions += 1
+            logger.info(f"♻️ 스필 이미지 제거 (LRU): {names}")
+
+    def _ensure_spill_dir(self) -> Path:
+        if self._spill_dir is None:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="autolabeling_spill_"))
+            logger.info(f"📂 메모리 이미지 스필 디렉토리 생성: {self._spill_dir}")
+        else:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+        return self._spill_dir
+
+    def _spill(self, digest: str, blob: Dict[str, Any]) -> bool:
+        try:
+            path = self._ensure_spill_dir() / digest
+            with open(path, "wb") as f:
+                f.write(blob["data"])
+        except OSError as e:
+            logger.warning(f"⚠️ 메모리 이미지 스필 실패 ({digest[:12]}): {str(e)}")
+            return False
+
+        blob["data"] = None
+        blob["spill_path"] = str(path)
+        self._spilled[digest] = blob
+        self._spilled_bytes += blob["size"]
+        self._spills += 1
+        logger.debug(f"💾 메모리 이미지 스필: {digest[:12]} → {path}")
+        return True
+
+    def _restore(self, digest: str, blob: Dict[str, Any]) -> Optional[bytes]:
+        """스필된 이미지를 읽어 메모리(LRU 최신 위치)로 복원합니다."""
+        try:
+            with open(blob["spill_path"], "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.warning(f"⚠️ 스필 이미지 읽기 실패 ({digest[:12]}): {str(e)}")
+            self._drop_blob(digest)
+            return None
+
+        self._spilled.pop(digest)
+        self._spilled_bytes -= blob["size"]
+        self._unlink(blob["spill_path"])
+        blob["data"] = data
+        blob["spill_path"] = None
+        self._memory[digest] = blob
+        self._memory_bytes += blob["size"]
+        self._enforce_budget()
+        return data
+
+    @staticmethod
+    def _unlink(path: Optional[str]):
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
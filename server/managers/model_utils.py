@@ -6,16 +6,33 @@ import cv2
 import numpy as np
 import logging
 import json
+import time
 from pathlib import Path
 from fastapi import HTTPException
 from datetime import datetime
 
+from .base_model import ProfiledModelMixin
+from .inference_profiles import get_profile
+from . import tiling
+from .result_cache import get_result_cache, image_content_hash, model_fingerprint
+
+try:
+    from ..core.metrics import record_images_processed
+    from ..core.tracing import span, record_span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
+except ImportError:
+    from core.metrics import record_images_processed
+    from core.tracing import span, record_span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-class ModelManager:
+class ModelManager(ProfiledModelMixin):
     def __init__(self):
         self.model = None
+        self.inference_profile = get_profile(None)
+        self._prepared_profile = None
+        self._fingerprint = None
+        self.model_name = None
         
     def get_model_training_info(self, model_path):
         """
@@ -212,12 +229,13 @@ class ModelManager:
     
 
         
-    def load_model(self, model_path):
+    def load_model(self, model_path, profile=None):
         """
         YOLO 모델을 로드합니다.
         
         Args:
             model_path: 모델 파일 경로
+            profile: 추론 프로파일 이름 ("accurate", "fast" 등, 기본값: accurate)
             
         Returns:
             성공 여부 및 메시지를 포함한 딕셔너리
@@ -225,19 +243,39 @@ class ModelManager:
         try:
             from ultralytics import YOLO
             
+            try:
+                inference_profile = get_profile(profile)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            
             if not model_path.is_file():
                 raise HTTPException(status_code=404, detail="Model file not found")
             
             self.model = YOLO(str(model_path))
+            self.model_name = Path(model_path).name
+            
+            # 모델 파일이 바뀌면 이전 결과 캐시를 무효화
+            self._fingerprint = model_fingerprint(model_path, model_class=self.__class__.__name__)
+            cache = get_result_cache()
+            if cache is not None:
+                cache.register_model(self._fingerprint)
             
             if torch.cuda.is_available():
                 torch.cuda.set_device(0)
                 self.model.to('cuda:0')
             
+            self.inference_profile = inference_profile
+            self._prepared_profile = None
+            self._prepare_profile(inference_profile)
+            logger.info(f"⚙️ 추론 프로파일: {inference_profile.name}")
+            
             return {
                 "success": True,
-                "message": f"Model {model_path} loaded successfully"
+                "message": f"Model {model_path} loaded successfully",
+                "inference_profile": inference_profile.name
             }
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"모델 로드 오류: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -259,6 +297,37 @@ class ModelManager:
         except Exception as e:
             return {"message": "GPU 정보를 가져올 수 없습니다."}
 
+    def _predict_tiled(self, image, selected_classes, confidence_threshold, profile, device, tile_size, tile_overlap):
+        """
+        타일 분할 예측을 수행합니다. 한 이미지의 모든 타일을 하나의 배치로 실행하고
+        타일 간 NMS로 병합한 뒤 predict_image와 동일한 박스 형식으로 반환합니다.
+        """
+        try:
+            logger.info(f"🧩 타일 예측 시작 - 이미지: {image.size}, 타일: {tile_size}px, 겹침: {tile_overlap}")
+            with span(STAGE_FORWARD), profile.inference_context(device):
+                xyxy, scores, class_ids, num_passes = tiling.predict_ultralytics_tiled(
+                    self.model,
+                    image,
+                    tile_size=tile_size,
+                    overlap=tile_overlap,
+                    conf=confidence_threshold,
+                    iou=0.5,
+                    max_det=300,
+                    half=profile.use_half(device)
+                )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"YOLO 타일 예측 실행 실패: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"모델 예측 실행 실패: {str(e)}")
+
+        with span(STAGE_POSTPROCESS):
+            boxes = tiling.detections_to_boxes(
+                xyxy, scores, class_ids, image.size, self.model.names or {}, selected_classes
+            )
+        logger.info(f"✅ 타일 예측 완료: 패스 {num_passes}개, {len(boxes)}개 객체 감지됨")
+        return boxes
+
     def get_model_classes(self):
         """
         모델의 클래스 정보를 반환합니다.
@@ -348,19 +417,60 @@ class ModelManager:
             # 오류 반환
             raise HTTPException(status_code=500, detail=f"클래스 정보 조회 오류: {str(e)}")
                               
-    def predict_image(self, image_input, selected_classes=None, confidence_threshold=0.5):
+    def predict_image(self, image_input, selected_classes=None, confidence_threshold=0.5, profile=None,
+                      tiled=False, tile_size=tiling.DEFAULT_TILE_SIZE, tile_overlap=tiling.DEFAULT_TILE_OVERLAP,
+                      use_cache=True):
         """
         이미지에 대한 예측을 수행합니다.
         ultralytics YOLO의 표준 방식을 사용하여 최적의 성능을 보장합니다.
+        같은 이미지/모델/파라미터 조합의 결과는 결과 캐시에서 반환합니다.
         
         Args:
             image_input: 이미지 파일 경로 (str 또는 Path 객체) 또는 BytesIO 스트림
             selected_classes: 선택된 클래스 목록 (선택 사항)
             confidence_threshold: 신뢰도 임계값 (0.0~1.0, 기본값: 0.5)
+            profile: 이번 호출에만 사용할 InferenceProfile (기본값: 로드 시 선택한 프로파일)
+            tiled: 고해상도 이미지를 겹치는 타일로 나눠 추론할지 여부 (기본값: False)
+            tile_size: 타일 크기 (기본값: 640)
+            tile_overlap: 타일 겹침 비율 (기본값: 0.2)
+            use_cache: 결과 캐시 사용 여부 (기본값: True)
             
         Returns:
             예측 결과를 포함한 딕셔너리 (ultralytics 표준 형식)
         """
+        cache = get_result_cache() if use_cache and self.model is not None and self._fingerprint else None
+        cache_key = None
+        if cache is not None:
+            image_hash = image_content_hash(image_input)
+            if image_hash is not None:
+                active_profile = profile or self.inference_profile
+                cache_key = cache.make_key(image_hash, self._fingerprint, {
+                    "selected_classes": sorted(selected_classes) if selected_classes else None,
+                    "conf": confidence_threshold,
+                    "iou": 0.5,
+                    "imgsz": 640,
+                    "profile": active_profile.name,
+                    "tiled": bool(tiled),
+                    "tile_size": tile_size if tiled else None,
+                    "tile_overlap": tile_overlap if tiled else None
+                })
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"🗄️ 결과 캐시 적중: {len(cached)}개 객체")
+                    record_images_processed(self.model_name)
+                    return cached
+        
+        boxes = self._predict_image_uncached(
+            image_input, selected_classes, confidence_threshold, profile, tiled, tile_size, tile_overlap
+        )
+        if cache_key is not None:
+            cache.put(cache_key, boxes)
+        record_images_processed(self.model_name)
+        return boxes
+    
+    def _predict_image_uncached(self, image_input, selected_classes, confidence_threshold, profile,
+                                tiled, tile_size, tile_overlap):
+        """predict_image의 실제 추론 (캐시 미사용)"""
         try:
             if self.model is None:
                 logger.error("모델이 로드되지 않았습니다.")
@@ -374,6 +484,7 @@ class ModelManager:
             # BytesIO 입력 처리
             from io import BytesIO
             processed_input = image_input
+            stage_start = time.perf_counter()
             
             if isinstance(image_input, BytesIO):
                 try:
@@ -402,41 +513,61 @@ class ModelManager:
             
             # ultralytics 기본값을 사용한 최적화된 예측 수행
             # 사용자 설정 신뢰도 임계값과 IoU 0.5 사용
+            active_profile = profile or self.inference_profile
+            self._prepare_profile(active_profile)
+            device = self._model_device()
+            
+            # 타일 분할 추론 (타일보다 큰 이미지만)
+            if tiled:
+                try:
+                    tile_image = tiling.to_pil_rgb(processed_input)
+                except Exception as e:
+                    raise HTTPException(status_code=400, detail=f"이미지 처리 실패: {str(e)}")
+                if tiling.needs_tiling(tile_image.width, tile_image.height, tile_size):
+                    record_span(STAGE_PREPROCESS, time.perf_counter() - stage_start)
+                    return self._predict_tiled(
+                        tile_image, selected_classes, effective_conf, active_profile, device, tile_size, tile_overlap
+                    )
+                processed_input = tile_image
+            record_span(STAGE_PREPROCESS, time.perf_counter() - stage_start)
+            
             try:
-                logger.info(f"YOLO 모델 예측 실행 중...")
-                results = self.model.predict(
-                    processed_input,
-                    imgsz=640,  # 이미지 크기 명시적 지정
-                    conf=effective_conf,  # 사용자 설정 신뢰도 값 사용
-                    iou=0.5,  # IoU 기본값 0.5 사용
-                    max_det=300,  # ultralytics 기본값 최대 검출 수
-                    augment=False,  # 추론 시 증강 비활성화
-                    agnostic_nms=False,  # ultralytics 기본값 클래스별 NMS
-                    classes=None,  # 모든 클래스 허용 (후에 필터링)
-                    half=False,  # FP32 사용 for 정확도
-                    device=None,  # 자동 디바이스 선택
-                    verbose=False,  # 로그 출력 최소화
-                    save=False,  # 결과 저장 안함
-                    save_txt=False,  # 텍스트 저장 안함
-                    save_conf=False,  # 신뢰도 저장 안함
-                    save_crop=False,  # 크롭 저장 안함
-                    show=False,  # 결과 표시 안함
-                    retina_masks=False,  # 세그멘테이션 마스크 비활성화
-                    show_labels=True,  # 라벨 표시
-                    show_conf=True,  # 신뢰도 표시
-                    show_boxes=True,  # 박스 표시
-                    vid_stride=1,  # 비디오 프레임 스트라이드
-                    stream_buffer=False,  # 스트림 버퍼 비활성화
-                    visualize=False,  # 모델 피처 시각화 비활성화
-                    rect=True,  # 사각형 추론 (패딩 최소화)
-                    batch=1  # 배치 크기 1
-                )
+                logger.info(f"YOLO 모델 예측 실행 중... (프로파일: {active_profile.name})")
+                with span(STAGE_FORWARD), active_profile.inference_context(device):
+                    results = self.model.predict(
+                        processed_input,
+                        imgsz=640,  # 이미지 크기 명시적 지정
+                        conf=effective_conf,  # 사용자 설정 신뢰도 값 사용
+                        iou=0.5,  # IoU 기본값 0.5 사용
+                        max_det=300,  # ultralytics 기본값 최대 검출 수
+                        augment=False,  # 추론 시 증강 비활성화
+                        agnostic_nms=False,  # ultralytics 기본값 클래스별 NMS
+                        classes=None,  # 모든 클래스 허용 (후에 필터링)
+                        half=active_profile.use_half(device),  # 프로파일에 따라 GPU FP16 사용
+                        device=None,  # 자동 디바이스 선택
+                        verbose=False,  # 로그 출력 최소화
+                        save=False,  # 결과 저장 안함
+                        save_txt=False,  # 텍스트 저장 안함
+                        save_conf=False,  # 신뢰도 저장 안함
+                        save_crop=False,  # 크롭 저장 안함
+                        show=False,  # 결과 표시 안함
+                        retina_masks=False,  # 세그멘테이션 마스크 비활성화
+                        show_labels=True,  # 라벨 표시
+                        show_conf=True,  # 신뢰도 표시
+                        show_boxes=True,  # 박스 표시
+                        vid_stride=1,  # 비디오 프레임 스트라이드
+                        stream_buffer=False,  # 스트림 버퍼 비활성화
+                        visualize=False,  # 모델 피처 시각화 비활성화
+                        rect=True,  # 사각형 추론 (패딩 최소화)
+                        batch=1  # 배치 크기 1
+                    )
                 logger.info(f"YOLO 모델 예측 완료")
             except Exception as e:
                 logger.error(f"YOLO 모델 예측 실행 실패: {str(e)}")
                 raise HTTPException(status_code=500, detail=f"모델 예측 실행 실패: {str(e)}")
             
             # 예측 결과 처리
+            stage_start = time.perf_counter()
             try:
                 result = results[0]  # 첫 번째 결과
                 boxes = []
@@ -506,6 +637,7 @@ class ModelManager:
                     logger.info("탐지된 객체가 없습니다.")
                 
                 logger.info(f"✅ ultralytics 최적화 예측 완료: {len(boxes)}개 객체 감지됨")
+                record_span(STAGE_POSTPROCESS, time.perf_counter() - stage_start)
                 
                 return boxes
                 
@@ -11,6 +11,11 @@ from fastapi import HTTPException
 
 from ..base_model import BaseModel, ModelType, TaskType
 
+try:
+    from ...core.tracing import span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
+except ImportError:
+    from core.tracing import span, STAGE_PREPROCESS, STAGE_FORWARD, STAGE_POSTPROCESS
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,23 +118,26 @@ class EasyOCRManager(BaseModel):
             logger.info(f"  - Text threshold: {text_threshold}")
 
             # 이미지 전처리
-            processed_image = self._preprocess_image(image)
+            with span(STAGE_PREPROCESS):
+                processed_image = self._preprocess_image(image)
 
             # EasyOCR 추론 실행
-            results = self.model.readtext(
-                processed_image,
-                detail=detail,
-                paragraph=paragraph,
-                min_size=min_size,
-                text_threshold=text_threshold,
-                low_text=low_text,
-                link_threshold=link_threshold,
-                width_ths=width_ths,
-                height_ths=height_ths
-            )
+            with span(STAGE_FORWARD):
+                results = self.model.readtext(
+                    processed_image,
+                    detail=detail,
+                    paragraph=paragraph,
+                    min_size=min_size,
+                    text_threshold=text_threshold,
+                    low_text=low_text,
+                    link_threshold=link_threshold,
+                    width_ths=width_ths,
+                    height_ths=height_ths
+                )
 
             # 결과 후처리
-            texts_data = self._postprocess_results(results, processed_image)
+            with span(STAGE_POSTPROCESS):
+                texts_data = self._postprocess_results(results, processed_image)
 
             logger.info(f"✅ EasyOCR 추론 완료 - 인식된 텍스트: {len(texts_data)}개")
 
@@ -9,6 +9,11 @@ from pathlib import Path
 from .model_factory import ModelFactory
 from .base_model import BaseModel, TaskType
 
+try:
+    from ..core.metrics import record_images_processed
+except ImportError:
+    from core.metrics import record_images_processed
+
 logger = logging.getLogger(__name__)
 
 
@@ -137,6 +142,7 @@ class PipelineManager:
                 logger.info(f"🔄 {task} 실행 중...")
                 task_result = model.predict(image, **task_kwargs)
                 results[task] = task_result
+                record_images_processed(model.model_name)
                 logger.info(f"✅ {task} 완료")
 
             except Exception as e:
@@ -172,6 +178,7 @@ class PipelineManager:
         logger.info(f"🔄 단일 작업 실행: {task_name}")
         model = self.models[task_name]
         result = model.predict(image, **kwargs)
+        record_images_processed(model.model_name)
         logger.info(f"✅ 작업 완료: {task_name}")
 
         return result
@@ -211,6 +218,7 @@ class PipelineManager:
                 result = model.predict(img, **kwargs)
                 results.append(result)
 
+        record_images_processed(model.model_name, len(results))
         logger.info(f"✅ 배치 작업 완료: {task_name} (처리된 이미지: {len(results)}개)")
 
         return results
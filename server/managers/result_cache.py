@@ -0,0 +1,384 @@
+"""
+Inference result cache
+추론 결과 캐시 (이미지 콘텐츠 해시 + 모델 지문 + 추론 파라미터 키, 메모리 LRU + 디스크 2단계)
+"""
+import os
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    from ..core.config import get_result_cache_settings
+except ImportError:
+    from core.config import get_result_cache_settings
+
+logger = logging.getLogger(__name__)
+
+_FILE_HASH_CACHE_SIZE = 4096
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _short_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+# 파일 경로 → (size, mtime_ns, 해시) 캐시 (같은 파일을 반복 추론할 때 재해시 방지)
+_file_hashes: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+_file_hash_lock = threading.Lock()
+
+
+def _hash_file(path: Path) -> Optional[str]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = str(path)
+    with _file_hash_lock:
+        cached = _file_hashes.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            _file_hashes.move_to_end(key)
+            return cached[2]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+
+    with _file_hash_lock:
+        _file_hashes[key] = (stat.st_size, stat.st_mtime_ns, value)
+        while len(_file_hashes) > _FILE_HASH_CACHE_SIZE:
+            _file_hashes.popitem(last=False)
+    return value
+
+
+def image_content_hash(image) -> Optional[str]:
+    """
+    추론 입력 이미지의 콘텐츠 해시를 계산합니다.
+
+    Args:
+        image: bytes, BytesIO, 파일 경로(str, Path), PIL Image, numpy array
+
+    Returns:
+        sha256 hex 또는 None (해시할 수 없는 입력이면 캐시를 사용하지 않음)
+    """
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(image).hexdigest()
+    if isinstance(image, BytesIO):
+        return hashlib.sha256(image.getbuffer()).hexdigest()
+    if isinstance(image, (str, Path)):
+        if str(image).startswith("memory://"):
+            return None
+        return _hash_file(Path(image))
+
+    # PIL Image (픽셀 + 모드 + 크기)
+    if hasattr(image, "tobytes") and hasattr(image, "mode") and hasattr(image, "size"):
+        digest = hashlib.sha256(f"{image.mode}:{image.size}".encode("utf-8"))
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    # numpy array (dtype + shape + 데이터)
+    if hasattr(image, "tobytes") and hasattr(image, "shape") and hasattr(image, "dtype"):
+        digest = hashlib.sha256(f"{image.dtype}:{image.shape}".encode("utf-8"))
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    return None
+
+
+def model_fingerprint(model_ref, **extra) -> Tuple[str, str]:
+    """
+    모델 지문을 계산합니다.
+
+    로컬 파일이면 (절대 경로, 크기, 수정 시각)을 사용하므로 모델 파일이 바뀌면 지문도 바뀝니다.
+    Hugging Face 모델 ID 등 파일이 아닌 경우 문자열 자체를 사용합니다.
+
+    Args:
+        model_ref: 모델 파일 경로 또는 모델 ID
+        **extra: 결과에 영향을 주는 로드 옵션 (모델 클래스, 언어 등)
+
+    Returns:
+        (모델 태그, 지문 태그) - 모델 태그는 경로/ID만으로 결정됩니다.
+    """
+    ref = str(model_ref) if model_ref is not None else ""
+    path = Path(ref) if ref else None
+    if path is not None and path.is_file():
+        stat = path.stat()
+        ref = str(path.resolve())
+        identity = f"{ref}|{stat.st_size}|{stat.st_mtime_ns}"
+    else:
+        identity = ref
+    extra_text = json.dumps(extra, sort_keys=True, default=str)
+    return _short_hash(ref + "|" + str(extra.get("model_class", ""))), _short_hash(identity + "|" + extra_text)
+
+
+class ResultCache:
+    """
+    추론 결과 2단계 캐시
+
+    - 메모리: 직렬화된 결과를 바이트 예산 LRU로 보관 (조회 시 매번 새 객체로 역직렬화)
+    - 디스크: `<disk_dir>/<모델 태그>/<지문 태그>/<키>.json` 형태로 보관하여 재시작 후에도 유지
+    - 모델 파일이 바뀌면 지문 태그가 바뀌므로 이전 결과는 조회되지 않으며,
+      register_model() 시 같은 모델의 이전 지문 디렉토리를 삭제합니다.
+    """
+
+    def __init__(self, max_memory_bytes: int, disk_dir: Optional[Path] = None, max_disk_bytes: int = 0):
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir and max_disk_bytes > 0 else None
+        self.max_disk_bytes = max_disk_bytes if self.disk_dir else 0
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = self._scan_disk_bytes()
+        self._lock = threading.RLock()
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._invalidations = 0
+
+    # ------------------------------------------------------------------
+    # 키
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(image_hash: str, fingerprint: Tuple[str, str], params: Dict[str, Any]) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            image_hash: 이미지 콘텐츠 해시
+            fingerprint: model_fingerprint() 결과
+            params: 결과에 영향을 주는 추론 파라미터 (conf, imgsz, prompt, threshold 등)
+
+        Returns:
+            "<모델 태그>/<지문 태그>/<파라미터 포함 해시>"
+        """
+        params_text = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.sha256(f"{image_hash}|{params_text}".encode("utf-8")).hexdigest()
+        return f"{fingerprint[0]}/{fingerprint[1]}/{digest}"
+
+    # ------------------------------------------------------------------
+    # 조회/저장
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 결과 (없으면 None)"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return _loads(data)
+
+        data = self._read_disk(key)
+        if data is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._disk_hits += 1
+            self._put_memory(key, data)
+        return _loads(data)
+
+    def put(self, key: str, value: Any):
+        """결과 저장 (직렬화할 수 없는 결과는 캐시하지 않음)"""
+        try:
+            data = _dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"결과 캐시 직렬화 실패 - 캐시하지 않음: {str(e)}")
+            return
+
+        with self._lock:
+            self._put_memory(key, data)
+            self._stores += 1
+        self._write_disk(key, data)
+
+    def register_model(self, fingerprint: Tuple[str, str]):
+        """
+        모델 로드 시 호출: 같은 모델(경로)의 이전 지문 결과를 무효화합니다.
+
+        Args:
+            fingerprint: model_fingerprint() 결과
+        """
+        model_tag, current_tag = fingerprint
+        prefix = f"{model_tag}/"
+        with self._lock:
+            stale = [key for key in self._memory if key.startswith(prefix) and not key.startswith(f"{prefix}{current_tag}/")]
+            for key in stale:
+                self._memory_bytes -= len(self._memory.pop(key))
+
+        removed_dirs = 0
+        if self.disk_dir is not None and (self.disk_dir / model_tag).is_dir():
+            for child in (self.disk_dir / model_tag).iterdir():
+                if child.is_dir() and child.name != current_tag:
+                    size = sum(f.stat().st_size for f in child.glob("*.json"))
+                    shutil.rmtree(child, ignore_errors=True)
+                    with self._lock:
+                        self._disk_bytes = max(0, self._disk_bytes - size)
+                    removed_dirs += 1
+
+        if stale or removed_dirs:
+            with self._lock:
+                self._invalidations += len(stale) + removed_dirs
+            logger.info(f"🧹 모델 변경으로 결과 캐시 무효화: 메모리 {len(stale)}개, 디스크 디렉토리 {removed_dirs}개")
+
+    def clear(self):
+        """메모리/디스크 캐시 전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self.disk_dir is not None and self.disk_dir.exists():
+                shutil.rmtree(self.disk_dir, ignore_errors=True)
+            self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률 및 사용량"""
+        with self._lock:
+            lookups = self._memory_hits + self._disk_hits + self._misses
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+                "disk_dir": str(self.disk_dir) if self.disk_dir else None,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": round((self._memory_hits + self._disk_hits) / lookups, 4) if lookups else None,
+                "stores": self._stores,
+                "invalidations": self._invalidations
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _put_memory(self, key: str, data: bytes):
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        if len(data) > self.max_memory_bytes:
+            return
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, data: bytes):
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            existed = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ 결과 캐시 디스크 기록 실패: {str(e)}")
+            return
+
+        with self._lock:
+            self._disk_bytes += len(data) - existed
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._trim_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        if self.disk_dir is None or not self.disk_dir.exists():
+            return 0
+        return sum(path.stat().st_size for path in self.disk_dir.glob("*/*/*.json"))
+
+    def _trim_disk(self):
+        """디스크 예산 초과 시 오래된 파일부터 예산의 90%까지 삭제"""
+        files = []
+        for path in self.disk_dir.glob("*/*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_disk_bytes * 0.9)
+        removed = 0
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self._disk_bytes = total
+        logger.info(f"♻️ 결과 캐시 디스크 정리: {removed}개 파일 삭제, 현재 {total} bytes")
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    전역 결과 캐시 인스턴스 (설정에서 비활성화된 경우 None)
+    """
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                settings = get_result_cache_settings()
+                if not settings["enabled"]:
+                    return None
+                _result_cache = ResultCache(
+                    max_memory_bytes=settings["max_memory_bytes"],
+                    disk_dir=settings["disk_dir"],
+                    max_disk_bytes=settings["max_disk_bytes"]
+                )
+                logger.info(f"🗄️ 추론 결과 캐시 활성화: 메모리 {settings['max_memory_bytes']} bytes, 디스크 {settings['disk_dir']}")
+    return _result_cache
@@ -0,0 +1,417 @@
+"""
+Tiled inference utilities
+고해상도 이미지용 타일 분할 추론 유틸리티 (타일 생성, 좌표 복원, 타일 간 NMS 병합)
+"""
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+try:
+    import torch
+    from torchvision.ops import batched_nms as _tv_batched_nms
+except ImportError:  # torchvision 미설치 시 numpy NMS 사용
+    torch = None
+    _tv_batched_nms = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TILE_SIZE = 640
+DEFAULT_TILE_OVERLAP = 0.2
+DEFAULT_MERGE_IOU = 0.5
+# 서로 다른 타일의 같은 클래스 박스가 작은 박스 면적의 이 비율 이상 겹치면 한 객체의 조각으로 보고 병합
+DEFAULT_MERGE_IOS = 0.7
+# 박스 변이 타일 내부 경계에서 이 거리(픽셀) 안에 있으면 경계에서 잘린 박스로 봄
+TILE_EDGE_TOLERANCE = 2.0
+
+
+def needs_tiling(width: int, height: int, tile_size: int = DEFAULT_TILE_SIZE) -> bool:
+    """긴 변이 타일 크기보다 큰 경우에만 타일 분할이 의미가 있습니다."""
+    return max(width, height) > tile_size
+
+
+def _tile_starts(length: int, tile_size: int, stride: int) -> np.ndarray:
+    """한 축의 타일 시작 좌표 (마지막 타일은 이미지 끝에 맞춤)"""
+    if length <= tile_size:
+        return np.zeros(1, dtype=np.int64)
+    starts = np.arange(0, length - tile_size, stride, dtype=np.int64)
+    return np.append(starts, length - tile_size)
+
+
+def compute_tile_windows(
+    width: int,
+    height: int,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    overlap: float = DEFAULT_TILE_OVERLAP
+) -> np.ndarray:
+    """
+    겹치는 타일 윈도우를 계산합니다.
+
+    타일 수는 이미지 크기와 tile_size/overlap만으로 결정되므로
+    추론 비용은 단일 패스 대비 예측 가능한 배수가 됩니다.
+
+    Args:
+        width: 이미지 너비
+        height: 이미지 높이
+        tile_size: 타일 한 변 크기 (픽셀)
+        overlap: 인접 타일 간 겹침 비율 (0.0 ~ 0.9)
+
+    Returns:
+        np.ndarray: [T, 4] 타일 윈도우 (x0, y0, x1, y1)
+    """
+    if tile_size <= 0:
+        raise ValueError(f"tile_size는 양수여야 합니다: {tile_size}")
+    if not (0.0 <= overlap < 0.9):
+        raise ValueError(f"tile_overlap은 0.0 이상 0.9 미만이어야 합니다: {overlap}")
+
+    stride = max(1, int(round(tile_size * (1.0 - overlap))))
+    grid_x, grid_y = np.meshgrid(
+        _tile_starts(width, tile_size, stride),
+        _tile_starts(height, tile_size, stride)
+    )
+    x0 = grid_x.ravel()
+    y0 = grid_y.ravel()
+    return np.stack([x0, y0, np.minimum(x0 + tile_size, width), np.minimum(y0 + tile_size, height)], axis=1)
+
+
+def count_tiles(width: int, height: int, tile_size: int = DEFAULT_TILE_SIZE, overlap: float = DEFAULT_TILE_OVERLAP) -> int:
+    """타일 수 (전체 이미지 패스 제외)"""
+    return len(compute_tile_windows(width, height, tile_size, overlap))
+
+
+def to_pil_rgb(image_input) -> Image.Image:
+    """
+    경로/BytesIO/numpy/PIL 입력을 RGB PIL 이미지로 변환합니다.
+
+    Args:
+        image_input: 이미지 경로(str, Path), BytesIO, numpy array(RGB), PIL Image
+
+    Returns:
+        PIL Image (RGB)
+    """
+    if isinstance(image_input, Image.Image):
+        image = image_input
+    elif isinstance(image_input, np.ndarray):
+        image = Image.fromarray(image_input)
+    else:
+        if hasattr(image_input, "seek"):
+            image_input.seek(0)
+        image = Image.open(image_input)
+
+    if image.mode in ('RGBA', 'LA'):
+        rgba_image = image.convert('RGBA')
+        rgb_image = Image.new('RGB', image.size, (255, 255, 255))
+        rgb_image.paste(rgba_image, mask=rgba_image.split()[-1])
+        return rgb_image
+    if image.mode != 'RGB':
+        return image.convert('RGB')
+    return image
+
+
+def crop_tiles(image: Image.Image, windows: np.ndarray, include_full: bool = True) -> Tuple[List[Image.Image], np.ndarray]:
+    """
+    타일 윈도우대로 이미지를 자릅니다.
+
+    include_full이면 타일 경계에 걸친 큰 객체를 위해 전체 이미지를 마지막 항목으로 추가합니다.
+    전체 이미지 윈도우의 오프셋은 (0, 0)이므로 병합 시 별도 처리가 필요 없습니다.
+
+    Returns:
+        (타일 이미지 리스트, 오프셋 [T, 2])
+    """
+    crops = [image.crop(tuple(int(v) for v in window)) for window in windows]
+    offsets = windows[:, :2]
+    if include_full:
+        crops.append(image)
+        offsets = np.vstack([offsets, np.zeros((1, 2), dtype=offsets.dtype)])
+    return crops, offsets
+
+
+def _numpy_batched_nms(xyxy: np.ndarray, scores: np.ndarray, groups: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """
+    클래스별 NMS (numpy 구현)
+
+    클래스마다 좌표 오프셋을 더해 서로 겹치지 않게 만든 뒤 한 번의 NMS로 처리합니다.
+    """
+    if len(xyxy) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    offset = (xyxy.max() + 1.0) * groups.astype(np.float64)
+    boxes = xyxy + offset[:, None]
+    areas = (boxes[:, 2] - boxes[:, 0]).clip(min=0) * (boxes[:, 3] - boxes[:, 1]).clip(min=0)
+
+    order = np.argsort(-scores, kind="stable")
+    keep = []
+    while order.size > 0:
+        current = order[0]
+        keep.append(current)
+        rest = order[1:]
+        top_left = np.maximum(boxes[current, :2], boxes[rest, :2])
+        bottom_right = np.minimum(boxes[current, 2:], boxes[rest, 2:])
+        inter = np.clip(bottom_right - top_left, 0, None).prod(axis=1)
+        iou = inter / np.maximum(areas[current] + areas[rest] - inter, 1e-12)
+        order = rest[iou <= iou_threshold]
+    return np.asarray(keep, dtype=np.int64)
+
+
+def batched_nms(xyxy: np.ndarray, scores: np.ndarray, groups: np.ndarray, iou_threshold: float = DEFAULT_MERGE_IOU) -> np.ndarray:
+    """
+    클래스별 NMS. torchvision이 있으면 C++/CUDA 구현을 사용합니다.
+
+    Args:
+        xyxy: [N, 4] 박스 좌표
+        scores: [N] 신뢰도
+        groups: [N] NMS 그룹 (클래스 ID)
+        iou_threshold: 중복 판정 IoU 임계값
+
+    Returns:
+        np.ndarray: 유지할 인덱스 (신뢰도 내림차순)
+    """
+    if len(xyxy) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if _tv_batched_nms is not None:
+        keep = _tv_batched_nms(
+            torch.from_numpy(np.ascontiguousarray(xyxy, dtype=np.float32)),
+            torch.from_numpy(np.ascontiguousarray(scores, dtype=np.float32)),
+            torch.from_numpy(np.ascontiguousarray(groups, dtype=np.int64)),
+            float(iou_threshold)
+        )
+        return keep.numpy()
+    return _numpy_batched_nms(xyxy.astype(np.float64), scores.astype(np.float64), groups, iou_threshold)
+
+
+def merge_tile_detections(
+    per_tile: Sequence[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    offsets: np.ndarray,
+    image_size: Tuple[int, int],
+    iou_threshold: float = DEFAULT_MERGE_IOU,
+    ios_threshold: float = DEFAULT_MERGE_IOS,
+    window_sizes: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    타일별 탐지 결과를 전체 이미지 좌표로 옮기고 타일 간 NMS로 병합합니다.
+
+    타일 경계에서 잘린 조각 박스는 온전한 박스와 IoU가 낮아 NMS로는 지워지지 않으므로,
+    먼저 타일 내부 경계에 닿은(잘린) 박스와 다른 타일의 같은 클래스 박스를
+    교집합/작은 박스 면적(IoS)으로 비교하여 한 객체로 보이면 합집합 박스 하나로 병합한 뒤
+    클래스별 NMS를 수행합니다. 경계에 닿지 않은 박스끼리나 전체 이미지 패스의 박스는
+    조각으로 보지 않으므로 큰 객체 안의 작은 객체(겹쳐 선 사람, 부품 등)는 그대로 남습니다.
+
+    Args:
+        per_tile: 타일별 (xyxy [n, 4], scores [n], class_ids [n]) - 타일 좌표계
+        offsets: [T, 2] 타일 오프셋 (x0, y0)
+        image_size: 전체 이미지 크기 (width, height)
+        iou_threshold: 병합 NMS IoU 임계값
+        ios_threshold: 타일 간 조각 병합 IoS 임계값 (1.0 이상이면 조각 병합 안 함)
+        window_sizes: [T, 2] 타일 크기 (width, height) - 없으면 조각 병합 안 함
+
+    Returns:
+        (xyxy [M, 4], scores [M], class_ids [M]) - 전체 이미지 좌표, 신뢰도 내림차순
+    """
+    counts = np.asarray([len(scores) for _, scores, _ in per_tile], dtype=np.int64)
+    if counts.sum() == 0:
+        return np.zeros((0, 4), dtype=np.float32), np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int64)
+
+    xyxy = np.concatenate([np.asarray(boxes, dtype=np.float32).reshape(-1, 4) for boxes, _, _ in per_tile])
+    scores = np.concatenate([np.asarray(s, dtype=np.float32).reshape(-1) for _, s, _ in per_tile])
+    class_ids = np.concatenate([np.asarray(c, dtype=np.int64).reshape(-1) for _, _, c in per_tile])
+    sources = np.repeat(np.arange(len(per_tile), dtype=np.int64), counts)
+
+    # 타일 오프셋을 한 번에 더해 전체 이미지 좌표로 변환
+    xyxy += np.tile(np.repeat(offsets.astype(np.float32), counts, axis=0), 2)
+    width, height = image_size
+    np.clip(xyxy[:, 0::2], 0, width, out=xyxy[:, 0::2])
+    np.clip(xyxy[:, 1::2], 0, height, out=xyxy[:, 1::2])
+
+    # 조각 병합을 먼저 수행 (NMS가 먼저 돌면 신뢰도가 높은 조각이 온전한 박스를 지울 수 있음)
+    if ios_threshold < 1.0 and window_sizes is not None:
+        windows = np.concatenate([offsets, offsets + np.asarray(window_sizes)], axis=1).astype(np.float32)
+        clipped, full_pass = _touches_interior_edge(xyxy, windows[sources], image_size)
+        xyxy, merged = _merge_tile_fragments(xyxy, scores, class_ids, sources, clipped, full_pass, ios_threshold)
+        scores, class_ids = scores[merged], class_ids[merged]
+    keep = batched_nms(xyxy, scores, class_ids, iou_threshold)
+    logger.info(f"🧩 타일 병합: {len(per_tile)}개 타일, {int(counts.sum())}개 → {len(keep)}개 박스")
+    return xyxy[keep], scores[keep], class_ids[keep]
+
+
+def _touches_interior_edge(
+    xyxy: np.ndarray,
+    box_windows: np.ndarray,
+    image_size: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    박스가 자기 타일의 내부 경계(이미지 가장자리가 아닌 변)에 닿았는지 확인합니다.
+
+    Args:
+        xyxy: [N, 4] 전체 이미지 좌표 박스
+        box_windows: [N, 4] 박스가 나온 타일 윈도우 (x0, y0, x1, y1)
+        image_size: 전체 이미지 크기 (width, height)
+
+    Returns:
+        (경계에서 잘린 박스 [N] bool, 전체 이미지 패스 박스 [N] bool)
+    """
+    width, height = image_size
+    limits = np.array([0, 0, width, height], dtype=np.float32)
+    # 윈도우 변이 이미지 가장자리가 아니면 내부 경계 (x0, y0는 0보다 클 때, x1, y1은 이미지 끝보다 작을 때)
+    interior = np.concatenate([box_windows[:, :2] > limits[:2], box_windows[:, 2:] < limits[2:]], axis=1)
+    near = np.abs(xyxy - box_windows) <= TILE_EDGE_TOLERANCE
+    return (interior & near).any(axis=1), ~interior.any(axis=1)
+
+
+def _merge_tile_fragments(
+    xyxy: np.ndarray,
+    scores: np.ndarray,
+    class_ids: np.ndarray,
+    sources: np.ndarray,
+    clipped: np.ndarray,
+    full_pass: np.ndarray,
+    ios_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    타일 경계에서 잘린 박스를 다른 타일의 같은 객체 박스와 병합합니다. (greedy)
+
+    클래스마다 쌍별 IoS 행렬을 한 번에 계산하고, 병합 가능한 쌍은
+    (다른 타일) & (둘 중 하나 이상이 경계에서 잘림) & (전체 이미지 패스 아님) & (IoS ≥ 임계값)입니다.
+    신뢰도가 높은 박스부터 남기고, 그 박스와 병합 가능한 박스를 흡수하여 합집합으로 넓힙니다.
+    (잘린 조각이 더 높은 신뢰도를 가져도 결과 박스는 객체 전체를 덮음)
+
+    Args:
+        xyxy: [N, 4] 박스 좌표
+        scores: [N] 신뢰도
+        class_ids: [N] 클래스 ID
+        sources: [N] 박스가 나온 타일 인덱스
+        clipped: [N] 타일 내부 경계에 닿은 박스
+        full_pass: [N] 전체 이미지 패스에서 나온 박스
+        ios_threshold: 병합 IoS 임계값
+
+    Returns:
+        (병합된 xyxy [M, 4], 유지할 인덱스 [M])
+    """
+    merged = xyxy.copy()
+    alive = np.ones(len(xyxy), dtype=bool)
+    candidates = clipped & ~full_pass
+    for class_id in np.unique(class_ids[candidates]):
+        members = np.flatnonzero((class_ids == class_id) & ~full_pass)
+        boxes = xyxy[members]
+        areas = (boxes[:, 2] - boxes[:, 0]).clip(min=0) * (boxes[:, 3] - boxes[:, 1]).clip(min=0)
+        top_left = np.maximum(boxes[:, None, :2], boxes[None, :, :2])
+        bottom_right = np.minimum(boxes[:, None, 2:], boxes[None, :, 2:])
+        inter = np.clip(bottom_right - top_left, 0, None).prod(axis=2)
+        smaller = np.maximum(np.minimum(areas[:, None], areas[None, :]), 1e-12)
+        member_clipped = clipped[members]
+        mergeable = (
+            (inter >= ios_threshold * smaller)
+            & (sources[members][:, None] != sources[members][None, :])
+            & (member_clipped[:, None] | member_clipped[None, :])
+        )
+        member_alive = np.ones(len(members), dtype=bool)
+        for local in np.argsort(-scores[members], kind="stable"):
+            if not member_alive[local]:
+                continue
+            member_alive[local] = False
+            fragments = np.flatnonzero(mergeable[local] & member_alive)
+            if len(fragments) == 0:
+                continue
+            member_alive[fragments] = False
+            alive[members[fragments]] = False
+            index = members[local]
+            merged[index, :2] = np.minimum(merged[index, :2], boxes[fragments, :2].min(axis=0))
+            merged[index, 2:] = np.maximum(merged[index, 2:], boxes[fragments, 2:].max(axis=0))
+    keep = np.flatnonzero(alive)
+    return merged[keep], keep
+
+
+def detections_to_boxes(
+    xyxy: np.ndarray,
+    scores: np.ndarray,
+    class_ids: np.ndarray,
+    image_size: Tuple[int, int],
+    class_names: Dict[int, str],
+    selected_classes: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    병합된 배열을 기존 박스 dict 형식(bbox: 좌상단 xywh, normalized_coords: 중심 xywh)으로 변환합니다.
+
+    Args:
+        xyxy: [M, 4] 전체 이미지 좌표
+        scores: [M] 신뢰도
+        class_ids: [M] 클래스 ID
+        image_size: 전체 이미지 크기 (width, height)
+        class_names: 클래스 ID → 이름
+        selected_classes: 필터링할 클래스 이름 목록
+
+    Returns:
+        List[Dict]: 박스 정보 리스트
+    """
+    if len(xyxy) == 0:
+        return []
+
+    names = [class_names.get(int(cid), f"class_{int(cid)}") for cid in class_ids.tolist()]
+    if selected_classes:
+        selected = set(selected_classes)
+        mask = np.fromiter((name in selected for name in names), dtype=bool, count=len(names))
+        xyxy, scores, class_ids = xyxy[mask], scores[mask], class_ids[mask]
+        names = [name for name, keep in zip(names, mask) if keep]
+
+    width, height = image_size
+    wh = xyxy[:, 2:] - xyxy[:, :2]
+    center = xyxy[:, :2] + wh / 2
+    bbox = np.concatenate([xyxy[:, :2], wh], axis=1).astype(np.float64).tolist()
+    normalized = (np.concatenate([center, wh], axis=1) / np.array([width, height, width, height], dtype=np.float64)).tolist()
+
+    return [
+        {
+            "class_id": cid,
+            "class_name": name,
+            "confidence": conf,
+            "bbox": box,
+            "normalized_coords": norm
+        }
+        for cid, name, conf, box, norm in zip(
+            class_ids.tolist(), names, scores.astype(np.float64).tolist(), bbox, normalized
+        )
+    ]
+
+
+def ultralytics_result_arrays(result) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ultralytics 결과 하나에서 (xyxy, conf, cls) 배열을 추출합니다. (박스별 .item() 호출 없음)"""
+    if result.boxes is None or len(result.boxes) == 0:
+        return np.zeros((0, 4), dtype=np.float32), np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int64)
+    boxes = result.boxes
+    return boxes.xyxy.cpu().numpy(), boxes.conf.cpu().numpy(), boxes.cls.cpu().numpy().astype(np.int64)
+
+
+def predict_ultralytics_tiled(
+    model,
+    image: Image.Image,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    overlap: float = DEFAULT_TILE_OVERLAP,
+    merge_iou: float = DEFAULT_MERGE_IOU,
+    include_full: bool = True,
+    **predict_kwargs
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    ultralytics YOLO 모델로 타일 추론을 수행합니다. 한 이미지의 모든 타일을 하나의 배치로 실행합니다.
+
+    Args:
+        model: ultralytics YOLO 모델
+        image: RGB PIL 이미지
+        tile_size: 타일 크기 (추론 imgsz로도 사용)
+        overlap: 타일 겹침 비율
+        merge_iou: 타일 간 병합 NMS IoU 임계값
+        include_full: 전체 이미지 패스 포함 여부
+        **predict_kwargs: model.predict에 전달할 추가 인자 (conf, half 등)
+
+    Returns:
+        (xyxy, scores, class_ids, 실행한 패스 수)
+    """
+    windows = compute_tile_windows(image.width, image.height, tile_size, overlap)
+    crops, offsets = crop_tiles(image, windows, include_full=include_full)
+
+    predict_kwargs.update(imgsz=tile_size, batch=len(crops), rect=False, verbose=False, save=False)
+    results = model.predict(crops, **predict_kwargs)
+
+    per_tile = [ultralytics_result_arrays(result) for result in results]
+    window_sizes = np.asarray([crop.size for crop in crops])
+    xyxy, scores, class_ids = merge_tile_detections(per_tile, offsets, image.size, merge_iou, window_sizes=window_sizes)
+    return xyxy, scores, class_ids, len(crops)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+프로젝트 불러오기(ProjectLoader) 워커 수별 처리 시간 측정 스크립트
+로컬 SSD와 네트워크 파일시스템(NFS/SMB)에서 같은 조건으로 측정해 비교합니다.
+
+사용법 (server/ 에서 실행):
+    python scripts/bench_project_load.py --root /mnt/ssd/bench --images 2000
+    python scripts/bench_project_load.py --root /mnt/nfs/bench --images 2000 --workers 1 4 16 32
+
+측정 방식:
+    - --root 아래에 합성 프로젝트(YYYY-MM-DD/bench_xxxx: images/, labels/, info.json)를 만듦
+    - 측정마다 매니페스트와 라벨 저장소(.annotations)를 지워 처음 불러오는 경우(콜드)를 재현
+      (이미지 헤더 읽기 + 라벨 txt 파싱이 모두 파일시스템을 거침)
+    - 워커 수마다 새 ProjectLoader로 open_project → resolve_classes → load_page(전체)를 실행
+    - --warm 이면 첫 로드 후 매니페스트/라벨 저장소를 남긴 상태로 다시 측정
+
+주의:
+    - 두 번째 측정부터는 OS 페이지 캐시에 파일이 남아 있어 네트워크 지연이 가려질 수 있음
+      (NFS 클라이언트 캐시 포함) - 정확한 콜드 측정은 --drop-caches 로 측정마다 캐시를 비움
+      (Linux: sync; echo 3 > /proc/sys/vm/drop_caches, 루트 권한)
+    - 같은 --seed/--images/--image-size 면 같은 프로젝트가 만들어지므로 결과를 저장소 간에 비교 가능
+"""
+
+import os
+import sys
+import time
+import json
+import random
+import shutil
+import logging
+import argparse
+import statistics
+from datetime import date
+from pathlib import Path
+
+from PIL import Image
+
+# server/ 를 import 경로에 추가 (scripts/ 에서 실행해도 동작하도록)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.image_manifest import manifest_path  # noqa: E402
+from services.project_loader import ProjectLoader  # noqa: E402
+from utils.annotation_store import ANNOTATION_DIR_NAME, AnnotationStore  # noqa: E402
+from utils.result_format import RESULT_FORMAT_COLUMNAR  # noqa: E402
+
+CLASSES = ["person", "helmet", "vest", "car"]
+
+
+def create_project(root: Path, images: int, image_size: int, seed: int) -> str:
+    """
+    합성 프로젝트 생성
+
+    Returns:
+        프로젝트 이름 ("YYYY-MM-DD/bench_xxxx")
+    """
+    rng = random.Random(seed)
+    project_name = f"{date.today().isoformat()}/bench_{seed}_{images}_{image_size}"
+    project_path = root / project_name
+    if project_path.exists():
+        shutil.rmtree(project_path)
+    (project_path / "images").mkdir(parents=True)
+    (project_path / "labels").mkdir()
+
+    # 이미지 내용은 로드 시간과 무관하므로 (헤더만 읽음) 몇 장을 만들어 바이트를 재사용
+    variants = []
+    for index in range(4):
+        color = tuple(rng.randrange(256) for _ in range(3))
+        target = project_path / f"variant_{index}.jpg"
+        Image.new("RGB", (image_size, image_size - 16 * index), color).save(target, quality=85)
+        variants.append(target.read_bytes())
+        target.unlink()
+
+    for index in range(images):
+        stem = f"img_{index:06d}"
+        (project_path / "images" / f"{stem}.jpg").write_bytes(variants[index % len(variants)])
+        lines = []
+        for _ in range(rng.randint(0, 12)):
+            w, h = rng.uniform(0.02, 0.3), rng.uniform(0.02, 0.3)
+            x, y = rng.uniform(w / 2, 1 - w / 2), rng.uniform(h / 2, 1 - h / 2)
+            lines.append(f"{rng.randrange(len(CLASSES))} {x:.6f} {y:.6f} {w:.6f} {h:.6f}")
+        (project_path / "labels" / f"{stem}.txt").write_text("\n".join(lines) + ("\n" if lines else ""))
+
+    info = {
+        "project_name": project_path.name,
+        "class_info": [{"id": index, "name": name} for index, name in enumerate(CLASSES)],
+    }
+    with open(project_path / f"{project_path.name}_info.json", "w", encoding="utf-8") as f:
+        json.dump(info, f, ensure_ascii=False)
+    return project_name
+
+
+def reset_caches(project_path: Path):
+    """매니페스트와 라벨 저장소를 지워 처음 불러오는 상태로 되돌림"""
+    manifest = manifest_path(project_path)
+    if manifest.exists():
+        manifest.unlink()
+    shutil.rmtree(project_path / ANNOTATION_DIR_NAME, ignore_errors=True)
+
+
+def drop_page_cache():
+    """OS 페이지 캐시 비우기 (Linux, 루트 권한)"""
+    os.sync()
+    with open("/proc/sys/vm/drop_caches", "w") as f:
+        f.write("3\n")
+
+
+def prepare_warm(root: Path, project_name: str):
+    """한 번 불러와 매니페스트를 기록하고 라벨 저장소를 (백그라운드 대신) 바로 생성"""
+    load_once(root, project_name, workers=1)
+    AnnotationStore.build(root / project_name)
+
+
+def load_once(root: Path, project_name: str, workers: int) -> float:
+    """ProjectLoader 하나로 프로젝트 전체를 불러오는 데 걸린 시간 (초)"""
+    loader = ProjectLoader(root, workers=workers)
+    try:
+        start = time.perf_counter()
+        handle = loader.open_project(project_name)
+        classes, _ = loader.resolve_classes(handle)
+        page = loader.load_page(handle, classes, RESULT_FORMAT_COLUMNAR, shared_class_names=[])
+        elapsed = time.perf_counter() - start
+        # 콜드 로드 후 백그라운드 라벨 저장소 재생성이 다음 측정과 겹치지 않도록 (측정 시간에는 포함하지 않음)
+        while handle.rebuilding:
+            time.sleep(0.01)
+    finally:
+        loader.close()
+    if len(page["results"]) != len(handle.image_names):
+        raise RuntimeError(f"불러온 이미지 수가 다릅니다: {len(page['results'])}/{len(handle.image_names)}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로젝트 불러오기 워커 수별 처리 시간 측정 (SSD vs 네트워크 FS)")
+    parser.add_argument("--root", required=True, type=Path, help="측정할 파일시스템의 디렉토리 (업로드 디렉토리 역할)")
+    parser.add_argument("--images", type=int, default=2000, help="합성 프로젝트 이미지 수 (기본값: 2000)")
+    parser.add_argument("--image-size", type=int, default=640, help="합성 이미지 한 변 크기 (기본값: 640)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16], help="비교할 워커 수 (기본값: 1 4 16)")
+    parser.add_argument("--repeat", type=int, default=3, help="워커 수별 반복 횟수 (기본값: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드 (기본값: 0)")
+    parser.add_argument("--warm", action="store_true", help="매니페스트/라벨 저장소가 있는 상태로도 측정")
+    parser.add_argument("--drop-caches", action="store_true",
+                        help="콜드 측정마다 OS 페이지 캐시를 비움 (Linux, 루트 권한)")
+    parser.add_argument("--keep", action="store_true", help="측정 후 합성 프로젝트를 지우지 않음")
+    args = parser.parse_args()
+
+    # resolve_classes()/load_page()의 로그가 결과 표를 가리지 않도록
+    logging.basicConfig(level=logging.WARNING)
+
+    root = args.root.resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    print(f"📁 {root} 에 합성 프로젝트 생성 중 (이미지 {args.images}장)...")
+    project_name = create_project(root, args.images, args.image_size, args.seed)
+    project_path = root / project_name
+
+    modes = ["cold", "warm"] if args.warm else ["cold"]
+    try:
+        for mode in modes:
+            print(f"\n=== {mode} ({'매니페스트/라벨 저장소 없음' if mode == 'cold' else '매니페스트/라벨 저장소 사용'}) ===")
+            print(f"{'workers':>8} {'mean ms':>10} {'min ms':>10} {'images/s':>10} {'speedup':>8}")
+            if mode == "warm":
+                prepare_warm(root, project_name)
+            baseline = None
+            for workers in args.workers:
+                timings = []
+                for _ in range(max(1, args.repeat)):
+                    if mode == "cold":
+                        reset_caches(project_path)
+                        if args.drop_caches:
+                            drop_page_cache()
+                    timings.append(load_once(root, project_name, workers))
+                mean = statistics.mean(timings)
+                baseline = baseline or mean
+                print(f"{workers:>8} {mean * 1000:>10.1f} {min(timings) * 1000:>10.1f} "
+                      f"{args.images / mean:>10.0f} {baseline / mean:>7.2f}x")
+    finally:
+        if not args.keep:
+            shutil.rmtree(project_path, ignore_errors=True)
+            try:
+                project_path.parent.rmdir()
+            except OSError:
+                pass
+
+
+if __name__ == "__main__":
+    main()
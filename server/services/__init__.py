@@ -1,5 +1,8 @@
 """서비스 패키지"""
 
 from .project_service import ProjectService
+from .thumbnail_service import ThumbnailService
+from .project_catalog import ProjectCatalog
+from .project_loader import ProjectLoader
 
-__all__ = ['ProjectService'] 
\ No newline at end of file
+__all__ = ['ProjectService', 'ThumbnailService', 'ProjectCatalog', 'ProjectLoader'] 
\ No newline at end of file
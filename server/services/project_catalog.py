@@ -0,0 +1,679 @@
+"""프로젝트 카탈로그 (SQLite) 서비스 모듈"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    from ..core.config import IMAGES_DIR_NAME, LABELS_DIR_NAME
+    from ..core.utils import find_project_info_file
+    from ..utils.yolo_labels import read_yolo_label_file
+except ImportError:
+    from core.config import IMAGES_DIR_NAME, LABELS_DIR_NAME
+    from core.utils import find_project_info_file
+    from utils.yolo_labels import read_yolo_label_file
+
+logger = logging.getLogger(__name__)
+
+DATE_FOLDER_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+PROJECT_IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.bmp', '.gif')
+# 신뢰도 분포 구간 수 ([0, 0.1), [0.1, 0.2), ..., [0.9, 1.0])
+CONFIDENCE_BINS = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    name TEXT NOT NULL,
+    date_folder TEXT,
+    project_folder TEXT NOT NULL,
+    valid INTEGER NOT NULL DEFAULT 0,
+    stamp TEXT NOT NULL,
+    info_file TEXT,
+    image_count INTEGER NOT NULL DEFAULT 0,
+    label_count INTEGER NOT NULL DEFAULT 0,
+    created_time REAL NOT NULL DEFAULT 0,
+    extra TEXT,
+    class_names TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name);
+CREATE INDEX IF NOT EXISTS idx_projects_listing ON projects(valid, created_time DESC);
+CREATE INDEX IF NOT EXISTS idx_projects_parent ON projects(parent);
+CREATE TABLE IF NOT EXISTS scan_dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    children TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS label_stats (
+    project_path TEXT NOT NULL,
+    stem TEXT NOT NULL,
+    box_count INTEGER NOT NULL,
+    class_counts TEXT NOT NULL,
+    confidence_hist TEXT NOT NULL,
+    file_stamp TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (project_path, stem)
+);
+CREATE TABLE IF NOT EXISTS project_stats (
+    project_path TEXT PRIMARY KEY,
+    labels_mtime_ns INTEGER NOT NULL,
+    box_count INTEGER NOT NULL,
+    labeled_files INTEGER NOT NULL,
+    class_counts TEXT NOT NULL,
+    confidence_hist TEXT NOT NULL,
+    updated_time REAL NOT NULL
+);
+"""
+
+
+def _empty_hist() -> List[int]:
+    # 마지막 칸은 신뢰도 정보가 없는 박스 (직접 그리거나 편집한 라벨)
+    return [0] * (CONFIDENCE_BINS + 1)
+
+
+def _confidence_hist(confidences: Iterable[Optional[float]], box_count: int) -> List[int]:
+    """박스 신뢰도 목록 → 구간별 개수 (신뢰도가 없는 박스는 마지막 칸)"""
+    hist = _empty_hist()
+    known = 0
+    for confidence in confidences:
+        if confidence is None or known >= box_count:
+            continue
+        index = min(CONFIDENCE_BINS - 1, max(0, int(float(confidence) * CONFIDENCE_BINS)))
+        hist[index] += 1
+        known += 1
+    hist[CONFIDENCE_BINS] += box_count - known
+    return hist
+
+
+def collect_box_confidences(images: Iterable[Dict[str, Any]]) -> Dict[str, List[Optional[float]]]:
+    """
+    프로젝트 저장 요청의 이미지 목록에서 라벨 파일(stem)별 박스 신뢰도를 모읍니다.
+    (YOLO txt에는 신뢰도가 저장되지 않으므로 통계용으로 따로 전달)
+    """
+    confidences = {}
+    for image in images:
+        filename = image.get("filename")
+        if filename:
+            confidences[Path(filename).stem] = [box.get("confidence") for box in image.get("boxes", [])]
+    return confidences
+
+
+def _mtime_ns(path: Union[str, Path]) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _file_stamp(path: Union[str, Path]) -> str:
+    """라벨 파일 변경 감지용 스탬프 (mtime_ns:크기, 파일이 없으면 빈 문자열)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _count_files(directory: Path, suffixes: Tuple[str, ...]) -> int:
+    count = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(suffixes) and entry.is_file():
+                    count += 1
+    except OSError:
+        pass
+    return count
+
+
+def _parse_class_names(content: Dict[str, Any]) -> List[str]:
+    """info.json의 classes 키에서 클래스 이름 목록 추출 (/project/classes 규칙)"""
+    classes = []
+    raw = content.get("classes")
+    if isinstance(raw, list):
+        # 새 형식: [{"id": 0, "name": "person"}, ...] 또는 기존 형식: ["person", ...]
+        for cls in raw:
+            if isinstance(cls, dict) and "name" in cls:
+                classes.append(cls["name"])
+            elif isinstance(cls, str):
+                classes.append(cls)
+    elif isinstance(raw, dict) and raw:
+        # 클래스 사전 형식 (ID: 이름)
+        classes = list(raw.values())
+    return classes
+
+
+class ProjectCatalog:
+    """
+    저장된 프로젝트의 메타데이터(이미지/라벨 개수, 클래스, 생성 시간)를 SQLite에 보관하는 카탈로그
+
+    - 목록/클래스 조회는 인덱스 쿼리로 처리하고, 매번 모든 폴더를 읽고 info.json을 파싱하지 않음
+    - 조회 전 reconcile(): 디렉토리/파일 mtime만 비교하여 바뀐 프로젝트만 다시 읽음
+      (업로드 루트·날짜 폴더는 mtime이 같으면 하위 목록을 다시 읽지 않음)
+    - 프로젝트 저장/라벨 저장/삭제 후 refresh_project()로 즉시 갱신
+    - 라벨 통계(클래스별 박스 수, 라벨 없는 이미지, 신뢰도 분포)는 라벨 파일별 기여분을 저장해 두고
+      바뀐 파일만 빼고 더하는 방식으로 갱신 (조회는 집계 행 하나만 읽음)
+    - WAL 모드로 조회와 갱신이 서로를 막지 않음
+    """
+
+    def __init__(self, upload_dir: Path, db_path: Union[str, Path],
+                 on_projects_removed: Optional[Callable[[List[str]], None]] = None):
+        """
+        Args:
+            upload_dir: 업로드 디렉토리
+            db_path: SQLite 파일 경로 (":memory:" 가능)
+            on_projects_removed: reconcile()에서 사라진 프로젝트를 발견하면 경로 목록으로 호출
+        """
+        self.upload_dir = Path(upload_dir)
+        self.db_path = str(db_path)
+        self.on_projects_removed = on_projects_removed
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.db_path != ":memory:":
+            try:
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                return self._open(self.db_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"⚠️ 프로젝트 카탈로그 DB를 열 수 없어 메모리 DB를 사용합니다: {self.db_path} ({str(e)})")
+                self.db_path = ":memory:"
+        return self._open(self.db_path)
+
+    @staticmethod
+    def _open(db_path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(label_stats)")]
+        if columns and "file_stamp" not in columns:
+            # 이전 형식의 라벨 통계 - 파일에서 다시 만들 수 있는 집계이므로 버리고 새로 집계
+            conn.execute("DROP TABLE label_stats")
+            conn.execute("DROP TABLE IF EXISTS project_stats")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        return conn
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def list_projects(self) -> List[Dict[str, Any]]:
+        """
+        유효한 프로젝트 목록을 생성 시간 내림차순으로 반환합니다. (호출 전 변경분 반영)
+
+        Returns:
+            /api/list-projects 응답 형식의 프로젝트 정보 목록
+        """
+        with self._lock:
+            self.reconcile()
+            rows = self._conn.execute(
+                "SELECT * FROM projects WHERE valid = 1 ORDER BY created_time DESC"
+            ).fetchall()
+        return [self._to_project_info(row) for row in rows]
+
+    def latest_project_name(self) -> Optional[str]:
+        """가장 최근 프로젝트 이름 (없으면 None)"""
+        with self._lock:
+            self.reconcile()
+            row = self._conn.execute(
+                "SELECT name FROM projects WHERE valid = 1 ORDER BY created_time DESC LIMIT 1"
+            ).fetchone()
+        return row["name"] if row else None
+
+    def get_project(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        프로젝트 하나의 카탈로그 항목을 반환합니다. (해당 프로젝트만 mtime 확인 후 필요 시 갱신)
+
+        Args:
+            name: 프로젝트 이름 ("YYYY-MM-DD/프로젝트" 또는 레거시 "프로젝트")
+
+        Returns:
+            {"path", "valid", "info_file", "classes", "class_names", ...} 또는 None (디렉토리 없음)
+            class_names가 None이면 info 파일을 파싱하지 못한 경우
+        """
+        project_dir = self.upload_dir / name.strip("/")
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM projects WHERE name = ?", (name.strip("/"),)).fetchone()
+            if row is None or row["stamp"] != self._stamp(Path(row["path"]), row["info_file"]):
+                self.refresh_project(project_dir)
+                row = self._conn.execute(
+                    "SELECT * FROM projects WHERE path = ?", (str(project_dir),)
+                ).fetchone()
+        if row is None:
+            return None
+        info = self._to_project_info(row)
+        info["valid"] = bool(row["valid"])
+        info["info_file"] = row["info_file"]
+        info["class_names"] = json.loads(row["class_names"]) if row["class_names"] is not None else None
+        return info
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def reconcile(self) -> int:
+        """
+        디스크와 카탈로그를 맞춥니다. mtime이 바뀐 디렉토리/프로젝트만 다시 읽습니다.
+
+        Returns:
+            int: 다시 읽은 프로젝트 수
+        """
+        with self._lock:
+            if not self.upload_dir.is_dir():
+                self._conn.execute("DELETE FROM projects")
+                self._conn.execute("DELETE FROM scan_dirs")
+                self._conn.commit()
+                return 0
+
+            # (프로젝트 경로, 상위 디렉토리, 날짜 폴더)
+            candidates: List[Tuple[Path, Path, str]] = []
+            date_dirs = []
+            for child in self._subdirs(self.upload_dir):
+                child_path = self.upload_dir / child
+                if DATE_FOLDER_PATTERN.match(child):
+                    date_dirs.append(str(child_path))
+                    for project_folder in self._subdirs(child_path):
+                        candidates.append((child_path / project_folder, child_path, child))
+                else:
+                    candidates.append((child_path, self.upload_dir, ""))
+
+            known = {
+                row["path"]: row
+                for row in self._conn.execute("SELECT path, stamp, info_file FROM projects")
+            }
+            refreshed = 0
+            seen = set()
+            for project_dir, parent, date_prefix in candidates:
+                key = str(project_dir)
+                seen.add(key)
+                row = known.get(key)
+                if row is not None and row["stamp"] == self._stamp(project_dir, row["info_file"]):
+                    continue
+                self._store(project_dir, parent, date_prefix)
+                refreshed += 1
+
+            removed = [path for path in known if path not in seen]
+            if removed:
+                self._conn.executemany("DELETE FROM projects WHERE path = ?", [(path,) for path in removed])
+                self._conn.executemany("DELETE FROM label_stats WHERE project_path = ?", [(path,) for path in removed])
+                self._conn.executemany("DELETE FROM project_stats WHERE project_path = ?", [(path,) for path in removed])
+            tracked = set(date_dirs) | {str(self.upload_dir)}
+            stale_dirs = [row["path"] for row in self._conn.execute("SELECT path FROM scan_dirs")
+                          if row["path"] not in tracked]
+            if stale_dirs:
+                self._conn.executemany("DELETE FROM scan_dirs WHERE path = ?", [(path,) for path in stale_dirs])
+            self._conn.commit()
+
+        if refreshed or removed:
+            logger.info(f"📚 프로젝트 카탈로그 갱신: {refreshed}개 다시 읽음, {len(removed)}개 제거")
+        if removed and self.on_projects_removed is not None:
+            try:
+                self.on_projects_removed(removed)
+            except Exception as e:
+                logger.warning(f"⚠️ 프로젝트 제거 후처리 실패: {str(e)}")
+        return refreshed
+
+    def refresh_project(self, project_dir: Union[str, Path]) -> None:
+        """
+        프로젝트 하나를 즉시 다시 읽습니다. (저장/삭제 직후 호출)
+        업로드 디렉토리 구조(날짜 폴더/레거시 루트) 밖의 경로는 무시합니다.
+
+        Args:
+            project_dir: 프로젝트 디렉토리 경로
+        """
+        project_dir = Path(project_dir)
+        location = self._locate(project_dir)
+        if location is None:
+            return
+        project_dir, parent, date_prefix = location
+        with self._lock:
+            if project_dir.is_dir():
+                self._store(project_dir, parent, date_prefix)
+            else:
+                self._conn.execute("DELETE FROM projects WHERE path = ?", (str(project_dir),))
+                self._conn.execute("DELETE FROM label_stats WHERE project_path = ?", (str(project_dir),))
+                self._conn.execute("DELETE FROM project_stats WHERE project_path = ?", (str(project_dir),))
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # 라벨 통계
+    # ------------------------------------------------------------------
+
+    def project_stats(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        프로젝트 라벨 통계를 반환합니다. (저장된 집계를 그대로 조회)
+
+        labels 폴더의 mtime이 마지막 집계 이후 바뀌었으면 (API 밖에서 파일이 추가/삭제됨)
+        또는 집계가 아직 없으면 한 번 전체를 다시 집계합니다.
+
+        Args:
+            name: 프로젝트 이름
+
+        Returns:
+            통계 dict 또는 None (프로젝트 없음)
+        """
+        entry = self.get_project(name)
+        if entry is None or not entry["valid"]:
+            return None
+        project_path = entry["path"]
+        labels_mtime = _mtime_ns(Path(project_path) / LABELS_DIR_NAME)
+
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM project_stats WHERE project_path = ?", (project_path,)).fetchone()
+            if row is None or row["labels_mtime_ns"] != labels_mtime:
+                self._rebuild_label_stats(Path(project_path))
+                row = self._conn.execute("SELECT * FROM project_stats WHERE project_path = ?", (project_path,)).fetchone()
+
+        class_names = entry.get("class_names") or []
+        class_counts = sorted(((int(class_id), count) for class_id, count in json.loads(row["class_counts"]).items()))
+        hist = json.loads(row["confidence_hist"])
+        labeled = row["labeled_files"]
+        return {
+            "name": entry["name"],
+            "imageCount": entry["imageCount"],
+            "labelCount": entry["labelCount"],
+            "boxCount": row["box_count"],
+            "labeledImages": labeled,
+            "unlabeledImages": max(0, entry["imageCount"] - labeled),
+            "classCounts": [
+                {
+                    "id": class_id,
+                    "name": class_names[class_id] if class_id < len(class_names) else f"class_{class_id}",
+                    "count": count
+                }
+                for class_id, count in class_counts
+            ],
+            "confidence": {
+                "bins": [round(index / CONFIDENCE_BINS, 2) for index in range(CONFIDENCE_BINS + 1)],
+                "counts": hist[:CONFIDENCE_BINS],
+                "unknown": hist[CONFIDENCE_BINS]
+            },
+            "updatedTime": row["updated_time"]
+        }
+
+    def update_label_stats(self, project_dir: Union[str, Path], stems: Iterable[str],
+                           confidences: Optional[Dict[str, List[Optional[float]]]] = None) -> None:
+        """
+        라벨 파일 몇 개가 저장/편집/삭제된 뒤 해당 파일만 다시 읽어 프로젝트 집계를 증분 갱신합니다.
+        집계가 아직 없는 프로젝트(처음 저장)는 전체를 집계하면서 전달된 신뢰도를 반영합니다.
+
+        Args:
+            project_dir: 프로젝트 디렉토리
+            stems: 바뀐 라벨 파일명 (확장자 제외)
+            confidences: stem별 박스 신뢰도 (프로젝트 저장 요청에서 전달된 경우)
+        """
+        location = self._locate(Path(project_dir))
+        if location is None:
+            return
+        project_path = location[0]
+        key = str(project_path)
+        confidences = confidences or {}
+
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM project_stats WHERE project_path = ?", (key,)).fetchone()
+            if row is None:
+                # 저장 요청에만 있는 신뢰도를 버리지 않도록 지금 전체 집계
+                self._rebuild_label_stats(project_path, confidences)
+                return
+
+            box_count = row["box_count"]
+            labeled = row["labeled_files"]
+            class_counts = json.loads(row["class_counts"])
+            hist = json.loads(row["confidence_hist"])
+
+            for stem in set(stems):
+                # 이전 기여분 제거
+                old = self._conn.execute(
+                    "SELECT * FROM label_stats WHERE project_path = ? AND stem = ?", (key, stem)
+                ).fetchone()
+                if old is not None:
+                    box_count -= old["box_count"]
+                    labeled -= 1 if old["box_count"] else 0
+                    for class_id, count in json.loads(old["class_counts"]).items():
+                        class_counts[class_id] = class_counts.get(class_id, 0) - count
+                    hist = [total - count for total, count in zip(hist, json.loads(old["confidence_hist"]))]
+                    self._conn.execute("DELETE FROM label_stats WHERE project_path = ? AND stem = ?", (key, stem))
+
+                # 새 기여분 추가
+                label_file = project_path / LABELS_DIR_NAME / f"{stem}.txt"
+                file_stamp = _file_stamp(label_file)
+                file_stats = self._label_file_stats(label_file, confidences.get(stem))
+                if file_stats is not None:
+                    file_boxes, file_classes, file_hist = file_stats
+                    box_count += file_boxes
+                    labeled += 1 if file_boxes else 0
+                    for class_id, count in file_classes.items():
+                        class_counts[class_id] = class_counts.get(class_id, 0) + count
+                    hist = [total + count for total, count in zip(hist, file_hist)]
+                    self._insert_label_stats(key, stem, file_stats, file_stamp)
+
+            class_counts = {class_id: count for class_id, count in class_counts.items() if count > 0}
+            self._write_project_stats(key, _mtime_ns(project_path / LABELS_DIR_NAME), box_count, labeled, class_counts, hist)
+            self._conn.commit()
+
+    def _rebuild_label_stats(self, project_path: Path,
+                             confidences: Optional[Dict[str, List[Optional[float]]]] = None):
+        """
+        프로젝트의 모든 라벨 파일을 읽어 집계를 새로 만듭니다.
+
+        txt에는 신뢰도가 없으므로, 전달된 신뢰도가 없는 파일은 이전 집계의 신뢰도 분포를
+        파일 스탬프(mtime, 크기)가 그대로일 때만 재사용합니다. (바뀐 파일은 신뢰도 없음으로 집계)
+        """
+        key = str(project_path)
+        labels_dir = project_path / LABELS_DIR_NAME
+        labels_mtime = _mtime_ns(labels_dir)
+        confidences = confidences or {}
+        previous = {
+            row["stem"]: (row["file_stamp"], row["box_count"], json.loads(row["confidence_hist"]))
+            for row in self._conn.execute(
+                "SELECT stem, file_stamp, box_count, confidence_hist FROM label_stats WHERE project_path = ?", (key,)
+            )
+        }
+        self._conn.execute("DELETE FROM label_stats WHERE project_path = ?", (key,))
+
+        box_count = 0
+        labeled = 0
+        class_counts: Dict[str, int] = {}
+        hist = _empty_hist()
+        try:
+            with os.scandir(labels_dir) as entries:
+                label_files = [entry.path for entry in entries if entry.name.endswith(".txt")]
+        except OSError:
+            label_files = []
+
+        for label_file in label_files:
+            stem = Path(label_file).stem
+            file_stamp = _file_stamp(label_file)
+            file_stats = self._label_file_stats(Path(label_file), confidences.get(stem))
+            if file_stats is None:
+                continue
+            file_boxes, file_classes, file_hist = file_stats
+            old = previous.get(stem)
+            if stem not in confidences and old is not None and old[0] == file_stamp and old[1] == file_boxes:
+                file_hist = old[2]
+                file_stats = (file_boxes, file_classes, file_hist)
+            box_count += file_boxes
+            labeled += 1 if file_boxes else 0
+            for class_id, count in file_classes.items():
+                class_counts[class_id] = class_counts.get(class_id, 0) + count
+            hist = [total + count for total, count in zip(hist, file_hist)]
+            self._insert_label_stats(key, stem, file_stats, file_stamp)
+
+        self._write_project_stats(key, labels_mtime, box_count, labeled, class_counts, hist)
+        self._conn.commit()
+        logger.info(f"📊 프로젝트 라벨 통계 집계: {project_path} ({len(label_files)}개 파일, {box_count}개 박스)")
+
+    @staticmethod
+    def _label_file_stats(label_file: Path, confidences: Optional[List[Optional[float]]]
+                          ) -> Optional[Tuple[int, Dict[str, int], List[int]]]:
+        """라벨 파일 하나의 (박스 수, 클래스별 개수, 신뢰도 분포) - 파일이 없으면 None"""
+        try:
+            labels = read_yolo_label_file(label_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"라벨 파일 읽기 실패 ({label_file}): {e}")
+            return None
+        class_counts: Dict[str, int] = {}
+        for class_id in labels.class_ids.tolist():
+            class_counts[str(class_id)] = class_counts.get(str(class_id), 0) + 1
+        return len(labels), class_counts, _confidence_hist(confidences or [], len(labels))
+
+    def _insert_label_stats(self, key: str, stem: str, file_stats: Tuple[int, Dict[str, int], List[int]],
+                            file_stamp: str):
+        file_boxes, file_classes, file_hist = file_stats
+        self._conn.execute(
+            "INSERT OR REPLACE INTO label_stats (project_path, stem, box_count, class_counts, confidence_hist, "
+            "file_stamp) VALUES (?, ?, ?, ?, ?, ?)",
+            (key, stem, file_boxes, json.dumps(file_classes), json.dumps(file_hist), file_stamp)
+        )
+
+    def _write_project_stats(self, key: str, labels_mtime: int, box_count: int, labeled: int,
+                             class_counts: Dict[str, int], hist: List[int]):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO project_stats (project_path, labels_mtime_ns, box_count, labeled_files, "
+            "class_counts, confidence_hist, updated_time) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, labels_mtime, box_count, labeled, json.dumps(class_counts), json.dumps(hist), time.time())
+        )
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _locate(self, project_dir: Path) -> Optional[Tuple[Path, Path, str]]:
+        """(카탈로그 경로, 상위 디렉토리, 날짜 폴더) - 업로드 디렉토리 구조 밖이면 None"""
+        try:
+            relative = project_dir.resolve().relative_to(self.upload_dir.resolve())
+        except ValueError:
+            return None
+        parts = relative.parts
+        if len(parts) == 2 and DATE_FOLDER_PATTERN.match(parts[0]):
+            parent = self.upload_dir / parts[0]
+            return parent / parts[1], parent, parts[0]
+        if len(parts) == 1 and not DATE_FOLDER_PATTERN.match(parts[0]):
+            return self.upload_dir / parts[0], self.upload_dir, ""
+        return None
+
+    def _subdirs(self, directory: Path) -> List[str]:
+        """하위 디렉토리 이름 목록 (디렉토리 mtime이 같으면 저장된 목록 사용)"""
+        mtime = _mtime_ns(directory)
+        key = str(directory)
+        row = self._conn.execute("SELECT mtime_ns, children FROM scan_dirs WHERE path = ?", (key,)).fetchone()
+        if row is not None and row["mtime_ns"] == mtime:
+            return json.loads(row["children"])
+
+        try:
+            with os.scandir(directory) as entries:
+                children = sorted(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            children = []
+        self._conn.execute(
+            "INSERT OR REPLACE INTO scan_dirs (path, mtime_ns, children) VALUES (?, ?, ?)",
+            (key, mtime, json.dumps(children))
+        )
+        return children
+
+    @staticmethod
+    def _stamp(project_dir: Path, info_file: Optional[str]) -> str:
+        """변경 감지용 스탬프: 프로젝트/images/labels 디렉토리와 info 파일의 mtime"""
+        return ":".join(str(value) for value in (
+            _mtime_ns(project_dir),
+            _mtime_ns(project_dir / IMAGES_DIR_NAME),
+            _mtime_ns(project_dir / LABELS_DIR_NAME),
+            _mtime_ns(info_file) if info_file else 0
+        ))
+
+    def _store(self, project_dir: Path, parent: Path, date_prefix: str):
+        """프로젝트 디렉토리를 읽어 카탈로그 행을 기록합니다. (유효하지 않은 폴더도 스탬프와 함께 기록)"""
+        project_folder = project_dir.name
+        name = f"{date_prefix}/{project_folder}" if date_prefix else project_folder
+        images_dir = project_dir / IMAGES_DIR_NAME
+        labels_dir = project_dir / LABELS_DIR_NAME
+
+        info_file = None
+        if images_dir.is_dir() and labels_dir.is_dir():
+            info_file = find_project_info_file(project_dir)
+
+        # 스탬프는 내용을 읽기 전에 계산 (읽는 도중 바뀌면 다음 reconcile에서 다시 읽힘)
+        stamp = self._stamp(project_dir, str(info_file) if info_file else None)
+        values = {
+            "path": str(project_dir), "parent": str(parent), "name": name,
+            "date_folder": date_prefix or None, "project_folder": project_folder,
+            "valid": 0, "stamp": stamp, "info_file": str(info_file) if info_file else None,
+            "image_count": 0, "label_count": 0, "created_time": 0.0,
+            "extra": None, "class_names": None
+        }
+
+        if info_file is not None:
+            values["valid"] = 1
+            values["image_count"] = _count_files(images_dir, PROJECT_IMAGE_SUFFIXES)
+            values["label_count"] = _count_files(labels_dir, ('.txt',))
+            try:
+                # 생성 시간은 info.json 파일의 수정 시간 사용
+                values["created_time"] = info_file.stat().st_mtime
+            except OSError:
+                pass
+            try:
+                with open(info_file, 'r', encoding='utf-8') as f:
+                    info_data = json.load(f)
+                values["extra"] = json.dumps(self._additional_info(info_data), ensure_ascii=False)
+                values["class_names"] = json.dumps(_parse_class_names(info_data), ensure_ascii=False)
+            except Exception as e:
+                logger.warning(f"info.json 파일 읽기 실패 ({project_dir}): {e}")
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO projects (path, parent, name, date_folder, project_folder, valid, stamp, "
+            "info_file, image_count, label_count, created_time, extra, class_names) VALUES "
+            "(:path, :parent, :name, :date_folder, :project_folder, :valid, :stamp, "
+            ":info_file, :image_count, :label_count, :created_time, :extra, :class_names)",
+            values
+        )
+
+    @staticmethod
+    def _additional_info(info_data: Dict[str, Any]) -> Dict[str, Any]:
+        # class_info 우선, 없으면 classes 키 사용 (하위 호환성)
+        classes_info = []
+        if info_data.get("class_info"):
+            class_info = info_data["class_info"]
+            if isinstance(class_info, list):
+                classes_info = [cls.get("name", f"class_{cls.get('id', 0)}") for cls in class_info if isinstance(cls, dict)]
+        elif "classes" in info_data:
+            classes_info = info_data.get('classes', [])
+        return {
+            'classes': classes_info,
+            'description': info_data.get('description', ''),
+            'version': info_data.get('version', '1.0')
+        }
+
+    @staticmethod
+    def _to_project_info(row: sqlite3.Row) -> Dict[str, Any]:
+        date_prefix = row["date_folder"] or ""
+        display_name = f"{row['name']} ({date_prefix})" if date_prefix else row["name"]
+        project_info = {
+            "name": row["name"],  # API에서 사용할 전체 경로
+            "displayName": display_name,  # UI에서 표시할 이름
+            "path": row["path"],
+            "dateFolder": date_prefix if date_prefix else None,
+            "projectFolder": row["project_folder"],
+            "imageCount": row["image_count"],
+            "labelCount": row["label_count"],
+            "createdTime": row["created_time"]
+        }
+        if row["extra"]:
+            project_info.update(json.loads(row["extra"]))
+        return project_info
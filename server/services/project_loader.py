@@ -0,0 +1,405 @@
+"""프로젝트 불러오기(이미지 + 라벨) 서비스 모듈"""
+
+import os
+import json
+import base64
+import bisect
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+from fastapi import HTTPException
+
+try:
+    from ..core.config import PROJECT_LOAD_WORKERS
+    from ..core.image_manifest import ImageManifest
+    from ..core.utils import find_project_info_file
+    from ..utils.result_format import encode_boxes, RESULT_FORMAT_COLUMNAR
+    from ..utils.annotation_store import AnnotationStore
+    from ..utils.yolo_labels import (EMPTY_LABELS, LabelArrays, read_yolo_label_file, parse_yolo_label_texts,
+                                     labels_to_boxes, labels_to_columnar, paused_gc)
+except ImportError:
+    from core.config import PROJECT_LOAD_WORKERS
+    from core.image_manifest import ImageManifest
+    from core.utils import find_project_info_file
+    from utils.result_format import encode_boxes, RESULT_FORMAT_COLUMNAR
+    from utils.annotation_store import AnnotationStore
+    from utils.yolo_labels import (EMPTY_LABELS, LabelArrays, read_yolo_label_file, parse_yolo_label_texts,
+                                   labels_to_boxes, labels_to_columnar, paused_gc)
+
+logger = logging.getLogger(__name__)
+
+PROJECT_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif')
+# 페이지 크기 상한 (한 번에 너무 많은 이미지를 처리하지 않도록 제한)
+MAX_PAGE_SIZE = 1000
+# 열어 둔 프로젝트 정보(info.json, 정렬된 파일명) 캐시 개수
+_HANDLE_CACHE_SIZE = 8
+
+
+def _encode_cursor(filename: str) -> str:
+    """페이지 커서 (마지막 파일명을 URL-safe base64로 인코딩)"""
+    return base64.urlsafe_b64encode(filename.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor: str) -> str:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        return base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+
+def parse_yolo_label_file(label_file: Path, img_width: int, img_height: int, classes: List[str]) -> List[Dict[str, Any]]:
+    """
+    YOLO 형식의 라벨 파일을 파싱하여 바운딩 박스 정보를 반환합니다.
+    프로젝트 저장 시 class_info로 저장된 클래스 정보를 우선 사용하고,
+    없을 경우 현재 로드된 모델의 클래스 정보를 사용합니다.
+    (파일 전체를 배열로 읽어 변환하며, 형식이 잘못된 라인은 경고 후 건너뜀)
+    """
+    return labels_to_boxes(_read_label_arrays(label_file), img_width, img_height, classes)
+
+
+def _read_label_arrays(label_file: Path) -> LabelArrays:
+    """라벨 파일을 배열로 읽고 형식이 잘못된 라인을 경고로 남깁니다."""
+    try:
+        labels = read_yolo_label_file(label_file)
+    except Exception as e:
+        logger.error(f"라벨 파일 읽기 오류 ({label_file}): {e}")
+        raise
+
+    _log_malformed(label_file, labels)
+    return labels
+
+
+def _log_malformed(label_file: Path, labels: LabelArrays):
+    for line_num, reason in labels.malformed:
+        logger.warning(f"라벨 파일 {label_file.name} 라인 {line_num} 파싱 오류: {reason}")
+
+
+class _LabelText(NamedTuple):
+    """워커 스레드가 읽어 둔 라벨 파일 내용 (페이지 단위로 한 번에 파싱하기 전)"""
+    label_file: Path
+    text: str
+
+
+class ProjectHandle:
+    """열린 프로젝트의 경로, info.json 내용, 정렬된 이미지 파일명, 이미지 크기 매니페스트, 라벨 저장소"""
+
+    __slots__ = ("name", "path", "images_dir", "labels_dir", "info", "image_names", "stamp", "manifest",
+                 "annotations", "labels_stale", "rebuilding")
+
+    def __init__(self, name: str, path: Path, info: Dict[str, Any], image_names: List[str], stamp: Tuple[int, int]):
+        self.name = name
+        self.path = path
+        self.images_dir = path / "images"
+        self.labels_dir = path / "labels"
+        self.info = info
+        self.image_names = image_names
+        self.stamp = stamp
+        self.manifest = ImageManifest.load(path)
+        self.annotations = AnnotationStore.open(path)
+        # 저장소에 없거나 바뀐 라벨 파일을 txt에서 읽었는지 여부 (마지막 페이지 후 저장소 재생성)
+        self.labels_stale = False
+        self.rebuilding = False
+
+
+class ProjectLoader:
+    """
+    저장된 프로젝트를 불러오는 서비스 클래스
+
+    - open_project(): info.json과 정렬된 이미지 파일명만 읽음 (이미지/라벨 파일은 열지 않음)
+    - load_page()/load_image(): 요청된 페이지(또는 이미지)에 대해서만 크기 확인과 라벨 파싱 수행
+    - 이미지 크기는 {프로젝트명}_manifest.json에서 읽고, 없거나 바뀐 이미지만 헤더를 읽어 확인
+    - 라벨은 프로젝트 라벨 저장소(.annotations, mmap)에서 읽고, 저장소에 없거나
+      mtime/크기가 바뀐 라벨 파일만 txt를 직접 파싱
+    - 이미지별 작업(크기 확인, 라벨 존재 확인, 라벨 파싱)은 워커 풀에서 병렬로 실행하고
+      결과는 파일명 순서대로 모음 (이미지 하나의 오류는 그 이미지만 제외)
+    - 파일명 커서 기반 페이지이므로 불러오는 도중 이미지가 추가/삭제되어도 중복·누락이 없음
+    - 열린 프로젝트 정보는 images 폴더와 info 파일 mtime이 같으면 재사용
+    """
+
+    def __init__(self, upload_dir: Path, model_manager=None, workers: int = PROJECT_LOAD_WORKERS):
+        self.upload_dir = Path(upload_dir)
+        self.model_manager = model_manager
+        self._handles: "OrderedDict[str, ProjectHandle]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._workers = max(1, workers)
+        self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="project-load")
+
+    def close(self):
+        """워커 종료"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # 프로젝트 열기
+    # ------------------------------------------------------------------
+
+    def open_project(self, project_name: str) -> ProjectHandle:
+        """
+        프로젝트 구조를 검증하고 info.json과 이미지 파일명 목록을 읽습니다.
+
+        Args:
+            project_name: 프로젝트 이름 ("YYYY-MM-DD/프로젝트")
+
+        Returns:
+            ProjectHandle
+        """
+        if not project_name:
+            raise HTTPException(status_code=400, detail="프로젝트 이름이 제공되지 않았습니다.")
+
+        # 프로젝트 경로 구성
+        project_path = self.upload_dir / project_name
+        if not project_path.exists():
+            raise HTTPException(status_code=404, detail=f"프로젝트를 찾을 수 없습니다: {project_name}")
+
+        # 프로젝트 구조 검증
+        if not (project_path / "images").exists():
+            raise HTTPException(status_code=404, detail="이미지 폴더를 찾을 수 없습니다.")
+        if not (project_path / "labels").exists():
+            raise HTTPException(status_code=404, detail="라벨 폴더를 찾을 수 없습니다.")
+
+        info_file = find_project_info_file(project_path)
+        if info_file is None:
+            raise HTTPException(status_code=404, detail="프로젝트 정보 파일(info.json)을 찾을 수 없습니다.")
+
+        stamp = (os.stat(project_path / "images").st_mtime_ns, info_file.stat().st_mtime_ns)
+        key = str(project_path)
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is not None and handle.stamp == stamp:
+                self._handles.move_to_end(key)
+                return handle
+
+        # 프로젝트 정보 로드
+        try:
+            with open(info_file, 'r', encoding='utf-8') as f:
+                info = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.error(f"프로젝트 정보 파일 파싱 오류: {e}")
+            raise HTTPException(status_code=400, detail="프로젝트 정보 파일 형식이 올바르지 않습니다.")
+
+        # 이미지 파일 목록 수집 (파일명 정렬)
+        with os.scandir(project_path / "images") as entries:
+            image_names = sorted(
+                entry.name for entry in entries
+                if entry.name.lower().endswith(PROJECT_IMAGE_EXTENSIONS) and entry.is_file()
+            )
+
+        handle = ProjectHandle(project_name, project_path, info, image_names, stamp)
+        with self._lock:
+            self._handles[key] = handle
+            self._handles.move_to_end(key)
+            while len(self._handles) > _HANDLE_CACHE_SIZE:
+                self._handles.popitem(last=False)
+        return handle
+
+    def resolve_classes(self, handle: ProjectHandle) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        프로젝트 클래스 목록을 결정합니다. class_info를 우선 사용하고, 없으면 현재 모델에서 가져옵니다.
+
+        Returns:
+            (ID 순서 클래스 이름 목록, 응답용 class_info)
+        """
+        logger.info("=== 프로젝트 로드: 클래스 정보 처리 시작 ===")
+        processed_classes = []
+        class_info = handle.info.get("class_info")
+
+        # 1. 먼저 project_info에서 class_info 확인
+        if class_info:
+            logger.info(f"✅ 프로젝트 파일에서 class_info 발견: {class_info}")
+            if isinstance(class_info, list) and len(class_info) > 0:
+                # class_info가 [{"id": 0, "name": "person"}, {"id": 1, "name": "helmet"}, ...] 형태인 경우
+                try:
+                    # ID 순서대로 정렬하여 클래스명 추출
+                    sorted_class_info = sorted(class_info, key=lambda x: x.get("id", 0))
+                    processed_classes = [cls.get("name", f"class_{cls.get('id', 0)}") for cls in sorted_class_info]
+                    logger.info(f"🎯 프로젝트 로드에 사용할 클래스 정보 (class_info): {processed_classes}")
+                except Exception as e:
+                    logger.error(f"❌ class_info 파싱 오류: {str(e)}")
+                    processed_classes = []
+            else:
+                logger.warning("⚠️ class_info가 리스트가 아니거나 비어있음")
+
+        # 2. class_info가 없거나 유효하지 않은 경우 현재 모델에서 동적으로 가져오기
+        if not processed_classes:
+            logger.info("📡 class_info가 없거나 유효하지 않음 - 현재 모델에서 클래스 정보 동적 로드")
+            processed_classes = self._model_classes()
+
+        logger.info(f"🎯 최종 프로젝트 로드에 사용할 클래스 정보: {processed_classes}")
+
+        # class_info도 응답에 포함 (없으면 processed_classes 기반으로 생성)
+        if not class_info:
+            class_info = [{"id": index, "name": class_name} for index, class_name in enumerate(processed_classes)]
+        return processed_classes, class_info
+
+    def _model_classes(self) -> List[str]:
+        try:
+            model_classes_response = self.model_manager.get_model_classes() if self.model_manager else None
+
+            if model_classes_response and "classes" in model_classes_response:
+                model_classes_dict = model_classes_response["classes"]
+                logger.info(f"모델에서 가져온 클래스 딕셔너리: {model_classes_dict}")
+
+                # 딕셔너리를 ID 순서대로 정렬하여 리스트로 변환
+                if isinstance(model_classes_dict, dict):
+                    # ID 순서대로 정렬: {0: 'person', 1: 'helmet', ...} -> ['person', 'helmet', ...]
+                    return [model_classes_dict[str(i)] for i in sorted([int(k) for k in model_classes_dict.keys()])]
+                logger.error("모델 클래스 정보가 딕셔너리 형태가 아닙니다.")
+                raise HTTPException(status_code=400, detail="현재 로드된 모델의 클래스 정보를 가져올 수 없습니다.")
+
+            logger.error("모델에서 클래스 정보를 가져오지 못했습니다.")
+            raise HTTPException(status_code=400, detail="모델이 로드되지 않았거나 클래스 정보를 가져올 수 없습니다. 먼저 모델을 로드해주세요.")
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"모델 클래스 정보 가져오기 실패: {str(e)}")
+            raise HTTPException(status_code=500, detail="현재 로드된 모델에서 클래스 정보를 가져오는 중 오류가 발생했습니다.")
+
+    # ------------------------------------------------------------------
+    # 이미지 결과 구성
+    # ------------------------------------------------------------------
+
+    def load_page(self, handle: ProjectHandle, classes: List[str], result_format: str,
+                  cursor: Optional[str] = None, limit: Optional[int] = None,
+                  shared_class_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        정렬된 이미지 목록에서 한 페이지의 결과를 구성합니다.
+
+        Args:
+            handle: open_project() 결과
+            classes: resolve_classes()의 클래스 이름 목록
+            result_format: 결과 포맷 (verbose/columnar)
+            cursor: 이전 페이지의 nextCursor (처음 페이지는 None)
+            limit: 페이지 크기 (None이면 나머지 전체)
+            shared_class_names: columnar 포맷에서 공유하는 클래스 이름 목록
+
+        Returns:
+            {"results": [...], "nextCursor": str 또는 None}
+        """
+        names = handle.image_names
+        start = bisect.bisect_right(names, _decode_cursor(cursor)) if cursor else 0
+        end = len(names) if limit is None else min(len(names), start + max(1, min(limit, MAX_PAGE_SIZE)))
+
+        page_names = names[start:end]
+        if self._workers > 1 and len(page_names) > 1:
+            # map()은 제출 순서대로 결과를 돌려주므로 출력 순서는 파일명 정렬 순서 그대로
+            built = self._executor.map(lambda filename: self._build_image_result(handle, filename, classes), page_names)
+        else:
+            built = (self._build_image_result(handle, filename, classes) for filename in page_names)
+
+        results = [image_info for image_info in built if image_info is not None]
+        self._parse_label_texts(results)
+        # columnar 인코딩은 공유 클래스 목록에 이름을 추가하므로 순서대로 한 스레드에서 수행
+        # (verbose는 박스마다 dict/list를 만들므로 GC를 멈춘 채로 인코딩)
+        with paused_gc():
+            results = [self._encode(image_info, classes, result_format, shared_class_names) for image_info in results]
+
+        has_more = end < len(names)
+        if not has_more:
+            # 마지막 페이지까지 읽었으면 새로 확인한 크기를 매니페스트에 기록 (다음 로드부터 헤더도 읽지 않음)
+            handle.manifest.save()
+            if handle.labels_stale and not handle.rebuilding:
+                handle.rebuilding = True
+                self._executor.submit(self._rebuild_annotations, handle)
+        return {
+            "results": results,
+            "nextCursor": _encode_cursor(names[end - 1]) if has_more and end > start else None
+        }
+
+    def load_image(self, handle: ProjectHandle, filename: str, classes: List[str], result_format: str,
+                   shared_class_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """이미지 한 장의 결과를 구성합니다. (목록에 없으면 404)"""
+        filename = os.path.basename(filename)
+        index = bisect.bisect_left(handle.image_names, filename)
+        if index >= len(handle.image_names) or handle.image_names[index] != filename:
+            raise HTTPException(status_code=404, detail=f"프로젝트에 이미지가 없습니다: {filename}")
+        image_info = self._build_image_result(handle, filename, classes)
+        if image_info is None:
+            raise HTTPException(status_code=500, detail=f"이미지 처리 오류: {filename}")
+        self._parse_label_texts([image_info])
+        return self._encode(image_info, classes, result_format, shared_class_names)
+
+    @staticmethod
+    def _parse_label_texts(image_infos: List[Dict[str, Any]]):
+        """워커가 읽어 둔 라벨 파일 내용을 np.loadtxt 한 번으로 파싱해 배열로 교체"""
+        pending = [image_info for image_info in image_infos if isinstance(image_info["boxes"], _LabelText)]
+        if not pending:
+            return
+        parsed = parse_yolo_label_texts([image_info["boxes"].text for image_info in pending])
+        for image_info, labels in zip(pending, parsed):
+            _log_malformed(image_info["boxes"].label_file, labels)
+            image_info["boxes"] = labels
+
+    @staticmethod
+    def _encode(image_info: Dict[str, Any], classes: List[str], result_format: str,
+                shared_class_names: Optional[List[str]]) -> Dict[str, Any]:
+        """라벨 배열을 요청 포맷의 박스 목록으로 변환 (columnar는 박스 dict를 만들지 않고 배열에서 바로 변환)"""
+        labels = image_info["boxes"]
+        width, height = image_info["width"], image_info["height"]
+        if result_format == RESULT_FORMAT_COLUMNAR:
+            image_info["boxes"] = labels_to_columnar(labels, width, height, classes, shared_class_names)
+        else:
+            image_info["boxes"] = encode_boxes(labels_to_boxes(labels, width, height, classes), result_format)
+        return image_info
+
+    def _build_image_result(self, handle: ProjectHandle, filename: str, classes: List[str]) -> Optional[Dict[str, Any]]:
+        """이미지 한 장의 크기와 라벨 배열 또는 라벨 파일 내용 (워커 스레드에서 실행, 오류 시 None)"""
+        img_file = handle.images_dir / filename
+        try:
+            # 해당 이미지의 라벨 파일 찾기
+            label_file = handle.labels_dir / f"{img_file.stem}.txt"
+
+            # 이미지 메타데이터 수집
+            image_info = {
+                "filename": filename,
+                "image_path": f"images/{filename}",
+                "boxes": EMPTY_LABELS
+            }
+            image_info["width"], image_info["height"] = self._image_size(handle, filename)
+
+            # 라벨 파일이 존재하면 바운딩 박스 정보 로드 (저장소 항목이 최신이면 파일을 읽지 않음)
+            try:
+                label_stat = os.stat(label_file)
+            except FileNotFoundError:
+                label_stat = None
+            if label_stat is not None:
+                labels = handle.annotations.get(label_file.stem, label_stat) if handle.annotations else None
+                if labels is None:
+                    # 파일 읽기만 워커에서 하고 파싱은 _parse_label_texts()에서 페이지 단위로
+                    handle.labels_stale = True
+                    try:
+                        with open(label_file, 'r', encoding='utf-8') as f:
+                            labels = _LabelText(label_file, f.read())
+                    except (OSError, UnicodeDecodeError) as e:
+                        logger.warning(f"라벨 파일 읽기 실패 ({label_file.name}): {e}")
+                        labels = EMPTY_LABELS
+                image_info["boxes"] = labels
+
+            return image_info
+
+        except Exception as e:
+            logger.error(f"이미지 처리 오류 ({filename}): {e}")
+            return None
+
+    @staticmethod
+    def _rebuild_annotations(handle: ProjectHandle):
+        """백그라운드: 오래된 라벨 저장소를 다시 만들어 다음 로드부터 사용"""
+        try:
+            handle.annotations = AnnotationStore.build(handle.path)
+            handle.labels_stale = False
+        except Exception as e:
+            logger.warning(f"⚠️ 라벨 저장소 재생성 실패 ({handle.path}): {str(e)}")
+        finally:
+            handle.rebuilding = False
+
+    @staticmethod
+    def _image_size(handle: ProjectHandle, filename: str) -> Tuple[int, int]:
+        """이미지 크기 (매니페스트 또는 헤더, 읽기 실패 시 기본값 640x640)"""
+        dimensions = handle.manifest.dimensions(filename)
+        if dimensions is None:
+            logger.warning(f"이미지 크기 정보 추출 실패 ({filename}): 이미지 헤더를 읽을 수 없습니다")
+            return 640, 640
+        return dimensions
@@ -8,6 +8,15 @@ from datetime import datetime
 from typing import Dict, Any, List
 from fastapi import HTTPException
 
+try:
+    from ..core.config import IMAGE_EXTENSIONS
+    from ..core.image_manifest import ImageManifest
+    from ..utils.annotation_store import AnnotationStore
+except ImportError:
+    from core.config import IMAGE_EXTENSIONS
+    from core.image_manifest import ImageManifest
+    from utils.annotation_store import AnnotationStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +58,10 @@ class ProjectService:
             # 프로젝트 정보 파일 저장
             self._save_project_info(project_dir, project_name, save_results, data)
 
+            # 이미지 크기 매니페스트와 라벨 저장소 생성 (불러올 때 이미지/라벨 txt를 열지 않도록)
+            self._save_image_manifest(project_dir)
+            self._save_annotation_store(project_dir)
+
             # 메모리 정리
             self._cleanup_memory_images()
 
@@ -293,16 +306,18 @@ class ProjectService:
             memory_data = self.image_manager.get_memory_image(memory_filename)
             
             if memory_data:
-                with open(dest_path, "wb") as f:
-                    f.write(memory_data)
+                # 콘텐츠 해시 blob으로 저장 후 하드링크 (여러 프로젝트에 같은 이미지가 있어도 한 벌만 저장)
+                self.image_manager.content_store.store_bytes_at(memory_data, dest_path)
+                self.image_manager.file_index.add(dest_path)
                 logger.info(f"[SAVE] 메모리 이미지를 디스크에 저장: {memory_filename}")
                 self.image_manager.remove_memory_image(memory_filename)
                 return True
         
         # 파일 시스템 이미지인 경우
         elif source_path and Path(source_path).exists():
-            shutil.copy2(source_path, dest_path)
-            logger.info(f"[SAVE] 파일 시스템 이미지 복사: {source_path}")
+            self.image_manager.content_store.store_file_at(source_path, dest_path)
+            self.image_manager.file_index.add(dest_path)
+            logger.info(f"[SAVE] 파일 시스템 이미지 배치: {source_path}")
             return True
         
         return False
@@ -626,6 +641,27 @@ class ProjectService:
         logger.info("✅ 프로젝트 로드 시 class_info를 통해 클래스 번호와 이름 매칭")
         logger.info("=== 프로젝트 정보 저장 완료 ===")
     
+    def _save_image_manifest(self, project_dir: Path) -> None:
+        """images 폴더의 이미지 크기/파일 크기/mtime을 {프로젝트명}_manifest.json에 기록"""
+        try:
+            manifest = ImageManifest.load(project_dir)
+            image_names = [path.name for path in (project_dir / "images").iterdir()
+                           if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS]
+            probed = manifest.update(image_names)
+            manifest.save(force=True)
+            logger.info(f"이미지 매니페스트 저장 완료: {manifest.path} ({probed}/{len(image_names)}개)")
+        except Exception as e:
+            # 매니페스트는 캐시이므로 실패해도 저장은 성공으로 처리 (불러올 때 헤더에서 다시 확인)
+            logger.warning(f"⚠️ 이미지 매니페스트 저장 실패 ({project_dir}): {str(e)}")
+
+    def _save_annotation_store(self, project_dir: Path) -> None:
+        """labels/*.txt를 열 기반 라벨 저장소(.annotations)로 묶어 저장 (txt 파일은 그대로 유지)"""
+        try:
+            AnnotationStore.build(project_dir)
+        except Exception as e:
+            # 저장소는 캐시이므로 실패해도 저장은 성공으로 처리 (불러올 때 txt를 직접 읽음)
+            logger.warning(f"⚠️ 라벨 저장소 생성 실패 ({project_dir}): {str(e)}")
+
     def _cleanup_memory_images(self) -> None:
         """메모리 이미지 정리"""
         remaining_memory_images = len(self.image_manager.memory_images)
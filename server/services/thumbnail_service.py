@@ -0,0 +1,349 @@
+"""썸네일/축소 이미지 캐시 서비스 모듈"""
+
+import os
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Iterable, Tuple, Union
+from fastapi import HTTPException
+from PIL import Image, ImageOps
+
+try:
+    from ..core.config import IMAGE_EXTENSIONS
+except ImportError:
+    from core.config import IMAGE_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+_MEDIA_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+_SUFFIXES = {"webp": ".webp", "jpeg": ".jpg"}
+# 최근 사용 순서를 기억할 썸네일 수 (넘으면 가장 오래전에 쓴 항목부터 잊음)
+_RECENT_LIMIT = 100_000
+
+
+def _webp_supported() -> bool:
+    try:
+        from PIL import features
+        return bool(features.check("webp"))
+    except Exception:
+        return False
+
+
+class ThumbnailService:
+    """
+    이미지 목록/네비게이터용 썸네일을 생성하고 디스크에 캐시하는 서비스 클래스
+
+    - 요청 너비는 고정 크기(128/256/512 등) 중 가장 가까운 큰 값으로 올려 변형 수를 제한
+    - 캐시 경로: <원본 키>/<버전>_<크기>_q<품질>.<포맷>
+      (원본 키 = 원본 경로 해시, 메모리 이미지는 콘텐츠 해시 / 버전 = 원본 mtime)
+      → 원본이 바뀌면 새 파일명이 되므로 별도 무효화가 필요 없고,
+        새 버전을 쓸 때 같은 원본의 이전 버전 썸네일은 삭제
+    - 캐시 전체 크기는 max_cache_bytes로 제한: 초과 시 예산의 90%까지 최근에 쓰지 않은 파일부터 삭제
+      (사용 순서는 메모리에 기록 - 파일 mtime은 ETag에 쓰이므로 건드리지 않음,
+       재시작 후 아직 사용하지 않은 파일은 mtime이 오래된 것부터 삭제)
+    - 요청 시 생성은 워커 풀에서, 프로젝트 저장/로드 시 미리 생성은 별도 백그라운드 워커에서 실행
+      (대량 사전 생성이 화면 요청을 막지 않도록 분리)
+    - 같은 썸네일을 동시에 요청하면 한 번만 생성
+    """
+
+    def __init__(self, image_manager, cache_dir: Path, sizes: Iterable[int] = (128, 256, 512),
+                 pregenerate_sizes: Iterable[int] = (256,), image_format: str = "webp",
+                 quality: int = 80, workers: int = 2, max_cache_bytes: int = 0):
+        self.image_manager = image_manager
+        self.cache_dir = Path(cache_dir)
+        self.sizes = tuple(sorted(set(int(size) for size in sizes)))
+        self.pregenerate_sizes = tuple(sorted(set(int(size) for size in pregenerate_sizes)))
+        self.quality = quality
+        self.max_cache_bytes = max(0, max_cache_bytes)
+
+        if image_format == "webp" and not _webp_supported():
+            logger.warning("⚠️ Pillow WebP 지원이 없어 썸네일을 JPEG로 생성합니다")
+            image_format = "jpeg"
+        self.image_format = image_format if image_format in _MEDIA_TYPES else "jpeg"
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="thumbnail")
+        self._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="thumbnail-pregen")
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        # 썸네일 경로 → None, 최근에 사용한 것이 뒤
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self._hits = 0
+        self._generated = 0
+        self._failures = 0
+        self._pregenerated = 0
+        self._evicted = 0
+        self._cache_bytes = self._scan_cache_bytes()
+
+    @property
+    def media_type(self) -> str:
+        """생성되는 썸네일의 MIME 타입"""
+        return _MEDIA_TYPES[self.image_format]
+
+    def snap_size(self, width: int) -> int:
+        """요청 너비를 고정 크기 중 하나로 맞춥니다."""
+        for size in self.sizes:
+            if width <= size:
+                return size
+        return self.sizes[-1]
+
+    async def get_thumbnail(self, filename: str, width: int) -> Path:
+        """
+        썸네일 파일 경로를 반환합니다. (없으면 워커 풀에서 생성)
+
+        Args:
+            filename: 이미지 파일명 또는 상대 경로 (/files와 동일한 규칙으로 검색)
+            width: 요청 너비 (px)
+
+        Returns:
+            Path: 캐시된 썸네일 파일 경로
+        """
+        source_key, version, source = self._resolve_source(filename)
+        size = self.snap_size(width)
+        dest = self._cache_path(source_key, version, size)
+        if dest.exists():
+            with self._lock:
+                self._hits += 1
+                self._mark_used(str(dest))
+            return dest
+
+        future = self._submit(self._executor, dest, source, size)
+        try:
+            await asyncio.wrap_future(future)
+        except Exception as e:
+            logger.error(f"썸네일 생성 실패 ({filename}): {str(e)}")
+            raise HTTPException(status_code=500, detail=f"썸네일 생성 실패: {str(e)}")
+        return dest
+
+    def schedule_directory(self, images_dir: Union[str, Path]):
+        """
+        디렉토리의 모든 이미지에 대해 기본 크기 썸네일을 백그라운드에서 미리 생성합니다.
+        (프로젝트 저장/로드 직후 호출, 즉시 반환)
+
+        Args:
+            images_dir: 프로젝트 images 디렉토리
+        """
+        if self.pregenerate_sizes:
+            self._background.submit(self._pregenerate_directory, Path(images_dir))
+
+    def stats(self) -> Dict[str, Any]:
+        """썸네일 캐시 통계"""
+        with self._lock:
+            return {
+                "cache_dir": str(self.cache_dir),
+                "format": self.image_format,
+                "sizes": list(self.sizes),
+                "hits": self._hits,
+                "generated": self._generated,
+                "pregenerated": self._pregenerated,
+                "failures": self._failures,
+                "pending": len(self._pending),
+                "cache_bytes": self._cache_bytes,
+                "max_cache_bytes": self.max_cache_bytes,
+                "evicted": self._evicted
+            }
+
+    def close(self):
+        """워커 종료 (대기 중인 사전 생성 작업은 취소)"""
+        self._background.shutdown(wait=False, cancel_futures=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _resolve_source(self, filename: str) -> Tuple[str, str, Union[Path, bytes]]:
+        """(원본 키, 버전, 원본 경로 또는 메모리 이미지 바이트)"""
+        image_path = self.image_manager.find_image_path(filename)
+        if image_path and str(image_path).startswith("memory://"):
+            memory_name = str(image_path)[len("memory://"):]
+            data = self.image_manager.get_memory_image(memory_name)
+            if data:
+                digest = self.image_manager.memory_images.hash_of(memory_name) or hashlib.sha256(data).hexdigest()
+                # 콘텐츠 해시가 곧 버전이므로 이전 버전이 생기지 않음
+                return f"memory|{digest}", "0", data
+            image_path = None
+
+        if not image_path:
+            raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {filename}")
+
+        image_path = Path(image_path)
+        try:
+            stat = image_path.stat()
+        except OSError:
+            raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {filename}")
+        return str(image_path.resolve()), str(stat.st_mtime_ns), image_path
+
+    def _cache_path(self, source_key: str, version: str, size: int) -> Path:
+        key = hashlib.sha1(source_key.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / key / f"{version}_{size}_q{self.quality}{_SUFFIXES[self.image_format]}"
+
+    def _submit(self, executor: ThreadPoolExecutor, dest: Path, source: Union[Path, bytes], size: int) -> Future:
+        """같은 썸네일의 중복 생성을 막고 워커에 작업을 넣습니다."""
+        key = str(dest)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = executor.submit(self._render, source, size, dest)
+                self._pending[key] = future
+                future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _forget(self, key: str):
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def _render(self, source: Union[Path, bytes], size: int, dest: Path):
+        """원본을 축소하여 dest에 저장합니다. (임시 파일에 쓴 뒤 교체)"""
+        if dest.exists():
+            return
+
+        try:
+            with Image.open(BytesIO(source) if isinstance(source, bytes) else source) as image:
+                # JPEG는 디코딩 단계에서 1/2~1/8로 축소하여 전체 해상도 디코딩을 피함
+                image.draft("RGB", (size, size))
+                image = ImageOps.exif_transpose(image)
+                image.thumbnail((size, size), Image.BILINEAR, reducing_gap=2.0)
+
+                has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+                if self.image_format == "webp" and has_alpha:
+                    image = image.convert("RGBA")
+                elif image.mode != "RGB":
+                    image = image.convert("RGB")
+
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = dest.with_name(f".{dest.name}.{threading.get_ident()}.tmp")
+                image.save(tmp_path, format=self.image_format.upper(), quality=self.quality)
+                os.replace(tmp_path, dest)
+        except Exception:
+            with self._lock:
+                self._failures += 1
+            raise
+
+        removed_bytes = self._remove_old_versions(dest)
+        try:
+            written = dest.stat().st_size
+        except OSError:
+            written = 0
+        with self._lock:
+            self._generated += 1
+            self._mark_used(str(dest))
+            self._cache_bytes = max(0, self._cache_bytes + written - removed_bytes)
+            over_budget = self.max_cache_bytes and self._cache_bytes > self.max_cache_bytes
+        if over_budget:
+            self._trim_cache()
+
+    def _mark_used(self, key: str):
+        """최근 사용 순서 갱신 (self._lock 안에서 호출)"""
+        self._recent[key] = None
+        self._recent.move_to_end(key)
+        if len(self._recent) > _RECENT_LIMIT:
+            self._recent.popitem(last=False)
+
+    @staticmethod
+    def _remove_old_versions(dest: Path) -> int:
+        """같은 원본의 다른 버전(원본 mtime이 다른) 썸네일 삭제, 삭제한 바이트 수 반환"""
+        prefix = dest.name.split("_", 1)[0] + "_"
+        removed = 0
+        try:
+            siblings = list(os.scandir(dest.parent))
+        except OSError:
+            return 0
+        for entry in siblings:
+            if entry.name.startswith((prefix, ".")):
+                continue
+            try:
+                size = entry.stat().st_size
+                os.unlink(entry.path)
+            except OSError:
+                continue
+            removed += size
+        return removed
+
+    def _cache_files(self):
+        """캐시 디렉토리의 썸네일 파일 (작성 중인 임시 파일 제외, 이전 배치의 파일 포함)"""
+        for suffix in set(_SUFFIXES.values()):
+            yield from self.cache_dir.rglob(f"*{suffix}")
+
+    def _scan_cache_bytes(self) -> int:
+        if not self.cache_dir.exists():
+            return 0
+        total = 0
+        for path in self._cache_files():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def _trim_cache(self):
+        """캐시 예산 초과 시 최근에 쓰지 않은 파일부터 예산의 90%까지 삭제"""
+        with self._lock:
+            recency = {key: rank for rank, key in enumerate(self._recent)}
+        files = []
+        for path in self._cache_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            # 이번 실행에서 쓰지 않은 파일(-1)이 먼저, 그중에서는 mtime 순
+            files.append((recency.get(str(path), -1), stat.st_mtime_ns, stat.st_size, path))
+        files.sort(key=lambda item: item[:2])
+
+        total = sum(item[2] for item in files)
+        target = int(self.max_cache_bytes * 0.9)
+        removed = 0
+        for _, _, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            with self._lock:
+                self._recent.pop(str(path), None)
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass
+
+        with self._lock:
+            self._cache_bytes = total
+            self._evicted += removed
+        logger.info(f"♻️ 썸네일 캐시 정리: {removed}개 파일 삭제, 현재 {total} bytes")
+
+    def _pregenerate_directory(self, images_dir: Path):
+        """백그라운드 워커: 디렉토리 이미지의 기본 크기 썸네일 생성"""
+        created = 0
+        try:
+            with os.scandir(images_dir) as entries:
+                paths = [Path(entry.path) for entry in entries
+                         if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)]
+        except OSError as e:
+            logger.warning(f"⚠️ 썸네일 사전 생성 디렉토리 읽기 실패: {images_dir} ({str(e)})")
+            return
+
+        for path in paths:
+            try:
+                source_key, version = str(path.resolve()), str(path.stat().st_mtime_ns)
+            except OSError:
+                continue
+            for size in self.pregenerate_sizes:
+                dest = self._cache_path(source_key, version, size)
+                if dest.exists():
+                    continue
+                try:
+                    self._render(path, size, dest)
+                    created += 1
+                except Exception as e:
+                    logger.debug(f"썸네일 사전 생성 실패 ({path.name}): {str(e)}")
+
+        with self._lock:
+            self._pregenerated += created
+        logger.info(f"🖼️ 썸네일 사전 생성 완료: {images_dir} ({created}개 생성, {len(paths)}개 이미지)")
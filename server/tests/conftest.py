@@ -0,0 +1,96 @@
+"""테스트에서 서버 모듈(core/, utils/ ...)을 server/ 기준 절대 경로로 import할 수 있도록 설정"""
+
+import os
+import sys
+
+import pytest
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+
+class SourceImageManager:
+    """
+    원본 디렉토리의 파일을 찾아 주는 최소 image_manager (ProjectService 저장 경로용)
+
+    메모리 이미지는 없고, 저장 시 배치는 실제 ContentStore/FileIndex를 사용합니다.
+    """
+
+    def __init__(self, upload_dir, source_dir):
+        from core.content_store import ContentStore
+        from core.file_index import FileIndex
+
+        self.source_dir = source_dir
+        self.content_store = ContentStore(upload_dir)
+        self.file_index = FileIndex(upload_dir)
+        self.memory_images = {}
+
+    def find_image_path(self, filename):
+        path = self.source_dir / filename
+        return path if path.exists() else None
+
+    def get_memory_image(self, filename):
+        return None
+
+    def remove_memory_image(self, filename):
+        pass
+
+    def clear_memory_images(self):
+        self.memory_images.clear()
+
+
+@pytest.fixture
+def upload_dir(tmp_path):
+    path = tmp_path / "uploads"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    path = tmp_path / "src"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def image_manager(upload_dir, source_dir):
+    return SourceImageManager(upload_dir, source_dir)
+
+
+@pytest.fixture
+def make_save_payload(source_dir):
+    """
+    원본 이미지 count장을 만들고 /api/project/save-local 요청 본문을 반환하는 함수
+
+    이미지마다 boxes_per_image개의 박스(신뢰도 confidence)를 넣습니다.
+    """
+    from PIL import Image
+
+    def factory(project_name, count, boxes_per_image=1, confidence=0.95, size=(64, 48)):
+        images = []
+        for index in range(count):
+            filename = f"{project_name}_{index:05d}.jpg"
+            Image.new("RGB", size, (index % 256, 0, 0)).save(source_dir / filename)
+            images.append({
+                "filename": filename,
+                "width": size[0],
+                "height": size[1],
+                "boxes": [
+                    {
+                        "class_id": 0,
+                        "class_name": "person",
+                        "confidence": confidence,
+                        "normalized_coords": [0.5, 0.5, 0.2 + 0.01 * box, 0.3]
+                    }
+                    for box in range(boxes_per_image)
+                ]
+            })
+        return {
+            "projectName": project_name,
+            "images": images,
+            "class_info": [{"id": 0, "name": "person"}]
+        }
+
+    return factory
@@ -0,0 +1,222 @@
+"""IOPool - 블로킹 파일 I/O를 풀에서 실행할 때 이벤트 루프가 막히지 않는지 검사"""
+
+import os
+import time
+import asyncio
+import threading
+import contextvars
+from pathlib import Path
+
+import pytest
+
+from core.io_pool import IOPool
+from services.project_catalog import ProjectCatalog, collect_box_confidences
+from services.project_service import ProjectService
+
+# 저장 함수가 이벤트 루프를 붙잡는 최소 시간 (디스크 속도와 무관하게 블로킹이 확실히 드러나도록)
+BLOCKING_SECONDS = 0.3
+# 풀에서 실행할 때 허용하는 최대 이벤트 루프 지연
+MAX_POOL_LAG = 0.1
+TICK_INTERVAL = 0.01
+# 실제 저장 경로 검사용 프로젝트 크기 (바로 호출하면 루프가 MAX_POOL_LAG 이상 멈출 만큼)
+SAVE_IMAGE_COUNT = 1500
+
+
+def _blocking_save(path, size_mb: int = 16) -> int:
+    """프로젝트 저장처럼 큰 파일을 쓰고 fsync하는 블로킹 함수"""
+    chunk = os.urandom(1024 * 1024)
+    deadline = time.perf_counter() + BLOCKING_SECONDS
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(chunk)
+        f.flush()
+        os.fsync(f.fileno())
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+    return size_mb * len(chunk)
+
+
+async def _run_with_ticker(awaitable):
+    """awaitable을 실행하는 동안 TICK_INTERVAL마다 깨어나는 코루틴으로 최대 루프 지연을 잽니다."""
+    loop = asyncio.get_running_loop()
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            expected = loop.time() + TICK_INTERVAL
+            await asyncio.sleep(TICK_INTERVAL)
+            lags.append(max(0.0, loop.time() - expected))
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    try:
+        result = await awaitable
+    finally:
+        done.set()
+        await task
+    return result, max(lags)
+
+
+def test_inline_save_blocks_event_loop(tmp_path):
+    """기준: 핸들러에서 바로 호출하면 저장 시간만큼 루프가 멈춤 (측정 방식 검증)"""
+    async def inline():
+        return _blocking_save(tmp_path / "inline.bin")
+
+    _, max_lag = asyncio.run(_run_with_ticker(inline()))
+    assert max_lag >= BLOCKING_SECONDS * 0.8
+
+
+def test_run_write_keeps_event_loop_responsive(tmp_path):
+    """run_write()로 실행하면 저장 중에도 루프 지연이 작게 유지됨"""
+    pool = IOPool(workers=2, write_concurrency=1)
+
+    async def main():
+        return await _run_with_ticker(pool.run_write(_blocking_save, tmp_path / "pooled.bin"))
+
+    try:
+        written, max_lag = asyncio.run(main())
+    finally:
+        pool.close()
+    assert written == 16 * 1024 * 1024
+    assert (tmp_path / "pooled.bin").stat().st_size == written
+    assert max_lag < MAX_POOL_LAG
+
+
+def test_run_write_limits_concurrent_writes():
+    """쓰기는 write_concurrency개까지만 동시에 실행되고 읽기 워커는 남아 있음"""
+    pool = IOPool(workers=4, write_concurrency=1)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def write():
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+
+    async def main():
+        started = time.perf_counter()
+        writes = asyncio.gather(*(pool.run_write(write) for _ in range(3)))
+        # 쓰기가 줄 서 있는 동안에도 읽기는 바로 실행됨
+        read_value = await pool.run(lambda: "read")
+        read_latency = time.perf_counter() - started
+        await writes
+        return read_value, read_latency
+
+    try:
+        read_value, read_latency = asyncio.run(main())
+    finally:
+        pool.close()
+    assert state["peak"] == 1
+    assert read_value == "read"
+    assert read_latency < 0.1
+
+
+def test_run_propagates_result_exception_and_context():
+    """반환값/예외와 요청 컨텍스트(contextvars)가 워커 스레드까지 전달됨"""
+    pool = IOPool(workers=1, write_concurrency=1)
+    request_id = contextvars.ContextVar("request_id", default=None)
+
+    def fail():
+        raise FileNotFoundError("missing")
+
+    async def main():
+        request_id.set("req-1")
+        value = await pool.run(request_id.get)
+        with pytest.raises(FileNotFoundError):
+            await pool.run(fail)
+        return value
+
+    try:
+        assert asyncio.run(main()) == "req-1"
+    finally:
+        pool.close()
+
+
+@pytest.fixture
+def catalog(upload_dir):
+    catalog = ProjectCatalog(upload_dir, ":memory:")
+    yield catalog
+    catalog.close()
+
+
+def _save_project_local(project_service, catalog, data):
+    """main._save_project_local과 같은 순서: 저장 → 카탈로그 갱신 → 저장한 라벨의 통계 반영"""
+    result = project_service.save_project(data)
+    catalog.refresh_project(result["path"])
+    confidences = collect_box_confidences(data["images"])
+    catalog.update_label_stats(result["path"], confidences.keys(), confidences)
+    return result
+
+
+def _delete_project_images(content_store, catalog, project_dir):
+    """main._delete_project_files와 같은 삭제(blob 참조 정리 + 라벨 삭제 + 카탈로그 갱신)를 모든 이미지에 수행"""
+    deleted = 0
+    for image_path in sorted((project_dir / "images").iterdir()):
+        content_store.unlink(image_path)
+        label_path = project_dir / "labels" / f"{image_path.stem}.txt"
+        if label_path.exists():
+            label_path.unlink()
+        deleted += 1
+    catalog.refresh_project(project_dir)
+    return deleted
+
+
+def test_save_project_through_run_write_keeps_event_loop_responsive(upload_dir, image_manager, catalog,
+                                                                    make_save_payload):
+    """실제 저장 경로(ProjectService.save_project + 카탈로그 갱신)를 핸들러처럼 run_write()로 실행"""
+    project_service = ProjectService(upload_dir, image_manager)
+    pool = IOPool(workers=2, write_concurrency=1)
+    inline_payload = make_save_payload("inline", SAVE_IMAGE_COUNT, boxes_per_image=5)
+    pooled_payload = make_save_payload("pooled", SAVE_IMAGE_COUNT, boxes_per_image=5)
+
+    async def inline():
+        return _save_project_local(project_service, catalog, inline_payload)
+
+    async def main():
+        _, inline_lag = await _run_with_ticker(inline())
+        pooled = await _run_with_ticker(pool.run_write(_save_project_local, project_service, catalog, pooled_payload))
+        return inline_lag, pooled
+
+    try:
+        inline_lag, (result, pooled_lag) = asyncio.run(main())
+    finally:
+        pool.close()
+
+    # 기준: 바로 호출하면 저장하는 동안 루프가 멈춤 (저장 작업이 측정에 충분히 큼)
+    assert inline_lag >= MAX_POOL_LAG
+    assert result["savedImages"] == SAVE_IMAGE_COUNT
+    project_dir = Path(result["path"])
+    assert len(list(project_dir.glob("labels/*.txt"))) == SAVE_IMAGE_COUNT
+    assert catalog.project_stats(f"{project_dir.parent.name}/{project_dir.name}")["boxCount"] == SAVE_IMAGE_COUNT * 5
+    assert pooled_lag < MAX_POOL_LAG
+
+
+def test_delete_project_files_through_run_write_keeps_event_loop_responsive(upload_dir, image_manager, catalog,
+                                                                            make_save_payload):
+    """저장한 프로젝트의 이미지/라벨/blob 삭제를 run_write()로 실행해도 루프 지연이 작게 유지됨"""
+    project_service = ProjectService(upload_dir, image_manager)
+    result = _save_project_local(project_service, catalog, make_save_payload("delete", SAVE_IMAGE_COUNT))
+    project_dir = Path(result["path"])
+    blob_dir = upload_dir / ".blobs"
+    assert any(path.is_file() for path in blob_dir.rglob("*"))
+    pool = IOPool(workers=2, write_concurrency=1)
+
+    async def main():
+        return await _run_with_ticker(
+            pool.run_write(_delete_project_images, image_manager.content_store, catalog, project_dir))
+
+    try:
+        deleted, max_lag = asyncio.run(main())
+    finally:
+        pool.close()
+
+    assert deleted == SAVE_IMAGE_COUNT
+    assert not any((project_dir / "images").iterdir())
+    # 다른 프로젝트가 쓰지 않는 blob은 마지막 참조와 함께 삭제됨
+    assert not any(path.is_file() for path in blob_dir.rglob("*"))
+    assert max_lag < MAX_POOL_LAG
@@ -0,0 +1,62 @@
+"""ProjectCatalog 라벨 통계 - 프로젝트 저장 직후 신뢰도 분포가 집계에 남는지 검사"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from services.project_catalog import ProjectCatalog, collect_box_confidences
+from services.project_service import ProjectService
+
+
+@pytest.fixture
+def catalog(upload_dir):
+    catalog = ProjectCatalog(upload_dir, ":memory:")
+    yield catalog
+    catalog.close()
+
+
+def _save(project_service, catalog, payload):
+    """main._save_project_local과 같은 순서: 저장 → 카탈로그 갱신 → 저장한 라벨의 통계 반영"""
+    result = project_service.save_project(payload)
+    catalog.refresh_project(result["path"])
+    confidences = collect_box_confidences(payload["images"])
+    catalog.update_label_stats(result["path"], confidences.keys(), confidences)
+    return Path(result["path"])
+
+
+def _project_name(project_dir: Path) -> str:
+    return f"{project_dir.parent.name}/{project_dir.name}"
+
+
+def test_first_save_keeps_confidences(upload_dir, image_manager, catalog, make_save_payload):
+    """처음 저장한 프로젝트도 요청의 신뢰도가 집계됨 (모두 unknown이 되지 않음)"""
+    project_service = ProjectService(upload_dir, image_manager)
+    project_dir = _save(project_service, catalog, make_save_payload("first", count=3, boxes_per_image=2))
+
+    stats = catalog.project_stats(_project_name(project_dir))
+
+    assert stats["boxCount"] == 6
+    assert stats["labeledImages"] == 3
+    assert stats["confidence"]["unknown"] == 0
+    assert stats["confidence"]["counts"][9] == 6
+
+
+def test_rebuild_keeps_confidences_of_unchanged_files(upload_dir, image_manager, catalog, make_save_payload):
+    """labels 폴더가 밖에서 바뀌어 전체를 다시 집계해도 바뀌지 않은 파일의 신뢰도 분포는 유지"""
+    project_service = ProjectService(upload_dir, image_manager)
+    project_dir = _save(project_service, catalog, make_save_payload("rebuild", count=2))
+    name = _project_name(project_dir)
+    assert catalog.project_stats(name)["confidence"]["counts"][9] == 2
+
+    # API 밖에서 라벨 파일 추가 (labels 폴더 mtime 변경 → 다음 조회에서 전체 재집계)
+    labels_dir = project_dir / "labels"
+    (labels_dir / "external.txt").write_text("0 0.5 0.5 0.1 0.1\n")
+    stat = os.stat(labels_dir)
+    os.utime(labels_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    stats = catalog.project_stats(name)
+
+    assert stats["boxCount"] == 3
+    assert stats["confidence"]["counts"][9] == 2
+    assert stats["confidence"]["unknown"] == 1
@@ -0,0 +1,111 @@
+"""ThumbnailService 디스크 캐시 - ETag 유지, 이전 버전 삭제, 예산 초과 시 LRU 정리"""
+
+import os
+import asyncio
+
+import pytest
+from PIL import Image
+from starlette.requests import Request
+
+from services.thumbnail_service import ThumbnailService
+from utils.http_cache import conditional_file_response
+
+
+class _ImageManager:
+    """원본 디렉토리의 파일명으로만 찾는 최소 image_manager"""
+
+    def __init__(self, source_dir):
+        self.source_dir = source_dir
+
+    def find_image_path(self, filename):
+        path = self.source_dir / filename
+        return path if path.exists() else None
+
+
+def _request(headers=None):
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/thumbs", "query_string": b"", "headers": raw_headers})
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    for index in range(12):
+        Image.effect_noise((600, 600), 64).convert("RGB").save(source / f"{index}.jpg")
+    return source
+
+
+@pytest.fixture
+def make_service(tmp_path, source_dir):
+    services = []
+
+    def factory(**kwargs):
+        service = ThumbnailService(_ImageManager(source_dir), tmp_path / "cache", image_format="jpeg", **kwargs)
+        services.append(service)
+        return service
+
+    yield factory
+    for service in services:
+        service.close()
+
+
+def test_cache_hits_keep_etag_stable(make_service):
+    """캐시 적중은 썸네일 파일을 건드리지 않으므로 ETag가 같고 If-None-Match에 304"""
+    service = make_service(max_cache_bytes=1024 * 1024 * 1024)
+
+    async def main():
+        first = await service.get_thumbnail("0.jpg", 256)
+        etag = conditional_file_response(_request(), first, service.media_type).headers["etag"]
+        second = await service.get_thumbnail("0.jpg", 256)
+        revalidated = conditional_file_response(_request({"If-None-Match": etag}), second, service.media_type)
+        return first, second, etag, revalidated
+
+    first, second, etag, revalidated = asyncio.run(main())
+    assert first == second
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert service.stats()["hits"] == 1
+
+
+def test_new_source_version_replaces_old_thumbnails(make_service, source_dir):
+    """원본이 바뀌면 새 썸네일을 만들고 같은 원본의 이전 버전(모든 크기)은 삭제"""
+    service = make_service()
+
+    async def main():
+        old_small = await service.get_thumbnail("0.jpg", 128)
+        old_large = await service.get_thumbnail("0.jpg", 256)
+        stat = os.stat(source_dir / "0.jpg")
+        os.utime(source_dir / "0.jpg", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        new = await service.get_thumbnail("0.jpg", 256)
+        return old_small, old_large, new
+
+    old_small, old_large, new = asyncio.run(main())
+    assert new != old_large
+    assert sorted(path.name for path in new.parent.iterdir()) == [new.name]
+    assert not old_small.exists()
+    assert service.stats()["cache_bytes"] == new.stat().st_size
+
+
+def test_over_budget_evicts_least_recently_used(make_service):
+    """예산을 넘으면 최근에 쓰지 않은 썸네일부터 삭제 (자주 쓰는 썸네일은 가장 오래됐어도 유지)"""
+    service = make_service()
+
+    async def main():
+        hot = await service.get_thumbnail("0.jpg", 256)
+        hot_mtime = hot.stat().st_mtime_ns
+        service.max_cache_bytes = hot.stat().st_size * 5
+        others = []
+        for index in range(1, 12):
+            others.append(await service.get_thumbnail(f"{index}.jpg", 256))
+            await service.get_thumbnail("0.jpg", 256)
+        return hot, hot_mtime, others
+
+    hot, hot_mtime, others = asyncio.run(main())
+    stats = service.stats()
+    assert stats["evicted"] > 0
+    assert stats["cache_bytes"] <= stats["max_cache_bytes"]
+    assert hot.exists()
+    assert hot.stat().st_mtime_ns == hot_mtime
+    assert not others[0].exists()
+    assert others[-1].exists()
@@ -0,0 +1,90 @@
+"""타일 추론 결과 병합 - 타일 경계에서 잘린 조각만 병합하고 큰 객체 안의 작은 객체는 유지"""
+
+import numpy as np
+import pytest
+
+# managers 패키지는 import 시 모델 매니저(torch)를 함께 불러옴
+pytest.importorskip("torch")
+
+from managers.tiling import compute_tile_windows, merge_tile_detections
+
+IMAGE_SIZE = (1000, 640)
+TILE_SIZE = 640
+
+
+def _tiles():
+    """가로로 겹치는 타일 2개 (x: 0~640, 360~1000) + 전체 이미지 패스"""
+    windows = compute_tile_windows(*IMAGE_SIZE, tile_size=TILE_SIZE, overlap=0.2)
+    offsets = np.vstack([windows[:, :2], np.zeros((1, 2), dtype=windows.dtype)])
+    sizes = np.vstack([windows[:, 2:] - windows[:, :2], np.asarray([IMAGE_SIZE])])
+    return offsets, sizes
+
+
+def _detections(boxes, scores):
+    """전체 이미지 좌표 박스 → (xyxy, scores, class_ids) - 클래스는 모두 0"""
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    return boxes, np.asarray(scores, dtype=np.float32), np.zeros(len(boxes), dtype=np.int64)
+
+
+def _to_tile(offset, boxes):
+    return np.asarray(boxes, dtype=np.float32).reshape(-1, 4) - np.tile(offset, 2)
+
+
+def test_tile_border_split_is_merged():
+    """타일 0의 오른쪽 경계(x=640)에서 잘린 조각과 타일 1의 온전한 박스는 하나로 병합"""
+    offsets, sizes = _tiles()
+    assert offsets[:, 0].tolist() == [0, 360, 0]
+    per_tile = [
+        _detections(_to_tile(offsets[0], [[600, 100, 640, 300]]), [0.95]),  # 경계에서 잘린 조각
+        _detections(_to_tile(offsets[1], [[600, 100, 700, 300]]), [0.8]),   # 온전한 박스
+        _detections(np.zeros((0, 4)), []),
+    ]
+
+    xyxy, scores, class_ids = merge_tile_detections(per_tile, offsets, IMAGE_SIZE, window_sizes=sizes)
+
+    assert xyxy.tolist() == [[600, 100, 700, 300]]
+    assert scores.tolist() == pytest.approx([0.95])
+    assert class_ids.tolist() == [0]
+
+
+def test_nested_object_is_kept():
+    """전체 이미지 패스의 큰 박스 안에 있는 타일의 작은 박스(경계에 닿지 않음)는 병합하지 않음"""
+    offsets, sizes = _tiles()
+    per_tile = [
+        _detections(_to_tile(offsets[0], [[100, 100, 200, 300]]), [0.8]),
+        _detections(np.zeros((0, 4)), []),
+        _detections([[50, 50, 900, 620]], [0.9]),  # 전체 이미지 패스
+    ]
+
+    xyxy, scores, _ = merge_tile_detections(per_tile, offsets, IMAGE_SIZE, window_sizes=sizes)
+
+    assert sorted(xyxy.tolist()) == [[50, 50, 900, 620], [100, 100, 200, 300]]
+    assert sorted(scores.tolist()) == pytest.approx([0.8, 0.9])
+
+
+def test_nested_objects_in_different_tiles_are_kept():
+    """두 타일 모두에서 경계에 닿지 않는 포함 관계의 박스는 서로 다른 객체로 유지"""
+    offsets, sizes = _tiles()
+    per_tile = [
+        _detections(_to_tile(offsets[0], [[400, 100, 440, 200]]), [0.9]),
+        _detections(_to_tile(offsets[1], [[380, 50, 450, 400]]), [0.85]),
+        _detections(np.zeros((0, 4)), []),
+    ]
+
+    xyxy, _, _ = merge_tile_detections(per_tile, offsets, IMAGE_SIZE, window_sizes=sizes)
+
+    assert len(xyxy) == 2
+
+
+def test_fragment_merge_needs_window_sizes():
+    """window_sizes가 없으면 경계를 알 수 없으므로 조각 병합 없이 NMS만 수행"""
+    offsets, _ = _tiles()
+    per_tile = [
+        _detections(_to_tile(offsets[0], [[600, 100, 640, 300]]), [0.95]),
+        _detections(_to_tile(offsets[1], [[600, 100, 700, 300]]), [0.8]),
+        _detections(np.zeros((0, 4)), []),
+    ]
+
+    xyxy, _, _ = merge_tile_detections(per_tile, offsets, IMAGE_SIZE)
+
+    assert len(xyxy) == 2
@@ -0,0 +1,96 @@
+"""YOLO 라벨 일괄 파싱 - 여러 파일을 한 번에 파싱해도 파일별 파싱과 같은 결과인지 검사"""
+
+import gc
+
+import numpy as np
+
+from utils.yolo_labels import (EMPTY_LABELS, _pixel_xywh, labels_to_boxes, paused_gc, parse_yolo_label_text,
+                               parse_yolo_label_texts, read_yolo_label_files)
+
+TEXTS = [
+    "0 0.5 0.5 0.2 0.3\n1 0.1 0.2 0.05 0.05\n",
+    "2 0.3 0.3 0.1 0.1 0.87",                       # 신뢰도 열 + 마지막 줄바꿈 없음
+    "",
+    "0 0.5 0.5 0.2 0.3\n\n  \n1 0.4 0.4 0.1 0.1\n",  # 빈 라인 / 공백만 있는 라인
+    "0 0.5 0.5 0.2\nabc 0.1 0.1 0.1 0.1\n3 0.2 0.2 0.2 0.2\n",  # 열 부족 / 숫자가 아닌 값
+    "1 0.5 0.5 0.1 0.1\n-1 0.5 0.5 0.1 0.1\n1.5 0.5 0.5 0.1 0.1\n0 nan 0.5 0.1 0.1\n",  # 검증 실패 행
+    "3 0.9 0.9 0.1 0.1\r\n0 0.1 0.1 0.1 0.1\r\n",
+    "\n\n",
+    "0 0.5 0.5 0.2 0.3\n \t\n1 0.4 0.4 0.1 0.1\n",  # 공백만 있는 라인 (행 수 검사로 걸러짐)
+    "1 0.6 0.6 0.2 0.2\n",
+]
+
+
+def _assert_same(actual, expected):
+    assert actual.class_ids.tolist() == expected.class_ids.tolist()
+    np.testing.assert_array_equal(actual.coords, expected.coords)
+    assert actual.malformed == expected.malformed
+
+
+def test_batched_parse_matches_per_file_parse():
+    """정상/형식 오류/검증 실패/빈 라인 파일이 섞여 있어도 파일별 결과와 malformed 라인 번호가 같음"""
+    parsed = parse_yolo_label_texts(TEXTS)
+
+    assert len(parsed) == len(TEXTS)
+    for actual, text in zip(parsed, TEXTS):
+        _assert_same(actual, parse_yolo_label_text(text))
+    assert parsed[2] is EMPTY_LABELS
+    assert parsed[4].malformed[0][0] == 1 and parsed[4].class_ids.tolist() == [3]
+    assert [number for number, _ in parsed[5].malformed] == [2, 3, 4]
+
+
+def test_read_files_in_one_batch(tmp_path):
+    """여러 파일을 읽어 한 번에 파싱 (읽을 수 없는 파일만 제외)"""
+    paths = []
+    for index, text in enumerate(TEXTS):
+        path = tmp_path / f"{index}.txt"
+        path.write_text(text, newline="")
+        paths.append(path)
+    missing = tmp_path / "missing.txt"
+
+    results = read_yolo_label_files(paths + [missing])
+
+    assert list(results) == [str(path) for path in paths]
+    for path, text in zip(paths, TEXTS):
+        _assert_same(results[str(path)], parse_yolo_label_text(text))
+
+
+def test_labels_to_boxes_names_out_of_range_ids():
+    labels = parse_yolo_label_text("0 0.5 0.5 0.5 0.5\n7 0.5 0.5 0.5 0.5\n")
+
+    boxes = labels_to_boxes(labels, 100, 50, ["person"])
+
+    assert [box["class_name"] for box in boxes] == ["person", "class_7"]
+    assert boxes[0]["bbox"] == [25.0, 12.5, 50.0, 25.0]
+    assert boxes[0]["normalized_coords"] == [0.5, 0.5, 0.5, 0.5]
+
+
+def test_paused_gc_restores_state_when_nested():
+    assert gc.isenabled()
+    with paused_gc():
+        with paused_gc():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        with paused_gc():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_labels_to_boxes_small_and_large_match_array_math():
+    """박스 수와 관계없이 (파이썬 계산 / 배열 연산) 같은 픽셀 좌표"""
+    rng = np.random.default_rng(0)
+    for count in (3, 200):
+        lines = "".join(f"{class_id} {cx} {cy} {w} {h}\n" for class_id, (cx, cy, w, h)
+                        in zip(rng.integers(0, 3, count).tolist(), rng.random((count, 4)).tolist()))
+        labels = parse_yolo_label_text(lines)
+
+        boxes = labels_to_boxes(labels, 1280, 720, ["a", "b", "c"])
+
+        assert [box["bbox"] for box in boxes] == _pixel_xywh(labels.coords, 1280, 720).tolist()
+        assert [box["normalized_coords"] for box in boxes] == labels.coords.tolist()
@@ -6,10 +6,43 @@ from .response_utils import (
     create_error_response,
     create_warning_response
 )
+from .result_format import (
+    RESULT_FORMAT_VERBOSE,
+    RESULT_FORMAT_COLUMNAR,
+    RESULT_FORMATS,
+    validate_result_format,
+    encode_boxes_columnar,
+    encode_boxes
+)
+from .yolo_labels import (
+    LabelArrays,
+    parse_yolo_label_text,
+    read_yolo_label_file,
+    read_yolo_label_files,
+    parse_yolo_label_texts,
+    labels_to_boxes,
+    labels_to_columnar
+)
+from .annotation_store import AnnotationStore, ANNOTATION_DIR_NAME
 
 __all__ = [
     'create_response_with_notification',
     'create_success_response', 
     'create_error_response',
-    'create_warning_response'
-] 
\ No newline at end of file
+    'create_warning_response',
+    'RESULT_FORMAT_VERBOSE',
+    'RESULT_FORMAT_COLUMNAR',
+    'RESULT_FORMATS',
+    'validate_result_format',
+    'encode_boxes_columnar',
+    'encode_boxes',
+    'LabelArrays',
+    'parse_yolo_label_text',
+    'read_yolo_label_file',
+    'read_yolo_label_files',
+    'parse_yolo_label_texts',
+    'labels_to_boxes',
+    'labels_to_columnar',
+    'AnnotationStore',
+    'ANNOTATION_DIR_NAME'
+]
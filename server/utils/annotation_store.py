@@ -0,0 +1,175 @@
+"""프로젝트 라벨의 열(column) 기반 저장소 (NumPy 배열 + 오프셋 인덱스, 메모리 맵으로 로드)"""
+
+import os
+import json
+import uuid
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from .yolo_labels import LabelArrays, parse_yolo_label_texts
+
+logger = logging.getLogger(__name__)
+
+ANNOTATION_DIR_NAME = ".annotations"
+ANNOTATION_STORE_VERSION = 1
+_INDEX_FILE = "index.json"
+_ARRAYS = ("offsets", "stamps", "class_ids", "coords")
+
+
+class AnnotationStore:
+    """
+    프로젝트 labels/*.txt 전체를 배열 네 개로 묶은 읽기 전용 저장소
+
+    - class_ids (M,) / coords (M, 4): 모든 박스를 라벨 파일 순서대로 이어 붙인 배열
+    - offsets (N+1,): 라벨 파일 i의 박스는 [offsets[i], offsets[i+1]) 구간
+    - stamps (N, 2): 라벨 파일의 (mtime_ns, size) - 파일이 바뀌었으면 해당 항목은 사용하지 않음
+    - 배열은 mmap으로 열리므로 로드 비용은 인덱스(JSON) 읽기뿐
+    - YOLO txt 파일이 원본(교환 형식)이고 이 저장소는 언제든 다시 만들 수 있는 캐시
+    """
+
+    def __init__(self, project_dir: Path, stems: List[str], arrays: Dict[str, np.ndarray]):
+        self.project_dir = Path(project_dir)
+        self.stems = stems
+        self._index = {stem: position for position, stem in enumerate(stems)}
+        # 파일 단위 인덱스는 작으므로 파이썬 리스트로 (조회마다 numpy 스칼라를 만들지 않도록)
+        self._offsets = arrays["offsets"].tolist()
+        self._stamps = [tuple(stamp) for stamp in arrays["stamps"].tolist()]
+        # 박스 배열은 mmap 그대로 두되 memmap 하위 클래스 오버헤드 없이 슬라이스
+        self._class_ids = arrays["class_ids"].view(np.ndarray)
+        self._coords = arrays["coords"].view(np.ndarray)
+
+    def __len__(self) -> int:
+        return len(self.stems)
+
+    @property
+    def box_count(self) -> int:
+        """저장된 전체 박스 수"""
+        return self._offsets[-1] if self._offsets else 0
+
+    def get(self, stem: str, stat_result: os.stat_result) -> Optional[LabelArrays]:
+        """
+        라벨 파일 하나의 배열을 반환합니다.
+
+        Args:
+            stem: 라벨 파일명 (확장자 제외)
+            stat_result: 현재 라벨 파일의 os.stat 결과 (저장 시점과 비교)
+
+        Returns:
+            LabelArrays (mmap 배열의 슬라이스) 또는 None (항목이 없거나 파일이 바뀜)
+        """
+        position = self._index.get(stem)
+        if position is None:
+            return None
+        if self._stamps[position] != (stat_result.st_mtime_ns, stat_result.st_size):
+            return None
+        start, end = self._offsets[position], self._offsets[position + 1]
+        return LabelArrays(self._class_ids[start:end], self._coords[start:end], [])
+
+    # ------------------------------------------------------------------
+    # 열기 / 만들기
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def open(cls, project_dir: Union[str, Path]) -> Optional["AnnotationStore"]:
+        """
+        저장소를 메모리 맵으로 엽니다.
+
+        Returns:
+            AnnotationStore 또는 None (없거나 손상됨 - 라벨 txt를 직접 읽어야 함)
+        """
+        store_dir = Path(project_dir) / ANNOTATION_DIR_NAME
+        try:
+            with open(store_dir / _INDEX_FILE, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != ANNOTATION_STORE_VERSION:
+                return None
+            build_id = index["build"]
+            arrays = {name: np.load(store_dir / f"{build_id}.{name}.npy", mmap_mode="r") for name in _ARRAYS}
+            stems = index["labels"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ 라벨 저장소를 열 수 없습니다 ({store_dir}): {str(e)}")
+            return None
+
+        if len(arrays["offsets"]) != len(stems) + 1 or len(arrays["stamps"]) != len(stems):
+            logger.warning(f"⚠️ 라벨 저장소 인덱스가 배열과 맞지 않습니다: {store_dir}")
+            return None
+        return cls(project_dir, stems, arrays)
+
+    @classmethod
+    def build(cls, project_dir: Union[str, Path]) -> "AnnotationStore":
+        """
+        labels 폴더의 모든 라벨 파일을 읽어 저장소를 새로 만듭니다. (프로젝트 저장 시/오래된 저장소 갱신 시)
+
+        배열 파일을 먼저 새 이름으로 쓰고 index.json을 마지막에 교체하므로,
+        읽는 쪽은 항상 완성된 한 벌의 배열만 보게 됩니다.
+        """
+        project_dir = Path(project_dir)
+        labels_dir = project_dir / "labels"
+        store_dir = project_dir / ANNOTATION_DIR_NAME
+        store_dir.mkdir(exist_ok=True)
+
+        stems: List[str] = []
+        stamps: List[tuple] = []
+        class_id_chunks: List[np.ndarray] = []
+        coord_chunks: List[np.ndarray] = []
+        offsets = [0]
+
+        with os.scandir(labels_dir) as entries:
+            label_entries = sorted((entry for entry in entries if entry.name.endswith(".txt") and entry.is_file()),
+                                   key=lambda entry: entry.name)
+
+        texts: List[str] = []
+        for entry in label_entries:
+            try:
+                # 읽기 전에 stat - 읽는 도중 바뀌면 다음 로드에서 오래된 항목으로 판정됨
+                stat_result = entry.stat()
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    texts.append(f.read())
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"라벨 파일 읽기 실패 ({entry.path}): {e}")
+                continue
+            stems.append(entry.name[:-len(".txt")])
+            stamps.append((stat_result.st_mtime_ns, stat_result.st_size))
+
+        # 모든 파일 내용을 np.loadtxt 한 번으로 파싱
+        for labels in parse_yolo_label_texts(texts):
+            class_id_chunks.append(labels.class_ids)
+            coord_chunks.append(labels.coords)
+            offsets.append(offsets[-1] + len(labels))
+
+        arrays = {
+            "offsets": np.asarray(offsets, dtype=np.int64),
+            "stamps": np.asarray(stamps, dtype=np.int64).reshape(-1, 2),
+            "class_ids": np.concatenate(class_id_chunks).astype(np.int64) if class_id_chunks else np.empty(0, dtype=np.int64),
+            "coords": np.concatenate(coord_chunks).astype(np.float64) if coord_chunks else np.empty((0, 4), dtype=np.float64)
+        }
+
+        build_id = uuid.uuid4().hex
+        for name, array in arrays.items():
+            np.save(store_dir / f"{build_id}.{name}.npy", array)
+
+        tmp_index = store_dir / f".{_INDEX_FILE}.{build_id}.tmp"
+        with open(tmp_index, "w", encoding="utf-8") as f:
+            json.dump({"version": ANNOTATION_STORE_VERSION, "build": build_id, "labels": stems},
+                      f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_index, store_dir / _INDEX_FILE)
+        cls._remove_old_builds(store_dir, build_id)
+
+        logger.info(f"🗃️ 라벨 저장소 생성: {store_dir} ({len(stems)}개 파일, {offsets[-1]}개 박스)")
+        store = cls.open(project_dir)
+        return store if store is not None else cls(project_dir, stems, arrays)
+
+    @staticmethod
+    def _remove_old_builds(store_dir: Path, build_id: str):
+        # 이미 열린 mmap은 파일을 지워도 유지되므로 바로 삭제해도 됨
+        for path in store_dir.glob("*.npy"):
+            if not path.name.startswith(f"{build_id}."):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
@@ -0,0 +1,198 @@
+"""HTTP 캐시 검증자(ETag)와 Range 응답 유틸리티"""
+
+import os
+import re
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+# 경로로 접근하는 파일은 같은 이름으로 덮어쓸 수 있으므로 항상 재검증 (변경 없으면 304)
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# URL에 현재 버전(?v=<ETag>)이 포함된 요청은 내용이 바뀌지 않으므로 재검증 없이 캐시
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png",
+    ".gif": "image/gif", ".webp": "image/webp", ".bmp": "image/bmp"
+}
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+_STREAM_CHUNK_SIZE = 256 * 1024
+
+
+def guess_image_media_type(filename: Union[str, Path]) -> str:
+    """확장자로 이미지 MIME 타입 결정 (알 수 없으면 application/octet-stream)"""
+    return _IMAGE_MEDIA_TYPES.get(Path(str(filename)).suffix.lower(), "application/octet-stream")
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """파일 mtime + 크기 기반 강한 ETag"""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def content_etag(content_hash: str) -> str:
+    """콘텐츠 해시 기반 강한 ETag"""
+    return f'"{content_hash}"'
+
+
+def etag_matches(header_value: Optional[str], etag: str) -> bool:
+    """If-None-Match / If-Range 헤더가 ETag와 일치하는지 확인"""
+    if not header_value:
+        return False
+    if header_value.strip() == "*":
+        return True
+    candidates = [value.strip() for value in header_value.split(",")]
+    return etag in candidates or f"W/{etag}" in candidates
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 바이트 범위 헤더를 해석합니다.
+
+    Args:
+        range_header: Range 헤더 값 (예: "bytes=0-1023", "bytes=-500")
+        size: 전체 크기
+
+    Returns:
+        (start, end) 포함 범위, 헤더가 없거나 다중 범위면 None
+
+    Raises:
+        ValueError: 만족할 수 없는 범위 (416)
+    """
+    if not range_header:
+        return None
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None  # 다중 범위 등은 전체 응답으로 처리
+    start_text, end_text = match.groups()
+    if not start_text and not end_text:
+        return None
+
+    if not start_text:
+        length = int(end_text)
+        if length == 0:
+            raise ValueError("빈 suffix 범위")
+        start, end = max(0, size - length), size - 1
+    else:
+        start = int(start_text)
+        end = min(int(end_text), size - 1) if end_text else size - 1
+
+    if start >= size or start > end:
+        raise ValueError("범위가 파일 크기를 벗어납니다")
+    return start, end
+
+
+def _cache_headers(request: Request, etag: str) -> dict:
+    versioned = request.query_params.get("v") == etag.strip('"')
+    return {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL,
+        "Accept-Ranges": "bytes"
+    }
+
+
+def not_modified_response(request: Request, etag: str, extra_headers: Optional[dict] = None) -> Optional[Response]:
+    """If-None-Match가 ETag와 일치하면 304 응답, 아니면 None (본문을 읽기 전에 확인할 때 사용)"""
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    headers = _cache_headers(request, etag)
+    if extra_headers:
+        headers.update(extra_headers)
+    return Response(status_code=304, headers=headers)
+
+
+def _requested_range(request: Request, etag: str, size: int) -> Optional[Tuple[int, int]]:
+    """If-Range가 현재 ETag와 다르면 Range를 무시합니다."""
+    if_range = request.headers.get("if-range")
+    if if_range and not etag_matches(if_range, etag):
+        return None
+    return parse_range(request.headers.get("range"), size)
+
+
+def _not_satisfiable(size: int, headers: dict) -> Response:
+    headers = dict(headers, **{"Content-Range": f"bytes */{size}"})
+    return Response(status_code=416, headers=headers)
+
+
+def conditional_file_response(request: Request, path: Union[str, Path], media_type: str,
+                              extra_headers: Optional[dict] = None) -> Response:
+    """
+    ETag/If-None-Match(304)/Range(206)를 지원하는 파일 응답
+
+    Args:
+        request: 요청 (조건부/Range 헤더 확인용)
+        path: 파일 경로
+        media_type: MIME 타입
+        extra_headers: 추가 응답 헤더
+    """
+    stat_result = os.stat(path)
+    etag = file_etag(stat_result)
+    headers = _cache_headers(request, etag)
+    if extra_headers:
+        headers.update(extra_headers)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    size = stat_result.st_size
+    try:
+        byte_range = _requested_range(request, etag, size)
+    except ValueError:
+        return _not_satisfiable(size, headers)
+
+    if byte_range is None:
+        return FileResponse(path=str(path), media_type=media_type, headers=headers, stat_result=stat_result)
+
+    start, end = byte_range
+
+    def iter_file():
+        remaining = end - start + 1
+        with open(path, "rb") as f:
+            f.seek(start)
+            while remaining > 0:
+                chunk = f.read(min(_STREAM_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    headers.update({
+        "Content-Range": f"bytes {start}-{end}/{size}",
+        "Content-Length": str(end - start + 1)
+    })
+    return StreamingResponse(iter_file(), status_code=206, media_type=media_type, headers=headers)
+
+
+def conditional_bytes_response(request: Request, data: bytes, etag: str, media_type: str,
+                               extra_headers: Optional[dict] = None) -> Response:
+    """
+    메모리 바이트에 대한 ETag/304/Range 응답 (저장된 bytes를 그대로 사용, 부분 응답은 요청 범위만 복사)
+
+    Args:
+        request: 요청
+        data: 응답 바이트
+        etag: content_etag()로 만든 ETag
+        media_type: MIME 타입
+        extra_headers: 추가 응답 헤더
+    """
+    headers = _cache_headers(request, etag)
+    if extra_headers:
+        headers.update(extra_headers)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    size = len(data)
+    try:
+        byte_range = _requested_range(request, etag, size)
+    except ValueError:
+        return _not_satisfiable(size, headers)
+
+    if byte_range is None:
+        return Response(content=data, media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return Response(content=data[start:end + 1], status_code=206, media_type=media_type, headers=headers)
@@ -0,0 +1,119 @@
+"""탐지 결과 인코딩 관련 유틸리티"""
+
+from typing import Dict, Any, List, Optional
+
+from fastapi import HTTPException
+
+# 지원하는 결과 포맷
+RESULT_FORMAT_VERBOSE = "verbose"
+RESULT_FORMAT_COLUMNAR = "columnar"
+RESULT_FORMATS = (RESULT_FORMAT_VERBOSE, RESULT_FORMAT_COLUMNAR)
+
+
+def validate_result_format(result_format: Optional[str]) -> str:
+    """
+    요청된 결과 포맷을 검증합니다.
+
+    Args:
+        result_format: 요청 파라미터 값 (None이면 verbose)
+
+    Returns:
+        검증된 결과 포맷 문자열
+    """
+    if not result_format:
+        return RESULT_FORMAT_VERBOSE
+
+    result_format = result_format.strip().lower()
+    if result_format not in RESULT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 result_format입니다: {result_format} (지원: {', '.join(RESULT_FORMATS)})"
+        )
+    return result_format
+
+
+def encode_boxes_columnar(
+    boxes: List[Dict[str, Any]],
+    shared_class_names: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    박스 dict 리스트를 열(column) 기반 포맷으로 변환합니다.
+
+    박스마다 반복되던 키와 normalized_coords를 제거하고, 클래스 이름은
+    class_names 목록에 한 번만 기록합니다.
+
+    Args:
+        boxes: 매니저가 반환한 박스 리스트 (class_id, class_name, confidence, bbox)
+        shared_class_names: 여러 이미지가 공유하는 클래스 이름 목록.
+            주어지면 새 이름을 이 목록에 추가하고 응답에서는 class_names를 생략합니다.
+
+    Returns:
+        {
+            "count": N,
+            "class_id": [N],         # 모델 class ID (없으면 -1)
+            "name_index": [N],       # class_names 내 인덱스
+            "confidence": [N],       # 신뢰도 (없는 결과는 키 생략)
+            "xywh": [4N],            # 픽셀 좌표 x, y, w, h (좌상단 기준, 행 우선)
+            "class_names": [...]     # shared_class_names가 없을 때만 포함
+        }
+    """
+    class_names = shared_class_names if shared_class_names is not None else []
+    name_lookup = {name: idx for idx, name in enumerate(class_names)}
+
+    class_ids = []
+    name_indices = []
+    confidences = []
+    xywh = []
+    has_confidence = False
+
+    for box in boxes:
+        class_name = box.get("class_name", "")
+        name_idx = name_lookup.get(class_name)
+        if name_idx is None:
+            name_idx = len(class_names)
+            class_names.append(class_name)
+            name_lookup[class_name] = name_idx
+
+        class_id = box.get("class_id")
+        class_ids.append(int(class_id) if class_id is not None else -1)
+        name_indices.append(name_idx)
+
+        confidence = box.get("confidence")
+        if confidence is not None:
+            has_confidence = True
+        confidences.append(confidence)
+
+        bbox = box.get("bbox") or [0.0, 0.0, 0.0, 0.0]
+        xywh.extend(bbox[:4])
+
+    encoded = {
+        "count": len(boxes),
+        "class_id": class_ids,
+        "name_index": name_indices,
+        "xywh": xywh
+    }
+
+    if has_confidence:
+        encoded["confidence"] = confidences
+
+    if shared_class_names is None:
+        encoded["class_names"] = class_names
+
+    return encoded
+
+
+def encode_boxes(boxes: List[Dict[str, Any]], result_format: str, shared_class_names: Optional[List[str]] = None):
+    """
+    요청된 포맷에 맞게 박스 리스트를 반환합니다. (verbose는 그대로 반환)
+
+    Args:
+        boxes: 박스 dict 리스트
+        result_format: validate_result_format()으로 검증된 포맷
+        shared_class_names: columnar 포맷에서 공유할 클래스 이름 목록
+
+    Returns:
+        verbose: 원본 리스트, columnar: encode_boxes_columnar() 결과
+    """
+    if result_format == RESULT_FORMAT_COLUMNAR:
+        return encode_boxes_columnar(boxes, shared_class_names)
+    return boxes
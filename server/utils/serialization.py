@@ -0,0 +1,155 @@
+"""응답 직렬화 관련 유틸리티"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json으로 대체
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 시 JSON 응답만 지원
+    msgpack = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+# JSON 응답에 해당하는 Accept 항목 (구체적인 것부터)
+JSON_MEDIA_RANGES = ("application/json", "application/*", "*/*")
+
+
+def _default(obj: Any) -> Any:
+    """기본 직렬화기가 처리하지 못하는 타입(numpy 스칼라/배열, Path 등)을 변환합니다."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "item"):
+        return obj.item()
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def _replace_non_finite(value: Any) -> Any:
+    """NaN/Infinity를 None으로 바꿉니다. (orjson과 같은 출력: null)"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+def _dumps_json(content: Any) -> bytes:
+    """표준 json 직렬화 (orjson 미설치 시) - NaN/Infinity는 orjson처럼 null로 기록"""
+    options = dict(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+    try:
+        return json.dumps(content, default=_default, **options).encode("utf-8")
+    except ValueError:
+        # 유한하지 않은 실수가 있을 때만 복사본을 만들어 다시 직렬화
+        return json.dumps(
+            _replace_non_finite(content),
+            default=lambda obj: _replace_non_finite(_default(obj)),
+            **options
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson 기반 JSON 응답 (애플리케이션 기본 응답 클래스)
+
+    orjson이 없으면 표준 json으로 동일한 출력 형식을 유지합니다. (NaN/Infinity → null 포함)
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(
+                content,
+                default=_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        return _dumps_json(content)
+
+
+class MsgPackResponse(Response):
+    """MessagePack 응답"""
+
+    media_type = MSGPACK_MEDIA_TYPES[0]
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True, default=_default)
+
+
+def is_msgpack_available() -> bool:
+    """msgpack 라이브러리 사용 가능 여부"""
+    return msgpack is not None
+
+
+def _parse_accept(accept: str) -> Dict[str, float]:
+    """
+    Accept 헤더를 {미디어 범위: q값}으로 변환합니다.
+
+    예: "application/msgpack;q=0.9, */*;q=0.1" → {"application/msgpack": 0.9, "*/*": 0.1}
+    (q가 없거나 잘못된 값이면 1.0, 같은 범위가 여러 번 나오면 가장 큰 q)
+    """
+    ranges: Dict[str, float] = {}
+    for item in accept.lower().split(","):
+        media_range, *params = [part.strip() for part in item.split(";")]
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = min(1.0, max(0.0, float(value.strip())))
+                except ValueError:
+                    quality = 1.0
+        ranges[media_range] = max(quality, ranges.get(media_range, 0.0))
+    return ranges
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """
+    요청의 Accept 헤더가 JSON보다 MessagePack을 선호하는지 확인합니다.
+
+    MessagePack 미디어 타입이 q > 0으로 명시되어 있고, 그 q가 JSON에 해당하는 항목
+    (application/json, 없으면 application/*, */*)의 q 이상이면 MessagePack을 선택합니다.
+    (application/msgpack;q=0 은 MessagePack을 거부하는 것이므로 JSON)
+    """
+    if msgpack is None or request is None:
+        return False
+    ranges = _parse_accept(request.headers.get("accept", ""))
+    msgpack_quality = max((ranges.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES), default=0.0)
+    if msgpack_quality <= 0.0:
+        return False
+    json_quality = next((ranges[media_range] for media_range in JSON_MEDIA_RANGES if media_range in ranges), 0.0)
+    return msgpack_quality >= json_quality
+
+
+def negotiated_response(request: Request, content: Any, status_code: int = 200) -> Response:
+    """
+    Accept 헤더에 따라 MessagePack 또는 JSON 응답을 생성합니다.
+
+    응답 객체를 직접 반환하므로 FastAPI의 jsonable_encoder 단계를 건너뜁니다.
+    content에는 JSON 호환 타입(및 numpy 값)만 포함되어야 합니다.
+
+    Args:
+        request: 현재 요청
+        content: 응답 본문
+        status_code: HTTP 상태 코드
+
+    Returns:
+        MsgPackResponse 또는 FastJSONResponse
+    """
+    headers = {"Vary": "Accept"}
+    if accepts_msgpack(request):
+        return MsgPackResponse(content, status_code=status_code, headers=headers)
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
@@ -0,0 +1,322 @@
+"""YOLO 라벨 파일 일괄 파싱 (NumPy 배열 기반)"""
+
+import gc
+import io
+import logging
+import warnings
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_EMPTY_IDS = np.empty(0, dtype=np.int64)
+_EMPTY_COORDS = np.empty((0, 4), dtype=np.float64)
+# labels_to_boxes에서 픽셀 좌표를 배열 연산으로 계산하는 최소 박스 수
+_VECTORIZE_MIN_BOXES = 64
+
+
+class LabelArrays(NamedTuple):
+    """라벨 파일 하나의 파싱 결과"""
+    class_ids: np.ndarray   # (N,) int64
+    coords: np.ndarray      # (N, 4) float64, 정규화 좌표 (x_center, y_center, width, height)
+    malformed: List[Tuple[int, str]]  # (라인 번호, 사유) - 건너뛴 라인
+
+    def __len__(self) -> int:
+        return len(self.class_ids)
+
+
+# 라벨 파일이 없는 이미지용 빈 결과
+EMPTY_LABELS = LabelArrays(_EMPTY_IDS, _EMPTY_COORDS, [])
+
+
+def parse_yolo_label_text(text: str) -> LabelArrays:
+    """
+    YOLO 라벨 텍스트 전체를 한 번에 배열로 변환합니다.
+
+    모든 라인을 NumPy 파서로 한꺼번에 읽고 클래스 ID/좌표 검증도 배열 연산으로 처리합니다.
+    형식이 맞지 않는 라인이 섞여 있으면 라인 단위로 다시 읽어 해당 라인만 제외합니다.
+    다섯 번째 이후 열(신뢰도 등)은 무시합니다.
+
+    Args:
+        text: 라벨 파일 내용
+
+    Returns:
+        LabelArrays
+    """
+    if not text.strip():
+        return EMPTY_LABELS
+
+    malformed: List[Tuple[int, str]] = []
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            rows = np.loadtxt(io.StringIO(text), dtype=np.float64, ndmin=2,
+                              usecols=(0, 1, 2, 3, 4), comments=None)
+        line_numbers = None  # 오류가 있을 때만 계산
+    except ValueError:
+        rows, line_numbers, malformed = _parse_lines(text)
+
+    if len(rows) == 0:
+        return LabelArrays(_EMPTY_IDS, _EMPTY_COORDS, malformed)
+
+    # 클래스 ID는 0 이상의 정수, 좌표는 유한한 값이어야 함
+    class_column = rows[:, 0]
+    valid = (class_column >= 0) & (np.floor(class_column) == class_column) & np.isfinite(rows).all(axis=1)
+    if not valid.all():
+        if line_numbers is None:
+            line_numbers = [number for number, line in enumerate(text.splitlines(), 1) if line.strip()]
+        for index in np.flatnonzero(~valid):
+            reason = "클래스 ID가 올바르지 않음" if np.isfinite(rows[index]).all() else "좌표 값이 올바르지 않음"
+            malformed.append((line_numbers[index], reason))
+        malformed.sort()
+        rows = rows[valid]
+
+    return LabelArrays(rows[:, 0].astype(np.int64), rows[:, 1:5], malformed)
+
+
+def _parse_lines(text: str) -> Tuple[np.ndarray, List[int], List[Tuple[int, str]]]:
+    """형식 오류가 있는 텍스트를 라인 단위로 읽습니다. (정상 행, 정상 행의 라인 번호, 오류 라인)"""
+    values = []
+    line_numbers = []
+    malformed = []
+    for number, line in enumerate(text.splitlines(), 1):
+        parts = line.split()
+        if not parts:
+            continue
+        if len(parts) < 5:
+            malformed.append((number, "형식이 올바르지 않음"))
+            continue
+        try:
+            values.append([float(part) for part in parts[:5]])
+            line_numbers.append(number)
+        except ValueError as e:
+            malformed.append((number, str(e)))
+    rows = np.array(values, dtype=np.float64).reshape(-1, 5)
+    return rows, line_numbers, malformed
+
+
+def read_yolo_label_file(label_file: Union[str, Path]) -> LabelArrays:
+    """라벨 파일 전체를 한 번에 읽어 배열로 변환합니다."""
+    with open(label_file, 'r', encoding='utf-8') as f:
+        return parse_yolo_label_text(f.read())
+
+
+def read_yolo_label_files(label_files: Iterable[Union[str, Path]]) -> Dict[str, LabelArrays]:
+    """
+    여러 라벨 파일을 읽어 배열로 변환합니다. (읽을 수 없는 파일은 결과에서 제외)
+
+    파일 내용을 모두 읽은 뒤 parse_yolo_label_texts()로 한 번에 파싱합니다.
+
+    Returns:
+        {파일 경로 문자열: LabelArrays}
+    """
+    paths = []
+    texts = []
+    for label_file in label_files:
+        try:
+            with open(label_file, 'r', encoding='utf-8') as f:
+                texts.append(f.read())
+            paths.append(str(label_file))
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"라벨 파일 읽기 실패 ({label_file}): {e}")
+    return dict(zip(paths, parse_yolo_label_texts(texts)))
+
+
+def parse_yolo_label_texts(texts: Sequence[str]) -> List[LabelArrays]:
+    """
+    여러 라벨 텍스트를 이어 붙여 np.loadtxt 한 번으로 파싱합니다.
+
+    파일별 행 수로 오프셋을 만들어 결과 배열을 파일 단위로 나눕니다. (각 결과는 전체 배열의 뷰)
+    형식 오류가 있으면 묶음을 반으로 나눠 다시 읽어 오류가 있는 파일만 parse_yolo_label_text()로
+    처리하고, 빈 라인이 섞인 파일이나 검증에 실패한 행이 있는 파일도 파일 단위로 처리합니다.
+    (어느 경우든 parse_yolo_label_text()를 파일마다 호출한 것과 같은 결과)
+
+    Args:
+        texts: 라벨 파일 내용 목록
+
+    Returns:
+        texts와 같은 순서의 LabelArrays 목록
+    """
+    results: List[LabelArrays] = [EMPTY_LABELS] * len(texts)
+    batch: List[int] = []
+    line_counts: List[int] = []
+    for index, text in enumerate(texts):
+        if not text or text.isspace():
+            continue
+        # np.loadtxt는 빈 라인을 건너뛰므로 빈 라인이 있는 파일은 행 수를 라인 수로 셀 수 없음
+        # (공백만 있는 라인은 여기서 거르지 않고 _parse_batch의 행 수 검사에서 걸러짐)
+        if text.startswith("\n") or "\n\n" in text or "\n\r\n" in text:
+            results[index] = parse_yolo_label_text(text)
+            continue
+        batch.append(index)
+        line_counts.append(text.count("\n") + (not text.endswith("\n")))
+
+    if batch:
+        _parse_batch(texts, batch, line_counts, results)
+    return results
+
+
+def _parse_batch(texts: Sequence[str], batch: List[int], line_counts: List[int], results: List[LabelArrays]):
+    """빈 라인이 없는 텍스트 묶음을 한 번에 파싱해 results에 채움 (형식 오류 시 반씩 나눠 재시도)"""
+    if len(batch) == 1:
+        results[batch[0]] = parse_yolo_label_text(texts[batch[0]])
+        return
+
+    joined = "".join(texts[index] if texts[index].endswith("\n") else texts[index] + "\n" for index in batch)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            rows = np.loadtxt(io.StringIO(joined), dtype=np.float64, ndmin=2,
+                              usecols=(0, 1, 2, 3, 4), comments=None)
+    except ValueError:
+        rows = None
+    if rows is None or len(rows) != sum(line_counts):
+        middle = len(batch) // 2
+        _parse_batch(texts, batch[:middle], line_counts[:middle], results)
+        _parse_batch(texts, batch[middle:], line_counts[middle:], results)
+        return
+
+    class_column = rows[:, 0]
+    valid = (class_column >= 0) & (np.floor(class_column) == class_column) & np.isfinite(rows).all(axis=1)
+    with np.errstate(invalid="ignore"):  # NaN/inf 행은 아래에서 파일 단위로 다시 처리
+        class_ids = class_column.astype(np.int64)
+    coords = rows[:, 1:5]
+    offsets = np.concatenate(([0], np.cumsum(line_counts))).tolist()
+    # 검증에 실패한 행이 있는 파일은 라인 번호와 사유를 남기도록 파일 단위로 다시 처리
+    invalid_files = set(np.searchsorted(offsets, np.flatnonzero(~valid), side="right").tolist()) if not valid.all() else ()
+    for position, index in enumerate(batch):
+        if position + 1 in invalid_files:
+            results[index] = parse_yolo_label_text(texts[index])
+            continue
+        start, end = offsets[position], offsets[position + 1]
+        results[index] = LabelArrays(class_ids[start:end], coords[start:end], [])
+
+
+def labels_to_boxes(labels: LabelArrays, img_width: int, img_height: int, classes: List[str]) -> List[Dict[str, Any]]:
+    """
+    정규화 좌표 배열을 픽셀 좌표 박스 목록으로 변환합니다. (박스가 많으면 좌표 계산은 배열 연산)
+
+    Args:
+        labels: parse_yolo_label_text() 결과
+        img_width: 이미지 너비
+        img_height: 이미지 높이
+        classes: 클래스 이름 목록 (ID 순서, 범위를 벗어나면 "class_{id}")
+
+    Returns:
+        [{"bbox": [x, y, w, h], "class_name": str, "normalized_coords": [cx, cy, w, h]}, ...]
+    """
+    if len(labels) == 0:
+        return []
+
+    normalized_coords = labels.coords.tolist()
+    if len(normalized_coords) < _VECTORIZE_MIN_BOXES:
+        # 박스가 적으면 NumPy 호출 비용이 계산보다 큼 (_pixel_xywh와 같은 순서의 연산)
+        pixel_boxes = []
+        for x_center, y_center, width, height in normalized_coords:
+            box_width = width * img_width
+            box_height = height * img_height
+            pixel_boxes.append([x_center * img_width - box_width / 2, y_center * img_height - box_height / 2,
+                                box_width, box_height])
+    else:
+        pixel_boxes = _pixel_xywh(labels.coords, img_width, img_height).tolist()
+
+    # 클래스 이름은 ID마다 한 번만 계산 (박스마다 범위 검사/문자열 생성을 하지 않도록)
+    class_ids = labels.class_ids.tolist()
+    names = {class_id: classes[class_id] if class_id < len(classes) else f"class_{class_id}"
+             for class_id in set(class_ids)}
+    return [
+        {
+            "bbox": bbox,
+            "class_name": names[class_id],
+            # 프로젝트 로드 시에는 신뢰도를 표시하지 않음 (confidence 필드 없음)
+            "normalized_coords": normalized
+        }
+        for bbox, class_id, normalized in zip(pixel_boxes, class_ids, normalized_coords)
+    ]
+
+
+_gc_lock = threading.Lock()
+_gc_pause_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def paused_gc():
+    """
+    박스 dict/list를 대량으로 만드는 동안 순환 GC를 멈춥니다. (중첩/여러 스레드에서 사용 가능)
+
+    만든 객체는 모두 살아남아 응답이 되므로 세대 GC가 반복해서 훑어도 회수할 것이 없고,
+    verbose 페이지 인코딩 시간의 대부분이 GC에 쓰입니다. 마지막으로 나가는 쪽이 원래 상태로 되돌립니다.
+    """
+    global _gc_pause_depth, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pause_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pause_depth -= 1
+            if _gc_pause_depth == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def labels_to_columnar(labels: LabelArrays, img_width: int, img_height: int, classes: List[str],
+                       shared_class_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    라벨 배열을 박스 dict를 거치지 않고 columnar 포맷으로 변환합니다.
+    (encode_boxes_columnar(labels_to_boxes(...))와 같은 결과)
+
+    Args:
+        labels: parse_yolo_label_text() 결과
+        img_width: 이미지 너비
+        img_height: 이미지 높이
+        classes: 클래스 이름 목록 (ID 순서)
+        shared_class_names: 여러 이미지가 공유하는 클래스 이름 목록 (새 이름은 뒤에 추가)
+    """
+    class_names = shared_class_names if shared_class_names is not None else []
+    count = len(labels)
+    name_index: List[int] = []
+    if count:
+        # 서로 다른 클래스 ID마다 한 번만 이름을 찾고, 박스별 인덱스는 배열 인덱싱으로 계산
+        unique_ids, first_rows, inverse = np.unique(labels.class_ids, return_index=True, return_inverse=True)
+        name_lookup = {}
+        for idx, name in enumerate(class_names):
+            name_lookup.setdefault(name, idx)
+        unique_indices = np.empty(len(unique_ids), dtype=np.int64)
+        # 새 이름은 처음 등장한 박스 순서대로 추가 (encode_boxes_columnar와 같은 순서)
+        for position in np.argsort(first_rows, kind="stable").tolist():
+            class_id = int(unique_ids[position])
+            name = classes[class_id] if class_id < len(classes) else f"class_{class_id}"
+            if name not in name_lookup:
+                name_lookup[name] = len(class_names)
+                class_names.append(name)
+            unique_indices[position] = name_lookup[name]
+        name_index = unique_indices[inverse.reshape(-1)].tolist()
+
+    encoded = {
+        "count": count,
+        # 저장된 라벨에는 모델 class ID 정보가 없으므로 박스 dict 경로와 같이 -1
+        "class_id": [-1] * count,
+        "name_index": name_index,
+        "xywh": _pixel_xywh(labels.coords, img_width, img_height).ravel().tolist() if count else []
+    }
+    if shared_class_names is None:
+        encoded["class_names"] = class_names
+    return encoded
+
+
+def _pixel_xywh(coords: np.ndarray, img_width: int, img_height: int) -> np.ndarray:
+    """정규화 중심 좌표 (N, 4) → 픽셀 좌상단 좌표 (N, 4)"""
+    box_width = coords[:, 2] * img_width
+    box_height = coords[:, 3] * img_height
+    # 좌상단 좌표 계산
+    x = coords[:, 0] * img_width - box_width / 2
+    y = coords[:, 1] * img_height - box_height / 2
+    return np.stack([x, y, box_width, box_height], axis=1)